@@ -39,17 +39,89 @@ public class TreeSpeciesDAO {
              ResultSet rs = stmt.executeQuery()) {
 
             while (rs.next()) {
-                TreeSpecies sp = new TreeSpecies();
-                sp.setId(rs.getInt("id"));
-                sp.setNombreComun(rs.getString("nombre_comun"));
-                sp.setNombreCientifico(rs.getString("nombre_cientifico"));
-                sp.setEstadoConservacionId(rs.getInt("estado_conservacion_id"));
-                sp.setZonaId(rs.getInt("zona_id"));
-                sp.setActivo(rs.getBoolean("activo"));
-                sp.setCreadoEn(rs.getTimestamp("creado_en"));
-                sp.setActualizadoEn(rs.getTimestamp("actualizado_en"));
-
-                list.add(sp);
+                list.add(mapResultSetToSpecies(rs));
+            }
+
+        } catch (SQLException e) {
+            e.printStackTrace();
+        }
+
+        return list;
+    }
+
+    // Leer una página de especies activas (keyset sobre id: estable aunque haya altas entre páginas)
+    public List<TreeSpecies> findPage(int afterId, int limit) {
+        List<TreeSpecies> list = new ArrayList<>();
+        String sql = "SELECT * FROM tree_species WHERE activo = 1 AND id > ? ORDER BY id ASC LIMIT ?";
+
+        try (Connection conn = ConnectionBdd.getConexion();
+             PreparedStatement stmt = conn.prepareStatement(sql)) {
+
+            stmt.setInt(1, afterId);
+            stmt.setInt(2, limit);
+            try (ResultSet rs = stmt.executeQuery()) {
+                while (rs.next()) {
+                    list.add(mapResultSetToSpecies(rs));
+                }
+            }
+
+        } catch (SQLException e) {
+            e.printStackTrace();
+        }
+
+        return list;
+    }
+
+    // Búsqueda filtrada en la base de datos; los filtros null no se aplican (keyset sobre id, como findPage).
+    // Como findAll / findPage solo devuelve especies activas salvo que se pidan también las inactivas
+    public List<TreeSpecies> search(String nameQuery, Integer zonaId, Integer estadoConservacionId,
+                                    boolean includeInactive, Timestamp createdAfter, Timestamp createdBefore,
+                                    int afterId, int limit) {
+        List<TreeSpecies> list = new ArrayList<>();
+        StringBuilder sql = new StringBuilder("SELECT * FROM tree_species WHERE id > ?");
+        List<Object> params = new ArrayList<>();
+        params.add(afterId);
+
+        if (nameQuery != null && !nameQuery.trim().isEmpty()) {
+            // La colación *_ci de la tabla ya ignora mayúsculas y acentos
+            String pattern = "%" + escapeLike(nameQuery.trim()) + "%";
+            sql.append(" AND (nombre_comun LIKE ? OR nombre_cientifico LIKE ?)");
+            params.add(pattern);
+            params.add(pattern);
+        }
+        if (zonaId != null) {
+            sql.append(" AND zona_id = ?");
+            params.add(zonaId);
+        }
+        if (estadoConservacionId != null) {
+            sql.append(" AND estado_conservacion_id = ?");
+            params.add(estadoConservacionId);
+        }
+        if (!includeInactive) {
+            sql.append(" AND activo = 1");
+        }
+        // Las especies sin fecha de creación no se descartan por el rango (igual que el cliente)
+        if (createdAfter != null) {
+            sql.append(" AND (creado_en IS NULL OR creado_en >= ?)");
+            params.add(createdAfter);
+        }
+        if (createdBefore != null) {
+            sql.append(" AND (creado_en IS NULL OR creado_en <= ?)");
+            params.add(createdBefore);
+        }
+        sql.append(" ORDER BY id ASC LIMIT ?");
+        params.add(limit);
+
+        try (Connection conn = ConnectionBdd.getConexion();
+             PreparedStatement stmt = conn.prepareStatement(sql.toString())) {
+
+            for (int i = 0; i < params.size(); i++) {
+                stmt.setObject(i + 1, params.get(i));
+            }
+            try (ResultSet rs = stmt.executeQuery()) {
+                while (rs.next()) {
+                    list.add(mapResultSetToSpecies(rs));
+                }
             }
 
         } catch (SQLException e) {
@@ -71,15 +143,7 @@ public class TreeSpeciesDAO {
             ResultSet rs = stmt.executeQuery();
 
             if (rs.next()) {
-                sp = new TreeSpecies();
-                sp.setId(rs.getInt("id"));
-                sp.setNombreComun(rs.getString("nombre_comun"));
-                sp.setNombreCientifico(rs.getString("nombre_cientifico"));
-                sp.setEstadoConservacionId(rs.getInt("estado_conservacion_id"));
-                sp.setZonaId(rs.getInt("zona_id"));
-                sp.setActivo(rs.getBoolean("activo"));
-                sp.setCreadoEn(rs.getTimestamp("creado_en"));
-                sp.setActualizadoEn(rs.getTimestamp("actualizado_en"));
+                sp = mapResultSetToSpecies(rs);
             }
 
         } catch (SQLException e) {
@@ -89,9 +153,32 @@ public class TreeSpeciesDAO {
         return sp;
     }
 
+    // Leer cambios (altas, modificaciones y bajas lógicas) desde una fecha, para sincronización incremental
+    public List<TreeSpecies> findModifiedSince(Timestamp since) {
+        List<TreeSpecies> list = new ArrayList<>();
+        String sql = "SELECT * FROM tree_species WHERE COALESCE(actualizado_en, creado_en) >= ? "
+                   + "ORDER BY COALESCE(actualizado_en, creado_en) ASC, id ASC";
+
+        try (Connection conn = ConnectionBdd.getConexion();
+             PreparedStatement stmt = conn.prepareStatement(sql)) {
+
+            stmt.setTimestamp(1, since);
+            try (ResultSet rs = stmt.executeQuery()) {
+                while (rs.next()) {
+                    list.add(mapResultSetToSpecies(rs));
+                }
+            }
+
+        } catch (SQLException e) {
+            e.printStackTrace();
+        }
+
+        return list;
+    }
+
     // Actualizar
     public void update(TreeSpecies sp) {
-        String sql = "UPDATE tree_species SET nombre_comun = ?, nombre_cientifico = ?, estado_conservacion_id = ?, zona_id = ?, activo = ? WHERE id = ?";
+        String sql = "UPDATE tree_species SET nombre_comun = ?, nombre_cientifico = ?, estado_conservacion_id = ?, zona_id = ?, activo = ?, actualizado_en = CURRENT_TIMESTAMP WHERE id = ?";
 
         try (Connection conn = ConnectionBdd.getConexion();
              PreparedStatement stmt = conn.prepareStatement(sql)) {
@@ -111,7 +198,7 @@ public class TreeSpeciesDAO {
 
     // Eliminar lógico
    public void delete(int id) {
-    String sql = "UPDATE tree_species SET activo = 0 WHERE id = ?";
+    String sql = "UPDATE tree_species SET activo = 0, actualizado_en = CURRENT_TIMESTAMP WHERE id = ?";
 
     try (Connection conn = ConnectionBdd.getConexion();
          PreparedStatement stmt = conn.prepareStatement(sql)) {
@@ -172,4 +259,22 @@ public class TreeSpeciesDAO {
 
     return estados;
 }
+
+    // Escapar los comodines de LIKE para buscar el texto tal cual
+    private static String escapeLike(String text) {
+        return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_");
+    }
+
+    private TreeSpecies mapResultSetToSpecies(ResultSet rs) throws SQLException {
+        TreeSpecies sp = new TreeSpecies();
+        sp.setId(rs.getInt("id"));
+        sp.setNombreComun(rs.getString("nombre_comun"));
+        sp.setNombreCientifico(rs.getString("nombre_cientifico"));
+        sp.setEstadoConservacionId(rs.getInt("estado_conservacion_id"));
+        sp.setZonaId(rs.getInt("zona_id"));
+        sp.setActivo(rs.getBoolean("activo"));
+        sp.setCreadoEn(rs.getTimestamp("creado_en"));
+        sp.setActualizadoEn(rs.getTimestamp("actualizado_en"));
+        return sp;
+    }
 }
@@ -10,9 +10,12 @@ public class ZoneDAO {
 
     private static final String SELECT_ALL_ACTIVE = "SELECT * FROM zones WHERE activo = 1";
     private static final String SELECT_BY_ID = "SELECT * FROM zones WHERE id = ?";
+    private static final String SELECT_PAGE = "SELECT * FROM zones WHERE activo = 1 AND id > ? ORDER BY id ASC LIMIT ?";
+    private static final String SELECT_MODIFIED_SINCE = "SELECT * FROM zones WHERE COALESCE(actualizado_en, creado_en) >= ? "
+                                                      + "ORDER BY COALESCE(actualizado_en, creado_en) ASC, id ASC";
     private static final String INSERT = "INSERT INTO zones (nombre, tipo_bosque, area_ha, activo) VALUES (?, ?, ?, 1)";
-    private static final String UPDATE = "UPDATE zones SET nombre = ?, tipo_bosque = ?, area_ha = ? WHERE id = ?";
-    private static final String DELETE_LOGICO = "UPDATE zones SET activo = 0 WHERE id = ?";
+    private static final String UPDATE = "UPDATE zones SET nombre = ?, tipo_bosque = ?, area_ha = ?, actualizado_en = CURRENT_TIMESTAMP WHERE id = ?";
+    private static final String DELETE_LOGICO = "UPDATE zones SET activo = 0, actualizado_en = CURRENT_TIMESTAMP WHERE id = ?";
 
     public List<Zone> findAll() {
         List<Zone> zonas = new ArrayList<>();
@@ -53,6 +56,28 @@ public class ZoneDAO {
     return zones;
 }
 
+    // Una página de zonas activas (keyset sobre id: estable aunque haya altas entre páginas)
+    public List<Zone> findPage(int afterId, int limit) {
+        List<Zone> zonas = new ArrayList<>();
+
+        try (Connection conn = ConnectionBdd.getConexion();
+             PreparedStatement stmt = conn.prepareStatement(SELECT_PAGE)) {
+
+            stmt.setInt(1, afterId);
+            stmt.setInt(2, limit);
+            try (ResultSet rs = stmt.executeQuery()) {
+                while (rs.next()) {
+                    zonas.add(mapResultSetToZone(rs));
+                }
+            }
+
+        } catch (SQLException e) {
+            e.printStackTrace();
+        }
+
+        return zonas;
+    }
+
     public Zone findById(int id) {
         Zone zone = null;
 
@@ -73,6 +98,27 @@ public class ZoneDAO {
         return zone;
     }
 
+    // Incluye las zonas dadas de baja para que los clientes las eliminen de su caché
+    public List<Zone> findModifiedSince(Timestamp since) {
+        List<Zone> zonas = new ArrayList<>();
+
+        try (Connection conn = ConnectionBdd.getConexion();
+             PreparedStatement stmt = conn.prepareStatement(SELECT_MODIFIED_SINCE)) {
+
+            stmt.setTimestamp(1, since);
+            try (ResultSet rs = stmt.executeQuery()) {
+                while (rs.next()) {
+                    zonas.add(mapResultSetToZone(rs));
+                }
+            }
+
+        } catch (SQLException e) {
+            e.printStackTrace();
+        }
+
+        return zonas;
+    }
+
 public void insert(Zone zone) {
     try (Connection conn = ConnectionBdd.getConexion();
          PreparedStatement stmt = conn.prepareStatement(INSERT)) {
@@ -4,7 +4,6 @@
 Arquitectura modular siguiendo lineamientos PLANNING.md (<500 líneas por archivo)
 """
 
-import customtkinter as ctk
 import sys
 from pathlib import Path
 
@@ -13,12 +12,21 @@ current_dir = Path(__file__).parent
 sys.path.insert(0, str(current_dir))
 sys.path.insert(0, str(current_dir.parent))
 
-# Imports de módulos core existentes
+# El cronómetro se crea antes que cualquier import pesado para medir el arranque completo
+from utils.startup_timer import StartupTimer
+startup_timer = StartupTimer()
+
+import customtkinter as ctk
+startup_timer.marcar("import customtkinter")
+
+# Imports de módulos core existentes (zeep/lxml se importan en la primera llamada remota)
 from core.soap_client import SOAPClientManager
 from core.data_manager import DataManager
+startup_timer.marcar("import core")
 
 # Imports de UI modular refactorizada
 from ui.main_window import MainWindow
+startup_timer.marcar("import ui")
 
 # Configuración del tema moderno
 ctk.set_appearance_mode("dark")
@@ -32,13 +40,18 @@ class ForestManagementClient:
         """Inicializar cliente con arquitectura modular"""
         # Inicializar componentes core
         self.soap_client = SOAPClientManager()
-        self.data_manager = DataManager()  # DataManager uses its own SOAP client with zeep
+        # DataManager uses its own SOAP client with zeep; it connects in the background
+        # once the window is shown (MainWindow.conectar_servicios), never here
+        self.data_manager = DataManager()
+        startup_timer.marcar("core services")
         
         # Configurar ventana principal con arquitectura modular
         self.main_window = MainWindow(
             soap_client=self.soap_client,
-            data_manager=self.data_manager
+            data_manager=self.data_manager,
+            startup_timer=startup_timer
         )
+        startup_timer.marcar("main window shell")
         
         # Mostrar mensaje de inicio
         self.main_window.logger.success("🌟 Forest Management System Ready!")
@@ -0,0 +1,144 @@
+"""
+⚡ Async SOAP Client
+Capa asíncrona (zeep AsyncClient) para lanzar varias operaciones SOAP en paralelo
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from .soap_deps import async_available
+from .wsdl_cache import get_default_registry, get_soap_client
+
+logger = logging.getLogger(__name__)
+
+# Una llamada se describe como (servicio, operación, *argumentos)
+SOAPCall = Tuple[Any, ...]
+
+
+class AsyncSOAPClient:
+    """
+    Cliente SOAP asíncrono con API de tipo gather.
+
+    Con httpx instalado usa el zeep.AsyncClient del registro (mismo WSDL
+    parseado y un pool httpx por host); si no, ejecuta los clientes
+    síncronos del registro en el pool de hilos del event loop, de modo que
+    las llamadas siguen solapándose en la misma ventana de ida y vuelta.
+    """
+
+    def __init__(self, service_urls: Dict[str, str]):
+        """
+        Args:
+            service_urls: Nombre lógico del servicio -> URL del WSDL
+                          (p. ej. {'species': ..., 'zones': ...})
+        """
+        self.service_urls = dict(service_urls)
+        self._clients: Dict[str, Any] = {}
+        self._client_locks: Dict[str, asyncio.Lock] = {}
+
+    async def _get_client(self, service: str):
+        """Obtener (construyendo una sola vez) el cliente para un servicio lógico"""
+        url = self.service_urls[service]
+        if url in self._clients:
+            return self._clients[url]
+
+        lock = self._client_locks.setdefault(url, asyncio.Lock())
+        async with lock:
+            if url not in self._clients:
+                # Parsear el WSDL (si el registro aún no lo tiene) es síncrono: no bloquear el event loop
+                loop = asyncio.get_running_loop()
+                self._clients[url] = await loop.run_in_executor(None, self._build_client, url)
+        return self._clients[url]
+
+    def _build_client(self, url: str):
+        """Cliente asíncrono del registro (o el síncrono compartido como respaldo)"""
+        if not async_available():
+            return get_soap_client(url)
+        return get_default_registry().get_async_client(url)
+
+    async def call(self, service: str, operation: str, *args, **kwargs):
+        """
+        Invocar una operación SOAP de forma asíncrona
+
+        Args:
+            service: Nombre lógico del servicio
+            operation: Nombre de la operación SOAP
+        """
+        client = await self._get_client(service)
+        method = getattr(client.service, operation)
+
+        if async_available():
+            return await method(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(method, *args, **kwargs))
+
+    async def gather(self, calls: Dict[str, SOAPCall]) -> Dict[str, Any]:
+        """
+        Lanzar varias operaciones a la vez y esperar a todas
+
+        Args:
+            calls: Nombre del resultado -> (servicio, operación, *argumentos)
+
+        Returns:
+            Dict[str, Any]: Resultado de cada llamada, o la excepción que produjo
+        """
+        names = list(calls)
+        results = await asyncio.gather(
+            *(self.call(*calls[name]) for name in names),
+            return_exceptions=True
+        )
+        return dict(zip(names, results))
+
+    async def aclose(self):
+        """
+        Soltar los clientes
+
+        Las conexiones httpx son del pool compartido por host
+        (TransportFactory.aclose_async_sessions), así que no se cierran aquí.
+        """
+        self._clients.clear()
+
+
+class AsyncLoopRunner:
+    """
+    Event loop persistente en un hilo de fondo.
+
+    Permite a código síncrono (hilos de la UI) ejecutar corrutinas sin crear
+    un loop nuevo por llamada, conservando así las conexiones httpx abiertas.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="soap-async-loop",
+                    daemon=True
+                ).start()
+            return self._loop
+
+    def run(self, coro, timeout: Optional[float] = None):
+        """Ejecutar una corrutina en el loop de fondo y esperar su resultado"""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        return future.result(timeout)
+
+
+_default_runner: Optional[AsyncLoopRunner] = None
+_default_runner_lock = threading.Lock()
+
+
+def get_async_runner() -> AsyncLoopRunner:
+    """Runner de corrutinas compartido por la aplicación"""
+    global _default_runner
+    with _default_runner_lock:
+        if _default_runner is None:
+            _default_runner = AsyncLoopRunner()
+        return _default_runner
@@ -3,77 +3,632 @@
 Gestor de datos para el sistema forestal con operaciones CRUD completas
 """
 
+import threading
 import time
-from typing import List, Optional, Dict, Any, Callable
+from concurrent.futures import Future
+from typing import AbstractSet, List, Optional, Dict, Any, Callable, Set
+from dataclasses import dataclass, replace
 from datetime import datetime
 
-# Simulamos el cliente SOAP para desarrollo
-try:
-    from zeep import Client
-    from zeep.exceptions import Fault
-    SOAP_AVAILABLE = True
-except ImportError:
-    SOAP_AVAILABLE = False
-    Client = None
-    Fault = Exception
-
 from .models import TreeSpecies, Zone, ConservationState, SearchFilter, TipoBosque, ZoneData
+from .species_store import SpeciesRepository
+from .text_normalization import fold_query, fold_text
+from .soap_deps import soap_available, fault_types
+from .soap_stream import StreamingSOAPReader
+from .paging import PageIterator, DEFAULT_PAGE_SIZE, slice_page
+from .remote_search import search_pages, rank_by_name, remote_filterable
+from .query_planner import QueryPlanner
+from .soap_decoding import (
+    SPECIES_DECODER, ZONE_DECODER, decode_species, decode_zones,
+    decode_conservation_states, parse_datetime
+)
+from .wsdl_cache import get_soap_client, get_default_registry
+from .async_client import AsyncSOAPClient, get_async_runner
+from .task_executor import get_task_executor
+
+# Versión del contrato de sincronización incremental que entiende este cliente
+# (SYNC_SCHEMA_VERSION en CrudSpeciesService / CrudZonesService)
+SYNC_PROTOCOL_VERSION = 1
+
+# Estados de una entrada de caché
+CACHE_FRESH = "fresh"      # Se sirve sin consultar al servidor
+CACHE_STALE = "stale"      # Se sirve al instante y se refresca en segundo plano
+CACHE_EXPIRED = "expired"  # Hay que esperar a una carga del servidor
+
+# Estados de la conexión con los servicios SOAP
+CONNECTION_IDLE = "idle"              # Todavía no se ha intentado conectar
+CONNECTION_CONNECTING = "connecting"  # Parseando WSDL en segundo plano
+CONNECTION_READY = "connected"        # Clientes listos
+CONNECTION_OFFLINE = "offline"        # El último intento falló (connect() lo reintenta)
+
+# Decodificador de las lecturas masivas (getAllTreeSpecies / getAllZones)
+BULK_DECODER_ZEEP = "zeep"      # Respuesta completa como objetos zeep y luego a modelos
+BULK_DECODER_STREAM = "stream"  # lxml.iterparse directo a modelos, fila a fila
+
+
+@dataclass
+class CacheTTL:
+    """Tiempos de vida de una entidad en caché (segundos)"""
+    soft: float  # Pasado este tiempo los datos se sirven y se revalidan en segundo plano
+    hard: float  # Pasado este tiempo ya no se sirven: la lectura espera al servidor
+
+
+DEFAULT_CACHE_TTLS = {
+    'species': CacheTTL(soft=300, hard=3600),
+    'zones': CacheTTL(soft=300, hard=3600),
+    # Catálogo que casi nunca cambia
+    'conservation_states': CacheTTL(soft=1800, hard=86400),
+}
 
 
 class DataManager:
     """Gestor de datos con comunicación SOAP y cache local"""
     
-    def __init__(self, base_url: str = "http://localhost:8282"):
+    # Entidad -> (cliente, operación "modificado desde")
+    DELTA_OPERATIONS = {
+        'species': ('species_client', 'getTreeSpeciesModifiedSince'),
+        'zones': ('zone_client', 'getZonesModifiedSince'),
+    }
+    
+    # Entidad -> operación paginada (keyset sobre id)
+    PAGE_OPERATIONS = {
+        'species': 'getTreeSpeciesPage',
+        'zones': 'getZonesPage',
+    }
+    
+    def __init__(self, base_url: str = "http://localhost:8282",
+                 species_client=None, zone_client=None, conservation_client=None,
+                 executor=None, cache_ttls: Optional[Dict[str, CacheTTL]] = None,
+                 stale_while_revalidate: bool = True, connect_on_init: bool = False,
+                 bulk_decoder: str = BULK_DECODER_ZEEP):
+        """
+        Args:
+            base_url: URL base de los servicios
+            species_client, zone_client, conservation_client: Clientes ya creados
+                (p. ej. un doble de pruebas); si se indican no se conecta por SOAP
+            executor: TaskExecutor para la reconciliación en segundo plano (por defecto el compartido)
+            cache_ttls: TTL blando/duro por entidad; se combinan con DEFAULT_CACHE_TTLS
+            stale_while_revalidate: Servir datos caducados (antes del TTL duro) mientras se refrescan
+            connect_on_init: Empezar a conectar en segundo plano al construir; si no, la
+                conexión se inicia con connect() o con el primer uso de un cliente
+            bulk_decoder: BULK_DECODER_ZEEP o BULK_DECODER_STREAM para las cargas completas
+        """
         self.base_url = base_url
         self.client = None
+        self._species_client = species_client
+        self._zone_client = zone_client
+        self._conservation_client = conservation_client
+        self._async_client = None
         self.species_cache = {}
+        self.species_repository = SpeciesRepository()
         self.zones_cache = {}
+        self.zone_name_keys: Dict[int, str] = {}  # ID de zona -> nombre normalizado
         self.conservation_states_cache = {}
         self.cache_timestamp = {}
-        self.cache_ttl = 300  # 5 minutos
+        self.cache_ttls: Dict[str, CacheTTL] = {**DEFAULT_CACHE_TTLS, **(cache_ttls or {})}
+        self.stale_while_revalidate = stale_while_revalidate
+        self._forced_stale: Set[str] = set()
+        self._data_callbacks: List[Callable[[str, Any], None]] = []
+        self.sync_watermarks: Dict[str, datetime] = {}  # Última fecha de modificación vista por entidad
+        self._delta_support: Dict[str, bool] = {}
+        self._paging_support: Dict[str, bool] = {}
+        self._search_supported: Optional[bool] = None  # searchTreeSpecies en el servidor
+        # Decide en cada búsqueda entre la caché, el resultado anterior o searchTreeSpecies
+        self.query_planner = QueryPlanner(
+            self.species_repository,
+            cache_state=lambda: self._cache_state('species', self.species_cache),
+            load_all=self.get_species,
+            remote_search=self._remote_search,
+            remote_available=lambda: self._search_supported is not False,
+        )
+        self._sync_lock = threading.RLock()
+        self._executor = executor
+        self.bulk_decoder = bulk_decoder
+        # Registros creados localmente a la espera de que el servidor confirme su ID real
+        self._provisional_ids: Dict[str, Set[int]] = {'species': set(), 'zones': set()}
+        self._next_provisional_id = -1
         
         # URLs de los servicios SOAP actualizadas para coincidir con los servicios ejecutándose
         self.species_service_url = "http://localhost:8282/TreeSpeciesCrudService?wsdl"
         self.zone_service_url = "http://localhost:8081/SistemaForestalFinal/ZoneCrudService?wsdl" 
         self.conservation_service_url = "http://localhost:8282/TreeSpeciesCrudService?wsdl"  # Conservation states from species service
         
-        self._init_soap_clients()
+        # Conexión: un Future por intento, resuelto con True (conectado) o False
+        self._connection_lock = threading.Lock()
+        self._ready: Optional[Future] = None
+        self._connection_callbacks: List[Callable[[str], None]] = []
+        self.connection_state = CONNECTION_IDLE
+        self.connection_error: Optional[Exception] = None
+        
+        if species_client or zone_client or conservation_client:
+            # Clientes inyectados: listos desde el principio
+            self._ready = Future()
+            self._ready.set_result(True)
+            self.connection_state = CONNECTION_READY
+        elif connect_on_init:
+            self.connect()
+    
+    # ===========================================
+    # CONEXIÓN EN SEGUNDO PLANO
+    # ===========================================
+    
+    def connect(self, force: bool = False) -> Future:
+        """
+        Conectar con los servicios SOAP sin bloquear al llamador
+        
+        Si ya hay un intento en curso, o la conexión está lista y no se fuerza,
+        se devuelve ese mismo Future. Tras un intento fallido se vuelve a probar.
+        
+        Args:
+            force: Reconectar aunque ya haya conexión (vuelve a leer los WSDL)
+        
+        Returns:
+            Future: Se resuelve con True si hay clientes listos, False si no
+        """
+        with self._connection_lock:
+            ready = self._ready
+            if ready is not None and (not ready.done() or (ready.result() and not force)):
+                return ready
+            self._ready = ready = Future()
+            ready.set_running_or_notify_cancel()
+        
+        self._set_connection_state(CONNECTION_CONNECTING)
+        threading.Thread(
+            target=self._connect_worker, args=(ready, force),
+            name="soap-connect", daemon=True
+        ).start()
+        return ready
     
-    def _init_soap_clients(self):
-        """Inicializa los clientes SOAP"""
-        if not SOAP_AVAILABLE:
+    def reconnect(self) -> Future:
+        """Volver a conectar (p. ej. tras reiniciar los servicios) sin reiniciar la aplicación"""
+        return self.connect(force=True)
+    
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Esperar a que termine la conexión, iniciándola si nunca se intentó
+        
+        En el hilo principal no espera: la UI nunca se bloquea por la red y
+        simplemente ve los clientes que haya en ese momento.
+        
+        Returns:
+            bool: True si los clientes están listos
+        """
+        with self._connection_lock:
+            ready = self._ready
+        if ready is None:
+            ready = self.connect()
+        if threading.current_thread() is threading.main_thread() and not ready.done():
+            return False
+        try:
+            return bool(ready.result(timeout))
+        except Exception:
+            return False
+    
+    @property
+    def ready(self) -> Optional[Future]:
+        """Future del intento de conexión actual (None si nunca se intentó)"""
+        return self._ready
+    
+    def is_ready(self) -> bool:
+        return self.connection_state == CONNECTION_READY
+    
+    def add_connection_callback(self, callback: Callable[[str], None]):
+        """Recibir los cambios de estado de la conexión (se llaman desde el hilo que conecta)"""
+        self._connection_callbacks.append(callback)
+    
+    def _set_connection_state(self, state: str):
+        self.connection_state = state
+        for callback in self._connection_callbacks:
+            try:
+                callback(state)
+            except Exception as e:
+                print(f"Error en callback de conexión: {e}")
+    
+    def _connect_worker(self, ready: Future, force: bool):
+        try:
+            if force:
+                self._discard_soap_clients()
+            connected = self._init_soap_clients()
+        except Exception as e:
+            self.connection_error = e
+            connected = False
+        if connected:
+            # Lo leído antes de esta conexión (o con otro servidor) se vuelve a sincronizar
+            for cache_key in self.cache_ttls:
+                self._mark_stale(cache_key)
+        self._set_connection_state(CONNECTION_READY if connected else CONNECTION_OFFLINE)
+        ready.set_result(connected)
+    
+    def _discard_soap_clients(self):
+        """Olvidar los clientes parseados para que la reconexión vuelva a leer los WSDL"""
+        registry = get_default_registry()
+        for url in {self.species_service_url, self.zone_service_url, self.conservation_service_url}:
+            registry.invalidate(url)
+        async_client, self._async_client = self._async_client, None
+        if async_client is not None:
+            try:
+                get_async_runner().run(async_client.aclose(), timeout=5)
+            except Exception:
+                pass
+    
+    def _init_soap_clients(self) -> bool:
+        """
+        Inicializa los clientes SOAP (en el hilo de conexión)
+        
+        Returns:
+            bool: True si los tres clientes quedaron listos
+        """
+        if not soap_available():
             print("⚠️  SOAP no disponible - modo simulación")
-            return
+            return False
         
         try:
-            self.species_client = Client(self.species_service_url)
-            self.zone_client = Client(self.zone_service_url)
-            self.conservation_client = Client(self.conservation_service_url)
+            # El registro compartido parsea cada WSDL una sola vez por proceso
+            # (species y conservation comparten endpoint y por tanto cliente)
+            self._species_client = get_soap_client(self.species_service_url)
+            self._zone_client = get_soap_client(self.zone_service_url)
+            self._conservation_client = get_soap_client(self.conservation_service_url)
+            self._async_client = AsyncSOAPClient({
+                'species': self.species_service_url,
+                'zones': self.zone_service_url,
+                'conservation_states': self.conservation_service_url,
+            })
+            self.connection_error = None
             print("✅ Clientes SOAP inicializados")
+            return True
         except Exception as e:
             print(f"⚠️  Error al conectar con SOAP: {e}")
-            self.species_client = None
-            self.zone_client = None
-            self.conservation_client = None
+            self.connection_error = e
+            self._species_client = None
+            self._zone_client = None
+            self._conservation_client = None
+            self._async_client = None
+            return False
+    
+    # Los clientes esperan a la conexión en curso (o la inician) al usarse desde un hilo de trabajo
+    @property
+    def species_client(self):
+        self.wait_until_ready()
+        return self._species_client
+    
+    @property
+    def zone_client(self):
+        self.wait_until_ready()
+        return self._zone_client
+    
+    @property
+    def conservation_client(self):
+        self.wait_until_ready()
+        return self._conservation_client
+    
+    @property
+    def async_client(self):
+        self.wait_until_ready()
+        return self._async_client
+    
+    @property
+    def executor(self):
+        # Se resuelve en cada uso: la ventana principal reemplaza el executor compartido al arrancar
+        return self._executor or get_task_executor()
+    
+    def add_data_callback(self, callback: Callable[[str, Any], None]):
+        """Añadir callback para notificaciones de datos"""
+        self._data_callbacks.append(callback)
+    
+    def add_data_change_callback(self, callback: Callable[[str, Any], None]):
+        """Alias para add_data_callback para compatibilidad"""
+        self.add_data_callback(callback)
+    
+    def _notify_data_change(self, event_type: str, data: Any = None):
+        """Notificar cambios de datos a todos los callbacks registrados"""
+        for callback in self._data_callbacks:
+            try:
+                callback(event_type, data)
+            except Exception as e:
+                print(f"Error in data change callback: {e}")
+    
+    def set_cache_ttl(self, cache_key: str, soft: float, hard: float):
+        """Configura los TTL blando y duro de una entidad"""
+        if hard < soft:
+            raise ValueError("hard TTL must be greater than or equal to soft TTL")
+        self.cache_ttls[cache_key] = CacheTTL(soft=soft, hard=hard)
+    
+    def _cache_state(self, cache_key: str, cache: dict) -> str:
+        """Estado de una entrada: CACHE_FRESH, CACHE_STALE o CACHE_EXPIRED"""
+        if cache_key not in cache or cache_key not in self.cache_timestamp:
+            return CACHE_EXPIRED
+        ttl = self.cache_ttls[cache_key]
+        age = time.time() - self.cache_timestamp[cache_key]
+        if age >= ttl.hard:
+            return CACHE_EXPIRED
+        if age >= ttl.soft or cache_key in self._forced_stale:
+            return CACHE_STALE if self.stale_while_revalidate else CACHE_EXPIRED
+        return CACHE_FRESH
     
     def _is_cache_valid(self, cache_key: str) -> bool:
         """Verifica si el cache está válido"""
-        if cache_key not in self.cache_timestamp:
+        if cache_key not in self.cache_timestamp or cache_key in self._forced_stale:
             return False
-        return (time.time() - self.cache_timestamp[cache_key]) < self.cache_ttl
+        return (time.time() - self.cache_timestamp[cache_key]) < self.cache_ttls[cache_key].soft
+    
+    def _touch(self, cache_key: str):
+        """Marca la entrada como recién cargada"""
+        self.cache_timestamp[cache_key] = time.time()
+        self._forced_stale.discard(cache_key)
+    
+    def _cached_or_revalidate(self, cache_key: str, cache: dict, force_refresh: bool = False):
+        """
+        Política stale-while-revalidate
+        
+        Returns:
+            Optional[list]: Los datos en caché si se pueden servir ya (refrescándolos en
+            segundo plano si están caducados), o None si hay que cargarlos ahora
+        """
+        if force_refresh:
+            return None
+        state = self._cache_state(cache_key, cache)
+        if state == CACHE_EXPIRED:
+            return None
+        data = cache[cache_key]  # Antes de programar: la revalidación puede reemplazarlo
+        if state == CACHE_STALE:
+            self._schedule_revalidate(cache_key)
+        return data
+    
+    def _schedule_revalidate(self, cache_key: str):
+        """Refresca la entidad en segundo plano y avisa a los listeners al terminar"""
+        client_attr = 'conservation_client' if cache_key == 'conservation_states' else self.DELTA_OPERATIONS[cache_key][0]
+        if not getattr(self, client_attr):
+            return
+        self.executor.submit(
+            self._revalidate, cache_key,
+            key=f"revalidate:{cache_key}",
+            on_success=lambda data: self._notify_data_change(f"{cache_key}_refreshed", data),
+            on_error=lambda e: print(f"⚠️  Error al revalidar {cache_key}: {e}")
+        )
+    
+    def _revalidate(self, cache_key: str) -> list:
+        """Carga en segundo plano (hilo de trabajo); propaga los errores para no notificar datos viejos"""
+        if cache_key == 'conservation_states':
+            response = self.conservation_client.service.getAllConservationStates()
+            states = self._convert_soap_response_to_conservation_states(response)
+            self.conservation_states_cache[cache_key] = states
+            self._touch(cache_key)
+            return states
+        return self._reconcile(cache_key)
     
     def _invalidate_cache(self, cache_key: str):
         """Invalida el cache específico"""
         if cache_key in self.cache_timestamp:
             del self.cache_timestamp[cache_key]
+        self._forced_stale.discard(cache_key)
+        self.sync_watermarks.pop(cache_key, None)
+        self._provisional_ids.get(cache_key, set()).clear()
         
         if cache_key == 'species' and 'species' in self.species_cache:
             del self.species_cache['species']
+            self.species_repository.load([])
         elif cache_key == 'zones' and 'zones' in self.zones_cache:
             del self.zones_cache['zones']
         elif cache_key == 'conservation_states' and 'conservation_states' in self.conservation_states_cache:
             del self.conservation_states_cache['conservation_states']
     
+    def _mark_stale(self, cache_key: str):
+        """Fuerza a sincronizar en la próxima lectura conservando los datos (y la marca de agua)"""
+        self._forced_stale.add(cache_key)
+    
+    # ===========================================
+    # SINCRONIZACIÓN INCREMENTAL
+    # ===========================================
+    
+    def _delta_supported(self, cache_key: str) -> bool:
+        """Comprueba (una vez por servicio) que el servidor habla el mismo contrato de sincronización"""
+        if cache_key in self._delta_support:
+            return self._delta_support[cache_key]
+        
+        client = getattr(self, self.DELTA_OPERATIONS[cache_key][0])
+        if not client:
+            return False
+        try:
+            version = client.service.getSyncVersion()
+        except (AttributeError,) + fault_types():
+            # Servidor anterior sin la operación: siempre carga completa
+            supported = False
+        except Exception as e:
+            # Error de red: no recordar el resultado, se reintenta en la próxima sincronización
+            print(f"⚠️  No se pudo consultar la versión de sincronización de {cache_key}: {e}")
+            return False
+        else:
+            supported = version == SYNC_PROTOCOL_VERSION
+            if not supported:
+                print(f"⚠️  Versión de sincronización de {cache_key} incompatible "
+                      f"({version} != {SYNC_PROTOCOL_VERSION}) - se usará carga completa")
+        
+        self._delta_support[cache_key] = supported
+        return supported
+    
+    def _fetch_plan(self, cache_key: str, force_refresh: bool = False):
+        """
+        Decide cómo refrescar una entidad
+        
+        Returns:
+            Tuple[str, tuple, Callable]: (operación SOAP, argumentos, función que aplica la respuesta)
+        """
+        full_operation = 'getAllTreeSpecies' if cache_key == 'species' else 'getAllZones'
+        if force_refresh:
+            # La recarga forzada también vuelve a comprobar la versión del servidor
+            self._delta_support.pop(cache_key, None)
+            return full_operation, (), self._apply_full
+        
+        watermark = self.sync_watermarks.get(cache_key)
+        if watermark is not None and self._delta_supported(cache_key):
+            return self.DELTA_OPERATIONS[cache_key][1], (watermark,), self._apply_delta
+        return full_operation, (), self._apply_full
+    
+    def _sync_entity(self, cache_key: str, force_refresh: bool = False,
+                     drop_ids: AbstractSet[int] = frozenset()) -> list:
+        """
+        Refresca una entidad con una consulta incremental si es posible, o completa si no
+        
+        Args:
+            drop_ids: Registros provisionales ya confirmados; se retiran al publicar el resultado
+        """
+        client = getattr(self, self.DELTA_OPERATIONS[cache_key][0])
+        with self._sync_lock:
+            operation, args, apply = self._fetch_plan(cache_key, force_refresh)
+            try:
+                response = self._call_operation(client, operation, args)
+            except (AttributeError,) + fault_types() as e:
+                if apply is not self._apply_delta:
+                    raise
+                # La operación incremental desapareció del servidor: recarga completa
+                print(f"⚠️  Sincronización incremental de {cache_key} no disponible: {e}")
+                self._delta_support[cache_key] = False
+                operation, args, apply = self._fetch_plan(cache_key)
+                response = self._call_operation(client, operation, args)
+            return apply(cache_key, response, drop_ids)
+    
+    def _streams(self, client, operation: str, args: tuple) -> bool:
+        """Indica si la operación se lee con el decodificador en streaming"""
+        return (self.bulk_decoder == BULK_DECODER_STREAM and not args
+                and StreamingSOAPReader.supports(client, operation))
+    
+    def _call_operation(self, client, operation: str, args: tuple):
+        """
+        Invocar una operación SOAP; las lecturas masivas pueden ir por streaming
+        
+        El streaming devuelve ya la lista de modelos, que los conversores
+        aceptan tal cual. Si lxml falta o el XML no se puede leer en
+        streaming, se repite por zeep.
+        """
+        if self._streams(client, operation, args):
+            try:
+                return StreamingSOAPReader(client).fetch(operation)
+            except (ImportError, SyntaxError) as e:
+                print(f"⚠️  Lectura en streaming de {operation} no disponible, se usa zeep: {e}")
+        return getattr(client.service, operation)(*args)
+    
+    def _apply_full(self, cache_key: str, response, drop_ids: AbstractSet[int] = frozenset()) -> list:
+        """
+        Reemplaza la entidad con una carga completa y fija la marca de agua
+        
+        La carga completa ya no contiene los registros provisionales (`drop_ids`
+        incluidos): desaparecen en el mismo paso que publica los del servidor.
+        """
+        if cache_key == 'species':
+            items = self._convert_soap_response_to_species(response)
+            self._store_species(items)
+            result = self.species_cache['species']
+        else:
+            items = self._convert_soap_response_to_zones(response)
+            self._store_zones(items)
+            result = items
+        self._set_watermark(cache_key, items)
+        return result
+    
+    def _apply_delta(self, cache_key: str, response, drop_ids: AbstractSet[int] = frozenset()) -> list:
+        """
+        Fusiona los registros cambiados; los inactivos (bajas lógicas) se eliminan de la caché
+        
+        Los provisionales de `drop_ids` se retiran en el mismo paso, para que
+        ningún lector vea a la vez el alta provisional y la confirmada.
+        """
+        if cache_key == 'species':
+            changed = self._convert_soap_response_to_species(response)
+            removed = [species.id for species in changed if not species.activo]
+            self.species_repository.apply_changes(
+                [species for species in changed if species.activo], removed + list(drop_ids)
+            )
+            self.species_cache['species'] = self.species_repository.all()
+            self._touch('species')
+            result = self.species_cache['species']
+        else:
+            changed = self._convert_soap_response_to_zones(response)
+            merged = {zone.id: zone for zone in self.zones_cache.get('zones', [])}
+            for zone in changed:
+                if zone.activo:
+                    merged[zone.id] = zone
+                else:
+                    merged.pop(zone.id, None)
+            for zone_id in drop_ids:
+                merged.pop(zone_id, None)
+            result = list(merged.values())
+            self._store_zones(result)
+        
+        if changed:
+            print(f"🔄 {cache_key}: {len(changed)} cambios sincronizados")
+        self._set_watermark(cache_key, changed)
+        return result
+    
+    def _set_watermark(self, cache_key: str, items: list):
+        """Avanza la marca de agua hasta la fecha de modificación más reciente de `items`"""
+        if cache_key == 'species':
+            stamps = [s.fechaModificacion or s.fechaCreacion for s in items]
+        else:
+            stamps = [z.fecha_modificacion or z.fecha_creacion for z in items]
+        stamps = [s for s in stamps if s is not None]
+        if not stamps:
+            return
+        latest = max(stamps)
+        current = self.sync_watermarks.get(cache_key)
+        if current is None or latest > current:
+            self.sync_watermarks[cache_key] = latest
+    
+    # ===========================================
+    # ESCRITURA DIRECTA EN CACHE Y RECONCILIACIÓN
+    # ===========================================
+    
+    def _schedule_reconcile(self, cache_key: str):
+        """Verifica en segundo plano contra el servidor los cambios ya aplicados en la caché"""
+        if not getattr(self, self.DELTA_OPERATIONS[cache_key][0]):
+            return
+        self.executor.submit(
+            self._reconcile, cache_key,
+            on_success=lambda data: self._notify_data_change(f"{cache_key}_refreshed", data),
+            on_error=lambda e: print(f"⚠️  Error al reconciliar {cache_key}: {e}")
+        )
+    
+    def _reconcile(self, cache_key: str) -> list:
+        """Sincroniza la entidad y retira los registros provisionales que el servidor ya confirmó"""
+        with self._sync_lock:
+            # Solo los provisionales existentes ahora: sus altas ya se completaron en el servidor
+            confirmed = set(self._provisional_ids[cache_key])
+            try:
+                result = self._sync_entity(cache_key, drop_ids=confirmed)
+            except Exception:
+                self._mark_stale(cache_key)
+                raise
+            self._provisional_ids[cache_key] -= confirmed
+            return result
+    
+    def _new_provisional_id(self, cache_key: str) -> int:
+        """ID negativo temporal para un alta cuyo ID real aún no se conoce"""
+        with self._sync_lock:
+            provisional_id = self._next_provisional_id
+            self._next_provisional_id -= 1
+            self._provisional_ids[cache_key].add(provisional_id)
+            return provisional_id
+    
+    def is_provisional(self, cache_key: str, item_id: Optional[int]) -> bool:
+        """Indica si un registro es un alta local todavía no confirmada por el servidor"""
+        return item_id in self._provisional_ids.get(cache_key, ())
+    
+    def _reject_provisional(self, name: str, callback: Callable = None) -> bool:
+        """Rechaza operaciones sobre un alta cuyo ID real aún no llegó del servidor"""
+        message = f"'{name}' is still being saved, please try again in a moment"
+        print(f"⚠️  {message}")
+        if callback:
+            callback(False, message)
+        return False
+    
+    @staticmethod
+    def _returned_id(response) -> Optional[int]:
+        """ID asignado por el servidor si la operación lo devuelve (los servicios actuales devuelven boolean)"""
+        if isinstance(response, bool):
+            return None
+        if isinstance(response, int):
+            return response if response > 0 else None
+        return getattr(response, 'id', None)
+    
     # ===========================================
     # OPERACIONES DE ESPECIES
     # ===========================================
@@ -82,20 +637,18 @@ class DataManager:
         """Obtiene todas las especies de árboles"""
         cache_key = 'species'
         
-        if not force_refresh and self._is_cache_valid(cache_key) and cache_key in self.species_cache:
-            return self.species_cache[cache_key]
+        cached = self._cached_or_revalidate(cache_key, self.species_cache, force_refresh)
+        if cached is not None:
+            return cached
         
         try:
             if self.species_client:
-                response = self.species_client.service.getAllTreeSpecies()
-                species_list = self._convert_soap_response_to_species(response)
-            else:
-                print("⚠️  SOAP client not available - cannot load species")
-                species_list = []
+                return self._sync_entity(cache_key, force_refresh)
             
-            self.species_cache[cache_key] = species_list
-            self.cache_timestamp[cache_key] = time.time()
-            return species_list
+            # Sin cliente (conectando o sin conexión) no se guarda nada: una lista
+            # vacía quedaría como "fresca" y ocultaría los datos al conectar
+            print("⚠️  SOAP client not available - cannot load species")
+            return self.species_cache.get(cache_key, [])
             
         except Exception as e:
             print(f"❌ Error al obtener especies: {e}")
@@ -112,13 +665,18 @@ class DataManager:
                     zonaId=species.zonaId
                 )
                 success = bool(response)  # SOAP returns boolean directly
+                created_id = self._returned_id(response)
             else:
                 # Simulación
                 success = True
+                created_id = None
                 print(f"✅ Especie simulada creada: {species.nombreComun}")
             
             if success:
-                self._invalidate_cache('species')
+                # createTreeSpecies devuelve un boolean: sin ID real se usa uno provisional
+                # y la reconciliación lo sustituye por el registro del servidor
+                self._apply_species_creation(species, created_id)
+                self._schedule_reconcile('species')
             
             if callback:
                 message = f"Species '{species.nombreComun}' created successfully!" if success else "Failed to create species"
@@ -134,6 +692,8 @@ class DataManager:
     
     def update_species(self, species: TreeSpecies, callback: Callable = None) -> bool:
         """Actualiza una especie existente"""
+        if self.is_provisional('species', species.id):
+            return self._reject_provisional(species.nombreComun, callback)
         try:
             if self.species_client and species.id:
                 response = self.species_client.service.updateTreeSpecies(
@@ -151,7 +711,8 @@ class DataManager:
                 print(f"✅ Especie simulada actualizada: {species.nombreComun}")
             
             if success:
-                self._invalidate_cache('species')
+                self._apply_species_update(species)
+                self._schedule_reconcile('species')
             
             if callback:
                 message = f"Species '{species.nombreComun}' updated successfully!" if success else "Failed to update species"
@@ -167,6 +728,8 @@ class DataManager:
     
     def delete_species(self, species_id: int, callback: Callable = None) -> bool:
         """Elimina una especie (soft delete)"""
+        if self.is_provisional('species', species_id):
+            return self._reject_provisional(f"ID {species_id}", callback)
         try:
             if self.species_client:
                 response = self.species_client.service.deleteTreeSpecies(id=species_id)
@@ -177,7 +740,9 @@ class DataManager:
                 print(f"✅ Especie simulada eliminada: ID {species_id}")
             
             if success:
-                self._invalidate_cache('species')
+                # El servicio solo lista especies activas: tras el soft delete deja de aparecer
+                self._apply_species_removal(species_id)
+                self._schedule_reconcile('species')
             
             if callback:
                 message = f"Species deleted successfully!" if success else "Failed to delete species"
@@ -192,25 +757,50 @@ class DataManager:
             return False
     
     def search_species(self, filter: SearchFilter) -> List[TreeSpecies]:
-        """Busca especies con filtros"""
+        """Busca especies con filtros (el planificador elige caché local o servidor; ver query_planner.explain())"""
         try:
-            if self.species_client:
-                response = self.species_client.service.searchSpecies(
-                    nameQuery=filter.name_query or "",
-                    zoneId=filter.zone_id or 0,
-                    conservationStateId=filter.conservation_state_id or 0,
-                    activeOnly=filter.active_only if filter.active_only is not None else True
-                )
-                return self._convert_soap_response_to_species(response)
-            else:
-                # Simulación con filtrado local
-                all_species = self.get_species()
-                return self._filter_species_locally(all_species, filter)
+            return self.query_planner.search(filter)
                 
         except Exception as e:
             print(f"❌ Error en búsqueda: {e}")
             return []
     
+    def iter_search_pages(self, filter: SearchFilter, page_size: int = DEFAULT_PAGE_SIZE) -> PageIterator:
+        """
+        Resultados de una búsqueda avanzada página a página
+        
+        El servidor aplica todos los filtros del SearchFilter y solo envía las
+        especies que coinciden; sin searchTreeSpecies (servidor anterior) o con
+        un rango de fecha de modificación se filtra la caché local con los
+        índices del repositorio.
+        """
+        pages = self._remote_search_pages(filter, page_size)
+        if pages is not None:
+            return pages
+        
+        self.get_species()
+        return PageIterator.from_items(self.species_repository.filter(filter))
+    
+    def _remote_search_pages(self, filter: SearchFilter, page_size: int) -> Optional[PageIterator]:
+        """Páginas de searchTreeSpecies, o None si el servidor no la expone o no aplica el filtro"""
+        if self._search_supported is False or not self.species_client or not remote_filterable(filter):
+            return None
+        try:
+            pages = search_pages(self.species_client, filter, page_size)
+        except AttributeError as e:
+            print(f"⚠️  Búsqueda en el servidor no disponible: {e}")
+            self._search_supported = False
+            return None
+        self._search_supported = True
+        return pages
+    
+    def _remote_search(self, filter: SearchFilter) -> Optional[List[TreeSpecies]]:
+        """Búsqueda completa en el servidor para el planificador (None = no disponible)"""
+        pages = self._remote_search_pages(filter, DEFAULT_PAGE_SIZE)
+        if pages is None:
+            return None
+        return rank_by_name(list(pages.items()), filter.name_query)
+    
     def get_species_by_id(self, species_id: int) -> Optional[TreeSpecies]:
         """Busca una especie específica por ID usando SOAP"""
         try:
@@ -224,11 +814,11 @@ class DataManager:
                     return None
             else:
                 # Simulación: buscar en cache local
-                all_species = self.get_species()
-                for species in all_species:
-                    if species.id == species_id:
-                        print(f"✅ Species found (simulated): {species.nombreComun}")
-                        return species
+                self.get_species()
+                species = self.species_repository.get(species_id)
+                if species:
+                    print(f"✅ Species found (simulated): {species.nombreComun}")
+                    return species
                 print(f"⚠️  No species found with ID: {species_id} (simulated)")
                 return None
                 
@@ -242,31 +832,16 @@ class DataManager:
             if not name_query or not name_query.strip():
                 return []
             
-            name_query = name_query.strip().lower()
-            all_species = self.get_species()
-            
-            if not all_species:
-                print("⚠️  No species available for search")
-                return []
-            
-            matching_species = []
-            
-            for species in all_species:
-                # Check common name
-                common_name = (species.nombreComun or "").lower()
-                # Check scientific name
-                scientific_name = (species.nombreCientifico or "").lower()
-                
-                if exact_match:
-                    # Exact match search
-                    if (common_name == name_query or 
-                        scientific_name == name_query):
-                        matching_species.append(species)
-                else:
-                    # Partial match search
-                    if (name_query in common_name or 
-                        name_query in scientific_name):
-                        matching_species.append(species)
+            name_query = name_query.strip()
+            if exact_match:
+                if not self.get_species():
+                    print("⚠️  No species available for search")
+                    return []
+                # El repositorio ya guarda los nombres normalizados (sin acentos ni mayúsculas)
+                matching_species = self.species_repository.search_by_name(name_query, exact_match)
+            else:
+                # Solo especies activas, como las que trae getAllTreeSpecies a la caché
+                matching_species = self.query_planner.search(SearchFilter(name_query=name_query, active_only=True))
             
             print(f"✅ Found {len(matching_species)} species matching '{name_query}'")
             return matching_species
@@ -275,18 +850,21 @@ class DataManager:
             print(f"❌ Error searching species by name '{name_query}': {e}")
             return []
     
+    def refine_species_search(self, name_query: str, previous: List[TreeSpecies]) -> List[TreeSpecies]:
+        """
+        Refinar localmente un resultado de search_species_by_name
+
+        Para consultas que extienden la anterior ("gua" -> "guay"): solo se
+        verifican las especies de `previous`, con el mismo orden de relevancia.
+        """
+        if not name_query or not name_query.strip():
+            return []
+        return self.species_repository.refine_by_name(name_query.strip(), previous)
+    
     def _convert_single_species_response(self, response) -> TreeSpecies:
         """Convierte respuesta SOAP individual a objeto TreeSpecies"""
         try:
-            # Handle the response based on the SOAP service structure
-            return TreeSpecies(
-                id=getattr(response, 'id', 0),
-                nombreComun=getattr(response, 'nombreComun', ''),
-                nombreCientifico=getattr(response, 'nombreCientifico', None),
-                estadoConservacionId=getattr(response, 'estadoConservacionId', None),
-                zonaId=getattr(response, 'zonaId', None),
-                activo=getattr(response, 'activo', True)
-            )
+            return SPECIES_DECODER.decode(response)
         except Exception as e:
             print(f"❌ Error converting single species response: {e}")
             return None
@@ -299,20 +877,16 @@ class DataManager:
         """Obtiene todas las zonas"""
         cache_key = 'zones'
         
-        if not force_refresh and self._is_cache_valid(cache_key) and cache_key in self.zones_cache:
-            return self.zones_cache[cache_key]
+        cached = self._cached_or_revalidate(cache_key, self.zones_cache, force_refresh)
+        if cached is not None:
+            return cached
         
         try:
             if self.zone_client:
-                response = self.zone_client.service.getAllZones()
-                zones_list = self._convert_soap_response_to_zones(response)
-            else:
-                print("⚠️  SOAP client not available - cannot load zones")
-                zones_list = []
+                return self._sync_entity(cache_key, force_refresh)
             
-            self.zones_cache[cache_key] = zones_list
-            self.cache_timestamp[cache_key] = time.time()
-            return zones_list
+            print("⚠️  SOAP client not available - cannot load zones")
+            return self.zones_cache.get(cache_key, [])
             
         except Exception as e:
             print(f"❌ Error al obtener zonas: {e}")
@@ -337,7 +911,10 @@ class DataManager:
                 success = False
             
             if success:
-                self._invalidate_cache('zones')
+                # ZoneDAO.insert siempre crea la zona activa
+                zone_id = self._returned_id(response) or self._new_provisional_id('zones')
+                self._apply_zone_change(replace(zone_data, id=zone_id, activo=True))
+                self._schedule_reconcile('zones')
             
             if callback:
                 message = f"Zone '{zone_data.nombre}' created successfully!" if success else "Failed to create zone"
@@ -354,6 +931,8 @@ class DataManager:
     
     def update_zone(self, zone_data: Zone, callback: Callable = None) -> bool:
         """Actualiza una zona existente usando el enum TipoBosque"""
+        if self.is_provisional('zones', zone_data.id):
+            return self._reject_provisional(zone_data.nombre, callback)
         try:
             # Convertir el enum TipoBosque a string para el SOAP
             tipo_bosque_str = zone_data.tipo_bosque.value if zone_data.tipo_bosque else TipoBosque.OTRO.value
@@ -372,7 +951,8 @@ class DataManager:
                 success = False
             
             if success:
-                self._invalidate_cache('zones')
+                self._apply_zone_change(replace(zone_data))
+                self._schedule_reconcile('zones')
             
             if callback:
                 message = f"Zone '{zone_data.nombre}' updated successfully!" if success else "Failed to update zone"
@@ -388,6 +968,8 @@ class DataManager:
     
     def delete_zone(self, zone_id: int, callback: Callable = None) -> bool:
         """Elimina una zona (soft delete)"""
+        if self.is_provisional('zones', zone_id):
+            return self._reject_provisional(f"ID {zone_id}", callback)
         try:
             if self.zone_client:
                 response = self.zone_client.service.deleteZone(id=zone_id)
@@ -397,7 +979,8 @@ class DataManager:
                 success = False
             
             if success:
-                self._invalidate_cache('zones')
+                self._apply_zone_removal(zone_id)
+                self._schedule_reconcile('zones')
             
             if callback:
                 message = f"Zone deleted successfully!" if success else "Failed to delete zone"
@@ -416,23 +999,8 @@ class DataManager:
         try:
             if self.zone_client:
                 response = self.zone_client.service.getZoneById(id=zone_id)
-                if response:
-                    # Convertir respuesta SOAP a objeto Zone
-                    tipo_bosque_str = getattr(response, 'tipoBosque', '')
-                    tipo_bosque = TipoBosque.from_string(tipo_bosque_str) if tipo_bosque_str else None
-                    
-                    zone = Zone(
-                        id=getattr(response, 'id', 0),
-                        nombre=getattr(response, 'nombre', ''),
-                        descripcion=getattr(response, 'descripcion', None),
-                        tipo_bosque=tipo_bosque,
-                        area_ha=getattr(response, 'areaHa', 0.0),
-                        activo=getattr(response, 'activo', True),
-                        fecha_creacion=self._parse_datetime(getattr(response, 'fechaCreacion', None)),
-                        fecha_modificacion=self._parse_datetime(getattr(response, 'fechaModificacion', None))
-                    )
-                    return zone
-                return None
+                # Convertir respuesta SOAP a objeto Zone
+                return ZONE_DECODER.decode(response) if response else None
             else:
                 print("⚠️  SOAP client not available - cannot get zone by ID")
                 return None
@@ -449,21 +1017,28 @@ class DataManager:
             if not name_query:
                 return all_zones
             
-            query = name_query.strip()
+            query = fold_query(name_query)
             if not query:
                 return all_zones
             
-            # Filtrar por nombre
+            # Filtrar por nombre normalizado (precalculado al cargar las zonas)
+            keys = self.zone_name_keys
             if exact_match:
-                filtered_zones = [z for z in all_zones if z.nombre.lower() == query.lower()]
+                filtered_zones = [z for z in all_zones if keys.get(z.id, "") == query]
             else:
-                filtered_zones = [z for z in all_zones if query.lower() in z.nombre.lower()]
+                filtered_zones = [z for z in all_zones if query in keys.get(z.id, "")]
             
             return filtered_zones
             
         except Exception as e:
             print(f"❌ Error al buscar zonas por nombre '{name_query}': {e}")
             return []
+    
+    def refine_zones_search(self, name_query: str, previous: List[Zone]) -> List[Zone]:
+        """Refinar localmente un resultado de search_zones_by_name (consulta que extiende la anterior)"""
+        query = fold_query(name_query)
+        keys = self.zone_name_keys
+        return [z for z in previous if query in keys.get(z.id, "")]
 
     def get_tipos_bosque(self) -> List[TipoBosque]:
         """Obtiene todos los tipos de bosque disponibles"""
@@ -477,139 +1052,285 @@ class DataManager:
         """Obtiene todos los estados de conservación"""
         cache_key = 'conservation_states'
         
-        if not force_refresh and self._is_cache_valid(cache_key) and cache_key in self.conservation_states_cache:
-            return self.conservation_states_cache[cache_key]
+        cached = self._cached_or_revalidate(cache_key, self.conservation_states_cache, force_refresh)
+        if cached is not None:
+            return cached
         
         try:
-            if self.conservation_client:
-                response = self.conservation_client.service.getAllConservationStates()
-                states_list = self._convert_soap_response_to_conservation_states(response)
-            else:
+            if not self.conservation_client:
                 print("⚠️  SOAP client not available - cannot load conservation states")
-                states_list = []
+                return self.conservation_states_cache.get(cache_key, [])
             
+            response = self.conservation_client.service.getAllConservationStates()
+            states_list = self._convert_soap_response_to_conservation_states(response)
             self.conservation_states_cache[cache_key] = states_list
-            self.cache_timestamp[cache_key] = time.time()
+            self._touch(cache_key)
             return states_list
             
         except Exception as e:
             print(f"❌ Error al obtener estados de conservación: {e}")
             return []
     
+    # ===========================================
+    # LECTURA PAGINADA
+    # ===========================================
+    
+    def iter_species_pages(self, page_size: int = DEFAULT_PAGE_SIZE, store: bool = False) -> PageIterator:
+        """
+        Especies página a página, precargando la siguiente mientras se usa la actual
+        
+        Args:
+            page_size: Especies por página
+            store: Si el recorrido llega al final, guardar el resultado en caché
+                como una carga completa
+        """
+        return self._page_iterator('species', page_size, store)
+    
+    def iter_zones_pages(self, page_size: int = DEFAULT_PAGE_SIZE, store: bool = False) -> PageIterator:
+        """Zonas página a página (ver iter_species_pages)"""
+        return self._page_iterator('zones', page_size, store)
+    
+    def _page_iterator(self, cache_key: str, page_size: int, store: bool) -> PageIterator:
+        cache = self.species_cache if cache_key == 'species' else self.zones_cache
+        cached = self._cached_or_revalidate(cache_key, cache)
+        if cached is not None:
+            # Con caché vigente todo llega en una sola página, sin ir al servidor
+            return PageIterator.from_items(cached)
+        
+        on_complete = (lambda items: self._store_paged(cache_key, items)) if store else None
+        return PageIterator(self._page_fetcher(cache_key), page_size, on_complete=on_complete)
+    
+    def _page_fetcher(self, cache_key: str) -> Callable[[int, int], list]:
+        """
+        Función (after_id, limit) -> modelos para un recorrido paginado
+        
+        Si el servidor no tiene la operación paginada se hace una carga
+        completa en la primera página y el resto se sirve de esa lista.
+        """
+        operation = self.PAGE_OPERATIONS[cache_key]
+        convert = (self._convert_soap_response_to_species if cache_key == 'species'
+                   else self._convert_soap_response_to_zones)
+        full: Optional[list] = None
+        
+        def fetch(after_id: int, limit: int) -> list:
+            nonlocal full
+            client = getattr(self, self.DELTA_OPERATIONS[cache_key][0])
+            if not client:
+                return []
+            if full is None and self._paging_support.get(cache_key, True):
+                try:
+                    response = getattr(client.service, operation)(afterId=after_id, limit=limit)
+                except (AttributeError,) + fault_types() as e:
+                    if self._paging_support.get(cache_key):
+                        raise
+                    # Servidor anterior sin la operación: carga completa paginada en local
+                    print(f"⚠️  Lectura paginada de {cache_key} no disponible: {e}")
+                    self._paging_support[cache_key] = False
+                else:
+                    self._paging_support[cache_key] = True
+                    return convert(response)
+            if full is None:
+                full_operation = 'getAllTreeSpecies' if cache_key == 'species' else 'getAllZones'
+                full = sorted(convert(self._call_operation(client, full_operation, ())),
+                              key=lambda item: item.id)
+            return slice_page(full, after_id, limit)
+        
+        return fetch
+    
+    def _store_paged(self, cache_key: str, items: list):
+        """Un recorrido paginado completo equivale a una carga completa"""
+        with self._sync_lock:
+            self._apply_full(cache_key, items)
+    
+    # ===========================================
+    # CARGA CONCURRENTE
+    # ===========================================
+    
+    def load_all_concurrently(self, force_refresh: bool = False) -> Dict[str, list]:
+        """
+        Carga especies, zonas y estados de conservación en una sola ronda concurrente.
+        
+        Solo se consultan las entidades cuyo cache expiró (las caducadas se sirven y se
+        revalidan en segundo plano); si una llamada falla
+        se conserva lo que hubiera en cache para esa entidad.
+        
+        Returns:
+            Dict[str, list]: {'species': [...], 'zones': [...], 'conservation_states': [...]}
+        """
+        sources = {
+            'species': self.species_cache,
+            'zones': self.zones_cache,
+            'conservation_states': self.conservation_states_cache,
+        }
+        
+        if not self.async_client:
+            return {
+                'species': self.get_species(force_refresh),
+                'zones': self.get_zones(force_refresh),
+                'conservation_states': self.get_conservation_states(force_refresh),
+            }
+        
+        results = {}
+        calls = {}
+        streamed = {}
+        appliers = {}
+        for cache_key, cache in sources.items():
+            cached = self._cached_or_revalidate(cache_key, cache, force_refresh)
+            if cached is not None:
+                results[cache_key] = cached
+            elif cache_key == 'conservation_states':
+                calls[cache_key] = (cache_key, 'getAllConservationStates')
+            else:
+                # Especies y zonas se piden solo desde la última marca de agua cuando el servidor lo permite
+                operation, args, appliers[cache_key] = self._fetch_plan(cache_key, force_refresh)
+                client = getattr(self, self.DELTA_OPERATIONS[cache_key][0])
+                if self._streams(client, operation, args):
+                    streamed[cache_key] = (client, operation)
+                else:
+                    calls[cache_key] = (cache_key, operation, *args)
+        
+        if calls or streamed:
+            # Las lecturas en streaming van en sus propios hilos, solapadas con el resto de la ronda
+            stream_results = {}
+            threads = [
+                threading.Thread(
+                    target=self._stream_into, args=(stream_results, cache_key, client, operation),
+                    name=f"soap-stream-{cache_key}", daemon=True
+                )
+                for cache_key, (client, operation) in streamed.items()
+            ]
+            for thread in threads:
+                thread.start()
+            
+            responses = {}
+            if calls:
+                try:
+                    responses = get_async_runner().run(self.async_client.gather(calls))
+                except Exception as e:
+                    print(f"❌ Error en la carga concurrente: {e}")
+                    responses = {cache_key: e for cache_key in calls}
+            for thread in threads:
+                thread.join()
+            responses.update(stream_results)
+            
+            for cache_key, response in responses.items():
+                cache = sources[cache_key]
+                if isinstance(response, Exception):
+                    print(f"❌ Error al obtener {cache_key}: {response}")
+                    results[cache_key] = cache.get(cache_key, [])
+                    continue
+                if cache_key in appliers:
+                    with self._sync_lock:
+                        appliers[cache_key](cache_key, response)
+                else:
+                    cache[cache_key] = self._convert_soap_response_to_conservation_states(response)
+                    self._touch(cache_key)
+                results[cache_key] = cache[cache_key]
+        
+        return results
+    
+    def _stream_into(self, results: Dict[str, Any], cache_key: str, client, operation: str):
+        try:
+            results[cache_key] = self._call_operation(client, operation, ())
+        except Exception as e:
+            results[cache_key] = e
+    
     # ===========================================
     # MÉTODOS DE CONVERSIÓN Y UTILIDADES
     # ===========================================
     
+    # Los decodificadores compartidos (core.soap_decoding) construyen cada modelo en una sola pasada
     def _convert_soap_response_to_species(self, response) -> List[TreeSpecies]:
         """Convierte respuesta SOAP a lista de especies"""
-        species_list = []
-        
-        # The SOAP service returns a list directly, not wrapped in an object
-        if response and hasattr(response, '__iter__'):
-            for species_data in response:
-                species = TreeSpecies(
-                    id=getattr(species_data, 'id', None),
-                    nombreComun=getattr(species_data, 'nombreComun', ''),
-                    nombreCientifico=getattr(species_data, 'nombreCientifico', None),
-                    estadoConservacionId=getattr(species_data, 'estadoConservacionId', 0),
-                    estadoConservacionNombre=getattr(species_data, 'estadoConservacionNombre', ''),
-                    zonaId=getattr(species_data, 'zonaId', 0),
-                    zonaNombre=getattr(species_data, 'zonaNombre', ''),
-                    activo=getattr(species_data, 'activo', True),
-                    fechaCreacion=self._parse_datetime(getattr(species_data, 'fechaCreacion', None)),
-                    fechaModificacion=self._parse_datetime(getattr(species_data, 'fechaModificacion', None))
-                )
-                species_list.append(species)
-        
-        return species_list
+        return decode_species(response)
     
     def _convert_soap_response_to_zones(self, response) -> List[Zone]:
         """Convierte respuesta SOAP a lista de zonas usando TipoBosque enum"""
-        zones_list = []
-        
-        # The SOAP service returns a list directly, not wrapped in an object
-        if response and hasattr(response, '__iter__'):
-            for zone_data in response:
-                # Convertir string a enum TipoBosque
-                tipo_bosque_str = getattr(zone_data, 'tipoBosque', '')
-                tipo_bosque = TipoBosque.from_string(tipo_bosque_str) if tipo_bosque_str else None
-                
-                zone = Zone(
-                    id=getattr(zone_data, 'id', 0),
-                    nombre=getattr(zone_data, 'nombre', ''),
-                    descripcion=getattr(zone_data, 'descripcion', None),
-                    tipo_bosque=tipo_bosque,
-                    area_ha=getattr(zone_data, 'areaHa', 0.0),
-                    activo=getattr(zone_data, 'activo', True),
-                    fecha_creacion=self._parse_datetime(getattr(zone_data, 'fechaCreacion', None)),
-                    fecha_modificacion=self._parse_datetime(getattr(zone_data, 'fechaModificacion', None))
-                )
-                zones_list.append(zone)
-        
-        return zones_list
+        return decode_zones(response)
     
     def _convert_soap_response_to_conservation_states(self, response) -> List[ConservationState]:
         """Convierte respuesta SOAP a lista de estados de conservación"""
-        states_list = []
-        
-        # The SOAP service returns a list directly, not wrapped in an object
-        if response and hasattr(response, '__iter__'):
-            for state_data in response:
-                state = ConservationState(
-                    id=getattr(state_data, 'id', 0),
-                    nombre=getattr(state_data, 'nombre', ''),
-                    descripcion=getattr(state_data, 'descripcion', None),
-                    nivel_riesgo=getattr(state_data, 'nivelRiesgo', None)
-                )
-                states_list.append(state)
-        
-        return states_list
+        return decode_conservation_states(response)
     
     def _parse_datetime(self, date_str) -> Optional[datetime]:
         """Convierte string de fecha a datetime"""
-        if not date_str:
-            return None
-        
-        try:
-            # Intenta varios formatos de fecha
-            formats = [
-                '%Y-%m-%d %H:%M:%S',
-                '%Y-%m-%dT%H:%M:%S',
-                '%Y-%m-%d',
-                '%d/%m/%Y %H:%M:%S',
-                '%d/%m/%Y'
-            ]
-            
-            for fmt in formats:
-                try:
-                    return datetime.strptime(str(date_str), fmt)
-                except ValueError:
-                    continue
-            
-            return None
-        except Exception:
-            return None
+        return parse_datetime(date_str)
     
-    def _filter_species_locally(self, species_list: List[TreeSpecies], filter: SearchFilter) -> List[TreeSpecies]:
-        """Filtra especies localmente"""
-        filtered = species_list
-        
-        if filter.name_query:
-            query = filter.name_query.lower()
-            filtered = [s for s in filtered if 
-                       query in s.nombreComun.lower() or 
-                       (s.nombreCientifico and query in s.nombreCientifico.lower())]
-        
-        if filter.zone_id:
-            filtered = [s for s in filtered if s.zonaId == filter.zone_id]
+    def _store_species(self, species_list: List[TreeSpecies]):
+        """Sincroniza el repositorio tras una carga completa (solo reindexa lo que cambió)"""
+        self.species_repository.sync(species_list)
+        self.species_cache['species'] = self.species_repository.all()
+        self._touch('species')
+    
+    def _store_zones(self, zones_list: List[Zone]):
+        """Guarda las zonas junto con sus nombres normalizados para la búsqueda"""
+        self.zones_cache['zones'] = zones_list
+        self.zone_name_keys = {zone.id: fold_text(zone.nombre) for zone in zones_list}
+        self._touch('zones')
+    
+    def _apply_species_update(self, species: TreeSpecies):
+        """Actualiza la especie en el repositorio sin descartar los índices"""
+        if 'species' not in self.species_cache or species.id not in self.species_repository:
+            self._invalidate_cache('species')
+            return
         
-        if filter.conservation_state_id:
-            filtered = [s for s in filtered if s.estadoConservacionId == filter.conservation_state_id]
+        previous = self.species_repository.get(species.id)
+        self._resolve_reference_names(species, previous)
+        species.fechaCreacion = species.fechaCreacion or previous.fechaCreacion
         
-        if filter.active_only is not None:
-            filtered = [s for s in filtered if s.activo == filter.active_only]
+        self.species_repository.upsert(species)
+        self.species_cache['species'] = self.species_repository.all()
+    
+    def _apply_species_creation(self, species: TreeSpecies, species_id: Optional[int] = None):
+        """Añade el alta al repositorio con el ID devuelto o uno provisional hasta reconciliar"""
+        if 'species' not in self.species_cache:
+            self._mark_stale('species')
+            return
         
-        return filtered
+        created = replace(species, id=species_id or self._new_provisional_id('species'))
+        self._resolve_reference_names(created)
+        self.species_repository.upsert(created)
+        self.species_cache['species'] = self.species_repository.all()
+    
+    def _resolve_reference_names(self, species: TreeSpecies, previous: Optional[TreeSpecies] = None):
+        """El formulario no trae los nombres de zona/estado: resolverlos desde las cachés"""
+        zonas = {z.id: z.nombre for z in self.zones_cache.get('zones', [])}
+        estados = {e.id: e.nombre for e in self.conservation_states_cache.get('conservation_states', [])}
+        if not species.zonaNombre:
+            species.zonaNombre = (previous.zonaNombre if previous and previous.zonaId == species.zonaId
+                                  else zonas.get(species.zonaId, ""))
+        if not species.estadoConservacionNombre:
+            species.estadoConservacionNombre = (previous.estadoConservacionNombre
+                                                if previous and previous.estadoConservacionId == species.estadoConservacionId
+                                                else estados.get(species.estadoConservacionId, ""))
+    
+    def _apply_zone_change(self, zone: Zone):
+        """Inserta o reemplaza la zona en la caché conservando el orden"""
+        if 'zones' not in self.zones_cache:
+            self._mark_stale('zones')
+            return
+        zones = list(self.zones_cache['zones'])
+        for position, current in enumerate(zones):
+            if current.id == zone.id:
+                zone.fecha_creacion = zone.fecha_creacion or current.fecha_creacion
+                zones[position] = zone
+                break
+        else:
+            zones.append(zone)
+        self._store_zones(zones)
+    
+    def _apply_zone_removal(self, zone_id: int):
+        """Quita la zona de la caché (el servicio solo lista zonas activas)"""
+        if 'zones' not in self.zones_cache:
+            return
+        self._store_zones([z for z in self.zones_cache['zones'] if z.id != zone_id])
+    
+    def _apply_species_removal(self, species_id: int):
+        """Quita la especie del repositorio sin descartar los índices"""
+        if 'species' not in self.species_cache:
+            return
+        self.species_repository.remove(species_id)
+        self.species_cache['species'] = self.species_repository.all()
     
     # ===========================================
     # MÉTODOS DE UTILIDAD
@@ -618,9 +1339,14 @@ class DataManager:
     def clear_cache(self):
         """Limpia todo el cache"""
         self.species_cache.clear()
+        self.species_repository.load([])
         self.zones_cache.clear()
         self.conservation_states_cache.clear()
         self.cache_timestamp.clear()
+        self._forced_stale.clear()
+        self.sync_watermarks.clear()
+        for ids in self._provisional_ids.values():
+            ids.clear()
         print("🧹 Cache limpiado")
     
     def get_cache_status(self) -> Dict[str, Any]:
@@ -628,12 +1354,20 @@ class DataManager:
         current_time = time.time()
         status = {}
         
+        caches = {
+            'species': self.species_cache,
+            'zones': self.zones_cache,
+            'conservation_states': self.conservation_states_cache,
+        }
         for cache_key, timestamp in self.cache_timestamp.items():
             age = current_time - timestamp
+            ttl = self.cache_ttls[cache_key]
             status[cache_key] = {
                 'age_seconds': age,
-                'is_valid': age < self.cache_ttl,
-                'expires_in': max(0, self.cache_ttl - age)
+                'state': self._cache_state(cache_key, caches[cache_key]),
+                'is_valid': self._is_cache_valid(cache_key),
+                'expires_in': max(0, ttl.soft - age),
+                'hard_expires_in': max(0, ttl.hard - age)
             }
         
         return status
@@ -678,6 +1412,10 @@ class DataManager:
         """Alias para get_species() - compatibilidad con UI"""
         return self.get_species(force_refresh)
     
+    def search_tree_species(self, search_filter: SearchFilter) -> List[TreeSpecies]:
+        """Alias para search_species (misma interfaz que SOAPClientManager)"""
+        return self.search_species(search_filter)
+    
     def get_all_zones(self, force_refresh: bool = False) -> List[Zone]:
         """Alias para get_zones() - compatibilidad con UI"""
         return self.get_zones(force_refresh)
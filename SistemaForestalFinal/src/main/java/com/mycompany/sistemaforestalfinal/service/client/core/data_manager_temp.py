@@ -4,19 +4,22 @@ Gestiona operaciones de datos y filtrado para el sistema forestal
 """
 
 from typing import List, Optional, Callable, Any
-import threading
 from .soap_client import SOAPClientManager
+from .task_executor import get_task_executor
 from .models import TreeSpecies, Zone, ConservationState, SearchFilter, TipoBosque
+from .species_store import SpeciesRepository
 
 
 class DataManager:
     """Gestor de datos para operaciones forestales"""
     
-    def __init__(self, soap_client: SOAPClientManager):
+    def __init__(self, soap_client: SOAPClientManager, executor=None):
         self.soap_client = soap_client
+        self.executor = executor or get_task_executor()
         self.zones: List[Zone] = []
         self.conservation_states: List[ConservationState] = []
         self.current_species_list: List[TreeSpecies] = []
+        self.species_repository = SpeciesRepository()
         self._data_callbacks = []
         
     def add_data_callback(self, callback: Callable[[str, Any], None]):
@@ -31,8 +34,8 @@ class DataManager:
         """Obtener todas las zonas sincronamente"""
         try:
             if not self.zones:
-                zones_raw = self.soap_client.get_all_zones()
-                self.zones = [self._convert_to_zone(z) for z in zones_raw]
+                # SOAPClientManager ya devuelve modelos Zone decodificados
+                self.zones = self.soap_client.get_all_zones()
             return self.zones
         except Exception as e:
             print(f"Error getting zones: {e}")
@@ -42,8 +45,7 @@ class DataManager:
         """Obtener todos los estados de conservación sincronamente"""
         try:
             if not self.conservation_states:
-                states_raw = self.soap_client.get_all_conservation_states()
-                self.conservation_states = [self._convert_to_conservation_state(s) for s in states_raw]
+                self.conservation_states = self.soap_client.get_all_conservation_states()
             return self.conservation_states
         except Exception as e:
             print(f"Error getting conservation states: {e}")
@@ -52,8 +54,8 @@ class DataManager:
     def get_all_species(self) -> List[TreeSpecies]:
         """Obtener todas las especies sincronamente"""
         try:
-            species_raw = self.soap_client.get_all_tree_species()
-            self.current_species_list = [self._convert_to_tree_species(s) for s in species_raw]
+            self.species_repository.load(self.soap_client.get_all_tree_species())
+            self.current_species_list = self.species_repository.all()
             return self.current_species_list
         except Exception as e:
             print(f"Error getting species: {e}")
@@ -62,68 +64,14 @@ class DataManager:
     def get_species_by_id(self, species_id: int) -> Optional[TreeSpecies]:
         """Obtener especie por ID sincronamente"""
         try:
-            species_raw = self.soap_client.get_tree_species_by_id(species_id)
-            if species_raw:
-                return self._convert_to_tree_species(species_raw)
-            return None
+            return self.soap_client.get_tree_species_by_id(species_id)
         except Exception as e:
             print(f"Error getting species by ID: {e}")
             return None
 
-    def _convert_to_zone(self, zone_raw) -> Zone:
-        """Convertir zona raw a modelo Zone"""
-        return Zone(
-            id=getattr(zone_raw, 'id', 0),
-            nombre=getattr(zone_raw, 'nombre', ''),
-            descripcion=getattr(zone_raw, 'descripcion', None),
-            tipo_bosque=TipoBosque.from_string(getattr(zone_raw, 'tipoBosque', '')) if getattr(zone_raw, 'tipoBosque', None) else None,
-            area_ha=float(getattr(zone_raw, 'areaHa', 0.0)) if getattr(zone_raw, 'areaHa', None) else 0.0,
-            activo=getattr(zone_raw, 'activo', True),
-            fecha_creacion=getattr(zone_raw, 'fechaCreacion', None),
-            fecha_modificacion=getattr(zone_raw, 'fechaModificacion', None)
-        )
-
-    def _convert_to_conservation_state(self, state_raw) -> ConservationState:
-        """Convertir estado raw a modelo ConservationState"""
-        return ConservationState(
-            id=state_raw.id,
-            nombre=state_raw.nombre,
-            descripcion=getattr(state_raw, 'descripcion', '')
-        )
-
-    def _convert_to_tree_species(self, species_raw) -> TreeSpecies:
-        """Convertir especie raw a modelo TreeSpecies"""
-        return TreeSpecies(
-            id=species_raw.id,
-            nombreComun=species_raw.nombreComun,
-            nombreCientifico=getattr(species_raw, 'nombreCientifico', ''),
-            estadoConservacionId=species_raw.estadoConservacionId,
-            zonaId=species_raw.zonaId,
-            activo=getattr(species_raw, 'activo', True),
-            estadoConservacionNombre=getattr(species_raw, 'estadoConservacionNombre', ''),
-            zonaNombre=getattr(species_raw, 'zonaNombre', '')
-        )
-
     def filter_species(self, search_filter: SearchFilter) -> List[TreeSpecies]:
-        """Filtrar especies localmente según criterios"""
-        filtered = self.current_species_list.copy()
-        
-        if search_filter.name_query:
-            query = search_filter.name_query.lower()
-            filtered = [s for s in filtered if 
-                       query in s.nombreComun.lower() or 
-                       (s.nombreCientifico and query in s.nombreCientifico.lower())]
-        
-        if search_filter.zone_id is not None:
-            filtered = [s for s in filtered if s.zonaId == search_filter.zone_id]
-            
-        if search_filter.conservation_state_id is not None:
-            filtered = [s for s in filtered if s.estadoConservacionId == search_filter.conservation_state_id]
-            
-        if search_filter.active_only is not None:
-            filtered = [s for s in filtered if s.activo == search_filter.active_only]
-            
-        return filtered
+        """Filtrar especies localmente según criterios (intersección de índices)"""
+        return self.species_repository.filter(search_filter)
 
     def create_species(self, species: TreeSpecies, callback: Optional[Callable[[bool, str, Optional[int]], None]] = None):
         """Crear nueva especie"""
@@ -149,7 +97,7 @@ class DataManager:
                 if callback:
                     callback(False, f"Error creating species: {e}", None)
                     
-        threading.Thread(target=_create_thread, daemon=True).start()
+        self.executor.submit(_create_thread)
 
     def update_species(self, species: TreeSpecies, callback: Optional[Callable[[bool, str], None]] = None):
         """Actualizar especie existente"""
@@ -176,7 +124,7 @@ class DataManager:
                 if callback:
                     callback(False, f"Error updating species: {e}")
                     
-        threading.Thread(target=_update_thread, daemon=True).start()
+        self.executor.submit(_update_thread)
         
     def delete_species(self, species_id: int, callback: Optional[Callable[[bool, str], None]] = None):
         """Eliminar especie"""
@@ -196,7 +144,7 @@ class DataManager:
                 if callback:
                     callback(False, f"Error deleting species: {e}")
                     
-        threading.Thread(target=_delete_thread, daemon=True).start()
+        self.executor.submit(_delete_thread)
     
     # ======== ZONE CRUD OPERATIONS ========
     
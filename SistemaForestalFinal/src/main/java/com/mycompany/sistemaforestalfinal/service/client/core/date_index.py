@@ -0,0 +1,152 @@
+"""
+📅 Date Index
+Índice ordenado de fechas (epoch en enteros + bisect) para filtros por rango en O(log n + k)
+"""
+
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch(value: datetime) -> int:
+    """
+    Microsegundos desde 1970-01-01 en hora local sin zona
+
+    Las fechas decodificadas ya vienen sin zona (ver soap_decoding.parse_datetime);
+    una con zona se pasa antes a hora local para que ambas sean comparables.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def day_end(day: date) -> datetime:
+    """Último instante de un día (para usar una fecha "hasta" como límite incluido)"""
+    return datetime.combine(day, time.max)
+
+
+def month_bounds(day: Optional[date] = None) -> Tuple[datetime, datetime]:
+    """
+    Primer y último instante del mes de `day` (por defecto el actual)
+
+    Returns:
+        Tuple[datetime, datetime]: (desde, hasta), ambos incluidos
+    """
+    day = day or date.today()
+    start = datetime(day.year, day.month, 1)
+    next_month = datetime(day.year + day.month // 12, day.month % 12 + 1, 1)
+    return start, next_month - _MICROSECOND
+
+
+class SortedDateIndex:
+    """
+    Fechas de un campo ordenadas en dos listas paralelas (epoch, ID).
+
+    Un rango se resuelve con dos búsquedas binarias y se recorre solo el
+    tramo que cae dentro. Las claves sin fecha se guardan aparte: los
+    filtros por rango no las descartan (igual que TreeSpeciesDAO.search).
+
+    Las listas se ordenan de una vez en la primera consulta tras `clear`,
+    así una carga completa no paga una inserción ordenada por registro; a
+    partir de ahí `add` / `remove` las mantienen con búsqueda binaria.
+    """
+
+    def __init__(self):
+        self._epochs: Dict[Hashable, int] = {}
+        self._undated: Set[Hashable] = set()
+        self._keys: Optional[List[int]] = None
+        self._ids: Optional[List[Hashable]] = None
+        self._lock = threading.RLock()
+
+    def clear(self):
+        """Vaciar el índice"""
+        with self._lock:
+            self._epochs.clear()
+            self._undated.clear()
+            self._keys = None
+            self._ids = None
+
+    def add(self, key: Hashable, value: Optional[datetime]):
+        """Indexar (o reindexar) la fecha de una clave"""
+        with self._lock:
+            if key in self._epochs or key in self._undated:
+                self.remove(key)
+            if value is None:
+                self._undated.add(key)
+                return
+            epoch = to_epoch(value)
+            self._epochs[key] = epoch
+            if self._keys is not None:
+                position = bisect_right(self._keys, epoch)
+                self._keys.insert(position, epoch)
+                self._ids.insert(position, key)
+
+    def remove(self, key: Hashable):
+        """Quitar una clave del índice (no hace nada si no estaba)"""
+        with self._lock:
+            self._undated.discard(key)
+            epoch = self._epochs.pop(key, None)
+            if epoch is None or self._keys is None:
+                return
+            position = bisect_left(self._keys, epoch)
+            while self._ids[position] != key:
+                position += 1
+            del self._keys[position]
+            del self._ids[position]
+
+    def between(self, after: Optional[datetime] = None, before: Optional[datetime] = None,
+                include_undated: bool = True) -> Set[Hashable]:
+        """
+        Claves con fecha dentro de [after, before] (extremos incluidos; None = abierto)
+
+        Args:
+            include_undated: Añadir también las claves sin fecha
+        """
+        with self._lock:
+            low, high = self._span(after, before)
+            found = set(self._ids[low:high])
+            if include_undated:
+                found |= self._undated
+            return found
+
+    def count(self, after: Optional[datetime] = None, before: Optional[datetime] = None,
+              include_undated: bool = True) -> int:
+        """Número de claves que devolvería `between`, en O(log n)"""
+        with self._lock:
+            low, high = self._span(after, before)
+            return max(0, high - low) + (len(self._undated) if include_undated else 0)
+
+    def contains(self, key: Hashable, after: Optional[datetime] = None,
+                 before: Optional[datetime] = None) -> bool:
+        """Indica si la fecha de una clave cae en el rango (las claves sin fecha sí)"""
+        with self._lock:
+            if key in self._undated:
+                return True
+            epoch = self._epochs.get(key)
+            if epoch is None:
+                return False
+            if after is not None and epoch < to_epoch(after):
+                return False
+            if before is not None and epoch > to_epoch(before):
+                return False
+            return True
+
+    def _span(self, after: Optional[datetime], before: Optional[datetime]) -> Tuple[int, int]:
+        self._build()
+        low = bisect_left(self._keys, to_epoch(after)) if after is not None else 0
+        high = bisect_right(self._keys, to_epoch(before)) if before is not None else len(self._keys)
+        return low, high
+
+    def _build(self):
+        if self._keys is not None:
+            return
+        ordered = sorted(self._epochs.items(), key=lambda item: item[1])
+        self._keys = [epoch for _, epoch in ordered]
+        self._ids = [key for key, _ in ordered]
+
+    def __len__(self) -> int:
+        return len(self._epochs) + len(self._undated)
@@ -4,10 +4,13 @@ Modelos de datos para el sistema forestal
 """
 
 from dataclasses import dataclass
-from typing import Optional, List
-from datetime import datetime
+from typing import Optional, List, Tuple
+from datetime import date, datetime
 from enum import Enum
 
+from .date_index import month_bounds
+from .text_normalization import fold_query, fold_text
+
 
 class TipoBosque(Enum):
     SECO = "Seco"
@@ -22,8 +25,10 @@ class TipoBosque(Enum):
     @classmethod
     def from_string(cls, text: str) -> 'TipoBosque':
         if text:
+            # "Humedo Tropical" y "Húmedo Tropical" son el mismo tipo
+            key = fold_text(text)
             for member in cls:
-                if text.lower() == member.value.lower():
+                if key == fold_text(member.value):
                     return member
         return cls.OTRO
 
@@ -84,3 +89,31 @@ class SearchFilter:
     active_only: Optional[bool] = None
     created_after: Optional[datetime] = None
     created_before: Optional[datetime] = None
+    modified_after: Optional[datetime] = None
+    modified_before: Optional[datetime] = None
+
+    @classmethod
+    def added_in_month(cls, day: Optional[date] = None, **filters) -> "SearchFilter":
+        """Filtro de especies creadas en el mes de `day` (por defecto el actual)"""
+        created_after, created_before = month_bounds(day)
+        return cls(created_after=created_after, created_before=created_before, **filters)
+
+    @property
+    def has_created_range(self) -> bool:
+        return self.created_after is not None or self.created_before is not None
+
+    @property
+    def has_modified_range(self) -> bool:
+        return self.modified_after is not None or self.modified_before is not None
+
+    def cache_key(self) -> Tuple:
+        """
+        Forma canónica y hashable del filtro
+
+        Filtros equivalentes dan la misma clave: el nombre se normaliza (sin
+        acentos, mayúsculas ni espacios extremos) y active_only None/False
+        son lo mismo ("sin filtrar").
+        """
+        name = fold_query(self.name_query) if self.name_query and self.name_query.strip() else None
+        return (name, self.zone_id, self.conservation_state_id, bool(self.active_only),
+                self.created_after, self.created_before, self.modified_after, self.modified_before)
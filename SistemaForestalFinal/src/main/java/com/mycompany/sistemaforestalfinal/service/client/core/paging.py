@@ -0,0 +1,162 @@
+"""
+📑 Paging
+Paginación por keyset (id > afterId) con iterador perezoso que precarga la página siguiente
+"""
+
+import logging
+from concurrent.futures import Future
+from typing import Any, Callable, Iterator, List, Optional, Sequence
+
+from .task_executor import TaskExecutor, get_task_executor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 500
+# Igual que CrudSpeciesService.MAX_PAGE_SIZE / CrudZonesService.MAX_PAGE_SIZE: el servidor
+# recorta el límite, y una página recortada se confundiría con la última
+MAX_PAGE_SIZE = 1000
+
+FetchPage = Callable[[int, int], List[Any]]
+
+
+def _item_id(item) -> int:
+    return item.id
+
+
+class PageIterator:
+    """
+    Recorre una lista remota página a página.
+
+    Cada página se pide con `fetch_page(after_id, limit)`, donde `after_id`
+    es el último ID de la página anterior (keyset: las altas o bajas entre
+    páginas no desplazan ni repiten filas). En cuanto se entrega una página,
+    la siguiente se envía al TaskExecutor compartido, así el consumidor
+    procesa una mientras llega la otra. Una página más corta que el límite
+    es la última.
+
+    Si la precarga sigue en cola cuando se pide (pool ocupado, p. ej. porque
+    el propio recorrido corre en una tarea del executor), se cancela y la
+    página se pide en el hilo actual en lugar de esperar un hilo libre.
+    """
+
+    def __init__(self, fetch_page: FetchPage, page_size: int = DEFAULT_PAGE_SIZE,
+                 after_id: int = 0, prefetch: bool = True,
+                 on_complete: Optional[Callable[[List[Any]], None]] = None,
+                 key: Callable[[Any], int] = _item_id,
+                 executor: Optional[TaskExecutor] = None):
+        """
+        Args:
+            fetch_page: Función (after_id, limit) -> lista de modelos ordenada por ID
+            page_size: Filas por página (se acota a [1, MAX_PAGE_SIZE])
+            after_id: Empezar tras este ID (0 = desde el principio)
+            prefetch: Pedir la página siguiente en segundo plano mientras se consume la actual
+            on_complete: Se llama con todas las filas si el recorrido llega al final
+            key: ID de una fila, para continuar tras la última de cada página
+            executor: Executor para la precarga (por defecto el compartido)
+        """
+        self.fetch_page = fetch_page
+        self.page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+        self.after_id = after_id
+        self.prefetch = prefetch
+        self.on_complete = on_complete
+        self.key = key
+        self.executor = executor
+        self.pages_fetched = 0
+        self.rows_fetched = 0
+        self.exhausted = False
+        self._collected: Optional[List[Any]] = [] if on_complete is not None else None
+        self._pending: Optional[Future] = None
+        self._closed = False
+
+    @classmethod
+    def from_items(cls, items: Sequence[Any]) -> "PageIterator":
+        """Iterador de una sola página sobre datos que ya están en memoria"""
+        iterator = cls(lambda after_id, limit: list(items), prefetch=False)
+        iterator.page_size = len(items) + 1  # Página siempre "corta": no se pide otra
+        return iterator
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        return self.pages()
+
+    def pages(self) -> Iterator[List[Any]]:
+        """Producir las páginas (listas de modelos) según se consumen"""
+        try:
+            while not self.exhausted and not self._closed:
+                page = self._next_page()
+                if page:
+                    yield page
+        finally:
+            self.close()
+
+    def items(self) -> Iterator[Any]:
+        """Producir las filas una a una, página a página"""
+        for page in self.pages():
+            yield from page
+
+    def first_page(self) -> List[Any]:
+        """
+        Pedir la primera página y dejar la siguiente precargándose
+
+        `pages()` / `items()` continúan después con el resto.
+        """
+        if self.pages_fetched or self.exhausted or self._closed:
+            raise RuntimeError("first_page() must be called before iterating")
+        return self._next_page()
+
+    def close(self):
+        """Abandonar el recorrido; una precarga en curso se descarta"""
+        self._closed = True
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+
+    # ===========================================
+    # PETICIÓN Y PRECARGA
+    # ===========================================
+
+    def _next_page(self) -> List[Any]:
+        pending, self._pending = self._pending, None
+        if pending is not None and not pending.cancel():
+            page = pending.result()
+        else:
+            page = self.fetch_page(self.after_id, self.page_size)
+        page = list(page or [])
+
+        self.pages_fetched += 1
+        self.rows_fetched += len(page)
+        if page:
+            self.after_id = self.key(page[-1])
+        if self._collected is not None:
+            self._collected.extend(page)
+
+        if len(page) < self.page_size:
+            self.exhausted = True
+            logger.info(f"Paged {self.rows_fetched} rows in {self.pages_fetched} pages")
+            if self.on_complete is not None:
+                self.on_complete(self._collected)
+        elif self.prefetch:
+            self._pending = self._start(self.after_id)
+        return page
+
+    def _start(self, after_id: int) -> Future:
+        executor = self.executor or get_task_executor()
+        return executor.submit(self.fetch_page, after_id, self.page_size).future
+
+
+def slice_page(items: Sequence[Any], after_id: int, limit: int,
+               key: Callable[[Any], int] = _item_id) -> List[Any]:
+    """
+    Página keyset sobre una lista ya cargada (ordenada por ID)
+
+    Sirve para paginar la caché local o la respuesta completa de un servidor
+    sin operaciones paginadas con la misma interfaz que `fetch_page`.
+    """
+    # Búsqueda binaria del primer ID mayor que after_id
+    low, high = 0, len(items)
+    while low < high:
+        middle = (low + high) // 2
+        if key(items[middle]) <= after_id:
+            low = middle + 1
+        else:
+            high = middle
+    return list(items[low:low + limit])
@@ -0,0 +1,296 @@
+"""
+🧭 Query Planner
+Decide cómo responder un SearchFilter: índices en memoria, refinar el resultado anterior o buscar en el servidor
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, List, Optional
+
+from .models import SearchFilter, TreeSpecies
+from .remote_search import remote_filterable
+from .search_cache import SearchResultCache
+from .species_store import SpeciesRepository
+from .text_normalization import fold_query, fold_text
+from .trigram_index import match_rank
+
+logger = logging.getLogger(__name__)
+
+PLAN_CACHED = "cached"          # Mismo filtro que una búsqueda reciente todavía vigente
+PLAN_REFINE = "refine"          # Filtrar el resultado anterior (la consulta nueva lo acota)
+PLAN_LOCAL = "local"            # Índices del repositorio sobre la caché vigente
+PLAN_LOAD_LOCAL = "load+local"  # Cargar la tabla completa y usar los índices (deja la caché caliente)
+PLAN_REMOTE = "remote"          # searchTreeSpecies: solo viajan las coincidencias
+
+# Estados de caché que se pueden servir sin esperar al servidor (CACHE_FRESH / CACHE_STALE de DataManager)
+SERVABLE_CACHE_STATES = ("fresh", "stale")
+
+
+@dataclass
+class QueryPlan:
+    """Plan elegido para una búsqueda, con sus estimaciones y tiempos"""
+    strategy: str
+    reason: str
+    search_filter: SearchFilter
+    cache_state: str
+    dataset_size: int
+    estimated_rows: Optional[int]
+    plan_ms: float = 0.0
+    execute_ms: Optional[float] = None
+    rows: Optional[int] = None
+    fallback: Optional[str] = None  # Estrategia usada si la elegida no pudo ejecutarse
+    base_results: Optional[List[TreeSpecies]] = field(default=None, repr=False)  # Filas de PLAN_CACHED / PLAN_REFINE
+
+    @property
+    def selectivity(self) -> Optional[float]:
+        if self.estimated_rows is None or not self.dataset_size:
+            return None
+        return self.estimated_rows / self.dataset_size
+
+    def describe(self) -> str:
+        """Texto de explain()"""
+        estimated = "?" if self.estimated_rows is None else str(self.estimated_rows)
+        selectivity = "" if self.selectivity is None else f" ({self.selectivity:.1%})"
+        strategy = self.strategy if self.fallback is None else f"{self.strategy} -> {self.fallback}"
+        lines = [
+            f"🧭 Plan: {strategy}",
+            f"   reason: {self.reason}",
+            f"   cache: {self.cache_state}  dataset: {self.dataset_size}  estimated rows: {estimated}{selectivity}",
+        ]
+        timing = f"   planning: {self.plan_ms:.2f} ms"
+        if self.execute_ms is not None:
+            timing += f"  execution: {self.execute_ms:.2f} ms  rows: {self.rows}"
+        else:
+            timing += "  (not executed)"
+        lines.append(timing)
+        return "\n".join(lines)
+
+
+@dataclass
+class _PreviousResult:
+    search_filter: SearchFilter
+    query: str
+    results: List[TreeSpecies]
+    version: int
+    at: float = field(default_factory=time.monotonic)
+
+
+class QueryPlanner:
+    """
+    Planificador de búsquedas de especies.
+
+    Con la caché vigente (fresca o caducada pero servible) siempre responde
+    en memoria. Sin caché compara el tamaño conocido de la tabla con las
+    filas estimadas por los índices: con pocos datos o filtros poco
+    selectivos conviene cargarla entera (la siguiente búsqueda ya es local);
+    con filtros selectivos sobre tablas grandes, buscar en el servidor. Si la
+    consulta nueva solo acota la anterior (mismos filtros y un nombre que
+    contiene al anterior) se filtra el resultado anterior.
+    """
+
+    def __init__(self, repository: SpeciesRepository,
+                 cache_state: Callable[[], str],
+                 load_all: Callable[[], Any],
+                 remote_search: Optional[Callable[[SearchFilter], Optional[List[TreeSpecies]]]] = None,
+                 remote_available: Callable[[], bool] = lambda: True,
+                 small_dataset: int = 1000,
+                 remote_max_selectivity: float = 0.3,
+                 refine_max_age: float = 60.0,
+                 result_cache: Optional[SearchResultCache] = None):
+        """
+        Args:
+            repository: Repositorio con los índices de la caché local
+            cache_state: Estado actual de la caché ("fresh", "stale" o "expired")
+            load_all: Carga (o sirve) la tabla completa en `repository`
+            remote_search: Búsqueda en el servidor; devuelve None si no está disponible
+            remote_available: Indica si vale la pena intentar la búsqueda remota
+            small_dataset: Hasta este tamaño se carga la tabla completa en lugar de buscar en remoto
+            remote_max_selectivity: Fracción máxima estimada de filas para preferir la búsqueda remota
+            refine_max_age: Segundos durante los que un resultado anterior sirve para refinar
+            result_cache: Caché LRU de resultados (por defecto una sobre `repository`)
+        """
+        self.repository = repository
+        self.cache_state = cache_state
+        self.load_all = load_all
+        self.remote_search = remote_search
+        self.remote_available = remote_available
+        self.small_dataset = small_dataset
+        self.remote_max_selectivity = remote_max_selectivity
+        self.refine_max_age = refine_max_age
+        self.result_cache = result_cache if result_cache is not None else SearchResultCache(repository)
+        self.last_plan: Optional[QueryPlan] = None
+        self._previous: Optional[_PreviousResult] = None
+        self._lock = threading.Lock()
+
+    # ===========================================
+    # PLANIFICACIÓN
+    # ===========================================
+
+    def plan(self, search_filter: SearchFilter) -> QueryPlan:
+        """Elegir la estrategia para un filtro (sin ejecutarla)"""
+        started = time.perf_counter()
+        state = self.cache_state()
+        size = len(self.repository)
+        estimated = self.estimate_rows(search_filter) if size else None
+
+        def build(strategy: str, reason: str, base_results=None) -> QueryPlan:
+            return QueryPlan(strategy, reason, search_filter, state, size, estimated,
+                             plan_ms=(time.perf_counter() - started) * 1000,
+                             base_results=base_results)
+
+        cached = self.result_cache.get(search_filter)
+        if cached is not None:
+            return build(PLAN_CACHED, "result cache hit", cached)
+        previous = self._refinable(search_filter)
+        if previous is not None:
+            return build(PLAN_REFINE, f"narrows previous query '{previous.query}' "
+                                      f"({len(previous.results)} rows)", previous.results)
+        if state in SERVABLE_CACHE_STATES:
+            return build(PLAN_LOCAL, f"cache is {state}")
+
+        can_go_remote = self.remote_search is not None and self.remote_available()
+        if not can_go_remote:
+            return build(PLAN_LOAD_LOCAL, "cache expired and no remote search available")
+        if not remote_filterable(search_filter):
+            return build(PLAN_LOAD_LOCAL, "modified-date range is only indexed locally")
+        if not self._has_predicates(search_filter):
+            return build(PLAN_LOAD_LOCAL, "no filters: every row is needed anyway")
+        if not size:
+            return build(PLAN_REMOTE, "cache empty: dataset size unknown")
+        if size <= self.small_dataset:
+            return build(PLAN_LOAD_LOCAL, f"small dataset ({size} <= {self.small_dataset} rows)")
+        selectivity = estimated / size
+        if selectivity > self.remote_max_selectivity:
+            return build(PLAN_LOAD_LOCAL, f"low selectivity ({selectivity:.1%} > "
+                                          f"{self.remote_max_selectivity:.0%})")
+        return build(PLAN_REMOTE, f"selective filter ({selectivity:.1%}) on a large dataset")
+
+    def estimate_rows(self, search_filter: SearchFilter) -> int:
+        """
+        Filas estimadas con los tamaños de los índices
+
+        Supone criterios independientes: tamaño por el producto de la
+        fracción que deja pasar cada uno. El nombre se acota con la lista de
+        trigramas más corta de la consulta; los rangos de fecha se cuentan
+        exactos con los índices ordenados.
+        """
+        size = len(self.repository)
+        if not size:
+            return 0
+        counts = self.repository.index_counts(search_filter)
+        fraction = 1.0
+        for count in counts:
+            fraction *= count / size
+        return round(size * fraction)
+
+    @staticmethod
+    def _has_predicates(search_filter: SearchFilter) -> bool:
+        return any((
+            search_filter.name_query and search_filter.name_query.strip(),
+            search_filter.zone_id is not None,
+            search_filter.conservation_state_id is not None,
+            search_filter.active_only,
+            search_filter.has_created_range,
+            search_filter.has_modified_range,
+        ))
+
+    def _refinable(self, search_filter: SearchFilter) -> Optional[_PreviousResult]:
+        """El resultado anterior, si la consulta nueva solo lo acota y sigue vigente"""
+        with self._lock:
+            previous = self._previous
+        if previous is None or not search_filter.name_query:
+            return None
+        query = fold_query(search_filter.name_query)
+        if not previous.query or previous.query not in query:
+            return None
+        # Los demás filtros deben ser idénticos
+        if replace(search_filter, name_query=None) != replace(previous.search_filter, name_query=None):
+            return None
+        if previous.version != self.repository.version:
+            return None
+        if time.monotonic() - previous.at > self.refine_max_age:
+            return None
+        return previous
+
+    # ===========================================
+    # EJECUCIÓN
+    # ===========================================
+
+    def search(self, search_filter: SearchFilter) -> List[TreeSpecies]:
+        """Planificar y ejecutar una búsqueda"""
+        return self.execute(self.plan(search_filter))
+
+    def execute(self, plan: QueryPlan) -> List[TreeSpecies]:
+        """Ejecutar un plan; registra sus tiempos en `last_plan`"""
+        started = time.perf_counter()
+        search_filter = plan.search_filter
+
+        version = self.repository.version
+        if plan.strategy == PLAN_CACHED:
+            results = plan.base_results
+        elif plan.strategy == PLAN_REFINE:
+            results = self._refine(plan.base_results, search_filter.name_query)
+        elif plan.strategy == PLAN_REMOTE:
+            results = self.remote_search(search_filter)
+            if results is None:
+                plan.fallback = PLAN_LOAD_LOCAL
+                results = self._local(search_filter)
+        else:
+            results = self._local(search_filter)
+
+        if plan.strategy != PLAN_CACHED:
+            # Lo calculado en local refleja el repositorio ya cargado; lo remoto, el de antes
+            local = plan.strategy != PLAN_REMOTE or plan.fallback is not None
+            self.result_cache.put(search_filter, results, None if local else version)
+        plan.execute_ms = (time.perf_counter() - started) * 1000
+        plan.rows = len(results)
+        self.last_plan = plan
+        self._remember(search_filter, results)
+        logger.debug(plan.describe())
+        return results
+
+    def _local(self, search_filter: SearchFilter) -> List[TreeSpecies]:
+        self.load_all()
+        return self.repository.filter(search_filter)
+
+    @staticmethod
+    def _refine(previous: List[TreeSpecies], name_query: str) -> List[TreeSpecies]:
+        """Coincidencias de la consulta dentro del resultado anterior, por relevancia"""
+        query = fold_query(name_query)
+        ranked = []
+        for position, species in enumerate(previous):
+            rank = match_rank(query, (fold_text(species.nombreComun), fold_text(species.nombreCientifico)))
+            if rank is not None:
+                ranked.append((rank, position, species))
+        ranked.sort(key=lambda item: (item[0], item[1]))
+        return [species for _, _, species in ranked]
+
+    def _remember(self, search_filter: SearchFilter, results: List[TreeSpecies]):
+        query = fold_query(search_filter.name_query) if search_filter.name_query else ""
+        with self._lock:
+            self._previous = _PreviousResult(search_filter, query, results, self.repository.version)
+
+    def reset(self):
+        """Olvidar el resultado anterior y los guardados (p. ej. tras cambios en los datos)"""
+        with self._lock:
+            self._previous = None
+        self.result_cache.clear()
+
+    # ===========================================
+    # EXPLAIN
+    # ===========================================
+
+    def explain(self, search_filter: Optional[SearchFilter] = None) -> str:
+        """
+        Describir un plan
+
+        Sin filtro, el de la última búsqueda ejecutada (con sus tiempos); con
+        filtro, el plan que se elegiría ahora, sin ejecutarlo.
+        """
+        if search_filter is not None:
+            return self.plan(search_filter).describe()
+        if self.last_plan is None:
+            return "🧭 No query executed yet"
+        return self.last_plan.describe()
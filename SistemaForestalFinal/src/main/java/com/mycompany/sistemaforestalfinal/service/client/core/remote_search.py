@@ -0,0 +1,83 @@
+"""
+🔎 Remote Search
+Búsqueda avanzada resuelta en el servidor (searchTreeSpecies): solo viajan las especies que cumplen el SearchFilter
+"""
+
+from typing import Any, Dict, List, Optional
+
+from .models import SearchFilter, TreeSpecies
+from .paging import PageIterator, DEFAULT_PAGE_SIZE
+from .soap_decoding import decode_species
+from .text_normalization import fold_query, fold_text
+from .trigram_index import match_rank, RANK_INFIX
+
+SEARCH_OPERATION = 'searchTreeSpecies'
+
+
+def remote_filterable(search_filter: SearchFilter) -> bool:
+    """Indica si searchTreeSpecies puede aplicar todo el filtro (no filtra por fecha de modificación)"""
+    return not search_filter.has_modified_range
+
+
+def search_arguments(search_filter: SearchFilter) -> Dict[str, Any]:
+    """
+    Parámetros de searchTreeSpecies para un SearchFilter
+
+    Los filtros vacíos van como None (zeep omite el elemento y el servidor no
+    filtra por él). activeOnly va siempre a True: el repositorio local solo
+    guarda especies activas (getAllTreeSpecies, getTreeSpeciesPage y la
+    sincronización incremental no traen las demás), así que `active_only`
+    None/False, "sin filtrar" en SpeciesRepository.filter, tampoco incluye
+    inactivas. El resultado no depende de si el plan fue local o remoto.
+    """
+    name_query = (search_filter.name_query or "").strip()
+    return {
+        'nameQuery': name_query or None,
+        'zonaId': search_filter.zone_id,
+        'estadoConservacionId': search_filter.conservation_state_id,
+        'activeOnly': True,
+        'createdAfter': search_filter.created_after,
+        'createdBefore': search_filter.created_before,
+    }
+
+
+def search_pages(client, search_filter: SearchFilter, page_size: int = DEFAULT_PAGE_SIZE) -> PageIterator:
+    """
+    Resultados de searchTreeSpecies página a página (por ID), precargando la siguiente
+
+    Args:
+        client: Cliente del servicio de especies (zeep)
+        search_filter: Filtros de la búsqueda
+        page_size: Especies por página
+
+    Raises:
+        AttributeError: Si el servidor no expone searchTreeSpecies
+        ValueError: Si el filtro tiene criterios que el servidor no aplica (ver remote_filterable)
+    """
+    if not remote_filterable(search_filter):
+        raise ValueError("searchTreeSpecies cannot filter by modification date")
+    operation = getattr(client.service, SEARCH_OPERATION)
+    arguments = search_arguments(search_filter)
+
+    def fetch(after_id: int, limit: int) -> List[TreeSpecies]:
+        return decode_species(operation(afterId=after_id, limit=limit, **arguments))
+
+    return PageIterator(fetch, page_size)
+
+
+def rank_by_name(species: List[TreeSpecies], name_query: Optional[str]) -> List[TreeSpecies]:
+    """
+    Ordenar por relevancia del nombre, como el índice de trigramas local
+
+    El servidor devuelve por ID; así la misma búsqueda sale en el mismo
+    orden tanto si se resolvió en local como en remoto.
+    """
+    if not name_query or not name_query.strip():
+        return species
+    query = fold_query(name_query)
+
+    def rank(item: TreeSpecies) -> int:
+        found = match_rank(query, (fold_text(item.nombreComun), fold_text(item.nombreCientifico)))
+        return found if found is not None else RANK_INFIX + 1
+
+    return sorted(species, key=rank)
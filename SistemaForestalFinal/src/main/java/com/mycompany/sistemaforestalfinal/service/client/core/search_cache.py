@@ -0,0 +1,177 @@
+"""
+🗂️ Search Cache
+Caché LRU de resultados de búsqueda por SearchFilter canónico, con invalidación selectiva e historial atrás/adelante
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import FrozenSet, List, Optional, Tuple
+
+from .models import SearchFilter, TreeSpecies
+from .species_store import SpeciesRepository
+
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_MAX_AGE = 300.0  # Como el TTL blando de la caché de especies
+# Con más cambios que estos entre dos versiones no se comprueba entrada por entrada
+MAX_SELECTIVE_CHANGES = 256
+
+
+@dataclass
+class _CachedResult:
+    search_filter: SearchFilter
+    results: List[TreeSpecies]
+    ids: FrozenSet[int]
+    version: int
+    at: float
+
+
+class SearchResultCache:
+    """
+    Resultados recientes de búsquedas avanzadas.
+
+    La clave es `SearchFilter.cache_key()`, así que filtros equivalentes
+    comparten entrada. Cada entrada recuerda la versión del repositorio con
+    la que se calculó; si el repositorio cambió, solo se descarta si alguna
+    especie cambiada estaba en el resultado o ahora cumple el filtro. Si no,
+    se da por vigente en la versión actual. Las más antiguas salen al
+    superar `max_entries` (LRU) y ninguna se sirve pasados `max_age` segundos.
+    """
+
+    def __init__(self, repository: SpeciesRepository,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_age: float = DEFAULT_MAX_AGE):
+        """
+        Args:
+            repository: Repositorio cuya versión invalida los resultados
+            max_entries: Número máximo de búsquedas guardadas
+            max_age: Segundos que se sirve un resultado como máximo
+        """
+        self.repository = repository
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries: "OrderedDict[Tuple, _CachedResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, search_filter: SearchFilter) -> Optional[List[TreeSpecies]]:
+        """Resultado guardado y vigente para el filtro, o None"""
+        key = search_filter.cache_key()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not self._still_valid(entry):
+                del self._entries[key]
+                self.invalidations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.results
+
+    def put(self, search_filter: SearchFilter, results: List[TreeSpecies], version: Optional[int] = None):
+        """
+        Guardar un resultado
+
+        Args:
+            version: Versión del repositorio con la que se calculó (por defecto la actual)
+        """
+        key = search_filter.cache_key()
+        entry = _CachedResult(
+            search_filter, results, frozenset(s.id for s in results),
+            self.repository.version if version is None else version, time.monotonic(),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __contains__(self, search_filter: SearchFilter) -> bool:
+        with self._lock:
+            entry = self._entries.get(search_filter.cache_key())
+            return entry is not None and self._still_valid(entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        """Descartar todos los resultados"""
+        with self._lock:
+            self._entries.clear()
+
+    def _still_valid(self, entry: _CachedResult) -> bool:
+        if time.monotonic() - entry.at > self.max_age:
+            return False
+        current = self.repository.version
+        if entry.version == current:
+            return True
+        changed = self.repository.changes_since(entry.version)
+        if changed is None or len(changed) > MAX_SELECTIVE_CHANGES:
+            return False
+        for species_id in changed:
+            # Estaba en el resultado (cambió o se borró) o ahora entraría en él
+            if species_id in entry.ids or self.repository.matches(species_id, entry.search_filter):
+                return False
+        entry.version = current
+        return True
+
+
+class SearchHistory:
+    """
+    Historial de búsquedas para navegar atrás y adelante, como un navegador.
+
+    Una búsqueda nueva descarta el "adelante"; repetir la actual no añade
+    entrada.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._filters: List[SearchFilter] = []
+        self._cursor = -1
+        self._lock = threading.Lock()
+
+    def push(self, search_filter: SearchFilter):
+        """Registrar una búsqueda nueva"""
+        with self._lock:
+            current = self._filters[self._cursor] if self._cursor >= 0 else None
+            if current is not None and current.cache_key() == search_filter.cache_key():
+                return
+            del self._filters[self._cursor + 1:]
+            self._filters.append(search_filter)
+            if len(self._filters) > self.max_entries:
+                del self._filters[0]
+            self._cursor = len(self._filters) - 1
+
+    def back(self) -> Optional[SearchFilter]:
+        """Búsqueda anterior (y mover el cursor a ella), o None"""
+        with self._lock:
+            if self._cursor <= 0:
+                return None
+            self._cursor -= 1
+            return self._filters[self._cursor]
+
+    def forward(self) -> Optional[SearchFilter]:
+        """Búsqueda siguiente (y mover el cursor a ella), o None"""
+        with self._lock:
+            if self._cursor >= len(self._filters) - 1:
+                return None
+            self._cursor += 1
+            return self._filters[self._cursor]
+
+    @property
+    def current(self) -> Optional[SearchFilter]:
+        with self._lock:
+            return self._filters[self._cursor] if self._cursor >= 0 else None
+
+    @property
+    def can_go_back(self) -> bool:
+        return self._cursor > 0
+
+    @property
+    def can_go_forward(self) -> bool:
+        return self._cursor < len(self._filters) - 1
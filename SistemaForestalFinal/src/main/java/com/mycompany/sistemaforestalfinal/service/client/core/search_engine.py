@@ -5,11 +5,26 @@ Módulo de búsqueda filtrada avanzada para especies forestales
 
 import customtkinter as ctk
 from tkinter import messagebox
+import time
 from typing import Optional, Callable, List, Any, Dict
 from datetime import datetime, date
-import threading
 
 from ..core.models import SearchFilter, TreeSpecies, Zone, ConservationState
+from ..core.soap_decoding import SPECIES_DECODER
+from ..core.task_executor import get_task_executor
+from ..core.species_store import SpeciesRepository
+from ..core.query_planner import QueryPlanner, PLAN_CACHED
+from ..core.search_cache import SearchHistory
+from ..core.date_index import day_end, month_bounds, to_epoch
+from ..core.trigram_index import match_rank
+from ..core.text_normalization import fold_query, fold_text
+
+# Segundos durante los que el SearchEngine responde con su repositorio sin volver a cargarlo
+LOCAL_TTL = 300
+
+# Fecha a la que se aplica el rango del diálogo
+DATE_FIELD_CREATED = "Created"
+DATE_FIELD_MODIFIED = "Modified"
 
 
 class AdvancedSearchDialog:
@@ -29,6 +44,7 @@ class AdvancedSearchDialog:
         self.active_only = ctk.BooleanVar(value=True)
         self.date_from = ctk.StringVar()
         self.date_to = ctk.StringVar()
+        self.date_field = ctk.StringVar(value=DATE_FIELD_CREATED)
         self.scientific_name_query = ctk.StringVar()
         
         self.create_dialog()
@@ -205,10 +221,17 @@ class AdvancedSearchDialog:
             text_color="gray"
         ).pack(anchor="w", padx=15, pady=(0, 10))
         
+        # Fecha de creación o de modificación
+        ctk.CTkSegmentedButton(
+            date_frame,
+            values=[DATE_FIELD_CREATED, DATE_FIELD_MODIFIED],
+            variable=self.date_field
+        ).pack(anchor="w", padx=15, pady=(0, 10))
+        
         # Fecha desde
         ctk.CTkLabel(
             date_frame,
-            text="📅 Created From:",
+            text="📅 From:",
             font=ctk.CTkFont(weight="bold")
         ).pack(anchor="w", padx=15, pady=(5, 5))
         
@@ -223,7 +246,7 @@ class AdvancedSearchDialog:
         # Fecha hasta
         ctk.CTkLabel(
             date_frame,
-            text="📅 Created To:",
+            text="📅 To (inclusive):",
             font=ctk.CTkFont(weight="bold")
         ).pack(anchor="w", padx=15, pady=(5, 5))
         
@@ -233,7 +256,21 @@ class AdvancedSearchDialog:
             placeholder_text="YYYY-MM-DD",
             height=35
         )
-        date_to_entry.pack(fill="x", padx=15, pady=(0, 15))
+        date_to_entry.pack(fill="x", padx=15, pady=(0, 10))
+        
+        # Atajo: mes actual
+        ctk.CTkButton(
+            date_frame,
+            text="🗓️ This Month",
+            command=self.set_this_month,
+            width=120
+        ).pack(anchor="w", padx=15, pady=(0, 15))
+    
+    def set_this_month(self):
+        """Rellenar el rango de fechas con el mes actual"""
+        month_start, month_end = month_bounds()
+        self.date_from.set(month_start.strftime("%Y-%m-%d"))
+        self.date_to.set(month_end.strftime("%Y-%m-%d"))
     
     def create_buttons(self, parent):
         """Crear botones de acción"""
@@ -283,6 +320,7 @@ class AdvancedSearchDialog:
         self.active_only.set(True)
         self.date_from.set("")
         self.date_to.set("")
+        self.date_field.set(DATE_FIELD_CREATED)
     
     def validate_dates(self) -> bool:
         """Validar fechas ingresadas"""
@@ -352,9 +390,16 @@ class AdvancedSearchDialog:
         if self.active_only.get():
             search_filter.active_only = True
         
-        # Fechas
+        # Fechas: "hasta" incluye el día entero
+        date_from = date_to = None
         if self.date_from.get().strip():
-            search_filter.created_after = datetime.strptime(self.date_from.get().strip(), "%Y-%m-%d")
+            date_from = datetime.strptime(self.date_from.get().strip(), "%Y-%m-%d")
+        if self.date_to.get().strip():
+            date_to = day_end(datetime.strptime(self.date_to.get().strip(), "%Y-%m-%d").date())
+        if self.date_field.get() == DATE_FIELD_MODIFIED:
+            search_filter.modified_after, search_filter.modified_before = date_from, date_to
+        else:
+            search_filter.created_after, search_filter.created_before = date_from, date_to
         
         # Ejecutar callback
         if self.result_callback:
@@ -381,85 +426,128 @@ class AdvancedSearchDialog:
 class SearchEngine:
     """Motor de búsqueda para especies forestales"""
     
-    def __init__(self, soap_client):
+    def __init__(self, soap_client, executor=None):
         self.soap_client = soap_client
+        self.executor = executor or get_task_executor()
+        self.repository = SpeciesRepository()
         self.last_results: List[TreeSpecies] = []
+        self.local_ttl = LOCAL_TTL
+        self._loaded_at: Optional[float] = None
+        # Con DataManager se comparte su planificador (y su caché); si no, uno sobre el repositorio propio
+        self.planner = getattr(soap_client, "query_planner", None) or QueryPlanner(
+            self.repository,
+            cache_state=self._cache_state,
+            load_all=self._load_all,
+            remote_search=getattr(soap_client, "search_tree_species", None),
+        )
+        self.history = SearchHistory()
     
     def search_with_filter(self, search_filter: SearchFilter, 
-                          callback: Optional[Callable[[bool, str, List[TreeSpecies]], None]] = None):
-        """Ejecutar búsqueda con filtros en hilo separado"""
-        threading.Thread(
-            target=self._search_thread,
-            args=(search_filter, callback),
-            daemon=True
-        ).start()
-    
-    def _search_thread(self, search_filter: SearchFilter, 
-                      callback: Optional[Callable[[bool, str, List[TreeSpecies]], None]]):
-        """Hilo de búsqueda"""
-        try:
-            # Obtener todas las especies primero
-            all_species = self.soap_client.get_all_tree_species()
-            if not all_species:
-                if callback:
-                    callback(True, "No species found in database", [])
-                return
-            
-            # Aplicar filtros
-            filtered_species = self._apply_filters(all_species, search_filter)
-            
-            # Guardar resultados
-            self.last_results = filtered_species
-            
-            # Ejecutar callback
+                          callback: Optional[Callable[[bool, str, List[TreeSpecies]], None]] = None,
+                          record: bool = True):
+        """
+        Ejecutar búsqueda con filtros en el executor compartido
+        
+        Si el mismo filtro (o uno equivalente) se buscó hace poco y su
+        resultado sigue vigente, el callback se llama al instante, sin pasar
+        por el executor.
+        
+        Args:
+            record: Añadir la búsqueda al historial (False al navegar atrás/adelante)
+        """
+        if record:
+            self.history.push(search_filter)
+        
+        plan = self.planner.plan(search_filter)
+        if plan.strategy == PLAN_CACHED:
+            # Una búsqueda lenta anterior todavía en curso no debe pisar este resultado
+            self.executor.cancel(group="advanced_search")
             if callback:
-                message = f"Found {len(filtered_species)} species matching criteria"
-                callback(True, message, filtered_species)
-                
-        except Exception as e:
+                callback(*self._finish(self.planner.execute(plan)))
+            return
+        
+        def _on_success(result):
+            if callback:
+                callback(*result)
+        
+        def _on_error(e):
             if callback:
                 callback(False, f"Search error: {str(e)}", [])
+        
+        # Una búsqueda nueva reemplaza a la anterior: su callback ya no se invoca
+        self.executor.submit(
+            self._search, search_filter,
+            group="advanced_search",
+            on_success=_on_success,
+            on_error=_on_error
+        )
+    
+    def _search(self, search_filter: SearchFilter):
+        """Búsqueda (en un hilo del executor); devuelve (éxito, mensaje, resultados)"""
+        # El planificador elige entre los índices locales, el resultado anterior o searchTreeSpecies
+        return self._finish(self.planner.search(search_filter))
+    
+    def _finish(self, filtered_species: List[TreeSpecies]):
+        """Guardar los resultados y componer (éxito, mensaje, resultados)"""
+        self.last_results = filtered_species
+        
+        message = f"Found {len(filtered_species)} species matching criteria"
+        return True, message, filtered_species
+    
+    def search_added_this_month(self, callback: Optional[Callable[[bool, str, List[TreeSpecies]], None]] = None,
+                                **filters):
+        """Especies creadas en el mes actual (rango sobre el índice de fechas), con filtros adicionales"""
+        self.search_with_filter(SearchFilter.added_in_month(**filters), callback)
+    
+    def back(self, callback: Optional[Callable[[bool, str, List[TreeSpecies]], None]] = None) -> bool:
+        """Repetir la búsqueda anterior del historial; devuelve False si no hay"""
+        search_filter = self.history.back()
+        if search_filter is None:
+            return False
+        self.search_with_filter(search_filter, callback, record=False)
+        return True
+    
+    def forward(self, callback: Optional[Callable[[bool, str, List[TreeSpecies]], None]] = None) -> bool:
+        """Repetir la búsqueda siguiente del historial; devuelve False si no hay"""
+        search_filter = self.history.forward()
+        if search_filter is None:
+            return False
+        self.search_with_filter(search_filter, callback, record=False)
+        return True
+    
+    def explain(self, search_filter: Optional[SearchFilter] = None) -> str:
+        """Plan de la última búsqueda (o el que se elegiría para `search_filter`) con sus tiempos"""
+        return self.planner.explain(search_filter)
+    
+    def _cache_state(self) -> str:
+        """Estado del repositorio propio: 'fresh' durante local_ttl segundos tras cargarlo"""
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.local_ttl:
+            return "fresh"
+        return "expired"
+    
+    def _load_all(self):
+        """Cargar todas las especies en el repositorio propio"""
+        if self._cache_state() == "fresh":
+            return
+        self.repository.sync(SPECIES_DECODER.decode_many(self.soap_client.get_all_tree_species()))
+        self._loaded_at = time.monotonic()
     
     def _apply_filters(self, species_list: List[Any], search_filter: SearchFilter) -> List[TreeSpecies]:
-        """Aplicar filtros a la lista de especies"""
-        filtered = []
-        
-        for species in species_list:
-            # Convertir a TreeSpecies si es necesario
-            if hasattr(species, 'nombreComun'):
-                tree_species = TreeSpecies(
-                    id=getattr(species, 'id', None),
-                    nombreComun=getattr(species, 'nombreComun', ''),
-                    nombreCientifico=getattr(species, 'nombreCientifico', None),
-                    estadoConservacionId=getattr(species, 'estadoConservacionId', 0),
-                    estadoConservacionNombre=getattr(species, 'estadoConservacionNombre', ''),
-                    zonaId=getattr(species, 'zonaId', 0),
-                    zonaNombre=getattr(species, 'zonaNombre', ''),
-                    activo=getattr(species, 'activo', True),
-                    fechaCreacion=getattr(species, 'fechaCreacion', None),
-                    fechaModificacion=getattr(species, 'fechaModificacion', None)
-                )
-            else:
-                tree_species = species
-            
-            # Aplicar filtros
-            if self._matches_filter(tree_species, search_filter):
-                filtered.append(tree_species)
+        """Aplicar filtros a la lista de especies usando los índices del repositorio"""
+        # Los clientes ya entregan TreeSpecies decodificados: se usan tal cual, sin copiarlos
+        converted = SPECIES_DECODER.decode_many(species_list)
         
-        return filtered
+        # Entre búsquedas solo se reindexan las especies que cambiaron en el servidor
+        self.repository.sync(converted)
+        return self.repository.filter(search_filter)
     
     def _matches_filter(self, species: TreeSpecies, search_filter: SearchFilter) -> bool:
-        """Verificar si una especie coincide con los filtros"""
+        """Verificar si una especie suelta coincide con los filtros"""
         
-        # Filtro por nombre (común o científico)
+        # Filtro por nombre (común o científico), misma regla que el índice de trigramas
         if search_filter.name_query:
-            query_lower = search_filter.name_query.lower()
-            common_name_match = query_lower in species.nombreComun.lower()
-            scientific_name_match = (
-                species.nombreCientifico and 
-                query_lower in species.nombreCientifico.lower()
-            )
-            if not (common_name_match or scientific_name_match):
+            names = (fold_text(species.nombreComun), fold_text(species.nombreCientifico))
+            if match_rank(fold_query(search_filter.name_query), names) is None:
                 return False
         
         # Filtro por zona
@@ -477,9 +565,16 @@ class SearchEngine:
             if search_filter.active_only and not species.activo:
                 return False
         
-        # Filtro por fecha de creación
-        if search_filter.created_after and species.fechaCreacion:
-            if species.fechaCreacion < search_filter.created_after:
+        # Filtros por rango de fechas (extremos incluidos; las especies sin fecha no se descartan)
+        for value, after, before in (
+            (species.fechaCreacion, search_filter.created_after, search_filter.created_before),
+            (species.fechaModificacion, search_filter.modified_after, search_filter.modified_before),
+        ):
+            if value is None:
+                continue
+            if after is not None and to_epoch(value) < to_epoch(after):
+                return False
+            if before is not None and to_epoch(value) > to_epoch(before):
                 return False
         
         return True
@@ -490,4 +585,5 @@ class SearchEngine:
     
     def clear_results(self):
         """Limpiar resultados de búsqueda"""
-        self.last_results.clear()
+        # Sin vaciar la lista: la misma puede estar guardada en la caché de resultados
+        self.last_results = []
@@ -5,47 +5,21 @@ Gestiona la comunicación con los servicios SOAP del sistema forestal
 
 import logging
 from typing import List, Optional, Any
-from zeep import Client
-from zeep.exceptions import Fault, TransportError
-import requests.exceptions
-from dataclasses import dataclass
+
+from .models import TreeSpecies, Zone, ConservationState, SearchFilter
+from .paging import PageIterator, DEFAULT_PAGE_SIZE
+from .remote_search import search_pages, rank_by_name, remote_filterable
+from .soap_decoding import (
+    SPECIES_DECODER, ZONE_DECODER, decode_species, decode_zones, decode_conservation_states
+)
+from .soap_deps import fault_types, connection_error_types
+from .wsdl_cache import get_soap_client
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class ZoneData:
-    """Estructura de datos para zonas"""
-    id: int
-    nombre: str
-    tipoBosque: str = ""
-    areaHa: float = 0.0
-    activo: bool = True
-
-
-@dataclass 
-class TreeSpeciesData:
-    """Estructura de datos para especies"""
-    id: int
-    nombreComun: str
-    nombreCientifico: str = ""
-    estadoConservacionId: int = 0
-    estadoConservacionNombre: str = ""
-    zonaId: int = 0
-    zonaNombre: str = ""
-    activo: bool = True
-
-
-@dataclass
-class ConservationStateData:
-    """Estructura de datos para estados de conservación"""
-    id: int
-    nombre: str
-    descripcion: str = ""
-
-
 class SOAPClientManager:
     """
     Gestor de cliente SOAP para comunicación con servicios forestales.
@@ -86,20 +60,20 @@ class SOAPClientManager:
             # Intentar conectar al servicio de zonas
             try:
                 logger.info(f"Connecting to zones service: {self.zones_service_url}")
-                self._zones_client = Client(self.zones_service_url)
+                self._zones_client = get_soap_client(self.zones_service_url)
                 zones_connected = True
                 logger.info("✅ Zones service connected")
-            except (TransportError, requests.exceptions.ConnectionError) as e:
+            except connection_error_types() as e:
                 logger.warning(f"⚠️ Zones service not available: {e}")
                 self._zones_client = None
             
             # Intentar conectar al servicio de especies
             try:
                 logger.info(f"Connecting to species service: {self.species_service_url}")
-                self._species_client = Client(self.species_service_url)
+                self._species_client = get_soap_client(self.species_service_url)
                 species_connected = True
                 logger.info("✅ Species service connected")
-            except (TransportError, requests.exceptions.ConnectionError) as e:
+            except connection_error_types() as e:
                 logger.error(f"❌ Species service connection error: {e}")
                 self._species_client = None
             
@@ -139,12 +113,12 @@ class SOAPClientManager:
 
     # ==================== MÉTODOS PARA ZONAS ====================
     
-    def get_all_zones(self) -> List[ZoneData]:
+    def get_all_zones(self) -> List[Zone]:
         """
         Obtener todas las zonas
         
         Returns:
-            List[ZoneData]: Lista de zonas disponibles
+            List[Zone]: Lista de zonas disponibles
         """
         if not self.is_connected():
             raise Exception("Not connected to SOAP services")
@@ -157,29 +131,19 @@ class SOAPClientManager:
             logger.info("Fetching all zones from SOAP service")
             response = self._zones_client.service.getAllZones()
             
-            zones = []
-            if response:
-                for zone_obj in response:
-                    zone_data = ZoneData(
-                        id=getattr(zone_obj, 'id', 0),
-                        nombre=getattr(zone_obj, 'nombre', ''),
-                        tipoBosque=getattr(zone_obj, 'tipoBosque', ''),
-                        areaHa=float(getattr(zone_obj, 'areaHa', 0.0)) if getattr(zone_obj, 'areaHa', None) else 0.0,
-                        activo=getattr(zone_obj, 'activo', True)
-                    )
-                    zones.append(zone_data)
+            zones = decode_zones(response)
             
             logger.info(f"Retrieved {len(zones)} zones")
             return zones
             
-        except Fault as e:
+        except fault_types() as e:
             logger.error(f"SOAP fault getting zones: {e}")
             raise Exception(f"SOAP service error: {e}")
         except Exception as e:
             logger.error(f"Error getting zones: {e}")
             raise Exception(f"Failed to get zones: {e}")
 
-    def get_zone_by_id(self, zone_id: int) -> Optional[ZoneData]:
+    def get_zone_by_id(self, zone_id: int) -> Optional[Zone]:
         """
         Obtener zona por ID
         
@@ -187,7 +151,7 @@ class SOAPClientManager:
             zone_id: ID de la zona
         
         Returns:
-            Optional[ZoneData]: Datos de la zona o None si no existe
+            Optional[Zone]: Datos de la zona o None si no existe
         """
         if not self.is_connected():
             raise Exception("Not connected to SOAP services")
@@ -200,18 +164,9 @@ class SOAPClientManager:
             logger.info(f"Fetching zone with ID {zone_id}")
             response = self._zones_client.service.getZoneById(zone_id)
             
-            if response:
-                zone_data = ZoneData(
-                    id=getattr(response, 'id', 0),
-                    nombre=getattr(response, 'nombre', ''),
-                    tipoBosque=getattr(response, 'tipoBosque', ''),
-                    areaHa=float(getattr(response, 'areaHa', 0.0)) if getattr(response, 'areaHa', None) else 0.0,
-                    activo=getattr(response, 'activo', True)
-                )
-                return zone_data
-            return None
+            return ZONE_DECODER.decode(response) if response else None
             
-        except Fault as e:
+        except fault_types() as e:
             logger.error(f"SOAP fault getting zone {zone_id}: {e}")
             return None
         except Exception as e:
@@ -220,12 +175,12 @@ class SOAPClientManager:
 
     # ==================== MÉTODOS PARA ESPECIES ====================
     
-    def get_all_species(self) -> List[TreeSpeciesData]:
+    def get_all_species(self) -> List[TreeSpecies]:
         """
         Obtener todas las especies de árboles
         
         Returns:
-            List[TreeSpeciesData]: Lista de especies disponibles
+            List[TreeSpecies]: Lista de especies disponibles
         """
         if not self.is_connected():
             raise Exception("Not connected to SOAP services")
@@ -234,40 +189,112 @@ class SOAPClientManager:
             logger.info("Fetching all tree species from SOAP service")
             response = self._species_client.service.getAllTreeSpecies()
             
-            species = []
-            if response:
-                for species_obj in response:
-                    species_data = TreeSpeciesData(
-                        id=getattr(species_obj, 'id', 0),
-                        nombreComun=getattr(species_obj, 'nombreComun', ''),
-                        nombreCientifico=getattr(species_obj, 'nombreCientifico', ''),
-                        estadoConservacionId=getattr(species_obj, 'estadoConservacionId', 0),
-                        estadoConservacionNombre=getattr(species_obj, 'estadoConservacionNombre', ''),                        zonaId=getattr(species_obj, 'zonaId', 0),
-                        zonaNombre=getattr(species_obj, 'zonaNombre', ''),
-                        activo=getattr(species_obj, 'activo', True)
-                    )
-                    species.append(species_data)
+            species = decode_species(response)
             
             logger.info(f"Retrieved {len(species)} species")
             return species
             
-        except Fault as e:
+        except fault_types() as e:
             logger.error(f"SOAP fault getting species: {e}")
             raise Exception(f"SOAP service error: {e}")
         except Exception as e:
             logger.error(f"Error getting species: {e}")
             raise Exception(f"Failed to get species: {e}")
 
-    def get_all_tree_species(self) -> List[TreeSpeciesData]:
+    def get_all_tree_species(self) -> List[TreeSpecies]:
         """
         Alias para get_all_species() para compatibilidad con DataManager
         
         Returns:
-            List[TreeSpeciesData]: Lista de especies disponibles
+            List[TreeSpecies]: Lista de especies disponibles
         """
         return self.get_all_species()
 
-    def get_tree_species_by_id(self, species_id: int) -> Optional[TreeSpeciesData]:
+    def iter_species_pages(self, page_size: int = DEFAULT_PAGE_SIZE) -> PageIterator:
+        """
+        Especies página a página (getTreeSpeciesPage), precargando la siguiente
+        
+        Args:
+            page_size: Especies por página
+            
+        Returns:
+            PageIterator: Iterable de páginas; `items()` recorre las especies una a una
+        """
+        if not self.is_connected():
+            raise Exception("Not connected to SOAP services")
+        
+        def fetch(after_id: int, limit: int) -> List[TreeSpecies]:
+            try:
+                response = self._species_client.service.getTreeSpeciesPage(afterId=after_id, limit=limit)
+                return decode_species(response)
+            except fault_types() as e:
+                logger.error(f"SOAP fault getting species page: {e}")
+                raise Exception(f"SOAP service error: {e}")
+        
+        return PageIterator(fetch, page_size)
+
+    def search_tree_species(self, search_filter: SearchFilter) -> Optional[List[TreeSpecies]]:
+        """
+        Búsqueda avanzada en el servidor (searchTreeSpecies)
+        
+        Args:
+            search_filter: Filtros de la búsqueda
+            
+        Returns:
+            Optional[List[TreeSpecies]]: Especies que coinciden, o None si el
+            servidor no expone la operación o no aplica el filtro (el llamador
+            debe filtrar en local)
+        """
+        if not self.is_connected():
+            raise Exception("Not connected to SOAP services")
+        if not remote_filterable(search_filter):
+            return None
+        
+        try:
+            pages = search_pages(self._species_client, search_filter)
+        except AttributeError:
+            logger.warning("searchTreeSpecies not available on the species service")
+            return None
+        
+        try:
+            logger.info("Searching tree species on the SOAP service")
+            species = rank_by_name(list(pages.items()), search_filter.name_query)
+            logger.info(f"Found {len(species)} species")
+            return species
+            
+        except fault_types() as e:
+            logger.error(f"SOAP fault searching species: {e}")
+            raise Exception(f"SOAP service error: {e}")
+        except Exception as e:
+            logger.error(f"Error searching species: {e}")
+            raise Exception(f"Failed to search species: {e}")
+
+    def iter_zones_pages(self, page_size: int = DEFAULT_PAGE_SIZE) -> PageIterator:
+        """
+        Zonas página a página (getZonesPage), precargando la siguiente
+        
+        Args:
+            page_size: Zonas por página
+            
+        Returns:
+            PageIterator: Iterable de páginas; `items()` recorre las zonas una a una
+        """
+        if not self.is_connected():
+            raise Exception("Not connected to SOAP services")
+        if not self._zones_client:
+            raise Exception("Zones service not available")
+        
+        def fetch(after_id: int, limit: int) -> List[Zone]:
+            try:
+                response = self._zones_client.service.getZonesPage(afterId=after_id, limit=limit)
+                return decode_zones(response)
+            except fault_types() as e:
+                logger.error(f"SOAP fault getting zones page: {e}")
+                raise Exception(f"SOAP service error: {e}")
+        
+        return PageIterator(fetch, page_size)
+
+    def get_tree_species_by_id(self, species_id: int) -> Optional[TreeSpecies]:
         """
         Obtener especie por ID
         
@@ -275,7 +302,7 @@ class SOAPClientManager:
             species_id: ID de la especie
         
         Returns:
-            Optional[TreeSpeciesData]: Datos de la especie o None si no existe
+            Optional[TreeSpecies]: Datos de la especie o None si no existe
         """
         if not self.is_connected():
             raise Exception("Not connected to SOAP services")
@@ -284,21 +311,9 @@ class SOAPClientManager:
             logger.info(f"Fetching species with ID {species_id}")
             response = self._species_client.service.getTreeSpeciesById(species_id)
             
-            if response:
-                species_data = TreeSpeciesData(
-                    id=getattr(response, 'id', 0),
-                    nombreComun=getattr(response, 'nombreComun', ''),
-                    nombreCientifico=getattr(response, 'nombreCientifico', ''),
-                    estadoConservacionId=getattr(response, 'estadoConservacionId', 0),
-                    estadoConservacionNombre=getattr(response, 'estadoConservacionNombre', ''),
-                    zonaId=getattr(response, 'zonaId', 0),
-                    zonaNombre=getattr(response, 'zonaNombre', ''),
-                    activo=getattr(response, 'activo', True)
-                )
-                return species_data
-            return None
+            return SPECIES_DECODER.decode(response) if response else None
             
-        except Fault as e:
+        except fault_types() as e:
             logger.error(f"SOAP fault getting species {species_id}: {e}")
             return None
         except Exception as e:
@@ -334,7 +349,7 @@ class SOAPClientManager:
             )
             return bool(response)
             
-        except Fault as e:
+        except fault_types() as e:
             logger.error(f"SOAP fault creating species: {e}")
             return False
         except Exception as e:
@@ -372,7 +387,7 @@ class SOAPClientManager:
             )
             return bool(response)
             
-        except Fault as e:
+        except fault_types() as e:
             logger.error(f"SOAP fault updating species: {e}")
             return False
         except Exception as e:
@@ -397,7 +412,7 @@ class SOAPClientManager:
             response = self._species_client.service.deleteTreeSpecies(species_id)
             return bool(response)
             
-        except Fault as e:
+        except fault_types() as e:
             logger.error(f"SOAP fault deleting species: {e}")
             return False
         except Exception as e:
@@ -406,12 +421,12 @@ class SOAPClientManager:
 
     # ==================== MÉTODOS AUXILIARES ====================
     
-    def get_all_conservation_states(self) -> List[ConservationStateData]:
+    def get_all_conservation_states(self) -> List[ConservationState]:
         """
         Obtener todos los estados de conservación
         
         Returns:
-            List[ConservationStateData]: Lista de estados de conservación
+            List[ConservationState]: Lista de estados de conservación
         """
         if not self.is_connected():
             raise Exception("Not connected to SOAP services")
@@ -420,31 +435,21 @@ class SOAPClientManager:
             logger.info("Fetching conservation states")
             response = self._species_client.service.getAllConservationStates()
             
-            states = []
-            if response:
-                for state_obj in response:
-                    state_data = ConservationStateData(
-                        id=getattr(state_obj, 'id', 0),
-                        nombre=getattr(state_obj, 'nombre', ''),
-                        descripcion=getattr(state_obj, 'descripcion', '')
-                    )
-                    states.append(state_data)
-            
-            return states
+            return decode_conservation_states(response)
             
-        except Fault as e:
+        except fault_types() as e:
             logger.error(f"SOAP fault getting conservation states: {e}")
             return []
         except Exception as e:
             logger.error(f"Error getting conservation states: {e}")
             return []
 
-    def get_zones_from_species_service(self) -> List[ZoneData]:
+    def get_zones_from_species_service(self) -> List[Zone]:
         """
         Obtener zonas desde el servicio de especies (método auxiliar)
         
         Returns:
-            List[ZoneData]: Lista de zonas desde el servicio de especies
+            List[Zone]: Lista de zonas desde el servicio de especies
         """
         if not self.is_connected():
             raise Exception("Not connected to SOAP services")
@@ -453,21 +458,11 @@ class SOAPClientManager:
             logger.info("Fetching zones from species service")
             response = self._species_client.service.getAllZones()
             
-            zones = []
-            if response:
-                for zone_obj in response:
-                    zone_data = ZoneData(
-                        id=getattr(zone_obj, 'id', 0),
-                        nombre=getattr(zone_obj, 'nombre', ''),
-                        tipoBosque=getattr(zone_obj, 'tipoBosque', ''),
-                        areaHa=float(getattr(zone_obj, 'areaHa', 0.0)) if getattr(zone_obj, 'areaHa', None) else 0.0,
-                        activo=getattr(zone_obj, 'activo', True)
-                    )
-                    zones.append(zone_data)
+            zones = decode_zones(response)
             
             return zones
             
-        except Fault as e:
+        except fault_types() as e:
             logger.error(f"SOAP fault getting zones from species service: {e}")
             return []
         except Exception as e:
@@ -5,47 +5,19 @@ Gestiona la comunicación con los servicios SOAP del sistema forestal
 
 import logging
 from typing import List, Optional, Any
-from zeep import Client
 from zeep.exceptions import Fault, TransportError
 import requests.exceptions
-from dataclasses import dataclass
+
+from .models import TreeSpecies, Zone, ConservationState
+from .soap_decoding import SPECIES_DECODER, ZONE_DECODER, decode_species, decode_zones, decode_conservation_states
+from .wsdl_cache import get_soap_client
+from .trigram_index import TrigramIndex
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class ZoneData:
-    """Estructura de datos para zonas"""
-    id: int
-    nombre: str
-    tipoBosque: str = ""
-    areaHa: float = 0.0
-    activo: bool = True
-
-
-@dataclass 
-class TreeSpeciesData:
-    """Estructura de datos para especies"""
-    id: int
-    nombreComun: str
-    nombreCientifico: str = ""
-    estadoConservacionId: int = 0
-    estadoConservacionNombre: str = ""
-    zonaId: int = 0
-    zonaNombre: str = ""
-    activo: bool = True
-
-
-@dataclass
-class ConservationStateData:
-    """Estructura de datos para estados de conservación"""
-    id: int
-    nombre: str
-    descripcion: str = ""
-
-
 class SOAPClientManager:
     """
     Gestor de cliente SOAP para comunicación con servicios forestales.
@@ -67,6 +39,7 @@ class SOAPClientManager:
         self._zones_client = None
         self._species_client = None
         self._is_connected = False
+        self._name_index = TrigramIndex()
         
         logger.info("SOAPClientManager initialized")
 
@@ -86,7 +59,7 @@ class SOAPClientManager:
             # Intentar conectar al servicio de zonas
             try:
                 logger.info(f"Connecting to zones service: {self.zones_service_url}")
-                self._zones_client = Client(self.zones_service_url)
+                self._zones_client = get_soap_client(self.zones_service_url)
                 zones_connected = True
                 logger.info("✅ Zones service connected")
             except (TransportError, requests.exceptions.ConnectionError) as e:
@@ -96,7 +69,7 @@ class SOAPClientManager:
             # Intentar conectar al servicio de especies
             try:
                 logger.info(f"Connecting to species service: {self.species_service_url}")
-                self._species_client = Client(self.species_service_url)
+                self._species_client = get_soap_client(self.species_service_url)
                 species_connected = True
                 logger.info("✅ Species service connected")
             except (TransportError, requests.exceptions.ConnectionError) as e:
@@ -154,12 +127,12 @@ class SOAPClientManager:
 
     # ==================== MÉTODOS PARA ZONAS ====================
     
-    def get_all_zones(self) -> List[ZoneData]:
+    def get_all_zones(self) -> List[Zone]:
         """
         Obtener todas las zonas
         
         Returns:
-            List[ZoneData]: Lista de zonas disponibles
+            List[Zone]: Lista de zonas disponibles
         """
         if not self.is_connected():
             raise Exception("Not connected to SOAP services")
@@ -172,17 +145,7 @@ class SOAPClientManager:
             logger.info("Fetching all zones from SOAP service")
             response = self._zones_client.service.getAllZones()
             
-            zones = []
-            if response:
-                for zone_obj in response:
-                    zone_data = ZoneData(
-                        id=getattr(zone_obj, 'id', 0),
-                        nombre=getattr(zone_obj, 'nombre', ''),
-                        tipoBosque=getattr(zone_obj, 'tipoBosque', ''),
-                        areaHa=float(getattr(zone_obj, 'areaHa', 0.0)) if getattr(zone_obj, 'areaHa', None) else 0.0,
-                        activo=getattr(zone_obj, 'activo', True)
-                    )
-                    zones.append(zone_data)
+            zones = decode_zones(response)
             
             logger.info(f"Retrieved {len(zones)} zones")
             return zones
@@ -194,7 +157,7 @@ class SOAPClientManager:
             logger.error(f"Error getting zones: {e}")
             raise Exception(f"Failed to get zones: {e}")
 
-    def get_zone_by_id(self, zone_id: int) -> Optional[ZoneData]:
+    def get_zone_by_id(self, zone_id: int) -> Optional[Zone]:
         """
         Obtener zona por ID
         
@@ -202,7 +165,7 @@ class SOAPClientManager:
             zone_id: ID de la zona
         
         Returns:
-            Optional[ZoneData]: Datos de la zona o None si no existe
+            Optional[Zone]: Datos de la zona o None si no existe
         """
         if not self.is_connected():
             raise Exception("Not connected to SOAP services")
@@ -215,16 +178,7 @@ class SOAPClientManager:
             logger.info(f"Fetching zone with ID {zone_id}")
             response = self._zones_client.service.getZoneById(zone_id)
             
-            if response:
-                zone_data = ZoneData(
-                    id=getattr(response, 'id', 0),
-                    nombre=getattr(response, 'nombre', ''),
-                    tipoBosque=getattr(response, 'tipoBosque', ''),
-                    areaHa=float(getattr(response, 'areaHa', 0.0)) if getattr(response, 'areaHa', None) else 0.0,
-                    activo=getattr(response, 'activo', True)
-                )
-                return zone_data
-            return None
+            return ZONE_DECODER.decode(response) if response else None
             
         except Fault as e:
             logger.error(f"SOAP fault getting zone {zone_id}: {e}")
@@ -340,12 +294,12 @@ class SOAPClientManager:
 
     # ==================== MÉTODOS PARA ESPECIES ====================
     
-    def get_all_species(self) -> List[TreeSpeciesData]:
+    def get_all_species(self) -> List[TreeSpecies]:
         """
         Obtener todas las especies de árboles
         
         Returns:
-            List[TreeSpeciesData]: Lista de especies disponibles
+            List[TreeSpecies]: Lista de especies disponibles
         """
         if not self.is_connected():
             raise Exception("Not connected to SOAP services")
@@ -354,20 +308,7 @@ class SOAPClientManager:
             logger.info("Fetching all tree species from SOAP service")
             response = self._species_client.service.getAllTreeSpecies()
             
-            species = []
-            if response:
-                for species_obj in response:
-                    species_data = TreeSpeciesData(
-                        id=getattr(species_obj, 'id', 0),
-                        nombreComun=getattr(species_obj, 'nombreComun', ''),
-                        nombreCientifico=getattr(species_obj, 'nombreCientifico', ''),
-                        estadoConservacionId=getattr(species_obj, 'estadoConservacionId', 0),
-                        estadoConservacionNombre=getattr(species_obj, 'estadoConservacionNombre', ''),
-                        zonaId=getattr(species_obj, 'zonaId', 0),
-                        zonaNombre=getattr(species_obj, 'zonaNombre', ''),
-                        activo=getattr(species_obj, 'activo', True)
-                    )
-                    species.append(species_data)
+            species = decode_species(response)
             
             logger.info(f"Retrieved {len(species)} species")
             return species
@@ -379,7 +320,7 @@ class SOAPClientManager:
             logger.error(f"Error getting species: {e}")
             raise Exception(f"Failed to get species: {e}")
 
-    def get_species_by_id(self, species_id: int) -> Optional[TreeSpeciesData]:
+    def get_species_by_id(self, species_id: int) -> Optional[TreeSpecies]:
         """
         Obtener especie por ID
         
@@ -387,7 +328,7 @@ class SOAPClientManager:
             species_id: ID de la especie
         
         Returns:
-            Optional[TreeSpeciesData]: Datos de la especie o None si no existe
+            Optional[TreeSpecies]: Datos de la especie o None si no existe
         """
         if not self.is_connected():
             raise Exception("Not connected to SOAP services")
@@ -396,19 +337,7 @@ class SOAPClientManager:
             logger.info(f"Fetching species with ID {species_id}")
             response = self._species_client.service.getTreeSpeciesById(species_id)
             
-            if response:
-                species_data = TreeSpeciesData(
-                    id=getattr(response, 'id', 0),
-                    nombreComun=getattr(response, 'nombreComun', ''),
-                    nombreCientifico=getattr(response, 'nombreCientifico', ''),
-                    estadoConservacionId=getattr(response, 'estadoConservacionId', 0),
-                    estadoConservacionNombre=getattr(response, 'estadoConservacionNombre', ''),
-                    zonaId=getattr(response, 'zonaId', 0),
-                    zonaNombre=getattr(response, 'zonaNombre', ''),
-                    activo=getattr(response, 'activo', True)
-                )
-                return species_data
-            return None
+            return SPECIES_DECODER.decode(response) if response else None
             
         except Fault as e:
             logger.error(f"SOAP fault getting species {species_id}: {e}")
@@ -417,24 +346,25 @@ class SOAPClientManager:
             logger.error(f"Error getting species {species_id}: {e}")
             return None
 
-    def search_species_by_name(self, name: str) -> List[TreeSpeciesData]:
+    def search_species_by_name(self, name: str) -> List[TreeSpecies]:
         """
-        Buscar especies por nombre (simulado con filtrado local)
+        Buscar especies por nombre (filtrado local con índice de trigramas)
         
         Args:
             name: Nombre a buscar
         
         Returns:
-            List[TreeSpeciesData]: Lista de especies que coinciden
+            List[TreeSpecies]: Especies que coinciden, las más relevantes primero
         """
         try:
             all_species = self.get_all_species()
-            filtered_species = [
-                species for species in all_species
-                if name.lower() in species.nombreComun.lower() or 
-                   name.lower() in species.nombreCientifico.lower()
-            ]
-            return filtered_species
+            by_id = {species.id: species for species in all_species}
+            # El índice se conserva entre búsquedas: solo se reindexa lo que cambió
+            self._name_index.sync(
+                (species.id, (species.nombreComun, species.nombreCientifico))
+                for species in all_species
+            )
+            return [by_id[species_id] for species_id in self._name_index.search(name)]
         except Exception as e:
             logger.error(f"Error searching species: {e}")
             return []
@@ -540,12 +470,12 @@ class SOAPClientManager:
 
     # ==================== MÉTODOS AUXILIARES ====================
     
-    def get_conservation_states(self) -> List[ConservationStateData]:
+    def get_conservation_states(self) -> List[ConservationState]:
         """
         Obtener todos los estados de conservación
         
         Returns:
-            List[ConservationStateData]: Lista de estados de conservación
+            List[ConservationState]: Lista de estados de conservación
         """
         if not self.is_connected():
             raise Exception("Not connected to SOAP services")
@@ -554,15 +484,7 @@ class SOAPClientManager:
             logger.info("Fetching conservation states")
             response = self._species_client.service.getAllConservationStates()
             
-            states = []
-            if response:
-                for state_obj in response:
-                    state_data = ConservationStateData(
-                        id=getattr(state_obj, 'id', 0),
-                        nombre=getattr(state_obj, 'nombre', ''),
-                        descripcion=getattr(state_obj, 'descripcion', '')
-                    )
-                    states.append(state_data)
+            states = decode_conservation_states(response)
             
             return states
             
@@ -573,12 +495,12 @@ class SOAPClientManager:
             logger.error(f"Error getting conservation states: {e}")
             return []
 
-    def get_zones_from_species_service(self) -> List[ZoneData]:
+    def get_zones_from_species_service(self) -> List[Zone]:
         """
         Obtener zonas desde el servicio de especies (método auxiliar)
         
         Returns:
-            List[ZoneData]: Lista de zonas desde el servicio de especies
+            List[Zone]: Lista de zonas desde el servicio de especies
         """
         if not self.is_connected():
             raise Exception("Not connected to SOAP services")
@@ -587,17 +509,7 @@ class SOAPClientManager:
             logger.info("Fetching zones from species service")
             response = self._species_client.service.getAllZones()
             
-            zones = []
-            if response:
-                for zone_obj in response:
-                    zone_data = ZoneData(
-                        id=getattr(zone_obj, 'id', 0),
-                        nombre=getattr(zone_obj, 'nombre', ''),
-                        tipoBosque=getattr(zone_obj, 'tipoBosque', ''),
-                        areaHa=float(getattr(zone_obj, 'areaHa', 0.0)) if getattr(zone_obj, 'areaHa', None) else 0.0,
-                        activo=getattr(zone_obj, 'activo', True)
-                    )
-                    zones.append(zone_data)
+            zones = decode_zones(response)
             
             return zones
             
@@ -4,27 +4,17 @@ Simple SOAP Client for Species Testing
 
 import logging
 from typing import List, Optional, Any
-from zeep import Client
 from zeep.exceptions import Fault, TransportError
 import requests.exceptions
-from dataclasses import dataclass
+
+from .models import TreeSpecies
+from .soap_decoding import decode_species
+from .wsdl_cache import get_soap_client
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass 
-class TreeSpeciesData:
-    """Estructura de datos para especies"""
-    id: int
-    nombreComun: str
-    nombreCientifico: str = ""
-    estadoConservacionId: int = 0
-    estadoConservacionNombre: str = ""
-    zonaId: int = 0
-    zonaNombre: str = ""
-    activo: bool = True
-
 class SimpleSOAPClient:
     """Cliente SOAP simplificado solo para especies"""
     
@@ -38,7 +28,7 @@ class SimpleSOAPClient:
         """Conectar al servicio de especies"""
         try:
             logger.info(f"Connecting to species service: {self.species_service_url}")
-            self._species_client = Client(self.species_service_url)
+            self._species_client = get_soap_client(self.species_service_url)
             self._is_connected = True
             logger.info("✅ Species service connected")
             return True
@@ -51,7 +41,7 @@ class SimpleSOAPClient:
     def is_connected(self) -> bool:
         return self._is_connected and self._species_client is not None
 
-    def get_all_tree_species(self) -> List[TreeSpeciesData]:
+    def get_all_tree_species(self) -> List[TreeSpecies]:
         """Obtener todas las especies"""
         if not self.is_connected():
             raise Exception("Not connected to SOAP services")
@@ -60,20 +50,7 @@ class SimpleSOAPClient:
             logger.info("Fetching all tree species from SOAP service")
             response = self._species_client.service.getAllTreeSpecies()
             
-            species_list = []
-            if response:
-                for species_obj in response:
-                    species_data = TreeSpeciesData(
-                        id=getattr(species_obj, 'id', 0),
-                        nombreComun=getattr(species_obj, 'nombreComun', ''),
-                        nombreCientifico=getattr(species_obj, 'nombreCientifico', ''),
-                        estadoConservacionId=getattr(species_obj, 'estadoConservacionId', 0),
-                        estadoConservacionNombre=getattr(species_obj, 'estadoConservacionNombre', ''),
-                        zonaId=getattr(species_obj, 'zonaId', 0),
-                        zonaNombre=getattr(species_obj, 'zonaNombre', ''),
-                        activo=getattr(species_obj, 'activo', True)
-                    )
-                    species_list.append(species_data)
+            species_list = decode_species(response)
             
             logger.info(f"Retrieved {len(species_list)} tree species")
             return species_list
@@ -160,7 +137,7 @@ class SimpleSOAPClient:
             raise Exception(f"Failed to delete tree species: {e}")
 
 if __name__ == "__main__":
-    # Test básico
+    # Test básico (python -m core.soap_client_simple)
     print("🌳 Testing Simple SOAP Client...")
     
     client = SimpleSOAPClient()
@@ -0,0 +1,192 @@
+"""
+🧬 SOAP Decoding
+Capa única de decodificación: filas SOAP (zeep o XML) -> modelos canónicos de core.models, en una sola pasada
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Tuple
+
+from .models import TreeSpecies, Zone, ConservationState, TipoBosque
+
+_DATE_FORMATS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%d',
+    '%d/%m/%Y %H:%M:%S',
+    '%d/%m/%Y'
+)
+
+
+def parse_datetime(value) -> Optional[datetime]:
+    """Convierte una fecha SOAP (datetime de zeep o texto) a datetime local sin zona"""
+    if not value:
+        return None
+
+    if isinstance(value, datetime):
+        # zeep ya devuelve datetime para xs:dateTime; se guarda en hora local sin zona
+        # para poder compararla con las fechas de los filtros de búsqueda
+        if value.tzinfo is not None:
+            return value.astimezone().replace(tzinfo=None)
+        return value
+
+    text = str(value)
+    try:
+        # xs:dateTime en texto (p. ej. desde el decodificador XML): 2024-05-01T10:00:00.123-05:00
+        parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+    except ValueError:
+        parsed = None
+    if parsed is not None:
+        return parsed.astimezone().replace(tzinfo=None) if parsed.tzinfo is not None else parsed
+
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def parse_tipo_bosque(value) -> Optional[TipoBosque]:
+    return TipoBosque.from_string(value) if value else None
+
+
+def parse_float(value) -> float:
+    return float(value) if value else 0.0
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """Un atributo del modelo y de dónde sale en la fila SOAP"""
+    name: str                    # Atributo del modelo
+    sources: Tuple[str, ...]     # Elementos SOAP, en orden de preferencia (el primero no vacío gana)
+    default: Any = None
+    convert: Optional[Callable[[Any], Any]] = None
+
+
+class RowDecoder:
+    """
+    Decodificador de filas SOAP a un modelo, compilado una vez por modelo.
+
+    Al construirse genera dos funciones especializadas (como hace
+    `dataclasses` con `__init__`): una lee la fila con `getattr` y otra con
+    `dict.get`. Cada una llama al constructor del modelo con una expresión
+    fija por campo, sin bucles ni búsquedas de nombres por fila. Las filas de
+    zeep exponen sus valores en `__values__`, así que se leen por la vía del
+    diccionario, la más rápida.
+    """
+
+    def __init__(self, model: type, fields: Iterable[FieldSpec]):
+        self.model = model
+        self.fields = tuple(fields)
+        self.from_object: Callable[[Any], Any] = self._compile(mapping=False)
+        self.from_mapping: Callable[[Mapping[str, Any]], Any] = self._compile(mapping=True)
+
+    def _compile(self, mapping: bool) -> Callable:
+        namespace = {'_model': self.model, '_getattr': getattr}
+        arguments = []
+        for field in self.fields:
+            default = f'_default_{field.name}'
+            namespace[default] = field.default
+            if len(field.sources) == 1:
+                # Un solo origen: el valor presente se respeta aunque sea falsy (0, False)
+                read = self._read(field.sources[0], default, mapping)
+            else:
+                reads = [self._read(source, 'None', mapping) for source in field.sources]
+                read = f"({' or '.join(reads)} or {default})"
+            if field.convert is not None:
+                convert = f'_convert_{field.name}'
+                namespace[convert] = field.convert
+                read = f"{convert}({read})"
+            arguments.append(f"{field.name}={read}")
+
+        name = f"decode_{self.model.__name__}_{'mapping' if mapping else 'object'}"
+        source = f"def {name}(row):\n    return _model({', '.join(arguments)})\n"
+        exec(compile(source, f"<{name}>", "exec"), namespace)
+        return namespace[name]
+
+    @staticmethod
+    def _read(source: str, default: str, mapping: bool) -> str:
+        if mapping:
+            return f"row.get({source!r}, {default})"
+        return f"_getattr(row, {source!r}, {default})"
+
+    def decode(self, row) -> Any:
+        """Decodificar una fila (objeto zeep, diccionario u objeto con atributos)"""
+        if row is None:
+            return None
+        if isinstance(row, self.model):
+            return row
+        values = getattr(row, '__values__', None)
+        if values is not None:
+            return self.from_mapping(values)
+        if isinstance(row, Mapping):
+            return self.from_mapping(row)
+        return self.from_object(row)
+
+    def decode_many(self, rows) -> List[Any]:
+        """Decodificar una respuesta de lista (vacía o None -> [])"""
+        if not rows or not hasattr(rows, '__iter__'):
+            return []
+        rows = list(rows)
+        first = rows[0]
+        # Se elige la vía una sola vez: todas las filas de una respuesta son del mismo tipo
+        if isinstance(first, self.model):
+            return rows
+        if getattr(first, '__values__', None) is not None:
+            decode = self.from_mapping
+            return [decode(row.__values__) for row in rows]
+        if isinstance(first, Mapping):
+            decode = self.from_mapping
+            return [decode(row) for row in rows]
+        decode = self.from_object
+        return [decode(row) for row in rows]
+
+
+# ===========================================
+# DECODIFICADORES DE LOS MODELOS
+# ===========================================
+
+# El bean Java publica creadoEn / actualizadoEn; versiones anteriores, fechaCreacion / fechaModificacion
+SPECIES_DECODER = RowDecoder(TreeSpecies, (
+    FieldSpec('id', ('id',)),
+    FieldSpec('nombreComun', ('nombreComun',), ''),
+    FieldSpec('nombreCientifico', ('nombreCientifico',)),
+    FieldSpec('estadoConservacionId', ('estadoConservacionId',), 0),
+    FieldSpec('estadoConservacionNombre', ('estadoConservacionNombre',), ''),
+    FieldSpec('zonaId', ('zonaId',), 0),
+    FieldSpec('zonaNombre', ('zonaNombre',), ''),
+    FieldSpec('activo', ('activo',), True),
+    FieldSpec('fechaCreacion', ('fechaCreacion', 'creadoEn'), convert=parse_datetime),
+    FieldSpec('fechaModificacion', ('fechaModificacion', 'actualizadoEn'), convert=parse_datetime),
+))
+
+ZONE_DECODER = RowDecoder(Zone, (
+    FieldSpec('id', ('id',), 0),
+    FieldSpec('nombre', ('nombre',), ''),
+    FieldSpec('descripcion', ('descripcion',)),
+    FieldSpec('tipo_bosque', ('tipoBosque',), convert=parse_tipo_bosque),
+    FieldSpec('area_ha', ('areaHa',), convert=parse_float),
+    FieldSpec('activo', ('activo',), True),
+    FieldSpec('fecha_creacion', ('fechaCreacion', 'creadoEn'), convert=parse_datetime),
+    FieldSpec('fecha_modificacion', ('fechaModificacion', 'actualizadoEn'), convert=parse_datetime),
+))
+
+CONSERVATION_STATE_DECODER = RowDecoder(ConservationState, (
+    FieldSpec('id', ('id',), 0),
+    FieldSpec('nombre', ('nombre',), ''),
+    FieldSpec('descripcion', ('descripcion',)),
+    FieldSpec('nivel_riesgo', ('nivelRiesgo',)),
+))
+
+
+def decode_species(rows) -> List[TreeSpecies]:
+    return SPECIES_DECODER.decode_many(rows)
+
+
+def decode_zones(rows) -> List[Zone]:
+    return ZONE_DECODER.decode_many(rows)
+
+
+def decode_conservation_states(rows) -> List[ConservationState]:
+    return CONSERVATION_STATE_DECODER.decode_many(rows)
@@ -0,0 +1,93 @@
+"""
+🐢 SOAP Dependencies
+Importación diferida de zeep / lxml / requests / httpx: se cargan en la primera llamada remota, no al arrancar
+"""
+
+import importlib.util
+import logging
+import sys
+import time
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _installed(*modules: str) -> bool:
+    # find_spec solo localiza el paquete, no lo importa
+    return all(importlib.util.find_spec(name) is not None for name in modules)
+
+
+@lru_cache(maxsize=None)
+def soap_available() -> bool:
+    """Indica si zeep y requests están instalados (sin importarlos)"""
+    return _installed("zeep", "requests", "urllib3")
+
+
+@lru_cache(maxsize=None)
+def async_available() -> bool:
+    """Indica si el cliente asíncrono de zeep (httpx) está disponible (sin importarlo)"""
+    return soap_available() and _installed("httpx")
+
+
+@lru_cache(maxsize=None)
+def zeep_modules() -> SimpleNamespace:
+    """
+    Importar zeep y requests la primera vez que se necesitan
+
+    Returns:
+        SimpleNamespace: Client, Transport, Fault, TransportError, requests, HTTPAdapter, Retry
+
+    Raises:
+        ImportError: Si zeep o requests no están instalados
+    """
+    started = time.perf_counter()
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from zeep import Client
+    from zeep.exceptions import Fault, TransportError
+    from zeep.transports import Transport
+    logger.info(f"Imported zeep/lxml in {time.perf_counter() - started:.2f}s")
+    return SimpleNamespace(
+        Client=Client, Transport=Transport, Fault=Fault, TransportError=TransportError,
+        requests=requests, HTTPAdapter=HTTPAdapter, Retry=Retry,
+    )
+
+
+@lru_cache(maxsize=None)
+def async_zeep_modules() -> SimpleNamespace:
+    """
+    Importar el cliente asíncrono de zeep la primera vez que se necesita
+
+    Returns:
+        SimpleNamespace: httpx, AsyncClient, AsyncTransport
+    """
+    import httpx
+    from zeep import AsyncClient
+    from zeep.transports import AsyncTransport
+    return SimpleNamespace(httpx=httpx, AsyncClient=AsyncClient, AsyncTransport=AsyncTransport)
+
+
+def fault_types() -> Tuple[type, ...]:
+    """
+    Excepciones SOAP Fault para usar en `except`, sin forzar la importación
+
+    Si zeep no se ha importado todavía ninguna llamada pudo lanzar un Fault,
+    así que basta con una tupla vacía.
+    """
+    exceptions = sys.modules.get("zeep.exceptions")
+    return (exceptions.Fault,) if exceptions is not None else ()
+
+
+def connection_error_types() -> Tuple[type, ...]:
+    """Errores de transporte/conexión de zeep y requests ya importados"""
+    types = []
+    exceptions = sys.modules.get("zeep.exceptions")
+    if exceptions is not None:
+        types.append(exceptions.TransportError)
+    requests_exceptions = sys.modules.get("requests.exceptions")
+    if requests_exceptions is not None:
+        types.append(requests_exceptions.ConnectionError)
+    return tuple(types)
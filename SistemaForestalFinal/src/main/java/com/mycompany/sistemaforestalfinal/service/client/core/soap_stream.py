@@ -0,0 +1,224 @@
+"""
+🌊 SOAP Stream
+Decodificador en streaming (lxml.iterparse) para las lecturas masivas getAllTreeSpecies / getAllZones
+"""
+
+import argparse
+import logging
+import time
+import tracemalloc
+from io import BytesIO
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .soap_decoding import RowDecoder, SPECIES_DECODER, ZONE_DECODER
+from .soap_deps import soap_available
+from .transport import get_transport_factory
+
+logger = logging.getLogger(__name__)
+
+# Operaciones de lectura masiva que admiten el decodificador en streaming
+STREAM_DECODERS: Dict[str, RowDecoder] = {
+    'getAllTreeSpecies': SPECIES_DECODER,
+    'getAllZones': ZONE_DECODER,
+}
+
+XSI_NIL = '{http://www.w3.org/2001/XMLSchema-instance}nil'
+
+
+def _xs_boolean(text: str) -> bool:
+    return text in ('true', '1')
+
+
+# Elementos escalares no textuales del esquema (el resto se deja como texto; fechas y
+# decimales los convierte el propio RowDecoder)
+XML_SCALARS: Dict[str, Callable[[str], Any]] = {
+    'id': int,
+    'zonaId': int,
+    'estadoConservacionId': int,
+    'activo': _xs_boolean,
+}
+
+
+def iter_rows(source, decoder: RowDecoder, row_tag: str = 'return') -> Iterator[Any]:
+    """
+    Recorrer un sobre SOAP y producir un modelo por cada fila `<return>`
+
+    Cada fila se convierte en cuanto se cierra su elemento y se libera
+    enseguida (junto con las anteriores), así la memoria no crece con el
+    tamaño de la respuesta.
+
+    Args:
+        source: Archivo o flujo binario con el sobre SOAP
+        decoder: RowDecoder del modelo
+        row_tag: Nombre local del elemento de cada fila (JAX-WS usa `return`)
+    """
+    from lxml import etree
+
+    decode = decoder.from_mapping
+    scalars = XML_SCALARS
+    # '{*}' acepta la fila con o sin namespace (elementFormDefault qualified o no)
+    for _, row in etree.iterparse(source, events=('end',), tag=f'{{*}}{row_tag}',
+                                  remove_blank_text=True, huge_tree=True):
+        values = {}
+        for child in row:
+            name = etree.QName(child).localname
+            text = child.text
+            if text is None or child.get(XSI_NIL) == 'true':
+                values[name] = None
+            else:
+                convert = scalars.get(name)
+                values[name] = convert(text) if convert else text
+        yield decode(values)
+
+        row.clear()
+        parent = row.getparent()
+        while row.getprevious() is not None:
+            del parent[0]
+
+
+class StreamingSOAPReader:
+    """
+    Lecturas masivas sin el árbol de objetos de zeep.
+
+    Usa el cliente zeep solo para construir el sobre de la petición y conocer
+    la dirección del servicio; la respuesta se descarga por la sesión HTTP
+    compartida con `stream=True` y se decodifica con `iter_rows` a medida que
+    llega. Los SOAP Fault y los errores HTTP se delegan en zeep, así que
+    fallan igual que por la vía normal.
+    """
+
+    def __init__(self, client):
+        """
+        Args:
+            client: Cliente zeep del servicio (el del registro compartido)
+        """
+        self.client = client
+
+    @staticmethod
+    def supports(client, operation: str) -> bool:
+        """Indica si la operación puede leerse en streaming con este cliente"""
+        return (operation in STREAM_DECODERS and soap_available()
+                and hasattr(client, 'create_message'))
+
+    def iter_operation(self, operation: str, *args) -> Iterator[Any]:
+        """Invocar una lectura masiva y producir los modelos según llegan"""
+        response = self._post(operation, *args)
+        try:
+            raw = response.raw
+            raw.decode_content = True  # gzip/deflate transparente
+            yield from iter_rows(raw, STREAM_DECODERS[operation])
+        finally:
+            response.close()
+
+    def fetch(self, operation: str, *args) -> List[Any]:
+        """Invocar una lectura masiva y devolver la lista completa de modelos"""
+        started = time.perf_counter()
+        items = list(self.iter_operation(operation, *args))
+        logger.info(f"Streamed {len(items)} rows from {operation} in {time.perf_counter() - started:.2f}s")
+        return items
+
+    def fetch_raw(self, operation: str, *args) -> bytes:
+        """Sobre de respuesta sin decodificar (para el benchmark)"""
+        response = self._post(operation, *args)
+        try:
+            return response.content
+        finally:
+            response.close()
+
+    def _post(self, operation: str, *args):
+        from lxml import etree
+
+        service = self.client.service
+        binding = service._binding
+        address = service._binding_options['address']
+        envelope = self.client.create_message(service, operation, *args)
+        soapaction = getattr(binding.get(operation), 'soapaction', None) or ''
+
+        factory = get_transport_factory()
+        response = factory.get_session(address).post(
+            address,
+            data=etree.tostring(envelope, xml_declaration=True, encoding='utf-8'),
+            headers={'Content-Type': 'text/xml; charset=utf-8', 'SOAPAction': f'"{soapaction}"'},
+            timeout=factory.config.timeout,
+            stream=True,
+        )
+        if response.status_code != 200:
+            # Deja que zeep interprete el Fault (o el error HTTP) como en la vía normal
+            try:
+                binding.process_reply(self.client, binding.get(operation), response)
+            finally:
+                response.close()
+            raise RuntimeError(f"Unexpected HTTP {response.status_code} from {operation}")
+        return response
+
+
+# ===========================================
+# BENCHMARK: zeep vs streaming sobre el mismo sobre
+# ===========================================
+
+def benchmark(client, operation: str = 'getAllTreeSpecies', repeat: int = 3) -> Dict[str, Any]:
+    """
+    Comparar la vía zeep con la de streaming sobre la misma respuesta
+
+    La respuesta se descarga una vez y se decodifica `repeat` veces por cada
+    vía (sin red en la medición). Se mide el mejor tiempo y el pico de
+    memoria de Python (tracemalloc) de una decodificación.
+
+    Returns:
+        Dict[str, Any]: {'payload_mb': float, 'zeep'|'stream': {'rows', 'seconds', 'peak_mb'}}
+    """
+    from requests.models import Response
+
+    reader = StreamingSOAPReader(client)
+    payload = reader.fetch_raw(operation)
+    binding = client.service._binding
+    decoder = STREAM_DECODERS[operation]
+
+    def zeep_path():
+        response = Response()
+        response._content = payload
+        response.status_code = 200
+        response.headers['Content-Type'] = 'text/xml; charset=utf-8'
+        return decoder.decode_many(binding.process_reply(client, binding.get(operation), response))
+
+    def stream_path():
+        return list(iter_rows(BytesIO(payload), decoder))
+
+    results: Dict[str, Any] = {'payload_mb': len(payload) / 1e6}
+    for name, decode in (('zeep', zeep_path), ('stream', stream_path)):
+        best = float('inf')
+        for _ in range(repeat):
+            started = time.perf_counter()
+            rows = decode()
+            best = min(best, time.perf_counter() - started)
+        tracemalloc.start()
+        decode()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name] = {'rows': len(rows), 'seconds': best, 'peak_mb': peak / 1e6}
+    return results
+
+
+def _main(argv: Optional[List[str]] = None):
+    # Uso: python -m core.soap_stream [--operation getAllZones] [--wsdl URL]
+    from .soap_client import SOAPClientManager
+    from .wsdl_cache import get_soap_client
+
+    defaults = SOAPClientManager()
+    parser = argparse.ArgumentParser(description="Benchmark zeep vs streaming decoder")
+    parser.add_argument('--operation', default='getAllTreeSpecies', choices=sorted(STREAM_DECODERS))
+    parser.add_argument('--wsdl', default=None, help="WSDL del servicio (por defecto el de DataManager)")
+    parser.add_argument('--repeat', type=int, default=3)
+    options = parser.parse_args(argv)
+
+    wsdl = options.wsdl or (defaults.species_service_url if options.operation == 'getAllTreeSpecies'
+                            else defaults.zones_service_url)
+    results = benchmark(get_soap_client(wsdl), options.operation, options.repeat)
+    print(f"📦 {options.operation}: {results.pop('payload_mb'):.1f} MB envelope")
+    for name, result in results.items():
+        print(f"   {name:<6} {result['rows']:>7} rows  {result['seconds'] * 1000:8.1f} ms  "
+              f"peak {result['peak_mb']:7.1f} MB")
+
+
+if __name__ == '__main__':
+    _main()
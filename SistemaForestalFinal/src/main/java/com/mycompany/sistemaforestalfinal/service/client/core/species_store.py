@@ -0,0 +1,376 @@
+"""
+🗃️ Species Repository
+Almacén en memoria de especies con búsqueda por ID en O(1) e índices secundarios
+"""
+
+import threading
+from collections import defaultdict, deque
+from typing import Deque, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .date_index import SortedDateIndex
+from .models import SearchFilter, TreeSpecies
+from .trigram_index import TrigramIndex, match_rank
+from .text_normalization import fold_query, fold_text
+
+# Versiones recientes de las que se recuerda qué especies cambiaron (ver changes_since)
+CHANGE_LOG_SIZE = 64
+
+
+class SpeciesRepository:
+    """
+    Lista de especies junto con sus índices.
+
+    - `by_id`: ID -> especie
+    - Índices invertidos por zonaId, estadoConservacionId y activo (ID -> set de IDs)
+    - Nombres común y científico normalizados (sin acentos, casefold) una sola vez por registro
+    - Índice de trigramas sobre ambos nombres para búsquedas por subcadena
+    - Índices ordenados por fechaCreacion y fechaModificacion para filtros por rango
+
+    Los filtros se resuelven intersecando sets en lugar de recorrer la lista, y
+    los índices se actualizan de forma incremental con `upsert` / `remove`.
+    `version` se incrementa con cada cambio para que otras cachés sepan
+    cuándo invalidarse, y `changes_since` dice qué especies cambiaron para
+    que puedan hacerlo de forma selectiva.
+    """
+
+    def __init__(self, species: Iterable[TreeSpecies] = ()):
+        self.by_id: Dict[int, TreeSpecies] = {}
+        self._by_zone: Dict[int, Set[int]] = defaultdict(set)
+        self._by_state: Dict[int, Set[int]] = defaultdict(set)
+        self._by_active: Dict[bool, Set[int]] = defaultdict(set)
+        self._names: Dict[int, Tuple[str, str]] = {}
+        self._name_index = TrigramIndex()
+        self._created = SortedDateIndex()
+        self._modified = SortedDateIndex()
+        self._position: Dict[int, int] = {}
+        self._next_position = 0
+        self._list: Optional[List[TreeSpecies]] = None
+        self._lock = threading.RLock()
+        self.version = 0
+        # (versión, IDs cambiados); None = todo cambió (carga completa)
+        self._change_log: Deque[Tuple[int, Optional[FrozenSet[int]]]] = deque(maxlen=CHANGE_LOG_SIZE)
+        self.load(species)
+
+    # ===========================================
+    # CARGA Y MODIFICACIÓN
+    # ===========================================
+
+    def load(self, species: Iterable[TreeSpecies]):
+        """Reemplazar todo el contenido (carga completa desde el servidor)"""
+        with self._lock:
+            self.by_id.clear()
+            self._by_zone.clear()
+            self._by_state.clear()
+            self._by_active.clear()
+            self._names.clear()
+            self._name_index.clear()
+            self._created.clear()
+            self._modified.clear()
+            self._position.clear()
+            self._next_position = 0
+            for item in species:
+                if item.id is not None:
+                    self._index(item)
+            self._changed(None)
+
+    def sync(self, species: Iterable[TreeSpecies]) -> int:
+        """
+        Sincronizar con una carga completa reindexando solo lo que cambió
+
+        Returns:
+            int: Número de especies añadidas, modificadas o eliminadas
+        """
+        with self._lock:
+            seen = set()
+            changed = []
+            for item in species:
+                if item.id is None:
+                    continue
+                seen.add(item.id)
+                current = self.by_id.get(item.id)
+                if current != item:
+                    if current is not None:
+                        self._unindex(item.id, keep_position=True)
+                    self._index(item)
+                    changed.append(item.id)
+            for species_id in [i for i in self.by_id if i not in seen]:
+                self._unindex(species_id)
+                changed.append(species_id)
+            if changed:
+                self._changed(changed)
+            return len(changed)
+    
+    def upsert(self, species: TreeSpecies):
+        """Insertar o reemplazar una especie actualizando solo sus entradas de índice"""
+        if species.id is None:
+            raise ValueError("Cannot index a species without id")
+        with self._lock:
+            if species.id in self.by_id:
+                self._unindex(species.id, keep_position=True)
+            self._index(species)
+            self._changed((species.id,))
+
+    def apply_changes(self, upserts: Iterable[TreeSpecies], removals: Iterable[int] = ()) -> int:
+        """
+        Aplicar altas/modificaciones y bajas en un solo paso (una sola versión)
+
+        Los lectores ven el estado anterior o el final, nunca uno intermedio.
+
+        Returns:
+            int: Número de especies insertadas, reemplazadas o eliminadas
+        """
+        with self._lock:
+            changed = []
+            for species in upserts:
+                if species.id is None:
+                    raise ValueError("Cannot index a species without id")
+                if species.id in self.by_id:
+                    self._unindex(species.id, keep_position=True)
+                self._index(species)
+                changed.append(species.id)
+            for species_id in removals:
+                if species_id in self.by_id:
+                    self._unindex(species_id)
+                    changed.append(species_id)
+            if changed:
+                self._changed(changed)
+            return len(changed)
+
+    def remove(self, species_id: int) -> Optional[TreeSpecies]:
+        """Quitar una especie; devuelve la eliminada o None si no existía"""
+        with self._lock:
+            if species_id not in self.by_id:
+                return None
+            removed = self._unindex(species_id)
+            self._changed((species_id,))
+            return removed
+
+    def _index(self, species: TreeSpecies):
+        species_id = species.id
+        self.by_id[species_id] = species
+        if species_id not in self._position:
+            self._position[species_id] = self._next_position
+            self._next_position += 1
+        self._by_zone[species.zonaId].add(species_id)
+        self._by_state[species.estadoConservacionId].add(species_id)
+        self._by_active[bool(species.activo)].add(species_id)
+        self._names[species_id] = (
+            fold_text(species.nombreComun),
+            fold_text(species.nombreCientifico),
+        )
+        # No hace nada si los nombres no cambiaron
+        self._name_index.update(species_id, species.nombreComun, species.nombreCientifico)
+        self._created.add(species_id, species.fechaCreacion)
+        self._modified.add(species_id, species.fechaModificacion)
+
+    def _unindex(self, species_id: int, keep_position: bool = False) -> TreeSpecies:
+        species = self.by_id.pop(species_id)
+        for index, value in ((self._by_zone, species.zonaId),
+                             (self._by_state, species.estadoConservacionId),
+                             (self._by_active, bool(species.activo))):
+            bucket = index.get(value)
+            if bucket is not None:
+                bucket.discard(species_id)
+                if not bucket:
+                    del index[value]
+        self._names.pop(species_id, None)
+        self._created.remove(species_id)
+        self._modified.remove(species_id)
+        if not keep_position:
+            self._position.pop(species_id, None)
+            self._name_index.remove(species_id)
+        return species
+
+    def _changed(self, species_ids: Optional[Iterable[int]]):
+        self._list = None
+        self.version += 1
+        self._change_log.append((self.version, frozenset(species_ids) if species_ids is not None else None))
+
+    def changes_since(self, version: int) -> Optional[Set[int]]:
+        """
+        IDs de las especies que cambiaron (altas, modificaciones o bajas) después de `version`
+
+        Returns:
+            Optional[Set[int]]: Los IDs, o None si no se puede saber (carga
+            completa de por medio o versión más antigua que el registro)
+        """
+        with self._lock:
+            if version >= self.version:
+                return set()
+            if not self._change_log or self._change_log[0][0] > version + 1:
+                return None
+            changed: Set[int] = set()
+            for change_version, species_ids in self._change_log:
+                if change_version <= version:
+                    continue
+                if species_ids is None:
+                    return None
+                changed |= species_ids
+            return changed
+
+    # ===========================================
+    # CONSULTAS
+    # ===========================================
+
+    def get(self, species_id: int) -> Optional[TreeSpecies]:
+        """Buscar por ID en O(1)"""
+        return self.by_id.get(species_id)
+
+    def all(self) -> List[TreeSpecies]:
+        """Todas las especies en el orden en que llegaron del servidor"""
+        with self._lock:
+            if self._list is None:
+                self._list = self._ordered(self.by_id.keys())
+            return self._list
+
+    def names(self, species_id: int) -> Tuple[str, str]:
+        """Nombres común y científico normalizados"""
+        return self._names.get(species_id, ("", ""))
+
+    def ids_for(self, zone_id: Optional[int] = None,
+                conservation_state_id: Optional[int] = None,
+                active: Optional[bool] = None) -> Set[int]:
+        """IDs que cumplen todos los criterios dados (intersección de índices)"""
+        with self._lock:
+            buckets = []
+            if zone_id is not None:
+                buckets.append(self._by_zone.get(zone_id, set()))
+            if conservation_state_id is not None:
+                buckets.append(self._by_state.get(conservation_state_id, set()))
+            if active is not None:
+                buckets.append(self._by_active.get(bool(active), set()))
+
+            if not buckets:
+                return set(self.by_id)
+
+            # Empezar por el set más pequeño reduce el coste de la intersección
+            buckets.sort(key=len)
+            return set(buckets[0]).intersection(*buckets[1:])
+
+    def index_counts(self, search_filter: SearchFilter) -> List[int]:
+        """
+        Tamaño del índice de cada criterio del filtro (para estimar su selectividad)
+
+        El del nombre es una cota superior: la lista de trigramas más corta de la consulta.
+        """
+        with self._lock:
+            counts = []
+            if search_filter.zone_id is not None:
+                counts.append(len(self._by_zone.get(search_filter.zone_id, ())))
+            if search_filter.conservation_state_id is not None:
+                counts.append(len(self._by_state.get(search_filter.conservation_state_id, ())))
+            if search_filter.active_only:
+                counts.append(len(self._by_active.get(True, ())))
+            if search_filter.name_query and search_filter.name_query.strip():
+                counts.append(self._name_index.estimate(fold_query(search_filter.name_query)))
+            # Los rangos de fecha se cuentan exactos con dos búsquedas binarias
+            if search_filter.has_created_range:
+                counts.append(self._created.count(search_filter.created_after, search_filter.created_before))
+            if search_filter.has_modified_range:
+                counts.append(self._modified.count(search_filter.modified_after, search_filter.modified_before))
+            return counts
+
+    def filter(self, search_filter: SearchFilter) -> List[TreeSpecies]:
+        """Aplicar un SearchFilter usando los índices"""
+        with self._lock:
+            ids = self._filter_ids(search_filter)
+            if search_filter.name_query:
+                # Orden por relevancia del nombre, restringido a los IDs filtrados
+                return [self.by_id[i] for i in self._name_index.search(fold_query(search_filter.name_query))
+                        if i in ids]
+            return self._ordered(ids)
+
+    def ids_in_range(self, created_after=None, created_before=None,
+                     modified_after=None, modified_before=None) -> Set[int]:
+        """
+        IDs con fechas de creación / modificación dentro de los rangos dados (extremos incluidos)
+
+        Cada rango se resuelve con el índice ordenado en O(log n + k). Las
+        especies sin fecha no se descartan, igual que en el servidor.
+        """
+        return self._filter_ids(SearchFilter(created_after=created_after, created_before=created_before,
+                                             modified_after=modified_after, modified_before=modified_before))
+
+    def _filter_ids(self, search_filter: SearchFilter) -> Set[int]:
+        """IDs que cumplen los criterios de índice y fecha del filtro (sin el nombre)"""
+        with self._lock:
+            buckets = []
+            if search_filter.zone_id is not None:
+                buckets.append(self._by_zone.get(search_filter.zone_id, set()))
+            if search_filter.conservation_state_id is not None:
+                buckets.append(self._by_state.get(search_filter.conservation_state_id, set()))
+            # active_only=False significa "sin filtrar", no "solo inactivas"
+            if search_filter.active_only:
+                buckets.append(self._by_active.get(True, set()))
+            if search_filter.has_created_range:
+                buckets.append(self._created.between(search_filter.created_after, search_filter.created_before))
+            if search_filter.has_modified_range:
+                buckets.append(self._modified.between(search_filter.modified_after, search_filter.modified_before))
+
+            if not buckets:
+                return set(self.by_id)
+
+            buckets.sort(key=len)
+            return set(buckets[0]).intersection(*buckets[1:])
+
+    def matches(self, species_id: int, search_filter: SearchFilter) -> bool:
+        """Indica si una especie del repositorio cumple el filtro (misma regla que `filter`)"""
+        with self._lock:
+            species = self.by_id.get(species_id)
+            if species is None:
+                return False
+            if search_filter.zone_id is not None and species.zonaId != search_filter.zone_id:
+                return False
+            if (search_filter.conservation_state_id is not None
+                    and species.estadoConservacionId != search_filter.conservation_state_id):
+                return False
+            if search_filter.active_only and not species.activo:
+                return False
+            if (search_filter.has_created_range and not self._created.contains(
+                    species_id, search_filter.created_after, search_filter.created_before)):
+                return False
+            if (search_filter.has_modified_range and not self._modified.contains(
+                    species_id, search_filter.modified_after, search_filter.modified_before)):
+                return False
+            if search_filter.name_query:
+                return match_rank(fold_query(search_filter.name_query), self._names[species_id]) is not None
+            return True
+
+    def search_by_name(self, query: str, exact_match: bool = False) -> List[TreeSpecies]:
+        """
+        Buscar por nombre común o científico
+
+        Las coincidencias parciales salen del índice de trigramas ordenadas por
+        relevancia (prefijo > inicio de palabra > dentro de palabra).
+        """
+        query = fold_query(query)
+        with self._lock:
+            if exact_match:
+                return self._ordered(i for i, (common, scientific) in self._names.items()
+                                     if common == query or scientific == query)
+            return [self.by_id[i] for i in self._name_index.search(query)]
+
+    def refine_by_name(self, query: str, previous: Iterable[TreeSpecies]) -> List[TreeSpecies]:
+        """
+        Repetir una búsqueda parcial solo sobre un resultado anterior
+
+        Válido cuando la consulta nueva extiende la que produjo `previous`;
+        devuelve lo mismo que `search_by_name(query)` sin recorrer el índice.
+        """
+        query = fold_query(query)
+        with self._lock:
+            ids = [s.id for s in previous if s.id in self.by_id]
+            return [self.by_id[i] for i in self._name_index.rank(query, ids)]
+
+    def _ordered(self, ids: Iterable[int]) -> List[TreeSpecies]:
+        position = self._position
+        return [self.by_id[i] for i in sorted(ids, key=position.__getitem__)]
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def __contains__(self, species_id: int) -> bool:
+        return species_id in self.by_id
+
+    def __iter__(self) -> Iterator[TreeSpecies]:
+        return iter(self.all())
@@ -0,0 +1,199 @@
+"""
+🧵 Task Executor
+Pool de hilos acotado con coalescencia por clave y cancelación de tareas reemplazadas
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+
+class TaskHandle:
+    """Referencia a una tarea enviada al executor"""
+
+    def __init__(self, key: Optional[str], group: Optional[str]):
+        self.key = key
+        self.group = group
+        self.future: Optional[Future] = None
+        self._callbacks: List[Tuple[Optional[Callable], Optional[Callable], Any]] = []
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """Indica si la tarea fue cancelada o reemplazada"""
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """Cancelar la tarea; si ya está en ejecución, su resultado se descarta"""
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+
+class TaskExecutor:
+    """
+    Executor central para el trabajo en segundo plano de la UI.
+
+    - Concurrencia acotada: nunca hay más de `max_workers` llamadas SOAP a la vez.
+    - Coalescencia: tareas con la misma `key` en curso se comparten
+      (una sola carga de "todas las especies" aunque se pulse varias veces).
+    - Reemplazo: dentro de un mismo `group` solo vale la última tarea enviada;
+      las anteriores se cancelan y sus callbacks no se ejecutan.
+    - Los callbacks se entregan a través de un dispatcher (p. ej. TkDispatcher)
+      para que se ejecuten en el hilo de la interfaz.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, dispatcher=None):
+        """
+        Args:
+            max_workers: Número máximo de hilos de trabajo
+            dispatcher: Objeto con `post(fn, *args)` usado por defecto para los callbacks
+        """
+        self.max_workers = max_workers
+        self.dispatcher = dispatcher
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="forest-worker")
+        self._inflight: Dict[str, TaskHandle] = {}
+        self._latest: Dict[str, TaskHandle] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable, *args,
+               key: Optional[str] = None,
+               group: Optional[str] = None,
+               on_success: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None,
+               dispatcher=None,
+               **kwargs) -> TaskHandle:
+        """
+        Enviar una tarea al pool
+
+        Args:
+            fn: Función a ejecutar en segundo plano
+            key: Identidad del trabajo; si ya hay una tarea con esa clave en curso se reutiliza
+            group: Canal "la última gana"; cancela la tarea anterior del mismo grupo
+            on_success: Callback con el resultado
+            on_error: Callback con la excepción
+            dispatcher: Dispatcher para los callbacks (por defecto el del executor)
+
+        Returns:
+            TaskHandle: Referencia para consultar o cancelar la tarea
+        """
+        with self._lock:
+            handle = self._inflight.get(key) if key is not None else None
+            is_new = handle is None
+            if is_new:
+                handle = TaskHandle(key, group)
+                if key is not None:
+                    self._inflight[key] = handle
+
+            handle._callbacks.append((on_success, on_error, dispatcher or self.dispatcher))
+
+            if group is not None:
+                previous = self._latest.get(group)
+                if previous is not None and previous is not handle:
+                    self._cancel_locked(previous)
+                self._latest[group] = handle
+
+        if is_new:
+            handle.future = self._pool.submit(self._run, handle, fn, args, kwargs)
+        return handle
+
+    def cancel(self, key: Optional[str] = None, group: Optional[str] = None):
+        """Cancelar la tarea en curso de una clave o la última de un grupo"""
+        with self._lock:
+            if key is not None and key in self._inflight:
+                self._cancel_locked(self._inflight[key])
+            if group is not None and group in self._latest:
+                self._cancel_locked(self._latest[group])
+
+    def is_running(self, key: str) -> bool:
+        """Indica si hay una tarea en curso para una clave"""
+        with self._lock:
+            return key in self._inflight
+
+    def _cancel_locked(self, handle: TaskHandle):
+        handle.cancel()
+        self._forget_locked(handle)
+
+    def _forget_locked(self, handle: TaskHandle):
+        if handle.key is not None and self._inflight.get(handle.key) is handle:
+            del self._inflight[handle.key]
+        if handle.group is not None and self._latest.get(handle.group) is handle:
+            del self._latest[handle.group]
+
+    def _run(self, handle: TaskHandle, fn: Callable, args: tuple, kwargs: dict):
+        """Ejecutar la tarea y entregar el resultado a sus callbacks"""
+        if handle.cancelled:
+            return None
+
+        error = None
+        result = None
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            error = e
+
+        with self._lock:
+            self._forget_locked(handle)
+            callbacks = [] if handle.cancelled else list(handle._callbacks)
+
+        for on_success, on_error, dispatcher in callbacks:
+            callback = on_error if error is not None else on_success
+            value = error if error is not None else result
+            if callback is None:
+                if error is not None:
+                    logger.warning(f"Background task {handle.key or fn.__name__} failed: {error}")
+                continue
+            if dispatcher is not None:
+                dispatcher.post(self._deliver, handle, callback, value)
+            else:
+                self._deliver(handle, callback, value)
+
+        if error is not None:
+            raise error
+        return result
+
+    @staticmethod
+    def _deliver(handle: TaskHandle, callback: Callable, value: Any):
+        # Una búsqueda puede quedar obsoleta mientras su resultado espera en la cola de la UI
+        if not handle.cancelled:
+            callback(value)
+
+    def shutdown(self, wait: bool = False):
+        """Detener el pool descartando las tareas pendientes"""
+        with self._lock:
+            for handle in list(self._inflight.values()) + list(self._latest.values()):
+                handle.cancel()
+            self._inflight.clear()
+            self._latest.clear()
+        self._pool.shutdown(wait=wait)
+
+
+_default_executor: Optional[TaskExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+def get_task_executor() -> TaskExecutor:
+    """Executor compartido por toda la aplicación"""
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = TaskExecutor()
+        return _default_executor
+
+
+def configure_task_executor(max_workers: int = DEFAULT_MAX_WORKERS, dispatcher=None) -> TaskExecutor:
+    """
+    Reemplazar el executor compartido (p. ej. al crear la ventana principal
+    para que los callbacks se entreguen en el hilo de Tk).
+    """
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is not None:
+            _default_executor.shutdown(wait=False)
+        _default_executor = TaskExecutor(max_workers=max_workers, dispatcher=dispatcher)
+        return _default_executor
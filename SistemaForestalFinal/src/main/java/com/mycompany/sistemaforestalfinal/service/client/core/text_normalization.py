@@ -0,0 +1,27 @@
+"""
+🔡 Text Normalization
+Normalización de texto para búsquedas insensibles a acentos y mayúsculas
+"""
+
+import unicodedata
+from functools import lru_cache
+from typing import Optional
+
+
+def fold_text(text: Optional[str]) -> str:
+    """
+    Clave de búsqueda de un texto: sin acentos (NFKD) y en casefold
+
+    "Guayacán" -> "guayacan", "Húmedo Tropical" -> "humedo tropical"
+    """
+    if not text:
+        return ""
+    # casefold antes de descomponer: algunas letras ("İ") generan marcas combinantes al plegarse
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+@lru_cache(maxsize=256)
+def fold_query(query: str) -> str:
+    """fold_text para consultas: se repiten mucho al escribir, así que se memorizan"""
+    return fold_text(query.strip())
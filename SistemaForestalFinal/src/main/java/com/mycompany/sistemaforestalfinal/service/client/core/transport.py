@@ -0,0 +1,192 @@
+"""
+🔌 Transport Factory
+Sesiones HTTP compartidas (keep-alive + pool de conexiones) para todos los clientes SOAP
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from .soap_deps import async_available, async_zeep_modules, soap_available, zeep_modules
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TransportConfig:
+    """Configuración del pool HTTP compartido"""
+    pool_connections: int = 4      # Pools por sesión (uno por host:puerto)
+    pool_maxsize: int = 10         # Conexiones keep-alive por pool
+    connect_timeout: float = 5.0   # Segundos para abrir la conexión TCP
+    read_timeout: float = 30.0     # Segundos esperando la respuesta
+    max_retries: int = 2           # Reintentos ante fallos de conexión
+    backoff_factor: float = 0.3    # Espera exponencial entre reintentos
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """Timeout en el formato (connect, read) que acepta requests"""
+        return (self.connect_timeout, self.read_timeout)
+
+
+class TransportFactory:
+    """
+    Fábrica de transportes zeep que comparten una sesión HTTP por host.
+
+    Todos los clientes que apuntan al mismo host:puerto reutilizan el mismo
+    pool de conexiones, evitando un handshake TCP por cada petición. Los
+    clientes asíncronos comparten igualmente un httpx.AsyncClient por host.
+    """
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        self.config = config or TransportConfig()
+        self._sessions: Dict[str, "requests.Session"] = {}
+        # host -> (httpx.AsyncClient para operaciones, httpx.Client para documentos)
+        self._async_sessions: Dict[str, Tuple[Any, Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _host_key(url: str) -> str:
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    def get_session(self, url: str) -> "requests.Session":
+        """
+        Obtener la sesión compartida para el host de una URL
+
+        Args:
+            url: URL de cualquier recurso del host (WSDL o endpoint)
+
+        Returns:
+            requests.Session: Sesión con pool de conexiones y reintentos
+        """
+        if not soap_available():
+            raise RuntimeError("requests/zeep are not installed - HTTP transport unavailable")
+
+        key = self._host_key(url)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._create_session()
+                self._sessions[key] = session
+                logger.info(f"Created pooled HTTP session for {key}")
+            return session
+
+    def _create_session(self) -> "requests.Session":
+        """Crear una sesión keep-alive con el pool y la política de reintentos configurados"""
+        deps = zeep_modules()
+        retry = deps.Retry(
+            total=self.config.max_retries,
+            connect=self.config.max_retries,
+            read=0,  # Una operación SOAP (POST) nunca se reenvía tras enviarse
+            status=self.config.max_retries,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            backoff_factor=self.config.backoff_factor,
+            raise_on_status=False,
+        )
+        adapter = deps.HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            max_retries=retry,
+        )
+        session = deps.requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def transport_kwargs(self, url: str) -> dict:
+        """Argumentos para construir un Transport de zeep sobre la sesión compartida"""
+        return {
+            "session": self.get_session(url),
+            "timeout": self.config.timeout,
+            "operation_timeout": self.config.timeout,
+        }
+
+    def create_transport(self, url: str, cache=None):
+        """Crear un Transport de zeep que usa la sesión compartida del host"""
+        return zeep_modules().Transport(cache=cache, **self.transport_kwargs(url))
+
+    def get_async_sessions(self, url: str) -> Tuple[Any, Any]:
+        """
+        Obtener los clientes httpx compartidos para el host de una URL
+
+        Returns:
+            Tuple[httpx.AsyncClient, httpx.Client]: Pool asíncrono para las
+            operaciones y cliente síncrono para los documentos WSDL/XSD
+        """
+        if not async_available():
+            raise RuntimeError("httpx is not installed - async HTTP transport unavailable")
+
+        key = self._host_key(url)
+        with self._lock:
+            sessions = self._async_sessions.get(key)
+            if sessions is None:
+                httpx = async_zeep_modules().httpx
+                timeout = httpx.Timeout(self.config.read_timeout, connect=self.config.connect_timeout)
+                limits = httpx.Limits(
+                    max_connections=self.config.pool_maxsize,
+                    max_keepalive_connections=self.config.pool_maxsize,
+                )
+                sessions = (httpx.AsyncClient(timeout=timeout, limits=limits), httpx.Client(timeout=timeout))
+                self._async_sessions[key] = sessions
+                logger.info(f"Created pooled async HTTP client for {key}")
+            return sessions
+
+    def create_async_transport(self, url: str, cache=None):
+        """Crear un AsyncTransport de zeep sobre los clientes httpx compartidos del host"""
+        client, wsdl_client = self.get_async_sessions(url)
+        return async_zeep_modules().AsyncTransport(client=client, wsdl_client=wsdl_client, cache=cache)
+
+    async def aclose_async_sessions(self):
+        """Cerrar los clientes httpx asíncronos (desde el event loop que los usa)"""
+        with self._lock:
+            sessions = list(self._async_sessions.values())
+            self._async_sessions.clear()
+        for client, wsdl_client in sessions:
+            await client.aclose()
+            wsdl_client.close()
+
+    def close(self):
+        """Cerrar todas las sesiones (al salir de la aplicación)"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            # Los AsyncClient solo se pueden cerrar desde su event loop (aclose_async_sessions);
+            # aquí se sueltan y se cierran los clientes síncronos
+            for _, wsdl_client in self._async_sessions.values():
+                wsdl_client.close()
+            self._async_sessions.clear()
+
+
+_default_factory: Optional[TransportFactory] = None
+_default_factory_lock = threading.Lock()
+
+
+def get_transport_factory() -> TransportFactory:
+    """Fábrica de transportes compartida por todas las capas cliente"""
+    global _default_factory
+    with _default_factory_lock:
+        if _default_factory is None:
+            _default_factory = TransportFactory()
+        return _default_factory
+
+
+def configure_transport(config: TransportConfig) -> TransportFactory:
+    """
+    Reemplazar la configuración del pool compartido.
+
+    Las sesiones existentes se cierran y los clientes ya parseados se descartan
+    para que el próximo uso los reconstruya sobre el nuevo pool.
+    """
+    global _default_factory
+    from .wsdl_cache import get_default_registry
+
+    with _default_factory_lock:
+        if _default_factory is not None:
+            _default_factory.close()
+        _default_factory = TransportFactory(config)
+    get_default_registry().clear()
+    return _default_factory
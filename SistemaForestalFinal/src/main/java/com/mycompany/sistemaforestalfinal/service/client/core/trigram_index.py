@@ -0,0 +1,210 @@
+"""
+🔤 Trigram Index
+Índice de trigramas para búsqueda de subcadenas con resultados ordenados por relevancia
+"""
+
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .text_normalization import fold_text
+
+# Niveles de relevancia (menor es mejor)
+RANK_PREFIX = 0       # El texto empieza por la consulta
+RANK_WORD_START = 1   # Alguna palabra del texto empieza por la consulta
+RANK_INFIX = 2        # La consulta aparece en medio de una palabra
+
+GRAM_SIZE = 3
+
+
+def match_rank(query: str, texts: Sequence[str]) -> Optional[int]:
+    """
+    Relevancia de la mejor coincidencia de `query` dentro de `texts`
+
+    Args:
+        query: Consulta ya normalizada
+        texts: Textos ya normalizados
+
+    Returns:
+        Optional[int]: RANK_PREFIX, RANK_WORD_START, RANK_INFIX o None si no coincide
+    """
+    best = None
+    for text in texts:
+        pos = text.find(query)
+        while pos != -1:
+            if pos == 0:
+                return RANK_PREFIX
+            rank = RANK_WORD_START if not text[pos - 1].isalnum() else RANK_INFIX
+            if best is None or rank < best:
+                best = rank
+            if best == RANK_WORD_START:
+                break
+            pos = text.find(query, pos + 1)
+    return best
+
+
+class TrigramIndex:
+    """
+    Índice invertido trigrama -> documentos.
+
+    Una consulta de 3 o más caracteres solo verifica los documentos que
+    contienen todos sus trigramas; las más cortas recorren el vocabulario de
+    trigramas (acotado por el alfabeto), no los documentos. El índice se
+    mantiene de forma incremental: `update` no hace nada si los textos de un
+    documento no cambiaron.
+    """
+
+    def __init__(self, normalize: Callable[[str], str] = fold_text):
+        """
+        Args:
+            normalize: Normalización aplicada a textos y consultas (por defecto sin acentos ni mayúsculas)
+        """
+        self.normalize = normalize
+        self._postings: Dict[str, Set[Hashable]] = defaultdict(set)
+        self._texts: Dict[Hashable, Tuple[str, ...]] = {}
+        self._short: Set[Hashable] = set()  # Documentos con algún texto sin trigramas
+        self._seq: Dict[Hashable, int] = {}
+        self._next_seq = 0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _grams(text: str) -> Set[str]:
+        return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+    def update(self, doc_id: Hashable, *texts: Optional[str]):
+        """Indexar (o reindexar) los textos de un documento"""
+        normalized = tuple(self.normalize(t) for t in texts if t)
+        with self._lock:
+            previous = self._texts.get(doc_id)
+            if previous == normalized:
+                return
+            old_grams = set().union(*(self._grams(t) for t in previous)) if previous else set()
+            new_grams = set().union(*(self._grams(t) for t in normalized)) if normalized else set()
+            for gram in old_grams - new_grams:
+                self._discard(gram, doc_id)
+            for gram in new_grams - old_grams:
+                self._postings[gram].add(doc_id)
+            self._texts[doc_id] = normalized
+            if any(len(t) < GRAM_SIZE for t in normalized):
+                self._short.add(doc_id)
+            else:
+                self._short.discard(doc_id)
+            if doc_id not in self._seq:
+                self._seq[doc_id] = self._next_seq
+                self._next_seq += 1
+
+    def remove(self, doc_id: Hashable):
+        """Quitar un documento del índice"""
+        with self._lock:
+            previous = self._texts.pop(doc_id, None)
+            self._seq.pop(doc_id, None)
+            self._short.discard(doc_id)
+            if previous:
+                for gram in set().union(*(self._grams(t) for t in previous)):
+                    self._discard(gram, doc_id)
+
+    def sync(self, documents: Iterable[Tuple[Hashable, Sequence[Optional[str]]]]) -> int:
+        """
+        Sincronizar el índice con una colección completa de documentos
+
+        Solo se reindexan los documentos nuevos o modificados y se eliminan los
+        que ya no están. Devuelve el número de documentos afectados.
+        """
+        with self._lock:
+            seen = set()
+            changed = 0
+            for doc_id, texts in documents:
+                seen.add(doc_id)
+                before = self._texts.get(doc_id)
+                self.update(doc_id, *texts)
+                if self._texts.get(doc_id) != before:
+                    changed += 1
+            for doc_id in [d for d in self._texts if d not in seen]:
+                self.remove(doc_id)
+                changed += 1
+            return changed
+
+    def clear(self):
+        """Vaciar el índice"""
+        with self._lock:
+            self._postings.clear()
+            self._texts.clear()
+            self._seq.clear()
+            self._short.clear()
+            self._next_seq = 0
+
+    def _discard(self, gram: str, doc_id: Hashable):
+        bucket = self._postings.get(gram)
+        if bucket is not None:
+            bucket.discard(doc_id)
+            if not bucket:
+                del self._postings[gram]
+
+    def candidates(self, query: str) -> Set[Hashable]:
+        """Documentos que pueden contener la consulta (superconjunto de las coincidencias)"""
+        query = self.normalize(query)
+        with self._lock:
+            if not query:
+                return set(self._texts)
+            if len(query) < GRAM_SIZE:
+                result = set()
+                for gram, bucket in self._postings.items():
+                    if query in gram:
+                        result |= bucket
+                # Textos más cortos que un trigrama no tienen entradas en el índice
+                result.update(d for d in self._short
+                              if any(query in t for t in self._texts[d]))
+                return result
+
+            buckets = [self._postings.get(gram) for gram in self._grams(query)]
+            if not all(buckets):
+                return set()
+            buckets.sort(key=len)
+            return set(buckets[0]).intersection(*buckets[1:])
+
+    def estimate(self, query: str) -> int:
+        """
+        Cota superior barata de los documentos que coinciden
+
+        El tamaño de la lista más corta entre los trigramas de la consulta,
+        sin intersecar; consultas cortas cuentan todos los documentos.
+        """
+        query = self.normalize(query)
+        with self._lock:
+            if len(query) < GRAM_SIZE:
+                return len(self._texts)
+            return min(len(self._postings.get(gram, ())) for gram in self._grams(query))
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Hashable]:
+        """
+        Documentos que contienen la consulta, ordenados por relevancia
+
+        Orden: prefijo > inicio de palabra > dentro de palabra; a igual
+        relevancia se respeta el orden de inserción.
+        """
+        with self._lock:
+            return self.rank(query, self.candidates(query), limit)
+
+    def rank(self, query: str, doc_ids: Iterable[Hashable], limit: Optional[int] = None) -> List[Hashable]:
+        """
+        Como `search`, pero verificando solo los documentos dados
+
+        Sirve para refinar un resultado anterior: si la consulta nueva extiende
+        la anterior ("gua" -> "guay"), sus coincidencias son un subconjunto.
+        """
+        normalized = self.normalize(query)
+        with self._lock:
+            ranked = []
+            for doc_id in doc_ids:
+                rank = match_rank(normalized, self._texts.get(doc_id, ()))
+                if rank is not None:
+                    ranked.append((rank, self._seq[doc_id], doc_id))
+        ranked.sort(key=lambda item: (item[0], item[1]))
+        ids = [doc_id for _, _, doc_id in ranked]
+        return ids[:limit] if limit is not None else ids
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self._texts
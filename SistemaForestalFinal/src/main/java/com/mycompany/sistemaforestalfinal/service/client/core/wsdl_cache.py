@@ -0,0 +1,276 @@
+"""
+🗂️ WSDL Cache
+Caché persistente en disco de documentos WSDL/XSD y registro único de clientes SOAP
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Any
+from urllib.parse import urlparse
+
+from .soap_deps import async_available, async_zeep_modules, soap_available, zeep_modules
+from .transport import get_transport_factory
+
+logger = logging.getLogger(__name__)
+
+# Incrementar cuando cambie el formato de las entradas en disco
+WSDL_CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get("FOREST_CLIENT_CACHE_DIR", Path.home() / ".forest_client" / "wsdl_cache")
+)
+DEFAULT_MAX_AGE = 3600  # Revalidar contra el servidor cada hora
+
+
+class WSDLDiskCache:
+    """
+    Caché versionada en disco para documentos WSDL/XSD.
+
+    Cada entrada se guarda bajo el hash de su URL junto con sus metadatos
+    (ETag, Last-Modified y hash SHA-256 del contenido), de modo que pueda
+    revalidarse con el servidor sin volver a descargar el documento.
+    Implementa la interfaz de caché de zeep (`add` / `get`) sin heredar de
+    ella, para no importar zeep al cargar este módulo.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_age: int = DEFAULT_MAX_AGE):
+        """
+        Args:
+            cache_dir: Directorio base de la caché
+            max_age: Segundos durante los que una entrada se usa sin revalidar
+        """
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR) / f"v{WSDL_CACHE_VERSION}"
+        self.max_age = max_age
+        self._lock = threading.Lock()
+
+    def _entry_paths(self, url: str):
+        """Rutas del contenido y de los metadatos para una URL"""
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.xml", self.cache_dir / f"{key}.json"
+
+    def get_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        """Obtiene la entrada (contenido + metadatos) o None si no existe o está corrupta"""
+        content_path, meta_path = self._entry_paths(url)
+        try:
+            with self._lock:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                content = content_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+        if meta.get("url") != url or meta.get("sha256") != hashlib.sha256(content).hexdigest():
+            logger.warning(f"Discarding corrupt WSDL cache entry for {url}")
+            return None
+
+        meta["content"] = content
+        return meta
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Indica si la entrada puede usarse sin revalidar"""
+        return (time.time() - entry.get("validated_at", 0)) < self.max_age
+
+    def store(self, url: str, content: bytes, etag: Optional[str] = None,
+              last_modified: Optional[str] = None):
+        """Guarda un documento y sus metadatos de forma atómica"""
+        content_path, meta_path = self._entry_paths(url)
+        meta = {
+            "url": url,
+            "sha256": hashlib.sha256(content).hexdigest(),
+            "etag": etag,
+            "last_modified": last_modified,
+            "validated_at": time.time(),
+        }
+        try:
+            with self._lock:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                self._write_atomic(content_path, content)
+                self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        except OSError as e:
+            logger.warning(f"Could not write WSDL cache entry for {url}: {e}")
+
+    def touch(self, url: str):
+        """Marca una entrada como revalidada (respuesta 304 o contenido sin cambios)"""
+        entry = self.get_entry(url)
+        if entry:
+            self.store(url, entry["content"], entry.get("etag"), entry.get("last_modified"))
+
+    def clear(self):
+        """Elimina todas las entradas de la versión actual"""
+        with self._lock:
+            if not self.cache_dir.exists():
+                return
+            for path in self.cache_dir.iterdir():
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    # Interfaz de caché de zeep
+    def add(self, url, content):
+        self.store(url, content)
+
+    def get(self, url):
+        entry = self.get_entry(url)
+        if entry and self.is_fresh(entry):
+            return entry["content"]
+        return None
+
+
+class CachingTransportMixin:
+    """Revalida los WSDL/XSD en caché con ETag / Last-Modified (se mezcla con el Transport de zeep)"""
+
+    def __init__(self, cache: WSDLDiskCache, **kwargs):
+        super().__init__(cache=cache, **kwargs)
+
+    def load(self, url):
+        """Carga un documento usando la caché en disco y peticiones condicionales"""
+        if not url or urlparse(url).scheme not in ("http", "https"):
+            return super().load(url)
+
+        entry = self.cache.get_entry(url)
+        if entry and self.cache.is_fresh(entry):
+            return entry["content"]
+
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self.session.get(url, headers=headers, timeout=self.load_timeout)
+
+        if response.status_code == 304 and entry:
+            self.cache.touch(url)
+            return entry["content"]
+
+        response.raise_for_status()
+        content = response.content
+        self.cache.store(
+            url,
+            content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return content
+
+
+@lru_cache(maxsize=None)
+def caching_transport_class() -> type:
+    """Clase CachingTransport, construida sobre zeep la primera vez que se pide"""
+    return type("CachingTransport", (CachingTransportMixin, zeep_modules().Transport), {})
+
+
+class SOAPClientRegistry:
+    """
+    Registro de clientes zeep ya parseados, compartido por todo el proceso.
+
+    Cada endpoint WSDL se parsea una sola vez; los documentos se leen de la
+    caché en disco, por lo que los arranques posteriores no los descargan.
+    El cliente asíncrono de un endpoint reutiliza el WSDL ya parseado del
+    síncrono.
+    """
+
+    def __init__(self, cache: Optional[WSDLDiskCache] = None):
+        self.cache = cache or WSDLDiskCache()
+        self._clients: Dict[str, Any] = {}
+        self._async_clients: Dict[str, Any] = {}
+        self._url_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get_client(self, wsdl_url: str):
+        """
+        Obtener (o construir una sola vez) el cliente zeep para un WSDL
+
+        Args:
+            wsdl_url: URL del WSDL del servicio
+
+        Returns:
+            Client: Cliente zeep compartido para ese endpoint
+        """
+        if not soap_available():
+            raise RuntimeError("zeep is not installed - SOAP clients unavailable")
+
+        with self._lock:
+            client = self._clients.get(wsdl_url)
+            if client is not None:
+                return client
+            url_lock = self._url_locks.setdefault(wsdl_url, threading.Lock())
+
+        # Un lock por URL: dos hilos pidiendo el mismo WSDL no lo parsean dos veces
+        with url_lock:
+            client = self._clients.get(wsdl_url)
+            if client is None:
+                started = time.perf_counter()
+                client = zeep_modules().Client(wsdl_url, transport=self._create_transport(wsdl_url))
+                logger.info(f"Parsed WSDL {wsdl_url} in {time.perf_counter() - started:.2f}s")
+                with self._lock:
+                    self._clients[wsdl_url] = client
+        return client
+
+    def get_async_client(self, wsdl_url: str):
+        """
+        Obtener (o construir una sola vez) el zeep.AsyncClient para un WSDL
+
+        Se monta sobre el documento del cliente síncrono del registro (sin
+        volver a parsearlo) y sobre el httpx.AsyncClient compartido del host.
+        """
+        if not async_available():
+            raise RuntimeError("httpx is not installed - async SOAP clients unavailable")
+
+        client = self.get_client(wsdl_url)
+        with self._lock:
+            async_client = self._async_clients.get(wsdl_url)
+            if async_client is None or async_client.wsdl is not client.wsdl:
+                transport = get_transport_factory().create_async_transport(wsdl_url, cache=self.cache)
+                async_client = async_zeep_modules().AsyncClient(
+                    client.wsdl, transport=transport, settings=client.settings
+                )
+                self._async_clients[wsdl_url] = async_client
+            return async_client
+
+    def _create_transport(self, wsdl_url: str):
+        """Crear el transporte del endpoint sobre la sesión HTTP compartida de su host"""
+        transport_class = caching_transport_class()
+        return transport_class(cache=self.cache, **get_transport_factory().transport_kwargs(wsdl_url))
+
+    def invalidate(self, wsdl_url: str):
+        """Descartar el cliente parseado de un endpoint (se reconstruye en el próximo uso)"""
+        with self._lock:
+            self._clients.pop(wsdl_url, None)
+            self._async_clients.pop(wsdl_url, None)
+
+    def clear(self):
+        """Descartar todos los clientes parseados"""
+        with self._lock:
+            self._clients.clear()
+            self._async_clients.clear()
+
+
+_default_registry: Optional[SOAPClientRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_default_registry() -> SOAPClientRegistry:
+    """Registro de clientes compartido por DataManager y SOAPClientManager"""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = SOAPClientRegistry()
+        return _default_registry
+
+
+def get_soap_client(wsdl_url: str):
+    """Atajo para obtener un cliente zeep del registro compartido"""
+    return get_default_registry().get_client(wsdl_url)
@@ -8,6 +8,9 @@ from tkinter import messagebox
 from typing import Optional, Callable, List, Any
 from datetime import datetime
 
+from utils.keyed_diff import KeyedWidgetList
+from utils.render_scheduler import RenderScheduler
+
 
 class HeaderComponent:
     """Componente del header con título y estado de conexión"""
@@ -451,10 +454,20 @@ class TabbedContentArea:
     def update_species_list(self, species_list):
         """Actualizar la lista de especies en la pestaña 'Species List'"""
         if hasattr(self, 'species_scroll') and self.species_scroll:
-            # Limpiar contenido anterior
-            for widget in self.species_scroll.winfo_children():
-                widget.destroy()
+            if not hasattr(self, 'species_rows'):
+                # Filas por ID de especie; el elemento es (posición, especie) para
+                # que un cambio de numeración también vuelva a enlazar la fila
+                self.species_rows = KeyedWidgetList(
+                    self.species_scroll,
+                    create=self._create_species_row,
+                    update=self._bind_species_row,
+                    key=lambda entry: entry[1].id,
+                    pack_options={"fill": "x"}
+                )
+                self.species_render = RenderScheduler(self.species_scroll)
             if not species_list:
+                self.species_render.cancel()
+                self.species_rows.clear()
                 placeholder = ctk.CTkLabel(
                     self.species_scroll,
                     text="🔄 No species to display",
@@ -463,20 +476,27 @@ class TabbedContentArea:
                 )
                 placeholder.pack(pady=50)
             else:
-                for i, species in enumerate(species_list, 1):
-                    label = ctk.CTkLabel(
-                        self.species_scroll,
-                        text=f"{i}. {species.nombreComun} (ID: {species.id})",
-                        font=ctk.CTkFont(size=13, weight="bold")
-                    )
-                    label.pack(anchor="w", padx=10, pady=2)
-                    details = ctk.CTkLabel(
-                        self.species_scroll,
-                        text=f"🧬 {species.nombreCientifico or 'N/A'} | 🛡️ {getattr(species, 'estadoConservacionNombre', 'Unknown')} | 🌍 {getattr(species, 'zonaNombre', 'Unknown')} | {'✅ Active' if species.activo else '❌ Inactive'}",
-                        font=ctk.CTkFont(size=11),
-                        text_color="gray"
-                    )
-                    details.pack(anchor="w", padx=30, pady=(0, 6))
+                # Por trozos con presupuesto por frame; una lista nueva aborta la anterior
+                entries = list(enumerate(species_list, 1))
+                self.species_render.run(self.species_rows.reconcile_steps(entries), total=len(entries))
+    
+    def _create_species_row(self, parent, entry):
+        """Crear la fila (nombre + detalles) de una especie"""
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        row.name_label = ctk.CTkLabel(row, text="", font=ctk.CTkFont(size=13, weight="bold"))
+        row.name_label.pack(anchor="w", padx=10, pady=2)
+        row.details_label = ctk.CTkLabel(row, text="", font=ctk.CTkFont(size=11), text_color="gray")
+        row.details_label.pack(anchor="w", padx=30, pady=(0, 6))
+        self._bind_species_row(row, entry)
+        return row
+    
+    def _bind_species_row(self, row, entry):
+        """Volcar una especie (y su posición) en una fila existente"""
+        i, species = entry
+        row.name_label.configure(text=f"{i}. {species.nombreComun} (ID: {species.id})")
+        row.details_label.configure(
+            text=f"🧬 {species.nombreCientifico or 'N/A'} | 🛡️ {getattr(species, 'estadoConservacionNombre', 'Unknown')} | 🌍 {getattr(species, 'zonaNombre', 'Unknown')} | {'✅ Active' if species.activo else '❌ Inactive'}"
+        )
 
 
 class FooterComponent:
@@ -11,6 +11,7 @@ current_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(current_dir))
 
 from core.models import TreeSpecies
+from core.trigram_index import TrigramIndex
 
 class ModernSpeciesSelector(ctk.CTkToplevel):
     """Modern species selector dialog with dropdown and search functionality"""
@@ -23,6 +24,11 @@ class ModernSpeciesSelector(ctk.CTkToplevel):
         self.selected_species = None
         self.callback = callback
         
+        # Index names once so filtering while typing doesn't rescan the list
+        self.name_index = TrigramIndex()
+        for position, species in enumerate(species_list):
+            self.name_index.update(position, species.nombreComun, species.nombreCientifico)
+        
         # Configure window
         self.title(title)
         self.geometry("500x400")
@@ -172,12 +178,14 @@ class ModernSpeciesSelector(ctk.CTkToplevel):
         self.search_entry.focus()
         
     def create_dropdown_options(self, filter_text: str = ""):
-        """Create formatted dropdown options"""
+        """Create formatted dropdown options (best matches first when filtering)"""
+        if filter_text:
+            matches = [self.species_list[i] for i in self.name_index.search(filter_text)]
+        else:
+            matches = self.species_list
+        
         options = []
-        for species in self.species_list:
-            if filter_text and filter_text.lower() not in species.nombreComun.lower():
-                continue
-                
+        for species in matches:
             status = "✅" if species.activo else "❌"
             zone_name = getattr(species, 'zonaNombre', 'Unknown')
             option = f"{status} {species.nombreComun} - {zone_name}"
@@ -14,9 +14,23 @@ sys.path.insert(0, client_dir)
 from utils.theme_manager import ThemeManager
 from utils.logger import Logger
 
+# Pestañas del sistema: (título, nombre)
+PESTANAS = [
+    ("🗂️ Species Data", "species"),
+    ("🌍 Zones Management", "zones"),
+    ("📋 Activity Log", "log"),
+    ("📊 Statistics", "stats")
+]
+
 
 class ContentAreaComponent:
-    """Área de contenido principal con sistema de pestañas"""
+    """
+    Área de contenido principal con sistema de pestañas
+    
+    Las pestañas se crean vacías; el contenido de cada una lo construye su
+    constructor registrado la primera vez que se selecciona, así la ventana
+    se muestra sin esperar a los widgets de pestañas que aún no se ven.
+    """
     
     def __init__(self, parent, theme_manager: ThemeManager, logger: Logger = None):
         """Inicializar área de contenido"""
@@ -25,6 +39,8 @@ class ContentAreaComponent:
         self.logger = logger or Logger()
         self.tabview = None
         self.tabs = {}
+        self._constructores = {}
+        self._construidas = set()
         self._crear_area_contenido()
     
     def _crear_area_contenido(self):
@@ -49,21 +65,14 @@ class ContentAreaComponent:
             height=400,
             fg_color=self.theme_manager.obtener_color('surface'),
             segmented_button_fg_color=self.theme_manager.obtener_color('primary'),
-            segmented_button_selected_color=self.theme_manager.obtener_color('secondary')
+            segmented_button_selected_color=self.theme_manager.obtener_color('secondary'),
+            command=self._al_seleccionar_tab
         )
         self.tabview.pack(fill="both", expand=True, padx=15, pady=15)
     
     def _crear_pestanas(self):
         """Crear pestañas principales"""
-        # Pestañas del sistema
-        pestanas = [
-            ("🗂️ Species Data", "species"),
-            ("🌍 Zones Management", "zones"), 
-            ("📋 Activity Log", "log"),
-            ("📊 Statistics", "stats")
-        ]
-        
-        for titulo, nombre in pestanas:
+        for titulo, nombre in PESTANAS:
             self.tabview.add(titulo)
             self.tabs[nombre] = self.tabview.tab(titulo)
     
@@ -72,21 +81,49 @@ class ContentAreaComponent:
         return self.tabs.get(nombre)
     
     def cambiar_tab(self, nombre: str):
-        """Cambiar a una pestaña específica"""
-        if nombre in self.tabs:
-            # Cambiar a la pestaña correspondiente
-            for tab_name, tab_frame in self.tabs.items():
-                if tab_name == nombre:
-                    # Encontrar el título de la pestaña
-                    for i, (titulo, tab_id) in enumerate([
-                        ("🗂️ Species Data", "species"),
-                        ("🌍 Zones Management", "zones"),
-                        ("📋 Activity Log", "log"),
-                        ("📊 Statistics", "stats")
-                    ]):
-                        if tab_id == nombre:
-                            self.tabview.set(titulo)
-                            break
+        """Cambiar a una pestaña específica (construyéndola si aún no se había mostrado)"""
+        for titulo, tab_id in PESTANAS:
+            if tab_id == nombre:
+                self.tabview.set(titulo)
+                self.asegurar_tab(nombre)
+                break
+    
+    def tab_actual(self):
+        """Nombre de la pestaña seleccionada"""
+        titulo = self.tabview.get()
+        return next((nombre for t, nombre in PESTANAS if t == titulo), None)
+    
+    # ===========================================
+    # CONSTRUCCIÓN DIFERIDA
+    # ===========================================
+    
+    def registrar_constructor(self, nombre: str, constructor):
+        """Registrar la función que llena una pestaña la primera vez que se muestra"""
+        self._constructores[nombre] = constructor
+    
+    def asegurar_tab(self, nombre: str) -> bool:
+        """
+        Construir una pestaña si todavía no se ha construido
+        
+        Returns:
+            bool: True si se construyó en esta llamada
+        """
+        if nombre in self._construidas or nombre not in self._constructores:
+            return False
+        self._construidas.add(nombre)
+        try:
+            self._constructores[nombre]()
+        except Exception as e:
+            self.logger.error(f"Error building tab '{nombre}': {e}")
+        return True
+    
+    def esta_construida(self, nombre: str) -> bool:
+        return nombre in self._construidas
+    
+    def _al_seleccionar_tab(self):
+        nombre = self.tab_actual()
+        if nombre:
+            self.asegurar_tab(nombre)
     
     def limpiar_tab(self, nombre: str):
         """Limpiar contenido de una pestaña"""
@@ -91,6 +91,11 @@ class HeaderComponent:
             texto = "🟢 Connected" if conectado else "🔴 Disconnected"
             self.connection_indicator.configure(text=texto)
     
+    def mostrar_conectando(self):
+        """Indicador mientras se conecta en segundo plano"""
+        if self.connection_indicator:
+            self.connection_indicator.configure(text="🟡 Connecting...")
+    
     def actualizar_contador_especies(self, cantidad: int):
         """Actualizar contador de especies"""
         if self.species_counter:
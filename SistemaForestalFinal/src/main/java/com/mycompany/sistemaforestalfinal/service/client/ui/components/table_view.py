@@ -0,0 +1,205 @@
+"""
+📊 Table View Component - Tabla nativa (ttk.Treeview) para listas grandes
+"""
+
+import customtkinter as ctk
+from tkinter import ttk
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import sys
+import os
+
+# Add parent directories to Python path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+client_dir = os.path.dirname(os.path.dirname(current_dir))
+sys.path.insert(0, client_dir)
+
+from utils.theme_manager import ThemeManager
+
+ESTILO_TABLA = "Forest.Treeview"
+
+
+@dataclass
+class ColumnaTabla:
+    """Definición de una columna: cómo se muestra y cómo se ordena"""
+    id: str
+    titulo: str
+    valor: Callable[[Any], Any]
+    clave_orden: Optional[Callable[[Any], Any]] = None  # Por defecto, el valor mostrado
+    ancho: int = 120
+    ancla: str = "w"
+
+
+class TableViewComponent:
+    """
+    Tabla de solo lectura sobre ttk.Treeview.
+
+    Una fila es un único item nativo (sin widgets por fila), así que miles de
+    filas se cargan en una fracción de segundo. Al pulsar una cabecera se
+    ordena por las claves de esa columna, calculadas una sola vez por
+    colección, y se reordena con una única llamada a Tk (`set_children`).
+    Las acciones se hacen sobre la selección: doble clic o Enter para
+    activar (editar) y Supr para eliminar.
+    """
+
+    def __init__(self, parent, theme_manager: ThemeManager,
+                 columnas: Sequence[ColumnaTabla],
+                 al_activar: Optional[Callable[[Any], None]] = None,
+                 al_eliminar: Optional[Callable[[Any], None]] = None,
+                 clave: Callable[[Any], Any] = lambda elemento: elemento.id):
+        """
+        Inicializar tabla
+
+        Args:
+            parent: Contenedor de la tabla
+            theme_manager: Gestor de tema para los colores
+            columnas: Columnas a mostrar, en orden
+            al_activar: Llamado con el elemento al hacer doble clic o pulsar Enter
+            al_eliminar: Llamado con el elemento al pulsar Supr
+            clave: Identidad de un elemento, para conservar la selección entre recargas
+        """
+        self.parent = parent
+        self.theme_manager = theme_manager
+        self.columnas = list(columnas)
+        self.al_activar = al_activar
+        self.al_eliminar = al_eliminar
+        self.clave = clave
+
+        self.elementos: Sequence[Any] = []
+        self._claves_orden: Dict[str, List[Any]] = {}  # columna -> clave de cada elemento
+        self._orden: Optional[str] = None
+        self._descendente = False
+
+        self._configurar_estilo()
+        self._crear_tabla()
+
+    def _configurar_estilo(self):
+        """Estilo del Treeview con los colores del ThemeManager"""
+        color = self.theme_manager.obtener_color
+        estilo = ttk.Style()
+        # Los temas nativos (vista, aqua) ignoran los colores de cabecera y fondo
+        if estilo.theme_use() not in ("default", "clam", "alt"):
+            estilo.theme_use("default")
+        estilo.configure(
+            ESTILO_TABLA,
+            background=color('surface'),
+            fieldbackground=color('surface'),
+            foreground=color('text_primary'),
+            rowheight=26,
+            borderwidth=0
+        )
+        estilo.map(ESTILO_TABLA, background=[("selected", color('primary'))])
+        estilo.configure(
+            f"{ESTILO_TABLA}.Heading",
+            background=color('background'),
+            foreground=color('text_primary'),
+            relief="flat"
+        )
+        estilo.map(f"{ESTILO_TABLA}.Heading", background=[("active", color('secondary'))])
+
+    def _crear_tabla(self):
+        """Crear Treeview, cabeceras y scrollbar"""
+        self.frame = ctk.CTkFrame(
+            self.parent,
+            fg_color=self.theme_manager.obtener_color('background'),
+            corner_radius=10
+        )
+
+        self.tree = ttk.Treeview(
+            self.frame,
+            columns=[columna.id for columna in self.columnas],
+            show="headings",
+            style=ESTILO_TABLA
+        )
+        for columna in self.columnas:
+            self.tree.heading(columna.id, text=columna.titulo, anchor=columna.ancla,
+                              command=lambda c=columna.id: self.ordenar_por(c))
+            self.tree.column(columna.id, width=columna.ancho, anchor=columna.ancla, stretch=True)
+
+        self.scrollbar = ctk.CTkScrollbar(self.frame, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.scrollbar.set)
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 5), pady=5)
+        self.tree.pack(side="left", fill="both", expand=True, padx=5, pady=5)
+
+        self.tree.bind("<Double-1>", lambda evento: self._activar())
+        self.tree.bind("<Return>", lambda evento: self._activar())
+        self.tree.bind("<Delete>", lambda evento: self._eliminar())
+
+    # ===========================================
+    # API PÚBLICA
+    # ===========================================
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def pack_forget(self):
+        self.frame.pack_forget()
+
+    def grid(self, **kwargs):
+        self.frame.grid(**kwargs)
+
+    def grid_remove(self):
+        self.frame.grid_remove()
+
+    def establecer_elementos(self, elementos: Sequence[Any], mantener_posicion: bool = False):
+        """Sustituir las filas; conserva el orden de columna activo"""
+        posicion = self.tree.yview()[0] if mantener_posicion else 0.0
+        seleccion = {self.clave(e) for e in self.seleccion()} if mantener_posicion else set()
+
+        self.elementos = elementos
+        self._claves_orden.clear()
+        self.tree.delete(*self.tree.get_children())
+
+        indices = self._indices_ordenados() if self._orden else range(len(elementos))
+        # tk.call directo: Treeview.insert formatea las opciones en Python en cada fila
+        insertar = self.tree.tk.call
+        ruta = self.tree._w
+        for i in indices:
+            elemento = elementos[i]
+            insertar(ruta, "insert", "", "end", "-id", i,
+                     "-values", tuple(columna.valor(elemento) for columna in self.columnas))
+
+        if seleccion:
+            self.tree.selection_set([str(i) for i, e in enumerate(elementos) if self.clave(e) in seleccion])
+        self.tree.yview_moveto(posicion)
+
+    def ordenar_por(self, columna_id: str):
+        """Ordenar por una columna; pulsar otra vez invierte el sentido"""
+        self._descendente = not self._descendente if self._orden == columna_id else False
+        self._orden = columna_id
+        self.tree.set_children("", *map(str, self._indices_ordenados()))
+        self._actualizar_cabeceras()
+
+    def seleccion(self) -> List[Any]:
+        """Elementos seleccionados, en el orden en que se ven"""
+        return [self.elementos[int(iid)] for iid in self.tree.selection()]
+
+    # ===========================================
+    # ORDEN Y ACCIONES
+    # ===========================================
+
+    def _indices_ordenados(self) -> List[int]:
+        claves = self._claves_orden.get(self._orden)
+        if claves is None:
+            columna = next(c for c in self.columnas if c.id == self._orden)
+            clave = columna.clave_orden or columna.valor
+            claves = self._claves_orden[self._orden] = [clave(e) for e in self.elementos]
+        # sorted es estable: a igual clave se mantiene el orden de carga
+        return sorted(range(len(claves)), key=claves.__getitem__, reverse=self._descendente)
+
+    def _actualizar_cabeceras(self):
+        for columna in self.columnas:
+            flecha = ""
+            if columna.id == self._orden:
+                flecha = " ▼" if self._descendente else " ▲"
+            self.tree.heading(columna.id, text=columna.titulo + flecha)
+
+    def _activar(self):
+        elementos = self.seleccion()
+        if elementos and self.al_activar:
+            self.al_activar(elementos[0])
+
+    def _eliminar(self):
+        elementos = self.seleccion()
+        if elementos and self.al_eliminar:
+            self.al_eliminar(elementos[0])
@@ -0,0 +1,244 @@
+"""
+📜 Virtual List Component - Lista virtualizada con tarjetas recicladas
+"""
+
+import math
+import customtkinter as ctk
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+import sys
+import os
+
+# Add parent directories to Python path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+client_dir = os.path.dirname(os.path.dirname(current_dir))
+sys.path.insert(0, client_dir)
+
+from utils.theme_manager import ThemeManager
+
+
+class VirtualListComponent:
+    """
+    Lista desplazable que solo construye las filas visibles.
+
+    Mantiene un pool fijo de widgets (los que caben en el viewport más uno) y
+    al desplazarse los recoloca con `place` y los vuelve a enlazar con las
+    filas que quedan a la vista. Cada fila ocupa siempre el mismo hueco del
+    pool (índice % tamaño del pool), así que bajar una fila solo re-enlaza una
+    tarjeta. El coste de pintar depende del alto de la ventana, no del número
+    de elementos.
+    """
+
+    def __init__(self, parent, theme_manager: ThemeManager,
+                 altura_fila: int,
+                 crear_fila: Callable[[Any], Any],
+                 enlazar_fila: Callable[[Any, Any, int], None],
+                 espaciado: int = 10,
+                 paso_scroll: int = 40):
+        """
+        Inicializar lista virtualizada
+
+        Args:
+            parent: Contenedor de la lista
+            theme_manager: Gestor de tema para los colores
+            altura_fila: Alto fijo de cada fila en píxeles (incluye el espaciado)
+            crear_fila: Crea un widget de fila vacío dentro del frame recibido
+            enlazar_fila: Vuelca un elemento en un widget ya creado (widget, elemento, índice)
+            espaciado: Separación vertical entre filas
+            paso_scroll: Píxeles desplazados por cada paso de la rueda del ratón
+        """
+        self.parent = parent
+        self.theme_manager = theme_manager
+        self.altura_fila = altura_fila
+        self.crear_fila = crear_fila
+        self.enlazar_fila = enlazar_fila
+        self.espaciado = espaciado
+        self.paso_scroll = paso_scroll
+
+        self.elementos: Sequence[Any] = []
+        self._offset = 0
+        self._pool: List[Any] = []
+        self._enlazados: Dict[int, Tuple[int, Any]] = {}  # hueco -> (índice, elemento)
+        self._panel_visible = False
+
+        self._crear_lista()
+
+    def _crear_lista(self):
+        """Crear viewport, scrollbar y panel de mensajes"""
+        self.frame = ctk.CTkFrame(
+            self.parent,
+            fg_color=self.theme_manager.obtener_color('background'),
+            corner_radius=10
+        )
+
+        self.scrollbar = ctk.CTkScrollbar(self.frame, command=self._al_mover_scrollbar)
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 5), pady=5)
+
+        self.viewport = ctk.CTkFrame(self.frame, fg_color="transparent")
+        self.viewport.pack(side="left", fill="both", expand=True, padx=5, pady=5)
+        self.viewport.bind("<Configure>", lambda evento: self._pintar())
+        self._vincular_rueda(self.viewport)
+
+        # Panel para mensajes (sin datos, sin resultados) superpuesto al viewport
+        self.panel = ctk.CTkFrame(self.viewport, fg_color="transparent")
+
+    # ===========================================
+    # API PÚBLICA
+    # ===========================================
+
+    def pack(self, **kwargs):
+        """Empaquetar el frame de la lista"""
+        self.frame.pack(**kwargs)
+
+    def pack_forget(self):
+        """Ocultar el frame de la lista"""
+        self.frame.pack_forget()
+
+    def establecer_elementos(self, elementos: Sequence[Any], mantener_posicion: bool = False):
+        """
+        Mostrar una nueva colección; solo se enlazan las filas visibles
+
+        Con `mantener_posicion` se conservan el desplazamiento y los enlaces
+        actuales, de modo que solo se re-enlazan las tarjetas visibles cuyo
+        elemento cambió (mismo índice y contenido igual se dejan intactas).
+        """
+        self._ocultar_panel()
+        self.elementos = elementos
+        if not mantener_posicion:
+            self._enlazados.clear()
+            self._offset = 0
+        self._pintar()
+
+    def refrescar(self):
+        """Volver a enlazar las filas visibles (p. ej. tras modificar elementos en sitio)"""
+        self._enlazados.clear()
+        self._pintar()
+
+    def desplazar_a(self, indice: int):
+        """Desplazar la vista para que la fila indicada quede arriba"""
+        self._offset = indice * self.altura_fila
+        self._pintar()
+
+    def mostrar_panel(self):
+        """
+        Ocultar las filas y devolver un panel vacío para mostrar un mensaje
+
+        Returns:
+            CTkFrame: Panel limpio que ocupa todo el viewport
+        """
+        for widget in self.panel.winfo_children():
+            widget.destroy()
+        self.elementos = []
+        self._enlazados.clear()
+        for fila in self._pool:
+            fila.place_forget()
+        self.scrollbar.set(0.0, 1.0)
+        self.panel.place(x=0, y=0, relwidth=1, relheight=1)
+        self._panel_visible = True
+        return self.panel
+
+    def filas_creadas(self) -> int:
+        """Número de widgets de fila existentes (tamaño del pool)"""
+        return len(self._pool)
+
+    # ===========================================
+    # PINTADO
+    # ===========================================
+
+    def _ocultar_panel(self):
+        if self._panel_visible:
+            self.panel.place_forget()
+            self._panel_visible = False
+
+    def _alto_viewport(self) -> int:
+        return max(1, self.viewport.winfo_height())
+
+    def _pintar(self):
+        """Recolocar y enlazar las filas que caen dentro del viewport"""
+        if self._panel_visible:
+            return
+
+        total = len(self.elementos)
+        alto = self._alto_viewport()
+        alto_total = total * self.altura_fila
+        self._offset = max(0, min(self._offset, alto_total - alto))
+
+        self._asegurar_pool(min(total, math.ceil(alto / self.altura_fila) + 1))
+        tam_pool = len(self._pool)
+
+        primera = self._offset // self.altura_fila
+        desfase = self._offset - primera * self.altura_fila
+        visibles = set()
+        for i in range(tam_pool):
+            indice = primera + i
+            if indice >= total:
+                break
+            hueco = indice % tam_pool
+            visibles.add(hueco)
+            fila = self._pool[hueco]
+            elemento = self.elementos[indice]
+            enlazado = self._enlazados.get(hueco)
+            if enlazado is None or enlazado[0] != indice or enlazado[1] != elemento:
+                self.enlazar_fila(fila, elemento, indice)
+                self._enlazados[hueco] = (indice, elemento)
+            fila.place(x=0, y=i * self.altura_fila - desfase, relwidth=1,
+                       height=self.altura_fila - self.espaciado)
+
+        for hueco, fila in enumerate(self._pool):
+            if hueco not in visibles:
+                fila.place_forget()
+                self._enlazados.pop(hueco, None)
+
+        if alto_total <= alto:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self._offset / alto_total, (self._offset + alto) / alto_total)
+
+    def _asegurar_pool(self, necesarias: int):
+        """Crear las filas que falten; nunca se destruyen, solo se reciclan"""
+        if necesarias <= len(self._pool):
+            return
+        while len(self._pool) < necesarias:
+            fila = self.crear_fila(self.viewport)
+            self._vincular_rueda(fila)
+            self._pool.append(fila)
+        # Al cambiar el tamaño del pool cambia el hueco de cada índice
+        self._enlazados.clear()
+
+    # ===========================================
+    # DESPLAZAMIENTO
+    # ===========================================
+
+    def _desplazar(self, pixeles: int):
+        if not self.elementos:
+            return
+        self._offset += pixeles
+        self._pintar()
+
+    def _al_mover_scrollbar(self, accion, *args):
+        """Comando de la scrollbar: ('moveto', fracción) o ('scroll', n, 'units'|'pages')"""
+        if accion == "moveto":
+            self._offset = int(float(args[0]) * len(self.elementos) * self.altura_fila)
+            self._pintar()
+        elif accion == "scroll":
+            pasos = int(args[0])
+            unidad = self._alto_viewport() if len(args) > 1 and args[1] == "pages" else self.paso_scroll
+            self._desplazar(pasos * unidad)
+
+    def _al_girar_rueda(self, evento):
+        """Rueda del ratón (Windows/macOS usan delta, Linux botones 4 y 5)"""
+        if getattr(evento, "num", None) == 4:
+            pasos = -1
+        elif getattr(evento, "num", None) == 5:
+            pasos = 1
+        elif sys.platform == "darwin":
+            pasos = -evento.delta
+        else:
+            pasos = -int(evento.delta / 120) or (-1 if evento.delta > 0 else 1)
+        self._desplazar(pasos * self.paso_scroll)
+
+    def _vincular_rueda(self, widget):
+        """Vincular la rueda al widget y a todos sus hijos"""
+        for secuencia in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(secuencia, self._al_girar_rueda, add="+")
+        for hijo in widget.winfo_children():
+            self._vincular_rueda(hijo)
@@ -3,7 +3,7 @@
 """
 
 import customtkinter as ctk
-import threading
+from tkinter import filedialog, messagebox
 from pathlib import Path
 import sys
 import os
@@ -21,15 +21,18 @@ from .managers.species_manager import SpeciesManager
 from .managers.zones_manager import ZonesManager
 from utils.theme_manager import ThemeManager
 from utils.logger import Logger
+from utils.tk_dispatcher import TkDispatcher
+from core.task_executor import configure_task_executor
 
 
 class MainWindow:
     """Ventana principal de la aplicación - Arquitectura modular"""
     
-    def __init__(self, soap_client, data_manager):
+    def __init__(self, soap_client, data_manager, startup_timer=None):
         """Inicializar ventana principal"""
         self.soap_client = soap_client
         self.data_manager = data_manager
+        self.startup_timer = startup_timer
         
         # Componentes base
         self.theme_manager = ThemeManager()
@@ -40,10 +43,15 @@ class MainWindow:
         self.footer = None
         self.content_area = None
         
-        # Gestores funcionales
+        # Gestores funcionales (se crean al mostrar su pestaña por primera vez)
         self.species_manager = None
         self.zones_manager = None
         
+        # Widgets de las pestañas de log y estadísticas (también diferidas)
+        self.log_filter_entry = None
+        self.stats_cards = {}
+        self.stats_valores = {}
+        
         # Configurar ventana
         self._configurar_ventana()
         
@@ -65,6 +73,10 @@ class MainWindow:
         self.root.title("🌳 Modern Forest Species Management")
         self.root.geometry("1200x800")
         self.root.minsize(1000, 700)
+        
+        # Pool de trabajo compartido; sus callbacks se entregan en el hilo de Tk
+        self.dispatcher = TkDispatcher(self.root)
+        self.executor = configure_task_executor(dispatcher=self.dispatcher)
           # Aplicar tema
         self.theme_manager.aplicar_tema()
     
@@ -95,34 +107,39 @@ class MainWindow:
         self.footer = FooterComponent(self.root, self.theme_manager)
     
     def _configurar_gestores(self):
-        """Configurar gestores de funcionalidad"""
-        # Gestor de especies
+        """Registrar los gestores de funcionalidad; cada uno se crea al abrir su pestaña"""
+        self.content_area.registrar_constructor("species", self._crear_gestor_especies)
+        self.content_area.registrar_constructor("zones", self._crear_gestor_zonas)
+    
+    def _crear_gestor_especies(self):
+        """Gestor de especies (construye la pestaña de especies)"""
         self.species_manager = SpeciesManager(
             data_manager=self.data_manager,
             content_area=self.content_area,
             theme_manager=self.theme_manager,
-            logger=self.logger
+            logger=self.logger,
+            executor=self.executor
         )
-        
-        # Gestor de zonas
+    
+    def _crear_gestor_zonas(self):
+        """Gestor de zonas (construye la pestaña de zonas)"""
         self.zones_manager = ZonesManager(
             data_manager=self.data_manager,
             content_area=self.content_area,
             theme_manager=self.theme_manager,
-            logger=self.logger
+            logger=self.logger,
+            executor=self.executor
         )
     
     def _configurar_logging(self):
         """Configurar sistema de logging"""
-        # Configurar tab de log
-        log_tab = self.content_area.obtener_tab("log")
-        if log_tab:
-            self._configurar_tab_log(log_tab)
-        
-        # Configurar tab de estadísticas
-        stats_tab = self.content_area.obtener_tab("stats")
-        if stats_tab:
-            self._configurar_tab_stats(stats_tab)
+        # Hasta que se abra la pestaña, el logger guarda el historial y escribe en consola
+        self.content_area.registrar_constructor(
+            "log", lambda: self._configurar_tab_log(self.content_area.obtener_tab("log"))
+        )
+        self.content_area.registrar_constructor(
+            "stats", lambda: self._configurar_tab_stats(self.content_area.obtener_tab("stats"))
+        )
     
     def _configurar_tab_log(self, log_frame):
         """Configurar pestaña de log"""
@@ -149,6 +166,28 @@ class MainWindow:
         )
         clear_button.pack(side="right")
         
+        # Exportar el historial completo (no solo lo visible)
+        export_button = ctk.CTkButton(
+            header_frame,
+            text="💾 Export",
+            command=self._exportar_log,
+            width=100,
+            **self.theme_manager.obtener_estilo_boton("info")
+        )
+        export_button.pack(side="right", padx=5)
+        
+        # Filtro sobre el historial
+        self.log_filter_entry = ctk.CTkEntry(
+            header_frame,
+            placeholder_text="🔍 Filter log...",
+            width=220
+        )
+        self.log_filter_entry.pack(side="right", padx=5)
+        self.log_filter_entry.bind(
+            "<KeyRelease>",
+            lambda evento: self.logger.establecer_filtro(self.log_filter_entry.get())
+        )
+        
         # Área de texto para el log
         log_text = ctk.CTkTextbox(
             log_frame,
@@ -160,6 +199,22 @@ class MainWindow:
         # Conectar logger con el widget
         self.logger.agregar_widget(log_text)
     
+    def _exportar_log(self):
+        """Guardar el historial del log (filtrado si hay filtro) en un archivo"""
+        ruta = filedialog.asksaveasfilename(
+            title="Export Activity Log",
+            defaultextension=".log",
+            filetypes=[("Log files", "*.log"), ("Text files", "*.txt"), ("All files", "*.*")]
+        )
+        if not ruta:
+            return
+        try:
+            total = self.logger.exportar(ruta, self.log_filter_entry.get())
+            self.logger.success(f"💾 Exported {total} log entries to {ruta}")
+        except OSError as e:
+            self.logger.error(f"Error exporting log: {e}")
+            messagebox.showerror("Export Error", f"Could not export the log: {e}")
+    
     def _configurar_tab_stats(self, stats_frame):
         """Configurar pestaña de estadísticas"""
         # Header
@@ -193,11 +248,13 @@ class MainWindow:
     
     def _crear_tarjetas_stats(self, parent):
         """Crear tarjetas de estadísticas"""
+        # Valores ya calculados antes de abrir la pestaña
+        valor = lambda titulo: str(self.stats_valores.get(titulo, 0))
         stats_data = [
-            ("🌳", "Total Species", "0", self.theme_manager.obtener_color("success")),
-            ("🌍", "Total Zones", "0", self.theme_manager.obtener_color("info")),
-            ("🛡️", "Conservation States", "0", self.theme_manager.obtener_color("warning")),
-            ("🔄", "Operations Today", "0", self.theme_manager.obtener_color("primary"))
+            ("🌳", "Total Species", valor("Total Species"), self.theme_manager.obtener_color("success")),
+            ("🌍", "Total Zones", valor("Total Zones"), self.theme_manager.obtener_color("info")),
+            ("🛡️", "Conservation States", valor("Conservation States"), self.theme_manager.obtener_color("warning")),
+            ("🔄", "Operations Today", valor("Operations Today"), self.theme_manager.obtener_color("primary"))
         ]
         
         self.stats_cards = {}
@@ -238,29 +295,29 @@ class MainWindow:
     
     def _actualizar_stats(self):
         """Actualizar estadísticas del sistema"""
-        def _actualizar_thread():
-            try:
-                # Obtener estadísticas
-                species_count = len(self.data_manager.get_all_species())
-                zones_count = len(self.data_manager.get_all_zones())
-                conservation_count = len(self.data_manager.get_all_conservation_states())
-                
-                # Actualizar UI en hilo principal
-                self.root.after(0, self._aplicar_stats, species_count, zones_count, conservation_count)
-                
-            except Exception as e:
-                self.root.after(0, self.logger.error, f"Error updating statistics: {e}")
-        
-        threading.Thread(target=_actualizar_thread, daemon=True).start()
+        # Las tres consultas en una sola ronda concurrente; clics repetidos comparten la misma carga
+        self.executor.submit(
+            self.data_manager.load_all_concurrently,
+            key="reference_data",
+            on_success=lambda data: self._aplicar_stats(
+                len(data['species']), len(data['zones']), len(data['conservation_states'])
+            ),
+            on_error=lambda e: self.logger.error(f"Error updating statistics: {e}")
+        )
     
     def _aplicar_stats(self, species_count, zones_count, conservation_count):
         """Aplicar estadísticas a las tarjetas"""
         try:
+            self.stats_valores.update({
+                "Total Species": species_count,
+                "Total Zones": zones_count,
+                "Conservation States": conservation_count
+            })
+            if self.header:
+                self.header.actualizar_contador_especies(species_count)
+            
             if "Total Species" in self.stats_cards:
                 self.stats_cards["Total Species"].configure(text=str(species_count))
-                # Actualizar header también
-                if self.header:
-                    self.header.actualizar_contador_especies(species_count)
             
             if "Total Zones" in self.stats_cards:
                 self.stats_cards["Total Zones"].configure(text=str(zones_count))
@@ -273,21 +330,32 @@ class MainWindow:
             self.logger.error(f"Error applying statistics: {e}")
     
     def conectar_servicios(self):
-        """Conectar a servicios SOAP"""
-        def _conectar_thread():
-            try:
-                self.logger.info("🔌 Connecting to SOAP services...")
-                success = self.soap_client.connect()
-                
-                if success:
-                    self.root.after(0, self._al_conectar_exitoso)
-                else:
-                    self.root.after(0, self._al_fallar_conexion)
-                    
-            except Exception as e:
-                self.root.after(0, self._al_error_conexion, str(e))
-        
-        threading.Thread(target=_conectar_thread, daemon=True).start()
+        """Conectar a servicios SOAP (en segundo plano; volver a pulsar reconecta)"""
+        self.logger.info("🔌 Connecting to SOAP services...")
+        if self.header:
+            self.header.mostrar_conectando()
+        
+        # Las cargas de datos esperan a este Future en sus hilos de trabajo, no en la UI
+        listo = self.data_manager.connect(force=self.data_manager.is_ready())
+        listo.add_done_callback(
+            lambda futuro: self.dispatcher.post(self._al_terminar_conexion_datos, futuro.result())
+        )
+        
+        self.executor.submit(
+            self.soap_client.connect,
+            key="connect",
+            on_success=lambda success: self._al_conectar_exitoso() if success else self._al_fallar_conexion(),
+            on_error=lambda e: self._al_error_conexion(str(e))
+        )
+    
+    def _al_terminar_conexion_datos(self, conectado: bool):
+        """Resultado de la conexión del DataManager (hilo de UI)"""
+        if conectado:
+            self.logger.success("📡 Data services ready")
+        else:
+            error = self.data_manager.connection_error
+            detalle = f": {error}" if error else ""
+            self.logger.warning(f"⚠️ Data services unavailable{detalle} - use 'Connect SOAP' to retry")
     
     def _al_conectar_exitoso(self):
         """Callback para conexión exitosa"""
@@ -312,26 +380,28 @@ class MainWindow:
     
     def _cargar_datos_iniciales(self):
         """Cargar datos iniciales tras conexión"""
-        def _cargar_thread():
-            try:
-                # Cargar datos de referencia
-                zones = self.data_manager.get_all_zones()
-                states = self.data_manager.get_all_conservation_states()
-                self.root.after(0, self.logger.info, f"📍 Loaded {len(zones)} zones and {len(states)} conservation states")
-                
-                # Actualizar estadísticas
-                self.root.after(0, self._actualizar_stats)
-                
-            except Exception as e:
-                self.root.after(0, self.logger.error, f"Error loading initial data: {e}")
-        
-        threading.Thread(target=_cargar_thread, daemon=True).start()
+        # Cargar datos de referencia y especies en paralelo
+        self.executor.submit(
+            self.data_manager.load_all_concurrently,
+            key="reference_data",
+            on_success=self._al_cargar_datos_iniciales,
+            on_error=lambda e: self.logger.error(f"Error loading initial data: {e}")
+        )
+    
+    def _al_cargar_datos_iniciales(self, data):
+        """Aplicar los datos iniciales (hilo de UI)"""
+        zones = data['zones']
+        states = data['conservation_states']
+        self.logger.info(f"📍 Loaded {len(zones)} zones and {len(states)} conservation states")
+        
+        # Las estadísticas salen de la misma ronda: no hace falta volver a consultar
+        self._aplicar_stats(len(data['species']), len(zones), len(states))
     
     def ejecutar(self):
         """Ejecutar la aplicación"""
         try:
-            # Programar conexión inicial
-            self.root.after(1000, self.conectar_servicios)
+            # La pestaña inicial y la conexión empiezan tras la primera pintura de la ventana
+            self.root.after(10, self._al_mostrar_ventana)
             
             # Iniciar bucle principal
             self.root.mainloop()
@@ -339,6 +409,25 @@ class MainWindow:
             self.logger.error(f"Error running application: {e}")
             raise
     
+    def _al_mostrar_ventana(self):
+        """Primera vuelta del bucle de Tk: construir la pestaña visible y reportar tiempos"""
+        timer = self.startup_timer
+        if timer:
+            timer.marcar("first paint (window shell)")
+        
+        # La ventana ya está visible: conectar en segundo plano con el indicador "Connecting..."
+        self.conectar_servicios()
+        
+        nombre = self.content_area.tab_actual()
+        if nombre:
+            self.content_area.asegurar_tab(nombre)
+            if timer:
+                self.root.update_idletasks()
+                timer.marcar(f"{nombre} tab built")
+        if timer:
+            timer.imprimir()
+            self.logger.info(f"⏱️ Startup completed in {timer.total * 1000:.0f} ms")
+    
     def _obtener_callbacks_sidebar(self):
         """Obtener callbacks para acciones de sidebar"""
         return {
@@ -3,7 +3,6 @@
 """
 
 import customtkinter as ctk
-import threading
 from typing import List, Optional, Callable
 from tkinter import messagebox
 import sys
@@ -17,23 +16,55 @@ sys.path.insert(0, client_dir)
 from utils.theme_manager import ThemeManager
 from utils.logger import Logger
 from core.models import TreeSpecies
+from core.task_executor import get_task_executor
+from ui.components.virtual_list import VirtualListComponent
+from ui.components.table_view import TableViewComponent, ColumnaTabla
+from core.text_normalization import fold_text
+from utils.keyed_diff import diff_keyed
+from utils.search_controller import SearchController
+
+# Alto fijo de cada tarjeta en la lista virtualizada (incluye el espaciado)
+ALTURA_TARJETA = 190
+
+MODO_TARJETAS = "🗂️ Cards"
+MODO_TABLA = "📊 Table"
+
+# Columnas del modo tabla; las claves de orden se calculan una vez por colección
+COLUMNAS_ESPECIES = (
+    ColumnaTabla("id", "ID", lambda e: e.id, lambda e: e.id or 0, ancho=70),
+    ColumnaTabla("nombre", "Common Name", lambda e: e.nombreComun or "", lambda e: fold_text(e.nombreComun), ancho=180),
+    ColumnaTabla("cientifico", "Scientific Name", lambda e: e.nombreCientifico or "", lambda e: fold_text(e.nombreCientifico), ancho=200),
+    ColumnaTabla("zona", "Zone", lambda e: e.zonaNombre or "", lambda e: fold_text(e.zonaNombre), ancho=150),
+    ColumnaTabla("estado", "Conservation", lambda e: e.estadoConservacionNombre or "", lambda e: fold_text(e.estadoConservacionNombre), ancho=150),
+    ColumnaTabla("activo", "Active", lambda e: "✅" if e.activo else "❌", lambda e: bool(e.activo), ancho=70, ancla="center"),
+)
 
 
 class SpeciesManager:
     """Gestor de operaciones CRUD para especies"""
     
-    def __init__(self, data_manager, content_area, theme_manager: ThemeManager, logger: Logger):
+    def __init__(self, data_manager, content_area, theme_manager: ThemeManager, logger: Logger, executor=None):
         """Inicializar gestor de especies"""
         self.data_manager = data_manager
         self.content_area = content_area
         self.theme_manager = theme_manager
         self.logger = logger
+        self.executor = executor or get_task_executor()
         
         # Estado del gestor
         self.especies_actuales = []
         self.termino_busqueda = ""
-        self.especies_scroll = None
+        self.lista_especies = None
+        self.tabla_especies = None
+        self.vista_mostrada = None
+        self.modo_tabla = False
         self.search_entry = None
+        self.mostrando_todas = False
+        self.titulo_mostrado = None
+        
+        # Volver a pintar la lista completa cuando lleguen datos frescos en segundo plano
+        if hasattr(self.data_manager, "add_data_change_callback"):
+            self.data_manager.add_data_change_callback(self._al_cambiar_datos)
         
         # Configurar pestaña de especies
         self._configurar_tab_especies()
@@ -109,6 +140,19 @@ class SpeciesManager:
         )
         self.search_entry.pack(side="left", padx=(0, 10))
         self.search_entry.bind("<KeyRelease>", self._al_cambiar_busqueda)
+        self.search_entry.bind("<Return>", lambda evento: self._buscar())
+        
+        # Búsqueda mientras se escribe: debounce, descarte de resultados viejos y refinamiento local
+        self.buscador = SearchController(
+            self.search_entry,
+            self.executor,
+            search=self._ejecutar_busqueda,
+            on_results=self._al_recibir_resultados,
+            on_clear=self.ver_todas,
+            refine=self._refinar_busqueda,
+            on_error=lambda termino, e: self.logger.error(f"Error searching '{termino}': {e}"),
+            group="species_view"
+        )
         
         # Search type selector
         self.search_type = ctk.CTkOptionMenu(
@@ -119,157 +163,257 @@ class SpeciesManager:
         )
         self.search_type.pack(side="left", padx=5)
         self.search_type.set("Name")
+        
+        # Modo de visualización: tarjetas o tabla nativa para listas grandes
+        self.selector_modo = ctk.CTkSegmentedButton(
+            search_frame,
+            values=[MODO_TARJETAS, MODO_TABLA],
+            command=self._al_cambiar_modo
+        )
+        self.selector_modo.pack(side="right", padx=5)
+        self.selector_modo.set(MODO_TARJETAS)
     
     def _crear_lista_especies(self, parent):
-        """Crear lista scrollable de especies"""
-        self.especies_scroll = ctk.CTkScrollableFrame(
-            parent,
-            fg_color=self.theme_manager.obtener_color('background'),
-            corner_radius=10
+        """Crear lista virtualizada de especies (solo existen las tarjetas visibles) y la tabla alternativa"""
+        vistas_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        vistas_frame.pack(fill="both", expand=True, padx=20, pady=10)
+        
+        self.lista_especies = VirtualListComponent(
+            vistas_frame,
+            self.theme_manager,
+            altura_fila=ALTURA_TARJETA,
+            crear_fila=self._crear_tarjeta_especie,
+            enlazar_fila=self._enlazar_tarjeta_especie
+        )
+        self.tabla_especies = TableViewComponent(
+            vistas_frame,
+            self.theme_manager,
+            COLUMNAS_ESPECIES,
+            al_activar=self._editar_especie,
+            al_eliminar=self._eliminar_especie
         )
-        self.especies_scroll.pack(fill="both", expand=True, padx=20, pady=10)
+        self._mostrar_vista(self.lista_especies)
+    
+    def _mostrar_vista(self, vista):
+        """Mostrar la lista de tarjetas o la tabla (solo una a la vez)"""
+        if vista is self.vista_mostrada:
+            return
+        if self.vista_mostrada is not None:
+            self.vista_mostrada.pack_forget()
+        vista.pack(fill="both", expand=True)
+        self.vista_mostrada = vista
+    
+    def _vista_seleccionada(self):
+        return self.tabla_especies if self.modo_tabla else self.lista_especies
+    
+    def _al_cambiar_modo(self, modo: str):
+        """Pasar los elementos mostrados a la otra vista"""
+        self.modo_tabla = modo == MODO_TABLA
+        elementos = self.vista_mostrada.elementos
+        if elementos:
+            self._mostrar_especies(elementos, self.titulo_mostrado or "Species List")
+    
+    def _panel_mensajes(self):
+        """Panel para mensajes (sin datos, sin resultados); siempre sobre la vista de tarjetas"""
+        self._mostrar_vista(self.lista_especies)
+        self.titulo_mostrado = None
+        return self.lista_especies.mostrar_panel()
     
     def ver_todas(self):
         """Ver todas las especies"""
         self.logger.info("🔍 Loading all species...")
-        threading.Thread(target=self._cargar_todas_thread, daemon=True).start()
+        # Una búsqueda pendiente o en curso ya no debe sustituir a la lista completa
+        self.buscador.cancel()
+        # Una sola carga en curso aunque se pulse varias veces; reemplaza búsquedas pendientes
+        self.executor.submit(
+            self._cargar_todas_por_paginas,
+            key="species:all",
+            group="species_view",
+            on_success=self._al_cargar_todas,
+            on_error=lambda e: self.logger.error(f"Error loading species: {e}")
+        )
     
-    def _cargar_todas_thread(self):
-        """Hilo para cargar todas las especies"""
-        try:
-            especies_lista = self.data_manager.get_all_species()
-            self.especies_actuales = especies_lista
-            
-            # Actualizar UI en el hilo principal
-            if hasattr(self.content_area, 'parent'):
-                self.content_area.parent.after(0, self._mostrar_especies, especies_lista, "All Species")
-        except Exception as e:
-            if hasattr(self.content_area, 'parent'):
-                self.content_area.parent.after(0, self.logger.error, f"Error loading species: {e}")
+    def _cargar_todas_por_paginas(self):
+        """
+        Cargar todas las especies página a página (hilo de trabajo)
+        
+        Cada página se muestra en cuanto llega, junto con las anteriores,
+        mientras la siguiente ya se está pidiendo; la lista completa se
+        entrega al final como resultado de la tarea.
+        """
+        if not hasattr(self.data_manager, "iter_species_pages"):
+            return self.data_manager.get_all_species()
+        
+        paginas = self.data_manager.iter_species_pages(store=True)
+        acumuladas = []
+        for pagina in paginas:
+            # Lista nueva en cada página: la vista conserva la anterior para el diff
+            acumuladas = acumuladas + pagina
+            if paginas.exhausted:
+                break
+            if not self.executor.is_running("species:all"):
+                # Reemplazada por una búsqueda: no seguir pidiendo páginas
+                paginas.close()
+                break
+            if self.executor.dispatcher is not None:
+                self.executor.dispatcher.post(self._al_cargar_pagina, acumuladas)
+        return acumuladas
+    
+    def _al_cargar_pagina(self, especies_lista):
+        """Mostrar las especies recibidas hasta ahora (hilo de UI)"""
+        if self.executor.is_running("species:all"):
+            self._al_cargar_todas(especies_lista)
+    
+    def _al_cargar_todas(self, especies_lista):
+        """Mostrar todas las especies cargadas (hilo de UI)"""
+        self.mostrando_todas = True
+        self.especies_actuales = especies_lista
+        self._mostrar_especies(especies_lista, "All Species")
+    
+    def _al_cambiar_datos(self, evento: str, datos=None):
+        """Refrescar la vista cuando el DataManager revalida las especies (hilo de UI)"""
+        if evento.startswith("species"):
+            # Los resultados anteriores ya no sirven de base para refinar
+            self.buscador.reset()
+        if evento == "species_refreshed" and self.mostrando_todas and datos is not None:
+            self._al_cargar_todas(datos)
     
     def _mostrar_especies(self, especies_lista, titulo="Species List"):
         """Mostrar lista de especies en la interfaz"""
         try:
-            if not self.especies_scroll:
+            if not self.lista_especies:
                 self.logger.warning("Species display frame not ready")
                 return
             
-            # Limpiar display actual
-            for widget in self.especies_scroll.winfo_children():
-                widget.destroy()
-            
             if not especies_lista:
                 self._mostrar_sin_datos()
                 return
             
-            # Mostrar especies en diseño de tarjetas
-            for especie in especies_lista:
-                self._crear_tarjeta_especie(especie)
+            # Misma vista refrescada: conservar scroll y re-enlazar solo lo que cambió
+            vista = self._vista_seleccionada()
+            misma_vista = titulo == self.titulo_mostrado and vista is self.vista_mostrada
+            cambios = diff_keyed(vista.elementos, especies_lista) if misma_vista else None
             
-            self.logger.success(f"✅ {titulo}: Displayed {len(especies_lista)} species")
+            # Tarjetas: las visibles se reciclan; tabla: una fila nativa por especie
+            self._mostrar_vista(vista)
+            vista.establecer_elementos(especies_lista, mantener_posicion=misma_vista)
+            self.titulo_mostrado = titulo
+            
+            detalle = f" ({cambios})" if cambios is not None else ""
+            self.logger.success(f"✅ {titulo}: Displayed {len(especies_lista)} species{detalle}")
             
         except Exception as e:
             self.logger.error(f"Error displaying species list: {e}")
     
-    def _crear_tarjeta_especie(self, especie):
-        """Crear tarjeta individual para una especie"""
+    def _crear_tarjeta_especie(self, parent):
+        """Crear una tarjeta vacía del pool; `_enlazar_tarjeta_especie` le asigna la especie"""
         # Tarjeta de especie
-        tarjeta = ctk.CTkFrame(self.especies_scroll)
-        tarjeta.pack(fill="x", padx=5, pady=5)
+        tarjeta = ctk.CTkFrame(parent)
+        tarjeta.especie = None
         
         # Header de la tarjeta
-        self._crear_header_tarjeta(tarjeta, especie)
+        self._crear_header_tarjeta(tarjeta)
         
         # Detalles de la especie
-        self._crear_detalles_tarjeta(tarjeta, especie)
+        self._crear_detalles_tarjeta(tarjeta)
         
         # Botones de acción
-        self._crear_botones_tarjeta(tarjeta, especie)
-    
-    def _crear_header_tarjeta(self, parent, especie):
+        self._crear_botones_tarjeta(tarjeta)
+        return tarjeta
+    
+    def _enlazar_tarjeta_especie(self, tarjeta, especie, indice: int):
+        """Mostrar una especie en una tarjeta reciclada"""
+        tarjeta.especie = especie
+        tarjeta.id_label.configure(text=f"ID: {especie.id}")
+        tarjeta.nombre_label.configure(text=f"🌳 {especie.nombreComun}")
+        tarjeta.cientifico_label.configure(text=f"📖 Scientific: {getattr(especie, 'nombreCientifico', 'N/A')}")
+        tarjeta.zona_label.configure(text=f"🗺️ Zone: {getattr(especie, 'zonaNombre', 'Unknown')}")
+        tarjeta.estado_label.configure(text=f"🛡️ Status: {getattr(especie, 'estadoConservacionNombre', 'Unknown')}")
+    
+    def _crear_header_tarjeta(self, tarjeta):
         """Crear header de tarjeta de especie"""
-        header_frame = ctk.CTkFrame(parent)
+        header_frame = ctk.CTkFrame(tarjeta)
         header_frame.pack(fill="x", padx=10, pady=(10, 5))
         
         # ID de la especie
-        id_label = ctk.CTkLabel(
+        tarjeta.id_label = ctk.CTkLabel(
             header_frame,
-            text=f"ID: {especie.id}",
+            text="",
             font=ctk.CTkFont(size=12, weight="bold"),
             text_color="#3B82F6"
         )
-        id_label.pack(side="left", padx=(10, 5))
+        tarjeta.id_label.pack(side="left", padx=(10, 5))
         
         # Nombre común
-        nombre_label = ctk.CTkLabel(
+        tarjeta.nombre_label = ctk.CTkLabel(
             header_frame,
-            text=f"🌳 {especie.nombreComun}",
+            text="",
             font=ctk.CTkFont(size=14, weight="bold")
         )
-        nombre_label.pack(side="left", padx=5)
+        tarjeta.nombre_label.pack(side="left", padx=5)
     
-    def _crear_detalles_tarjeta(self, parent, especie):
+    def _crear_detalles_tarjeta(self, tarjeta):
         """Crear sección de detalles de la tarjeta"""
-        detalles_frame = ctk.CTkFrame(parent)
+        detalles_frame = ctk.CTkFrame(tarjeta)
         detalles_frame.pack(fill="x", padx=10, pady=(0, 10))
         
         # Columna izquierda
         col_izq = ctk.CTkFrame(detalles_frame)
         col_izq.pack(side="left", fill="both", expand=True, padx=(10, 5), pady=10)
         
-        nombre_cientifico = getattr(especie, 'nombreCientifico', 'N/A')
-        ctk.CTkLabel(
+        tarjeta.cientifico_label = ctk.CTkLabel(
             col_izq,
-            text=f"📖 Scientific: {nombre_cientifico}",
+            text="",
             font=ctk.CTkFont(size=12)
-        ).pack(anchor="w", padx=5, pady=2)
+        )
+        tarjeta.cientifico_label.pack(anchor="w", padx=5, pady=2)
         
         # Columna derecha
         col_der = ctk.CTkFrame(detalles_frame)
         col_der.pack(side="right", fill="both", expand=True, padx=(5, 10), pady=10)
         
-        zona_nombre = getattr(especie, 'zonaNombre', 'Unknown')
-        ctk.CTkLabel(
+        tarjeta.zona_label = ctk.CTkLabel(
             col_der,
-            text=f"🗺️ Zone: {zona_nombre}",
+            text="",
             font=ctk.CTkFont(size=12)
-        ).pack(anchor="w", padx=5, pady=2)
+        )
+        tarjeta.zona_label.pack(anchor="w", padx=5, pady=2)
         
-        estado_conservacion = getattr(especie, 'estadoConservacionNombre', 'Unknown')
-        ctk.CTkLabel(
+        tarjeta.estado_label = ctk.CTkLabel(
             col_der,
-            text=f"🛡️ Status: {estado_conservacion}",
+            text="",
             font=ctk.CTkFont(size=12)
-        ).pack(anchor="w", padx=5, pady=2)
+        )
+        tarjeta.estado_label.pack(anchor="w", padx=5, pady=2)
     
-    def _crear_botones_tarjeta(self, parent, especie):
+    def _crear_botones_tarjeta(self, tarjeta):
         """Crear botones de acción para la tarjeta"""
-        button_frame = ctk.CTkFrame(parent)
+        button_frame = ctk.CTkFrame(tarjeta)
         button_frame.pack(fill="x", padx=10, pady=(0, 10))
         
-        # Botón editar
+        # Los botones actúan sobre la especie enlazada en ese momento
         ctk.CTkButton(
             button_frame,
             text="✏️ Edit",
             width=80,
             height=30,
-            command=lambda: self._editar_especie(especie),
+            command=lambda: self._editar_especie(tarjeta.especie),
             **self.theme_manager.obtener_estilo_boton("warning")
         ).pack(side="left", padx=(10, 5), pady=5)
-          # Botón eliminar
+        # Botón eliminar
         ctk.CTkButton(
             button_frame,
             text="🗑️ Delete",
             width=80,
             height=30,
-            command=lambda: self._eliminar_especie(especie),
+            command=lambda: self._eliminar_especie(tarjeta.especie),
             **self.theme_manager.obtener_estilo_boton("error")
         ).pack(side="left", padx=5, pady=5)
     
     def _mostrar_sin_datos(self):
         """Mostrar mensaje cuando no hay datos"""
         no_data_label = ctk.CTkLabel(
-            self.especies_scroll,
+            self._panel_mensajes(),
             text="📋 No species data to display",
             font=ctk.CTkFont(size=14)
         )
@@ -280,30 +424,51 @@ class SpeciesManager:
         termino = self.search_entry.get() if self.search_entry else ""
         if termino != self.termino_busqueda:
             self.termino_busqueda = termino
-            self._buscar()
+            self._buscar(inmediata=False)
     
-    def _buscar(self):
-        """Ejecutar búsqueda según el tipo seleccionado"""
+    def _buscar(self, inmediata: bool = True):
+        """Ejecutar búsqueda según el tipo seleccionado (al teclear, tras el debounce)"""
         search_term = self.search_entry.get().strip()
         search_type = self.search_type.get()
         
         if not search_term:
-            self.ver_todas()
+            self.buscador.clear()
             return
         
-        self.logger.info(f"🔍 Searching by {search_type}: '{search_term}'")
-        
         if search_type == "ID":
-            self._buscar_por_id_directo(search_term)
+            self._buscar_por_id_directo(search_term, inmediata)
         else:  # Name search
-            self._buscar_por_nombre(search_term)
-    
-    def _buscar_por_id_directo(self, id_text):
+            self._buscar_por_nombre(search_term, inmediata)
+    
+    def _ejecutar_busqueda(self, termino: str, modo: str):
+        """Búsqueda completa (hilo de trabajo)"""
+        if modo == "ID":
+            return self.data_manager.get_species_by_id(int(termino))
+        return self.data_manager.search_species_by_name(termino, exact_match=False)
+    
+    def _refinar_busqueda(self, termino: str, modo: str, anteriores):
+        """Filtrar localmente el resultado anterior cuando la consulta lo extiende"""
+        if modo != "Name":
+            return None
+        return self.data_manager.refine_species_search(termino, anteriores)
+    
+    def _al_recibir_resultados(self, termino: str, modo: str, resultado):
+        """Resultado vigente de una búsqueda (hilo de UI)"""
+        if modo == "ID":
+            self._al_buscar_por_id(int(termino), resultado)
+        else:
+            self._al_buscar_por_nombre(termino, resultado)
+    
+    def _buscar_por_id_directo(self, id_text, inmediata: bool = True):
         """Buscar especie por ID desde el campo de texto principal"""
         try:
             species_id = int(id_text)
-            self._buscar_por_id_con_id(species_id)
+            if inmediata:
+                self._buscar_por_id_con_id(species_id)
+            else:
+                self.buscador.query_changed(id_text, "ID", min_length=1)
         except ValueError:
+            self.buscador.cancel()
             self.logger.error(f"❌ Invalid ID format: '{id_text}'. Please enter a valid number.")
             self._mostrar_especies([], f"Invalid ID: {id_text}")
     
@@ -325,31 +490,21 @@ class SpeciesManager:
     def _buscar_por_id_con_id(self, species_id: int):
         """Buscar especie por ID específico"""
         self.logger.info(f"🔍 Searching for species with ID: {species_id}")
-        threading.Thread(target=self._buscar_por_id_thread, args=(species_id,), daemon=True).start()
+        # Una búsqueda nueva reemplaza a la anterior: su resultado ya no se muestra
+        self.buscador.search_now(str(species_id), "ID")
     
-    def _buscar_por_id_thread(self, species_id: int):
-        """Thread para buscar especie por ID"""
-        try:
-            # Use DataManager to search by ID
-            especie = self.data_manager.get_species_by_id(species_id)
-            
-            if especie:
-                # Update UI in main thread
-                self.content_area.parent.after(0, self._mostrar_especies, [especie], f"Species with ID: {species_id}")
-            else:
-                self.content_area.parent.after(0, self._mostrar_sin_resultados_id, species_id)
-                
-        except Exception as e:
-            self.content_area.parent.after(0, self.logger.error, f"Error searching by ID {species_id}: {e}")
+    def _al_buscar_por_id(self, species_id: int, especie):
+        """Mostrar el resultado de la búsqueda por ID (hilo de UI)"""
+        self.mostrando_todas = False
+        if especie:
+            self._mostrar_especies([especie], f"Species with ID: {species_id}")
+        else:
+            self._mostrar_sin_resultados_id(species_id)
     
     def _mostrar_sin_resultados_id(self, species_id: int):
         """Mostrar mensaje cuando no se encuentra especie por ID"""
-        # Limpiar display actual
-        for widget in self.especies_scroll.winfo_children():
-            widget.destroy()
-        
-        # Mensaje de no encontrado
-        no_data_frame = ctk.CTkFrame(self.especies_scroll)
+        # Mensaje de no encontrado (sustituye a las tarjetas)
+        no_data_frame = ctk.CTkFrame(self._panel_mensajes())
         no_data_frame.pack(fill="x", padx=5, pady=20)
         
         no_data_label = ctk.CTkLabel(
@@ -370,34 +525,27 @@ class SpeciesManager:
         
         self.logger.warning(f"No species found with ID: {species_id}")
     
-    def _buscar_por_nombre(self, name_query: str):
+    def _buscar_por_nombre(self, name_query: str, inmediata: bool = True):
         """Buscar especies por nombre"""
+        if not inmediata:
+            # Al escribir rápido solo se busca cuando el usuario hace una pausa
+            self.buscador.query_changed(name_query, "Name")
+            return
         self.logger.info(f"🔍 Searching for species with name: '{name_query}'")
-        threading.Thread(target=self._buscar_por_nombre_thread, args=(name_query,), daemon=True).start()
+        self.buscador.search_now(name_query, "Name")
     
-    def _buscar_por_nombre_thread(self, name_query: str):
-        """Thread para buscar especies por nombre"""
-        try:
-            # Use DataManager to search by name
-            especies_encontradas = self.data_manager.search_species_by_name(name_query, exact_match=False)
-            
-            if especies_encontradas:
-                # Update UI in main thread
-                self.content_area.parent.after(0, self._mostrar_especies, especies_encontradas, f"Search results for: '{name_query}'")
-            else:
-                self.content_area.parent.after(0, self._mostrar_sin_resultados_nombre, name_query)
-                
-        except Exception as e:
-            self.content_area.parent.after(0, self.logger.error, f"Error searching by name '{name_query}': {e}")
+    def _al_buscar_por_nombre(self, name_query: str, especies_encontradas):
+        """Mostrar el resultado de la búsqueda por nombre (hilo de UI)"""
+        self.mostrando_todas = False
+        if especies_encontradas:
+            self._mostrar_especies(especies_encontradas, f"Search results for: '{name_query}'")
+        else:
+            self._mostrar_sin_resultados_nombre(name_query)
     
     def _mostrar_sin_resultados_nombre(self, name_query: str):
         """Mostrar mensaje cuando no se encuentran especies por nombre"""
-        # Limpiar display actual
-        for widget in self.especies_scroll.winfo_children():
-            widget.destroy()
-        
-        # Mensaje de no encontrado
-        no_data_frame = ctk.CTkFrame(self.especies_scroll)
+        # Mensaje de no encontrado (sustituye a las tarjetas)
+        no_data_frame = ctk.CTkFrame(self._panel_mensajes())
         no_data_frame.pack(fill="x", padx=5, pady=20)
         
         no_data_label = ctk.CTkLabel(
@@ -442,13 +590,21 @@ class SpeciesManager:
     
     def editar(self):
         """Editar especie seleccionada"""
+        seleccion = self.tabla_especies.seleccion() if self.vista_mostrada is self.tabla_especies else []
+        if seleccion:
+            self._editar_especie(seleccion[0])
+            return
         self.logger.info("✏️ Select species to edit...")
-        messagebox.showinfo("Edit Species", "Please use the Edit button on individual species cards to edit them.")
+        messagebox.showinfo("Edit Species", "Please use the Edit button on individual species cards, or select a row in table mode.")
     
     def eliminar(self):
         """Eliminar especie seleccionada"""
+        seleccion = self.tabla_especies.seleccion() if self.vista_mostrada is self.tabla_especies else []
+        if seleccion:
+            self._eliminar_especie(seleccion[0])
+            return
         self.logger.info("🗑️ Select species to delete...")
-        messagebox.showinfo("Delete Species", "Please use the Delete button on individual species cards to delete them.")
+        messagebox.showinfo("Delete Species", "Please use the Delete button on individual species cards, or select a row in table mode.")
     
     def _editar_especie(self, especie):
         """Editar especie específica"""
@@ -667,112 +823,3 @@ class SpeciesManager:
         
         # Enfocar el primer campo
         nombre_comun_entry.focus()
-    
-    # ===========================================
-    # SEARCH METHODS IMPLEMENTATION
-    # ===========================================
-    
-    def _buscar_por_id_con_id(self, species_id: int):
-        """Buscar especie por ID específico"""
-        self.logger.info(f"🔍 Searching for species with ID: {species_id}")
-        threading.Thread(target=self._buscar_por_id_thread, args=(species_id,), daemon=True).start()
-    
-    def _buscar_por_id_thread(self, species_id: int):
-        """Thread para buscar especie por ID"""
-        try:
-            # Use DataManager to search by ID
-            especie = self.data_manager.get_species_by_id(species_id)
-            
-            if especie:
-                # Update UI in main thread
-                self.content_area.parent.after(0, self._mostrar_especies, [especie], f"Species with ID: {species_id}")
-            else:
-                self.content_area.parent.after(0, self._mostrar_sin_resultados_id, species_id)
-                
-        except Exception as e:
-            self.content_area.parent.after(0, self.logger.error, f"Error searching by ID {species_id}: {e}")
-    
-    def _mostrar_sin_resultados_id(self, species_id: int):
-        """Mostrar mensaje cuando no se encuentra especie por ID"""
-        # Limpiar display actual
-        for widget in self.especies_scroll.winfo_children():
-            widget.destroy()
-        
-        # Mensaje de no encontrado
-        no_data_frame = ctk.CTkFrame(self.especies_scroll)
-        no_data_frame.pack(fill="x", padx=5, pady=20)
-        
-        no_data_label = ctk.CTkLabel(
-            no_data_frame,
-            text=f"🔍 No species found with ID: {species_id}",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=self.theme_manager.obtener_color('warning')
-        )
-        no_data_label.pack(pady=20)
-        
-        # Botón para ver todas las especies
-        ctk.CTkButton(
-            no_data_frame,
-            text="🌳 View All Species",
-            command=self.ver_todas,
-            **self.theme_manager.obtener_estilo_boton("primary")
-        ).pack(pady=10)
-        
-        self.logger.warning(f"No species found with ID: {species_id}")
-    
-    def _buscar_por_nombre(self, name_query: str):
-        """Buscar especies por nombre"""
-        self.logger.info(f"🔍 Searching for species with name: '{name_query}'")
-        threading.Thread(target=self._buscar_por_nombre_thread, args=(name_query,), daemon=True).start()
-    
-    def _buscar_por_nombre_thread(self, name_query: str):
-        """Thread para buscar especies por nombre"""
-        try:
-            # Use DataManager to search by name
-            especies_encontradas = self.data_manager.search_species_by_name(name_query, exact_match=False)
-            
-            if especies_encontradas:
-                # Update UI in main thread
-                self.content_area.parent.after(0, self._mostrar_especies, especies_encontradas, f"Search results for: '{name_query}'")
-            else:
-                self.content_area.parent.after(0, self._mostrar_sin_resultados_nombre, name_query)
-                
-        except Exception as e:
-            self.content_area.parent.after(0, self.logger.error, f"Error searching by name '{name_query}': {e}")
-    
-    def _mostrar_sin_resultados_nombre(self, name_query: str):
-        """Mostrar mensaje cuando no se encuentran especies por nombre"""
-        # Limpiar display actual
-        for widget in self.especies_scroll.winfo_children():
-            widget.destroy()
-        
-        # Mensaje de no encontrado
-        no_data_frame = ctk.CTkFrame(self.especies_scroll)
-        no_data_frame.pack(fill="x", padx=5, pady=20)
-        
-        no_data_label = ctk.CTkLabel(
-            no_data_frame,
-            text=f"🔍 No species found matching: '{name_query}'",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=self.theme_manager.obtener_color('warning')
-        )
-        no_data_label.pack(pady=20)
-        
-        # Sugerencia de búsqueda
-        suggestion_label = ctk.CTkLabel(
-            no_data_frame,
-            text="💡 Try searching with different keywords or check spelling",
-            font=ctk.CTkFont(size=12),
-            text_color=self.theme_manager.obtener_color('secondary')
-        )
-        suggestion_label.pack(pady=5)
-        
-        # Botón para ver todas las especies
-        ctk.CTkButton(
-            no_data_frame,
-            text="🌳 View All Species",
-            command=self.ver_todas,
-            **self.theme_manager.obtener_estilo_boton("primary")
-        ).pack(pady=10)
-        
-        self.logger.warning(f"No species found matching: '{name_query}'")
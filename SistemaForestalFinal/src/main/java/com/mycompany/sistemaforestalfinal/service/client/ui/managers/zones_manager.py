@@ -3,7 +3,6 @@
 """
 
 import customtkinter as ctk
-import threading
 from typing import List, Optional
 import sys
 import os
@@ -16,6 +15,12 @@ sys.path.insert(0, client_dir)
 
 from utils.theme_manager import ThemeManager
 from utils.logger import Logger
+from core.task_executor import get_task_executor
+from utils.keyed_diff import KeyedWidgetList
+from utils.render_scheduler import RenderScheduler
+from utils.search_controller import SearchController
+from ui.components.table_view import TableViewComponent, ColumnaTabla
+from core.text_normalization import fold_text
 
 try:
     from gui.zone_dialogs import ZoneCreateDialog, ZoneEditDialog
@@ -24,22 +29,50 @@ except ImportError:
     # Alternative import paths if needed
     pass
 
+MODO_TARJETAS = "🗂️ Cards"
+MODO_TABLA = "📊 Table"
+
+
+def _texto_tipo_bosque(zona) -> str:
+    tipo = zona.tipo_bosque
+    return getattr(tipo, "value", tipo) or ""
+
+
+# Columnas del modo tabla; las claves de orden se calculan una vez por colección
+COLUMNAS_ZONAS = (
+    ColumnaTabla("id", "ID", lambda z: z.id, lambda z: z.id or 0, ancho=70),
+    ColumnaTabla("nombre", "Name", lambda z: z.nombre or "", lambda z: fold_text(z.nombre), ancho=220),
+    ColumnaTabla("tipo", "Forest Type", _texto_tipo_bosque, lambda z: fold_text(_texto_tipo_bosque(z)), ancho=160),
+    ColumnaTabla("area", "Area (ha)", lambda z: f"{z.area_ha or 0:,.2f}", lambda z: z.area_ha or 0.0, ancho=110, ancla="e"),
+    ColumnaTabla("activo", "Active", lambda z: "✅" if z.activo else "❌", lambda z: bool(z.activo), ancho=70, ancla="center"),
+)
+
 
 class ZonesManager:
     """Gestor de operaciones CRUD para zonas"""
     
-    def __init__(self, data_manager, content_area, theme_manager: ThemeManager, logger: Logger):
+    def __init__(self, data_manager, content_area, theme_manager: ThemeManager, logger: Logger, executor=None):
         """Inicializar gestor de zonas"""
         self.data_manager = data_manager
         self.content_area = content_area
         self.theme_manager = theme_manager
         self.logger = logger
+        self.executor = executor or get_task_executor()
           # Estado del gestor
         self.zonas_actuales = []
         self.zones_content = None
         self.search_entry = None
         self.search_type = None
         self.termino_busqueda = ""
+        self.mostrando_todas = False
+        self.modo_tabla = False
+        self.tabla_zonas = None
+        self.zonas_mostradas = []
+        self.titulo_mostrado = None
+        
+        # Volver a pintar la lista completa cuando lleguen datos frescos en segundo plano
+        if hasattr(self.data_manager, "add_data_change_callback"):
+            self.data_manager.add_data_change_callback(self._al_cambiar_datos)
         
         # Configurar pestaña de zonas
         self._configurar_tab_zonas()
@@ -102,6 +135,11 @@ class ZonesManager:
 
     def _editar_zona_seleccionada(self):
         """Permite al usuario seleccionar una zona para editarla."""
+        # En modo tabla se edita directamente la fila seleccionada
+        seleccion = self.tabla_zonas.seleccion() if self.modo_tabla and self.tabla_zonas else []
+        if seleccion:
+            self._editar_zona(seleccion[0])
+            return
         if not self.zonas_actuales:
             messagebox.showinfo("No Zones", "There are no zones to edit.")
             return
@@ -162,6 +200,19 @@ class ZonesManager:
         )
         self.search_entry.pack(side="left", padx=(0, 10))
         self.search_entry.bind("<KeyRelease>", self._al_cambiar_busqueda_zona)
+        self.search_entry.bind("<Return>", lambda evento: self._buscar_zona())
+        
+        # Búsqueda mientras se escribe: debounce, descarte de resultados viejos y refinamiento local
+        self.buscador = SearchController(
+            self.search_entry,
+            self.executor,
+            search=self._ejecutar_busqueda_zona,
+            on_results=self._al_recibir_resultados_zona,
+            on_clear=self.ver_todas,
+            refine=self._refinar_busqueda_zona,
+            on_error=lambda termino, e: self.logger.error(f"Error searching zones '{termino}': {e}"),
+            group="zones_view"
+        )
 
         self.search_type = ctk.CTkOptionMenu(
             search_frame,
@@ -188,6 +239,15 @@ class ZonesManager:
             **self.theme_manager.obtener_estilo_boton("warning")
         ).pack(side="left", padx=5)
         
+        # Modo de visualización: tarjetas o tabla nativa para listas grandes
+        self.selector_modo = ctk.CTkSegmentedButton(
+            search_frame,
+            values=[MODO_TARJETAS, MODO_TABLA],
+            command=self._al_cambiar_modo
+        )
+        self.selector_modo.pack(side="right", padx=5)
+        self.selector_modo.set(MODO_TARJETAS)
+        
         # Remove specific ID search entry and button as it's now part of the main search
         # self.search_id_entry = ctk.CTkEntry(...) 
         # ctk.CTkButton(...) for find by ID
@@ -206,12 +266,65 @@ class ZonesManager:
     
     def _crear_area_contenido(self, parent):
         """Crear área de contenido para zonas"""
+        # Fila 0: progreso del pintado (oculto), fila 1: lista de zonas
+        area = ctk.CTkFrame(parent, fg_color="transparent")
+        area.pack(fill="both", expand=True, padx=20, pady=10)
+        area.grid_columnconfigure(0, weight=1)
+        area.grid_rowconfigure(1, weight=1)
+        
         self.zones_content = ctk.CTkScrollableFrame(
-            parent,
+            area,
             fg_color=self.theme_manager.obtener_color('background'),
             corner_radius=10
         )
-        self.zones_content.pack(fill="both", expand=True, padx=20, pady=10)
+        self.zones_content.grid(row=1, column=0, sticky="nsew")
+        
+        # Tabla alternativa en la misma celda (solo una de las dos visible)
+        self.tabla_zonas = TableViewComponent(
+            area,
+            self.theme_manager,
+            COLUMNAS_ZONAS,
+            al_activar=self._editar_zona,
+            al_eliminar=self._eliminar_zona
+        )
+        self.tabla_zonas.grid(row=1, column=0, sticky="nsew")
+        self.tabla_zonas.grid_remove()
+        
+        # Tarjetas por ID: cada refresco solo toca las zonas que cambiaron
+        self.lista_zonas = KeyedWidgetList(
+            self.zones_content,
+            create=self._crear_tarjeta_zona,
+            update=self._enlazar_tarjeta_zona
+        )
+        
+        # Las listas grandes se pintan por trozos de ~8 ms para no congelar la ventana
+        self.render_zonas = RenderScheduler(self.zones_content)
+        self._crear_barra_progreso(area)
+    
+    def _crear_barra_progreso(self, parent):
+        """Crear la barra de progreso del pintado (solo visible mientras dura)"""
+        self.progreso_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        self.progreso_frame.grid(row=0, column=0, sticky="ew", pady=(0, 5))
+        self.progreso_frame.grid_remove()
+        
+        self.progreso_label = ctk.CTkLabel(
+            self.progreso_frame,
+            text="",
+            font=ctk.CTkFont(size=12),
+            text_color=self.theme_manager.obtener_color('text_secondary')
+        )
+        self.progreso_label.pack(side="left", padx=(0, 10))
+        
+        self.progreso_barra = ctk.CTkProgressBar(self.progreso_frame)
+        self.progreso_barra.pack(side="left", fill="x", expand=True, padx=5)
+        
+        ctk.CTkButton(
+            self.progreso_frame,
+            text="✖ Cancel",
+            command=self._cancelar_render,
+            width=90,
+            **self.theme_manager.obtener_estilo_boton("warning")
+        ).pack(side="left", padx=5)
     
     def _mostrar_mensaje_inicial(self):
         """Mostrar mensaje inicial en el área de zonas"""
@@ -226,21 +339,30 @@ class ZonesManager:
     def ver_todas(self):
         """Ver todas las zonas"""
         self.logger.info("🔍 Loading all zones...")
-        threading.Thread(target=self._cargar_zonas_thread, daemon=True).start()
+        # Una búsqueda pendiente o en curso ya no debe sustituir a la lista completa
+        self.buscador.cancel()
+        # Una sola carga en curso aunque se pulse varias veces; reemplaza búsquedas pendientes
+        self.executor.submit(
+            self.data_manager.get_all_zones,
+            key="zones:all",
+            group="zones_view",
+            on_success=self._al_cargar_zonas,
+            on_error=lambda e: self.logger.error(f"Error loading zones: {e}")
+        )
     
-    def _cargar_zonas_thread(self):
-        """Hilo para cargar todas las zonas"""
-        try:
-            zonas_lista = self.data_manager.get_all_zones()
-            self.zonas_actuales = zonas_lista
-            
-            # Actualizar UI en el hilo principal
-            if hasattr(self.content_area, 'parent'):
-                self.content_area.parent.after(0, self._mostrar_zonas, zonas_lista)
-                
-        except Exception as e:
-            if hasattr(self.content_area, 'parent'):
-                self.content_area.parent.after(0, self.logger.error, f"Error loading zones: {e}")
+    def _al_cargar_zonas(self, zonas_lista):
+        """Mostrar todas las zonas cargadas (hilo de UI)"""
+        self.mostrando_todas = True
+        self.zonas_actuales = zonas_lista
+        self._mostrar_zonas(zonas_lista)
+    
+    def _al_cambiar_datos(self, evento: str, datos=None):
+        """Refrescar la vista cuando el DataManager revalida las zonas (hilo de UI)"""
+        if evento.startswith("zones"):
+            # Los resultados anteriores ya no sirven de base para refinar
+            self.buscador.reset()
+        if evento == "zones_refreshed" and self.mostrando_todas and datos is not None:
+            self._al_cargar_zonas(datos)
     
     def _mostrar_zonas(self, zonas_lista, titulo="Zones List"):
         """Mostrar lista de zonas en la interfaz"""
@@ -249,70 +371,134 @@ class ZonesManager:
                 self.logger.warning("Zones display frame not ready")
                 return
             
-            # Limpiar display actual
-            for widget in self.zones_content.winfo_children():
-                widget.destroy()
-            
             if not zonas_lista:
                 self._mostrar_sin_zonas()
                 return
-              # Mostrar zonas en diseño de tarjetas
-            for zona in zonas_lista:
-                self._crear_tarjeta_zona(zona)
             
-            self.logger.success(f"✅ {titulo}: Displayed {len(zonas_lista)} zones")
+            misma_vista = titulo == self.titulo_mostrado
+            self.zonas_mostradas = zonas_lista
+            self.titulo_mostrado = titulo
+            self._mostrar_vista_tabla(self.modo_tabla)
+            
+            if self.modo_tabla:
+                # Una fila nativa por zona: sin widgets ni pintado por trozos
+                self._detener_render()
+                self.tabla_zonas.establecer_elementos(zonas_lista, mantener_posicion=misma_vista)
+                self.logger.success(f"✅ {titulo}: Displayed {len(zonas_lista)} zones (table)")
+                return
+            
+            # Reconciliar por ID contra las tarjetas ya mostradas, por trozos;
+            # un resultado nuevo aborta el pintado anterior
+            self.render_zonas.run(
+                self.lista_zonas.reconcile_steps(zonas_lista),
+                total=len(zonas_lista),
+                on_progress=self._al_progresar_render,
+                on_done=lambda cambios: self._al_terminar_render(titulo, len(zonas_lista), cambios)
+            )
             
         except Exception as e:
             self.logger.error(f"Error displaying zones list: {e}")
     
-    def _crear_tarjeta_zona(self, zona):
-        """Crear tarjeta individual para una zona"""
+    def _mostrar_vista_tabla(self, tabla: bool):
+        """Mostrar la tabla o las tarjetas en el área de contenido"""
+        if tabla:
+            self.zones_content.grid_remove()
+            self.tabla_zonas.grid()
+        else:
+            self.tabla_zonas.grid_remove()
+            self.zones_content.grid()
+    
+    def _al_cambiar_modo(self, modo: str):
+        """Pasar las zonas mostradas a la otra vista"""
+        self.modo_tabla = modo == MODO_TABLA
+        if self.zonas_mostradas:
+            self._mostrar_zonas(self.zonas_mostradas, self.titulo_mostrado or "Zones List")
+    
+    def _preparar_mensaje(self):
+        """Vaciar las tarjetas para mostrar un mensaje (los mensajes van siempre en la vista de tarjetas)"""
+        self._detener_render()
+        self._mostrar_vista_tabla(False)
+        self.zonas_mostradas = []
+        self.titulo_mostrado = None
+        self.lista_zonas.clear()
+    
+    def _al_progresar_render(self, hechas: int, total: int):
+        """Mostrar el avance del pintado en curso"""
+        self.progreso_frame.grid()
+        self.progreso_barra.set(hechas / total if total else 1.0)
+        self.progreso_label.configure(text=f"Rendering {hechas}/{total} zones...")
+    
+    def _al_terminar_render(self, titulo: str, total: int, cambios):
+        """Ocultar el progreso al terminar de pintar"""
+        self.progreso_frame.grid_remove()
+        self.logger.success(f"✅ {titulo}: Displayed {total} zones ({cambios})")
+    
+    def _cancelar_render(self):
+        """Detener el pintado en curso; las tarjetas ya dibujadas se quedan"""
+        if self.render_zonas.is_running:
+            self.logger.warning("Zone rendering cancelled")
+        self._detener_render()
+    
+    def _detener_render(self):
+        """Abortar el pintado en curso y ocultar el progreso"""
+        self.render_zonas.cancel()
+        self.progreso_frame.grid_remove()
+    
+    def _crear_tarjeta_zona(self, parent, zona):
+        """Crear tarjeta individual para una zona (la empaqueta la lista por clave)"""
         # Tarjeta de zona
-        tarjeta = ctk.CTkFrame(self.zones_content)
-        tarjeta.pack(fill="x", padx=5, pady=5)
+        tarjeta = ctk.CTkFrame(parent)
         
         # Header de la tarjeta
         header_frame = ctk.CTkFrame(tarjeta)
         header_frame.pack(fill="x", padx=10, pady=10)
         
         # ID y nombre de la zona
-        id_label = ctk.CTkLabel(
+        tarjeta.id_label = ctk.CTkLabel(
             header_frame,
-            text=f"ID: {zona.id}",
+            text="",
             font=ctk.CTkFont(size=12, weight="bold"),
             text_color="#3B82F6"
         )
-        id_label.pack(side="left", padx=(10, 5))
+        tarjeta.id_label.pack(side="left", padx=(10, 5))
         
-        nombre_label = ctk.CTkLabel(
+        tarjeta.nombre_label = ctk.CTkLabel(
             header_frame,
-            text=f"🌍 {zona.nombre}",
+            text="",
             font=ctk.CTkFont(size=14, weight="bold")
         )
-        nombre_label.pack(side="left", padx=5)
-          # Botones de acción
-        self._crear_botones_zona(tarjeta, zona)
+        tarjeta.nombre_label.pack(side="left", padx=5)
+        # Botones de acción
+        self._crear_botones_zona(tarjeta)
+        self._enlazar_tarjeta_zona(tarjeta, zona)
+        return tarjeta
+    
+    def _enlazar_tarjeta_zona(self, tarjeta, zona):
+        """Volcar los datos de una zona en su tarjeta"""
+        tarjeta.zona = zona
+        tarjeta.id_label.configure(text=f"ID: {zona.id}")
+        tarjeta.nombre_label.configure(text=f"🌍 {zona.nombre}")
+        tarjeta.details_label.configure(text=(
+            f"Type: {zona.tipo_bosque}\n"
+            f"Area: {zona.area_ha} hectares\n"
+            f"Status: {'Active' if zona.activo else 'Inactive'}"
+        ))
     
-    def _crear_botones_zona(self, parent, zona):
+    def _crear_botones_zona(self, tarjeta):
         """Crear botones de acción para la zona"""
-        button_frame = ctk.CTkFrame(parent)
+        button_frame = ctk.CTkFrame(tarjeta)
         button_frame.pack(fill="x", padx=10, pady=(0, 10))
         
         # Zone details info
         details_frame = ctk.CTkFrame(button_frame)
         details_frame.pack(fill="x", padx=10, pady=5)
-        details_text = (
-            f"Type: {zona.tipo_bosque}\n"
-            f"Area: {zona.area_ha} hectares\n"
-            f"Status: {'Active' if zona.activo else 'Inactive'}"
-        )
-        details_label = ctk.CTkLabel(
+        tarjeta.details_label = ctk.CTkLabel(
             details_frame,
-            text=details_text,
+            text="",
             font=ctk.CTkFont(size=12),
             justify="left"
         )
-        details_label.pack(anchor="w", padx=10, pady=5)
+        tarjeta.details_label.pack(anchor="w", padx=10, pady=5)
         
         # Action buttons
         action_frame = ctk.CTkFrame(button_frame)
@@ -324,7 +510,7 @@ class ZonesManager:
             text="✏️ Edit",
             width=80,
             height=30,
-            command=lambda: self._editar_zona(zona),
+            command=lambda: self._editar_zona(tarjeta.zona),
             fg_color="#059669",
             hover_color="#047857"
         ).pack(side="left", padx=(10, 5), pady=5)
@@ -335,12 +521,13 @@ class ZonesManager:
             text="🗑️ Delete",
             width=80,
             height=30,
-            command=lambda: self._eliminar_zona(zona),
+            command=lambda: self._eliminar_zona(tarjeta.zona),
             **self.theme_manager.obtener_estilo_boton("error")
         ).pack(side="left", padx=5, pady=5)
     
     def _mostrar_sin_zonas(self):
         """Mostrar mensaje cuando no hay zonas"""
+        self._preparar_mensaje()
         no_data_label = ctk.CTkLabel(
             self.zones_content,
             text="📋 No zones data to display",
@@ -369,26 +556,19 @@ class ZonesManager:
     def _on_zone_created(self, zone_data: ZoneData):
         """Callback cuando se crea una nueva zona"""
         self.logger.info(f"Creating zone: {zone_data.nombre}")
-        threading.Thread(target=self._create_zone_thread, args=(zone_data,), daemon=True).start()
+        self.executor.submit(
+            self.data_manager.create_zone, zone_data,
+            on_success=lambda success: self._al_crear_zona(zone_data, success),
+            on_error=lambda e: self._on_zone_created_error(str(e))
+        )
     
-    def _create_zone_thread(self, zone_data: ZoneData):
-        """Hilo para crear zona en el servidor"""
-        try:
-            # Create zone via SOAP
-            success = self.data_manager.create_zone(zone_data)
-            
-            # Update UI in main thread
-            parent = self._get_parent_window()
-            if parent and success:
-                parent.after(0, self._on_zone_created_success, zone_data.nombre)
-                parent.after(0, self.ver_todas)  # Refresh zones list
-            elif parent:
-                parent.after(0, self._on_zone_created_error, "Failed to create zone")
-                
-        except Exception as e:
-            parent = self._get_parent_window()
-            if parent:
-                parent.after(0, self._on_zone_created_error, str(e))
+    def _al_crear_zona(self, zone_data: ZoneData, success: bool):
+        """Resultado de la creación de zona (hilo de UI)"""
+        if success:
+            self._on_zone_created_success(zone_data.nombre)
+            self.ver_todas()  # Refresh zones list
+        else:
+            self._on_zone_created_error("Failed to create zone")
     
     def _on_zone_created_success(self, zone_name: str):
         """Callback para éxito en creación de zona"""
@@ -418,29 +598,52 @@ class ZonesManager:
             self.logger.error(f"Error opening edit zone dialog: {e}")
             messagebox.showerror("Error", f"Could not open zone edit dialog: {str(e)}")
     
+    def _eliminar_zona(self, zona):
+        """Eliminar zona específica (baja lógica)"""
+        respuesta = messagebox.askyesno(
+            "Confirm Delete",
+            f"Are you sure you want to delete the zone '{zona.nombre}'?\n\nThis action cannot be undone.",
+            icon="warning"
+        )
+        if not respuesta:
+            return
+        
+        self.logger.info(f"🗑️ Deleting zone: {zona.nombre}")
+        self.executor.submit(
+            self.data_manager.delete_zone, zona.id,
+            on_success=lambda success: self._al_eliminar_zona(zona, success),
+            on_error=lambda e: self._on_zone_deleted_error(str(e))
+        )
+    
+    def _al_eliminar_zona(self, zona, success: bool):
+        """Resultado de la eliminación de zona (hilo de UI)"""
+        if success:
+            self.logger.success(f"✅ Zone '{zona.nombre}' deleted successfully!")
+            self.ver_todas()
+        else:
+            self._on_zone_deleted_error("Failed to delete zone")
+    
+    def _on_zone_deleted_error(self, error_msg: str):
+        """Callback para error en eliminación de zona"""
+        messagebox.showerror("Error", f"Failed to delete zone: {error_msg}")
+        self.logger.error(f"❌ Error deleting zone: {error_msg}")
+    
     def _on_zone_edited(self, updated_zone: ZoneData):
         """Callback cuando se edita una zona"""
         self.logger.info(f"Updating zone: {updated_zone.nombre}")
-        threading.Thread(target=self._update_zone_thread, args=(updated_zone,), daemon=True).start()
+        self.executor.submit(
+            self.data_manager.update_zone, updated_zone,
+            on_success=lambda success: self._al_actualizar_zona(updated_zone, success),
+            on_error=lambda e: self._on_zone_updated_error(str(e))
+        )
     
-    def _update_zone_thread(self, zone_data: ZoneData):
-        """Hilo para actualizar zona en el servidor"""
-        try:
-            # Update zone via SOAP
-            success = self.data_manager.update_zone(zone_data)
-            
-            # Update UI in main thread
-            parent = self._get_parent_window()
-            if parent and success:
-                parent.after(0, self._on_zone_updated_success, zone_data.nombre)
-                parent.after(0, self.ver_todas)  # Refresh zones list
-            elif parent:
-                parent.after(0, self._on_zone_updated_error, "Failed to update zone")
-                
-        except Exception as e:
-            parent = self._get_parent_window()
-            if parent:
-                parent.after(0, self._on_zone_updated_error, str(e))
+    def _al_actualizar_zona(self, zone_data: ZoneData, success: bool):
+        """Resultado de la actualización de zona (hilo de UI)"""
+        if success:
+            self._on_zone_updated_success(zone_data.nombre)
+            self.ver_todas()  # Refresh zones list
+        else:
+            self._on_zone_updated_error("Failed to update zone")
     
     def _on_zone_updated_success(self, zone_name: str):
         """Callback para éxito en actualización de zona"""
@@ -498,30 +701,51 @@ class ZonesManager:
         termino = self.search_entry.get() if self.search_entry else ""
         if termino != self.termino_busqueda:
             self.termino_busqueda = termino
-            self._buscar_zona()
+            self._buscar_zona(inmediata=False)
     
-    def _buscar_zona(self):
-        """Ejecutar búsqueda de zonas según el tipo seleccionado"""
+    def _buscar_zona(self, inmediata: bool = True):
+        """Ejecutar búsqueda de zonas según el tipo seleccionado (al teclear, tras el debounce)"""
         search_term = self.search_entry.get().strip()
         search_type = self.search_type.get()
         
         if not search_term:
-            self.ver_todas()
+            self.buscador.clear()
             return
         
-        self.logger.info(f"🔍 Searching zones by {search_type}: '{search_term}'")
-        
         if search_type == "ID":
-            self._buscar_zona_por_id_directo(search_term)
+            self._buscar_zona_por_id_directo(search_term, inmediata)
         else:  # Name search
-            self._buscar_zona_por_nombre(search_term)
-    
-    def _buscar_zona_por_id_directo(self, id_text):
+            self._buscar_zona_por_nombre(search_term, inmediata)
+    
+    def _ejecutar_busqueda_zona(self, termino: str, modo: str):
+        """Búsqueda completa de zonas (hilo de trabajo)"""
+        if modo == "ID":
+            return self.data_manager.get_zone_by_id(int(termino))
+        return self.data_manager.search_zones_by_name(termino, exact_match=False)
+    
+    def _refinar_busqueda_zona(self, termino: str, modo: str, anteriores):
+        """Filtrar localmente el resultado anterior cuando la consulta lo extiende"""
+        if modo != "Name":
+            return None
+        return self.data_manager.refine_zones_search(termino, anteriores)
+    
+    def _al_recibir_resultados_zona(self, termino: str, modo: str, resultado):
+        """Resultado vigente de una búsqueda de zonas (hilo de UI)"""
+        if modo == "ID":
+            self._al_buscar_zona_por_id(int(termino), resultado)
+        else:
+            self._al_buscar_zona_por_nombre(termino, resultado)
+    
+    def _buscar_zona_por_id_directo(self, id_text, inmediata: bool = True):
         """Buscar zona por ID desde el campo de texto principal"""
         try:
             zone_id = int(id_text)
-            self._buscar_zona_por_id_con_id(zone_id)
+            if inmediata:
+                self._buscar_zona_por_id_con_id(zone_id)
+            else:
+                self.buscador.query_changed(id_text, "ID", min_length=1)
         except ValueError:
+            self.buscador.cancel()
             self.logger.error(f"❌ Invalid ID format: '{id_text}'. Please enter a valid number.")
             self._mostrar_zonas([], f"Invalid ID: {id_text}")
     
@@ -545,48 +769,37 @@ class ZonesManager:
     def _buscar_zona_por_id_con_id(self, zone_id: int):
         """Buscar zona por ID específico"""
         self.logger.info(f"🔍 Searching for zone with ID: {zone_id}")
-        threading.Thread(target=self._buscar_zona_por_id_thread, args=(zone_id,), daemon=True).start()
+        self.buscador.search_now(str(zone_id), "ID")
     
-    def _buscar_zona_por_id_thread(self, zone_id: int):
-        """Thread para buscar zona por ID"""
-        try:
-            # Use DataManager to search by ID
-            zona = self.data_manager.get_zone_by_id(zone_id)
-            
-            if zona:
-                # Update UI in main thread
-                self.content_area.parent.after(0, self._mostrar_zonas, [zona], f"Zone with ID: {zone_id}")
-            else:
-                self.content_area.parent.after(0, self._mostrar_sin_resultados_zona_id, zone_id)
-                
-        except Exception as e:
-            self.content_area.parent.after(0, self.logger.error, f"Error searching zone by ID {zone_id}: {e}")
+    def _al_buscar_zona_por_id(self, zone_id: int, zona):
+        """Mostrar el resultado de la búsqueda de zona por ID (hilo de UI)"""
+        self.mostrando_todas = False
+        if zona:
+            self._mostrar_zonas([zona], f"Zone with ID: {zone_id}")
+        else:
+            self._mostrar_sin_resultados_zona_id(zone_id)
     
-    def _buscar_zona_por_nombre(self, name_query: str):
+    def _buscar_zona_por_nombre(self, name_query: str, inmediata: bool = True):
         """Buscar zonas por nombre"""
+        if not inmediata:
+            # Al escribir rápido solo se busca cuando el usuario hace una pausa
+            self.buscador.query_changed(name_query, "Name")
+            return
         self.logger.info(f"🔍 Searching for zones with name: '{name_query}'")
-        threading.Thread(target=self._buscar_zona_por_nombre_thread, args=(name_query,), daemon=True).start()
+        self.buscador.search_now(name_query, "Name")
     
-    def _buscar_zona_por_nombre_thread(self, name_query: str):
-        """Thread para buscar zonas por nombre"""
-        try:
-            # Use DataManager to search by name
-            zonas_encontradas = self.data_manager.search_zones_by_name(name_query, exact_match=False)
-            
-            if zonas_encontradas:
-                # Update UI in main thread
-                self.content_area.parent.after(0, self._mostrar_zonas, zonas_encontradas, f"Search results for: '{name_query}'")
-            else:
-                self.content_area.parent.after(0, self._mostrar_sin_resultados_zona_nombre, name_query)
-                
-        except Exception as e:
-            self.content_area.parent.after(0, self.logger.error, f"Error searching zones by name '{name_query}': {e}")
+    def _al_buscar_zona_por_nombre(self, name_query: str, zonas_encontradas):
+        """Mostrar el resultado de la búsqueda de zonas por nombre (hilo de UI)"""
+        self.mostrando_todas = False
+        if zonas_encontradas:
+            self._mostrar_zonas(zonas_encontradas, f"Search results for: '{name_query}'")
+        else:
+            self._mostrar_sin_resultados_zona_nombre(name_query)
     
     def _mostrar_sin_resultados_zona_id(self, zone_id: int):
         """Mostrar mensaje cuando no se encuentra zona por ID"""
         # Limpiar display actual
-        for widget in self.zones_content.winfo_children():
-            widget.destroy()
+        self._preparar_mensaje()
         
         # Mensaje de no encontrado
         no_data_frame = ctk.CTkFrame(self.zones_content)
@@ -622,8 +835,7 @@ class ZonesManager:
     def _mostrar_sin_resultados_zona_nombre(self, name_query: str):
         """Mostrar mensaje cuando no se encuentran zonas por nombre"""
         # Limpiar display actual
-        for widget in self.zones_content.winfo_children():
-            widget.destroy()
+        self._preparar_mensaje()
         
         # Mensaje de no encontrado
         no_data_frame = ctk.CTkFrame(self.zones_content)
@@ -0,0 +1,207 @@
+"""
+🔑 Keyed Diff - Reconciliación de listas por clave (ID)
+"""
+
+import bisect
+import operator
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generator, Hashable, List, Sequence, Set
+
+
+def _default_key(item) -> Hashable:
+    return item.id
+
+
+@dataclass
+class KeyedDiff:
+    """Cambios entre la lista mostrada y la nueva, expresados como claves"""
+    inserted: List[Hashable] = field(default_factory=list)
+    removed: List[Hashable] = field(default_factory=list)
+    moved: List[Hashable] = field(default_factory=list)
+    changed: List[Hashable] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.inserted or self.removed or self.moved or self.changed)
+
+    def __len__(self) -> int:
+        return len(self.inserted) + len(self.removed) + len(self.moved) + len(self.changed)
+
+    def __str__(self) -> str:
+        return (f"+{len(self.inserted)} -{len(self.removed)} "
+                f"~{len(self.changed)} ↕{len(self.moved)}")
+
+
+def _longest_increasing(positions: Sequence[int]) -> Set[int]:
+    """Índices de una subsecuencia creciente más larga (O(n log n))"""
+    tails: List[int] = []       # Último valor de cada longitud
+    tail_index: List[int] = []  # Índice en `positions` de ese valor
+    previous = [-1] * len(positions)
+    for i, value in enumerate(positions):
+        length = bisect.bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_index.append(i)
+        else:
+            tails[length] = value
+            tail_index[length] = i
+        previous[i] = tail_index[length - 1] if length else -1
+
+    result = set()
+    i = tail_index[-1] if tail_index else -1
+    while i != -1:
+        result.add(i)
+        i = previous[i]
+    return result
+
+
+def diff_keyed(old: Sequence[Any], new: Sequence[Any],
+               key: Callable[[Any], Hashable] = _default_key,
+               equals: Callable[[Any, Any], bool] = operator.eq) -> KeyedDiff:
+    """
+    Calcular altas, bajas, movimientos y cambios de campos entre dos listas
+
+    Las claves deben ser únicas dentro de cada lista. Solo se marcan como
+    movidos los elementos fuera de la subsecuencia más larga que conserva el
+    orden, es decir, el mínimo de elementos que hay que recolocar.
+
+    Args:
+        old: Lista mostrada actualmente
+        new: Lista nueva
+        key: Clave de cada elemento (por defecto su `id`)
+        equals: Comparación de contenido para detectar cambios de campos
+
+    Returns:
+        KeyedDiff: Claves afectadas por tipo de cambio
+    """
+    old_position = {key(item): i for i, item in enumerate(old)}
+    new_keys = [key(item) for item in new]
+    new_key_set = set(new_keys)
+
+    diff = KeyedDiff()
+    diff.removed = [k for k in old_position if k not in new_key_set]
+
+    retained_keys = []
+    retained_positions = []
+    for item, k in zip(new, new_keys):
+        position = old_position.get(k)
+        if position is None:
+            diff.inserted.append(k)
+            continue
+        retained_keys.append(k)
+        retained_positions.append(position)
+        if not equals(old[position], item):
+            diff.changed.append(k)
+
+    stable = _longest_increasing(retained_positions)
+    diff.moved = [k for i, k in enumerate(retained_keys) if i not in stable]
+    return diff
+
+
+class KeyedWidgetList:
+    """
+    Widgets empaquetados (pack) en un contenedor, uno por clave.
+
+    `reconcile` compara la lista nueva con la mostrada y solo destruye los
+    widgets de las bajas, crea los de las altas, vuelve a enlazar los que
+    cambiaron y recoloca los movidos; el resto no se toca.
+    """
+
+    def __init__(self, container,
+                 create: Callable[[Any, Any], Any],
+                 update: Callable[[Any, Any], None],
+                 key: Callable[[Any], Hashable] = _default_key,
+                 pack_options: Dict[str, Any] = None):
+        """
+        Args:
+            container: Widget padre de las filas
+            create: Crea el widget de un elemento (contenedor, elemento) sin empaquetarlo
+            update: Vuelca un elemento en su widget existente (widget, elemento)
+            key: Clave de cada elemento (por defecto su `id`)
+            pack_options: Opciones de pack de cada fila
+        """
+        self.container = container
+        self.create = create
+        self.update = update
+        self.key = key
+        self.pack_options = pack_options or {"fill": "x", "padx": 5, "pady": 5}
+        self.items: List[Any] = []
+        self.widgets: Dict[Hashable, Any] = {}
+
+    def reconcile(self, items: Sequence[Any]) -> KeyedDiff:
+        """Actualizar los widgets para que muestren `items` en ese orden"""
+        steps = self.reconcile_steps(items)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as done:
+                return done.value
+
+    def reconcile_steps(self, items: Sequence[Any]) -> Generator[None, None, KeyedDiff]:
+        """
+        `reconcile` paso a paso, para pintarlo por trozos (ver RenderScheduler)
+
+        Recorre la lista nueva de arriba abajo y cede tras cada fila, de modo
+        que las filas aparecen progresivamente en su sitio. Si se cierra antes
+        de terminar, la lista queda coherente con lo que hay en pantalla y el
+        siguiente `reconcile` parte de ahí. Devuelve el KeyedDiff.
+        """
+        self._remove_foreign_widgets()
+        diff = diff_keyed(self.items, items, self.key)
+        inserted = set(diff.inserted)
+        changed = set(diff.changed)
+        to_place = inserted | set(diff.moved)
+        shown = {self.key(item): item for item in self.items}
+        completed = False
+
+        try:
+            for k in diff.removed:
+                self.widgets.pop(k).destroy()
+                del shown[k]
+
+            # Altas y movidos se colocan justo después de su predecesor en el orden nuevo
+            previous = None
+            for item in items:
+                k = self.key(item)
+                if k in inserted:
+                    widget = self.widgets[k] = self.create(self.container, item)
+                else:
+                    widget = self.widgets[k]
+                    if k in changed:
+                        self.update(widget, item)
+                shown[k] = item
+                if k in to_place:
+                    if previous is not None:
+                        widget.pack(**self.pack_options, after=previous)
+                    else:
+                        packed = [w for w in self.container.pack_slaves() if w is not widget]
+                        if packed:
+                            widget.pack(**self.pack_options, before=packed[0])
+                        else:
+                            widget.pack(**self.pack_options)
+                previous = widget
+                yield
+            completed = True
+        finally:
+            if completed:
+                self.items = list(items)
+            else:
+                # Interrumpido: reconstruir el orden real a partir de lo empaquetado
+                order = {id(w): n for n, w in enumerate(self.container.pack_slaves())}
+                self.items = sorted(shown.values(),
+                                    key=lambda item: order.get(id(self.widgets[self.key(item)]), len(order)))
+        return diff
+
+    def clear(self):
+        """Vaciar el contenedor: filas y mensajes (p. ej. antes de mostrar otro mensaje)"""
+        for widget in self.container.winfo_children():
+            widget.destroy()
+        self.widgets.clear()
+        self.items = []
+
+    def _remove_foreign_widgets(self):
+        """Quitar mensajes u otros widgets que no pertenecen a la lista"""
+        own = set(map(id, self.widgets.values()))
+        for widget in self.container.winfo_children():
+            if id(widget) not in own:
+                widget.destroy()
@@ -2,61 +2,220 @@
 📋 Logger - Sistema de registro de actividades
 """
 
+import queue
+import threading
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Callable, Optional
+from typing import Callable, Deque, List, Optional
 import customtkinter as ctk
 
+from core.text_normalization import fold_text
+
+ICONOS = {
+    "info": "ℹ️",
+    "success": "✅",
+    "error": "❌",
+    "warning": "⚠️",
+    "debug": "🐛"
+}
+
+
+@dataclass(frozen=True)
+class RegistroLog:
+    """Una entrada del historial"""
+    momento: datetime
+    tipo: str
+    mensaje: str
+    
+    @property
+    def icono(self) -> str:
+        return ICONOS.get(self.tipo, "📝")
+    
+    def formatear(self) -> str:
+        return f"[{self.momento.strftime('%H:%M:%S')}] {self.icono} {self.mensaje}\n"
+
 
 class Logger:
-    """Sistema de logging para la aplicación"""
+    """
+    Sistema de logging para la aplicación
     
-    def __init__(self, log_widget: Optional[ctk.CTkTextbox] = None):
+    `log` solo encola el mensaje (seguro y sin bloqueo desde cualquier hilo);
+    un único temporizador de Tk vacía la cola cada `intervalo_ms` y escribe el
+    lote en el widget con un solo insert. El widget conserva solo las últimas
+    `max_lineas` líneas; el historial completo (acotado a `max_historial`
+    entradas) se guarda en memoria para buscar y exportar.
+    """
+    
+    def __init__(self, log_widget: Optional[ctk.CTkTextbox] = None,
+                 max_lineas: int = 500,
+                 max_historial: int = 10000,
+                 intervalo_ms: int = 100):
         """Inicializar logger"""
-        self.log_widget = log_widget
+        self.log_widget = None
         self.callbacks = []
+        self.max_lineas = max_lineas
+        self.intervalo_ms = intervalo_ms
+        
+        self._cola = queue.SimpleQueue()
+        self._historial: Deque[RegistroLog] = deque(maxlen=max_historial)
+        # Lo que falta escribir en el widget; más de max_lineas se recortaría de todos modos
+        self._pendientes: Deque[RegistroLog] = deque(maxlen=max_lineas)
+        self._lock = threading.Lock()
+        self._filtro = ""
+        self._after_id = None
+        
+        if log_widget is not None:
+            self.agregar_widget(log_widget)
     
     def agregar_widget(self, widget: ctk.CTkTextbox):
-        """Agregar widget de texto para mostrar logs"""
+        """Agregar widget de texto para mostrar logs y empezar a vaciar la cola en él"""
         self.log_widget = widget
+        # Lo registrado antes de tener widget también se muestra
+        recientes = self._recientes(self.max_lineas)
+        with self._lock:
+            self._pendientes.clear()
+            self._pendientes.extend(recientes)
+        self._programar()
     
     def agregar_callback(self, callback: Callable):
-        """Agregar callback para eventos de log"""
+        """Agregar callback para eventos de log (se llaman en el hilo de la UI)"""
         self.callbacks.append(callback)
     
     def log(self, mensaje: str, tipo: str = "info"):
-        """Registrar mensaje con tipo"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        icono = self._obtener_icono(tipo)
-        mensaje_formateado = f"[{timestamp}] {icono} {mensaje}\n"
+        """Registrar mensaje con tipo (desde cualquier hilo)"""
+        self._cola.put(RegistroLog(datetime.now(), tipo, mensaje))
+        if self.log_widget is None:
+            # Sin ventana no hay temporizador: pasar al historial y a consola ya
+            self._drenar()
+    
+    def _obtener_icono(self, tipo: str) -> str:
+        """Obtener icono según tipo de mensaje"""
+        return ICONOS.get(tipo, "📝")
+    
+    # ===========================================
+    # VACIADO POR LOTES
+    # ===========================================
+    
+    def _drenar(self) -> List[RegistroLog]:
+        """Pasar lo encolado al historial y a los pendientes del widget"""
+        nuevos = []
+        while True:
+            try:
+                nuevos.append(self._cola.get_nowait())
+            except queue.Empty:
+                break
+        if nuevos:
+            with self._lock:
+                self._historial.extend(nuevos)
+                self._pendientes.extend(r for r in nuevos if self._coincide(r))
+            # También a consola, en un solo print por lote
+            print("\n".join(f"{r.icono} {r.mensaje}" for r in nuevos))
+        return nuevos
+    
+    def _programar(self):
+        if self.log_widget is None or self._after_id is not None:
+            return
+        try:
+            self._after_id = self.log_widget.after(self.intervalo_ms, self._vaciar)
+        except Exception:
+            # La ventana se destruyó
+            self._after_id = None
+    
+    def _vaciar(self):
+        """Temporizador de Tk: escribir el lote pendiente en el widget"""
+        self._after_id = None
+        nuevos = self._drenar()
         
-        # Mostrar en widget si está disponible
-        if self.log_widget:
-            self.log_widget.insert("end", mensaje_formateado)
+        with self._lock:
+            lote = list(self._pendientes)
+            self._pendientes.clear()
+        if lote and self.log_widget is not None:
+            self.log_widget.insert("end", "".join(r.formatear() for r in lote))
+            self._recortar_widget()
             self.log_widget.see("end")
         
-        # Llamar callbacks
-        for callback in self.callbacks:
-            try:
-                callback(mensaje, tipo)
-            except Exception as e:
-                print(f"Error in log callback: {e}")
+        for registro in nuevos:
+            for callback in self.callbacks:
+                try:
+                    callback(registro.mensaje, registro.tipo)
+                except Exception as e:
+                    print(f"Error in log callback: {e}")
         
-        # También imprimir en consola
-        print(f"{icono} {mensaje}")
+        self._programar()
     
-    def _obtener_icono(self, tipo: str) -> str:
-        """Obtener icono según tipo de mensaje"""
-        iconos = {
-            "info": "ℹ️",
-            "success": "✅",
-            "error": "❌",
-            "warning": "⚠️",
-            "debug": "🐛"
-        }
-        return iconos.get(tipo, "📝")
+    def _recortar_widget(self):
+        """Dejar en el widget solo las últimas max_lineas líneas"""
+        lineas = int(self.log_widget.index("end-1c").split(".")[0])
+        sobrantes = lineas - self.max_lineas - 1  # La última línea queda vacía tras el "\n" final
+        if sobrantes > 0:
+            self.log_widget.delete("1.0", f"{sobrantes + 1}.0")
+    
+    def cerrar(self):
+        """Detener el temporizador (p. ej. al cerrar la ventana)"""
+        if self._after_id is not None and self.log_widget is not None:
+            try:
+                self.log_widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._after_id = None
+    
+    # ===========================================
+    # HISTORIAL
+    # ===========================================
+    
+    def historial(self) -> List[RegistroLog]:
+        """Copia del historial completo (acotado a max_historial)"""
+        self._drenar()
+        with self._lock:
+            return list(self._historial)
+    
+    def buscar(self, texto: str = "", tipo: Optional[str] = None) -> List[RegistroLog]:
+        """Entradas del historial que contienen `texto` (sin acentos ni mayúsculas) y son de `tipo`"""
+        consulta = fold_text(texto.strip())
+        return [r for r in self.historial()
+                if (tipo is None or r.tipo == tipo) and consulta in fold_text(r.mensaje)]
+    
+    def exportar(self, ruta: str, texto: str = "", tipo: Optional[str] = None) -> int:
+        """Guardar el historial (o lo que coincida con la búsqueda) en un archivo de texto"""
+        registros = self.buscar(texto, tipo) if texto or tipo else self.historial()
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.writelines(r.formatear() for r in registros)
+        return len(registros)
+    
+    def establecer_filtro(self, texto: str):
+        """Mostrar en el widget solo las entradas que contienen `texto` (vacío = todas)"""
+        self._drenar()
+        with self._lock:
+            self._filtro = fold_text(texto.strip())
+            self._pendientes.clear()
+        if self.log_widget is not None:
+            self.log_widget.delete("1.0", "end")
+        recientes = self._recientes(self.max_lineas)
+        with self._lock:
+            self._pendientes.extend(recientes)
+        self._programar()
+    
+    def _coincide(self, registro: RegistroLog) -> bool:
+        return not self._filtro or self._filtro in fold_text(registro.mensaje)
+    
+    def _recientes(self, cantidad: int) -> List[RegistroLog]:
+        """Últimas entradas del historial que pasan el filtro del widget"""
+        with self._lock:
+            resultado = []
+            for registro in reversed(self._historial):
+                if len(resultado) >= cantidad:
+                    break
+                if self._coincide(registro):
+                    resultado.append(registro)
+        resultado.reverse()
+        return resultado
     
     def limpiar(self):
-        """Limpiar el log"""
+        """Limpiar el log visible (el historial se conserva para buscar y exportar)"""
+        self._drenar()
+        with self._lock:
+            self._pendientes.clear()
         if self.log_widget:
             self.log_widget.delete("1.0", "end")
             self.log("📋 Log cleared", "info")
@@ -0,0 +1,121 @@
+"""
+⏱️ Render Scheduler - Pintado por trozos con presupuesto de tiempo por frame
+"""
+
+import logging
+import time
+import tkinter as tk
+from typing import Any, Callable, Generator, Optional
+
+
+class RenderJob:
+    """Un pintado en curso: un generador que avanza un paso por cada `yield`"""
+
+    def __init__(self, steps: Generator, total: int,
+                 on_progress: Optional[Callable[[int, int], None]],
+                 on_done: Optional[Callable[[Any], None]]):
+        self.steps = steps
+        self.total = total
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.done = 0
+        self.finished = False
+        self.cancelled = False
+
+
+class RenderScheduler:
+    """
+    Ejecuta pintados largos en trozos desde el bucle de Tk.
+
+    Cada trozo avanza el generador hasta agotar el presupuesto del frame
+    (8 ms por defecto) y cede el control con `after`, así la ventana sigue
+    repintando y atendiendo scroll y clics entre trozos. Solo hay un pintado
+    activo: `run` cancela el anterior, de modo que un resultado nuevo aborta
+    el que aún se estaba dibujando.
+    """
+
+    def __init__(self, widget, budget_ms: float = 8.0, pause_ms: int = 1):
+        """
+        Args:
+            widget: Widget Tk cuyo bucle de eventos ejecuta los trozos
+            budget_ms: Tiempo máximo de trabajo por trozo
+            pause_ms: Espera entre trozos para dejar pasar eventos y repintados
+        """
+        self.widget = widget
+        self.budget = budget_ms / 1000.0
+        self.pause_ms = pause_ms
+        self._job: Optional[RenderJob] = None
+        self._after_id = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._job is not None
+
+    def run(self, steps: Generator, total: int,
+            on_progress: Optional[Callable[[int, int], None]] = None,
+            on_done: Optional[Callable[[Any], None]] = None) -> RenderJob:
+        """
+        Empezar un pintado (cancela el que estuviera en curso)
+
+        Args:
+            steps: Generador que hace una unidad de trabajo por `yield`; su valor de retorno se pasa a on_done
+            total: Número aproximado de pasos, para el progreso
+            on_progress: Llamado tras cada trozo incompleto con (hechos, total)
+            on_done: Llamado al terminar con el valor devuelto por el generador
+
+        Returns:
+            RenderJob: El pintado programado
+        """
+        self.cancel()
+        job = RenderJob(steps, total, on_progress, on_done)
+        self._job = job
+        # El primer trozo corre ya: las listas pequeñas se pintan sin esperar al siguiente frame
+        self._run_chunk(job)
+        return job
+
+    def cancel(self):
+        """Abortar el pintado en curso; lo ya dibujado se queda"""
+        job, self._job = self._job, None
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        if job is not None and not job.finished:
+            job.cancelled = True
+            job.steps.close()
+
+    def _run_chunk(self, job: RenderJob):
+        self._after_id = None
+        if job is not self._job:
+            return
+
+        deadline = time.perf_counter() + self.budget
+        try:
+            while True:
+                next(job.steps)
+                job.done += 1
+                if time.perf_counter() >= deadline:
+                    break
+        except StopIteration as stop:
+            self._finish(job, stop.value)
+            return
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Error while rendering: {e}")
+            self._finish(job, None)
+            return
+
+        if job.on_progress:
+            job.on_progress(job.done, job.total)
+        try:
+            self._after_id = self.widget.after(self.pause_ms, self._run_chunk, job)
+        except tk.TclError:
+            # La ventana se destruyó a mitad de pintado
+            self.cancel()
+
+    def _finish(self, job: RenderJob, result):
+        job.finished = True
+        self._job = None
+        if job.on_done:
+            job.on_done(result)
@@ -0,0 +1,141 @@
+"""
+🔎 Search Controller - Búsqueda mientras se escribe, con debounce y descarte de resultados obsoletos
+"""
+
+import logging
+import tkinter as tk
+from typing import Any, Callable, Hashable, List, Optional
+
+from core.text_normalization import fold_query
+
+
+class SearchController:
+    """
+    Coordina la búsqueda de un campo de texto.
+
+    - Debounce: solo se busca cuando el usuario deja de escribir `debounce_ms`.
+    - Longitud mínima: consultas más cortas no lanzan búsqueda (vacía = limpiar).
+    - Generación: cada búsqueda lanzada incrementa un contador; un resultado
+      que llega con una generación anterior se descarta, aunque llegue tarde
+      o fuera de orden.
+    - Refinamiento: si la consulta nueva extiende la anterior ("gua" ->
+      "guay") en el mismo modo, se filtra localmente el resultado anterior en
+      lugar de volver a buscar en todo el conjunto.
+    """
+
+    def __init__(self, widget, executor,
+                 search: Callable[[str, Hashable], Any],
+                 on_results: Callable[[str, Hashable, Any], None],
+                 on_clear: Callable[[], None],
+                 refine: Optional[Callable[[str, Hashable, Any], Optional[Any]]] = None,
+                 on_error: Optional[Callable[[str, Exception], None]] = None,
+                 debounce_ms: int = 250,
+                 min_length: int = 2,
+                 group: Optional[str] = None):
+        """
+        Args:
+            widget: Widget Tk que programa el debounce
+            executor: TaskExecutor donde se ejecuta `search`
+            search: Búsqueda completa (consulta, modo) -> resultado; corre en segundo plano
+            on_results: Recibe (consulta, modo, resultado) en el hilo de la UI
+            on_clear: Llamado cuando la consulta queda vacía
+            refine: (consulta, modo, resultado anterior) -> resultado, o None si no se puede refinar
+            on_error: Recibe (consulta, excepción) si la búsqueda falla
+            debounce_ms: Espera tras la última pulsación antes de buscar
+            min_length: Longitud mínima de la consulta normalizada
+            group: Grupo del executor ("la última gana") compartido con otras cargas de la vista
+        """
+        self.widget = widget
+        self.executor = executor
+        self.search = search
+        self.on_results = on_results
+        self.on_clear = on_clear
+        self.refine = refine
+        self.on_error = on_error
+        self.debounce_ms = debounce_ms
+        self.min_length = min_length
+        self.group = group
+
+        self.generation = 0
+        self._after_id = None
+        self._last: Optional[tuple] = None  # (consulta normalizada, modo, resultado)
+
+    def query_changed(self, text: str, mode: Hashable = None, min_length: Optional[int] = None):
+        """Nueva consulta tecleada: buscar cuando pase la ventana de debounce"""
+        self._cancel_pending()
+        query = fold_query(text)
+        if not query:
+            self.clear()
+            return
+        if len(query) < (self.min_length if min_length is None else min_length):
+            return
+        try:
+            self._after_id = self.widget.after(self.debounce_ms, self._run, text, mode)
+        except tk.TclError:
+            self._after_id = None
+
+    def search_now(self, text: str, mode: Hashable = None):
+        """Buscar sin esperar el debounce (botón buscar, Enter)"""
+        self._cancel_pending()
+        if not fold_query(text):
+            self.clear()
+            return
+        self._run(text, mode)
+
+    def clear(self):
+        """Consulta vacía: invalidar lo que esté en curso y avisar a la vista"""
+        self.cancel()
+        self._last = None
+        self.on_clear()
+
+    def cancel(self):
+        """Descartar la búsqueda programada y la que esté en curso"""
+        self._cancel_pending()
+        self.generation += 1
+
+    def reset(self):
+        """Olvidar el último resultado (p. ej. cuando cambian los datos) para no refinar sobre él"""
+        self._last = None
+
+    def _cancel_pending(self):
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    def _run(self, text: str, mode: Hashable):
+        self._after_id = None
+        self.generation += 1
+        generation = self.generation
+        query = fold_query(text)
+
+        if self.refine is not None and self._last is not None:
+            last_query, last_mode, last_result = self._last
+            if mode == last_mode and query.startswith(last_query):
+                refined = self.refine(text, mode, last_result)
+                if refined is not None:
+                    self._deliver(generation, text, query, mode, refined)
+                    return
+
+        self.executor.submit(
+            self.search, text, mode,
+            group=self.group,
+            on_success=lambda result: self._deliver(generation, text, query, mode, result),
+            on_error=lambda error: self._fail(generation, text, error)
+        )
+
+    def _deliver(self, generation: int, text: str, query: str, mode: Hashable, result: Any):
+        if generation != self.generation:
+            logging.getLogger(__name__).debug(f"Dropping stale results for '{text}'")
+            return
+        self._last = (query, mode, result)
+        self.on_results(text, mode, result)
+
+    def _fail(self, generation: int, text: str, error: Exception):
+        if generation != self.generation:
+            return
+        self._last = None
+        if self.on_error:
+            self.on_error(text, error)
@@ -0,0 +1,54 @@
+"""
+⏱️ Startup Timer - Tiempos por fase del arranque de la aplicación
+"""
+
+import time
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+
+class StartupTimer:
+    """
+    Cronómetro del arranque.
+
+    `marcar` cierra la fase en curso con un nombre; el reporte lista cuánto
+    duró cada fase y el acumulado desde el inicio, para ver qué retrasa la
+    primera pintura de la ventana.
+    """
+
+    def __init__(self, inicio: Optional[float] = None):
+        self.inicio = inicio if inicio is not None else time.perf_counter()
+        self._ultima = self.inicio
+        self.fases: List[Tuple[str, float, float]] = []  # (nombre, duración, acumulado)
+
+    def marcar(self, nombre: str) -> float:
+        """Cerrar la fase en curso; devuelve su duración en segundos"""
+        ahora = time.perf_counter()
+        duracion = ahora - self._ultima
+        self._ultima = ahora
+        self.fases.append((nombre, duracion, ahora - self.inicio))
+        return duracion
+
+    @contextmanager
+    def fase(self, nombre: str):
+        """Medir un bloque como una fase propia"""
+        self._ultima = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.marcar(nombre)
+
+    @property
+    def total(self) -> float:
+        return self.fases[-1][2] if self.fases else 0.0
+
+    def reporte(self) -> str:
+        """Tabla de fases en milisegundos"""
+        ancho = max((len(nombre) for nombre, _, _ in self.fases), default=10)
+        lineas = ["⏱️ Startup timing:"]
+        for nombre, duracion, acumulado in self.fases:
+            lineas.append(f"   {nombre:<{ancho}}  {duracion * 1000:8.1f} ms  (t={acumulado * 1000:8.1f} ms)")
+        return "\n".join(lineas)
+
+    def imprimir(self):
+        print(self.reporte())
@@ -0,0 +1,67 @@
+"""
+📬 Tk Dispatcher - Entrega de callbacks en el hilo de la interfaz
+"""
+
+import logging
+import queue
+import tkinter as tk
+
+
+class TkDispatcher:
+    """
+    Cola segura entre hilos que ejecuta callbacks en el hilo de Tk.
+
+    Los hilos de trabajo solo encolan (`post`); el hilo de la UI vacía la cola
+    periódicamente con `after`, en lotes acotados para no congelar la ventana.
+    """
+
+    def __init__(self, widget, poll_interval: int = 16, max_batch: int = 50):
+        """
+        Args:
+            widget: Widget Tk cuyo bucle de eventos ejecuta los callbacks
+            poll_interval: Milisegundos entre vaciados de la cola
+            max_batch: Máximo de callbacks ejecutados por vaciado
+        """
+        self.widget = widget
+        self.poll_interval = poll_interval
+        self.max_batch = max_batch
+        self._queue = queue.SimpleQueue()
+        self._after_id = None
+        self._closed = False
+        self._schedule()
+
+    def post(self, fn, *args):
+        """Encolar un callback (seguro desde cualquier hilo)"""
+        if not self._closed:
+            self._queue.put((fn, args))
+
+    def _schedule(self):
+        try:
+            self._after_id = self.widget.after(self.poll_interval, self._drain)
+        except tk.TclError:
+            # La ventana se destruyó: no hay hilo de UI al que entregar
+            self._closed = True
+
+    def _drain(self):
+        """Ejecutar los callbacks pendientes en el hilo de Tk"""
+        for _ in range(self.max_batch):
+            try:
+                fn, args = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn(*args)
+            except Exception as e:
+                logging.getLogger(__name__).error(f"Error in UI callback {getattr(fn, '__name__', fn)}: {e}")
+        if not self._closed:
+            self._schedule()
+
+    def close(self):
+        """Detener el vaciado periódico"""
+        self._closed = True
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
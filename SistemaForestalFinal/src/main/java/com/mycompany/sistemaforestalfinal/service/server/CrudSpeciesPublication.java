@@ -24,6 +24,8 @@ public class CrudSpeciesPublication {
             System.out.println("- deleteTreeSpecies: Eliminar especie");
             System.out.println("- getAllZones: Obtener todas las zonas");
             System.out.println("- getAllConservationStates: Obtener estados de conservación");
+            System.out.println("- getTreeSpeciesModifiedSince: Obtener especies modificadas desde una fecha");
+            System.out.println("- getSyncVersion: Versión del contrato de sincronización");
             System.out.println("=====================================================");
             System.out.println("Presiona Ctrl+C para detener el servicio...");
             
@@ -7,6 +7,8 @@ import com.mycompany.sistemaforestalfinal.model.Zone;
 import jakarta.jws.WebService;
 import jakarta.jws.WebMethod;
 import jakarta.jws.WebParam;
+import java.sql.Timestamp;
+import java.util.Date;
 import java.util.List;
 import java.util.ArrayList;
 import java.util.logging.Logger;
@@ -15,6 +17,10 @@ import java.util.logging.Logger;
 public class CrudSpeciesService {
     
     private static final Logger LOGGER = Logger.getLogger(CrudSpeciesService.class.getName());
+    // Versión del contrato de sincronización incremental; cambiarla obliga a los clientes a recargar todo
+    public static final int SYNC_SCHEMA_VERSION = 1;
+    // Tamaño máximo de página de getTreeSpeciesPage
+    public static final int MAX_PAGE_SIZE = 1000;
     private final TreeSpeciesDAO treeSpeciesDAO;
     
     public CrudSpeciesService() {
@@ -89,6 +95,63 @@ public class CrudSpeciesService {
         return result;
     }
     
+    // READ - Obtener una página de especies ordenadas por ID (la siguiente página empieza tras el último ID recibido)
+    @WebMethod(operationName = "getTreeSpeciesPage")
+    public List<TreeSpecies> getTreeSpeciesPage(
+            @WebParam(name = "afterId") int afterId,
+            @WebParam(name = "limit") int limit) {
+        int pageSize = Math.max(1, Math.min(limit, MAX_PAGE_SIZE));
+        LOGGER.info("Obteniendo página de especies tras ID " + afterId + " (máx. " + pageSize + ")");
+        List<TreeSpecies> result = new ArrayList<>();
+        
+        try {
+            result = treeSpeciesDAO.findPage(afterId, pageSize);
+            LOGGER.info("Obtenidas " + result.size() + " especies");
+            
+        } catch (Exception e) {
+            LOGGER.severe("Error al obtener página de especies: " + e.getMessage());
+            e.printStackTrace();
+        }
+        
+        return result;
+    }
+    
+    // SEARCH - Búsqueda avanzada en el servidor: solo viajan las especies que cumplen los filtros
+    // (los parámetros omitidos no filtran, salvo activeOnly: sin él solo se devuelven especies
+    // activas, como getAllTreeSpecies; se pagina como getTreeSpeciesPage)
+    @WebMethod(operationName = "searchTreeSpecies")
+    public List<TreeSpecies> searchTreeSpecies(
+            @WebParam(name = "nameQuery") String nameQuery,
+            @WebParam(name = "zonaId") Integer zonaId,
+            @WebParam(name = "estadoConservacionId") Integer estadoConservacionId,
+            @WebParam(name = "activeOnly") Boolean activeOnly,
+            @WebParam(name = "createdAfter") Date createdAfter,
+            @WebParam(name = "createdBefore") Date createdBefore,
+            @WebParam(name = "afterId") int afterId,
+            @WebParam(name = "limit") int limit) {
+        int pageSize = Math.max(1, Math.min(limit, MAX_PAGE_SIZE));
+        LOGGER.info("Buscando especies: nombre=" + nameQuery + ", zona=" + zonaId
+                + ", estado=" + estadoConservacionId + ", activas=" + activeOnly
+                + ", creadas entre " + createdAfter + " y " + createdBefore + " (tras ID " + afterId + ")");
+        List<TreeSpecies> result = new ArrayList<>();
+        
+        try {
+            // Solo activeOnly=false pide también las inactivas (nunca "solo inactivas")
+            boolean includeInactive = Boolean.FALSE.equals(activeOnly);
+            result = treeSpeciesDAO.search(nameQuery, zonaId, estadoConservacionId, includeInactive,
+                    createdAfter != null ? new Timestamp(createdAfter.getTime()) : null,
+                    createdBefore != null ? new Timestamp(createdBefore.getTime()) : null,
+                    afterId, pageSize);
+            LOGGER.info("Encontradas " + result.size() + " especies");
+            
+        } catch (Exception e) {
+            LOGGER.severe("Error al buscar especies: " + e.getMessage());
+            e.printStackTrace();
+        }
+        
+        return result;
+    }
+    
     // READ - Obtener especie por ID
     @WebMethod(operationName = "getTreeSpeciesById")
     public TreeSpecies getTreeSpeciesById(@WebParam(name = "id") int id) {
@@ -104,6 +167,33 @@ public class CrudSpeciesService {
         return null;
     }
     
+    // SYNC - Especies creadas, modificadas o dadas de baja desde una fecha
+    @WebMethod(operationName = "getTreeSpeciesModifiedSince")
+    public List<TreeSpecies> getTreeSpeciesModifiedSince(@WebParam(name = "since") Date since) {
+        LOGGER.info("Obteniendo especies modificadas desde: " + since);
+        List<TreeSpecies> result = new ArrayList<>();
+        
+        try {
+            if (since == null) {
+                return treeSpeciesDAO.findAll();
+            }
+            result = treeSpeciesDAO.findModifiedSince(new Timestamp(since.getTime()));
+            LOGGER.info("Obtenidas " + result.size() + " especies modificadas");
+            
+        } catch (Exception e) {
+            LOGGER.severe("Error al obtener especies modificadas: " + e.getMessage());
+            e.printStackTrace();
+        }
+        
+        return result;
+    }
+    
+    // SYNC - Versión del contrato de sincronización
+    @WebMethod(operationName = "getSyncVersion")
+    public int getSyncVersion() {
+        return SYNC_SCHEMA_VERSION;
+    }
+    
     // UPDATE - Actualizar especie
     @WebMethod(operationName = "updateTreeSpecies")
     public boolean updateTreeSpecies(
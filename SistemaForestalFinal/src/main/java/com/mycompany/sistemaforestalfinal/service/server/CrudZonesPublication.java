@@ -24,6 +24,8 @@ public class CrudZonesPublication {
             System.out.println("- getZoneById: Obtener zona por ID");
             System.out.println("- updateZone: Actualizar zona existente");
             System.out.println("- deleteZone: Eliminar zona");
+            System.out.println("- getZonesModifiedSince: Obtener zonas modificadas desde una fecha");
+            System.out.println("- getSyncVersion: Versión del contrato de sincronización");
             System.out.println("=====================================================");
             System.out.println("Presiona Ctrl+C para detener el servicio...");
             
@@ -6,6 +6,8 @@ import jakarta.jws.WebService;
 import jakarta.jws.WebMethod;
 import jakarta.jws.WebParam;
 import java.math.BigDecimal;
+import java.sql.Timestamp;
+import java.util.Date;
 import java.util.List;
 import java.util.ArrayList;
 import java.util.logging.Logger;
@@ -14,6 +16,10 @@ import java.util.logging.Logger;
 public class CrudZonesService {
 
     private static final Logger LOGGER = Logger.getLogger(CrudZonesService.class.getName());
+    // Versión del contrato de sincronización incremental; cambiarla obliga a los clientes a recargar todo
+    public static final int SYNC_SCHEMA_VERSION = 1;
+    // Tamaño máximo de página de getZonesPage
+    public static final int MAX_PAGE_SIZE = 1000;
     private final ZoneDAO zoneDAO;
 
     public CrudZonesService() {
@@ -77,6 +83,24 @@ public class CrudZonesService {
         return result;
     }
 
+    // Una página de zonas ordenadas por ID (la siguiente página empieza tras el último ID recibido)
+    @WebMethod(operationName = "getZonesPage")
+    public List<Zone> obtenerPaginaDeZonas(
+            @WebParam(name = "afterId") int afterId,
+            @WebParam(name = "limit") int limit) {
+        int pageSize = Math.max(1, Math.min(limit, MAX_PAGE_SIZE));
+        LOGGER.info("Obteniendo página de zonas tras ID " + afterId + " (máx. " + pageSize + ")");
+        List<Zone> result = new ArrayList<>();
+        try {
+            result = zoneDAO.findPage(afterId, pageSize);
+            LOGGER.info("Obtenidas " + result.size() + " zonas");
+        } catch (Exception e) {
+            LOGGER.severe("Error al obtener página de zonas: " + e.getMessage());
+            e.printStackTrace();
+        }
+        return result;
+    }
+
     @WebMethod(operationName = "getZoneById")
     public Zone obtenerZonaPorId(@WebParam(name = "id") int id) {
         LOGGER.info("Obteniendo zona con ID: " + id);
@@ -89,6 +113,28 @@ public class CrudZonesService {
         return null;
     }
 
+    @WebMethod(operationName = "getZonesModifiedSince")
+    public List<Zone> obtenerZonasModificadasDesde(@WebParam(name = "since") Date since) {
+        LOGGER.info("Obteniendo zonas modificadas desde: " + since);
+        List<Zone> result = new ArrayList<>();
+        try {
+            if (since == null) {
+                return zoneDAO.findAll();
+            }
+            result = zoneDAO.findModifiedSince(new Timestamp(since.getTime()));
+            LOGGER.info("Obtenidas " + result.size() + " zonas modificadas");
+        } catch (Exception e) {
+            LOGGER.severe("Error al obtener zonas modificadas: " + e.getMessage());
+            e.printStackTrace();
+        }
+        return result;
+    }
+
+    @WebMethod(operationName = "getSyncVersion")
+    public int obtenerVersionSincronizacion() {
+        return SYNC_SCHEMA_VERSION;
+    }
+
     @WebMethod(operationName = "updateZone")
     public boolean actualizarZona(
             @WebParam(name = "id") int id,
@@ -135,8 +181,8 @@ public class CrudZonesService {
                 LOGGER.warning("No se encontró zona con ID: " + id + " para eliminar.");
                 return false;
             }
-            zone.setActivo(false);
-            zoneDAO.update(zone); // Reutiliza el método update para el borrado lógico
+            // UPDATE no toca 'activo': el borrado lógico tiene su propia sentencia
+            zoneDAO.delete(id);
             LOGGER.info("Zona eliminada (lógicamente) exitosamente con ID: " + id);
             return true;
         } catch (Exception e) {
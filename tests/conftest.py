@@ -0,0 +1,74 @@
+"""
+🧪 Pytest configuration
+Pruebas sin servidor: DataManager y core contra LocalForestService
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Mismo directorio de importación que los scripts test_*.py de la raíz
+CLIENT_DIR = (Path(__file__).resolve().parent.parent / "SistemaForestalFinal" / "src" / "main" / "java"
+              / "com" / "mycompany" / "sistemaforestalfinal" / "service" / "client")
+sys.path.insert(0, str(CLIENT_DIR))
+
+from core.data_manager import CacheTTL, DataManager  # noqa: E402
+from fakes import LocalForestService  # noqa: E402
+
+
+class DeferredExecutor:
+    """
+    Executor de prueba con la interfaz de TaskExecutor.submit
+
+    Guarda las tareas en lugar de ejecutarlas; `run_pending()` las ejecuta en
+    orden en el hilo de la prueba, así se puede observar el estado intermedio.
+    """
+
+    def __init__(self):
+        self.pending = []
+
+    def submit(self, fn, *args, key=None, group=None, on_success=None, on_error=None,
+               dispatcher=None, **kwargs):
+        self.pending.append((fn, args, kwargs, on_success, on_error))
+
+    def run_pending(self):
+        while self.pending:
+            fn, args, kwargs, on_success, on_error = self.pending.pop(0)
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(e)
+            else:
+                if on_success is not None:
+                    on_success(result)
+
+
+@pytest.fixture
+def local():
+    """Servicio en memoria con tres especies y dos zonas"""
+    service = LocalForestService()
+    service.createZone("Costa", tipoBosque="MANGLAR", areaHa=12.5)
+    service.createZone("Andes", tipoBosque="MONTANO", areaHa=80.0)
+    service.createTreeSpecies("Guayacán", nombreCientifico="Tabebuia chrysantha", estadoConservacionId=1, zonaId=1)
+    service.createTreeSpecies("Cedro", nombreCientifico="Cedrela odorata", estadoConservacionId=3, zonaId=2)
+    service.createTreeSpecies("Roble andino", nombreCientifico="Quercus humboldtii", estadoConservacionId=2, zonaId=2)
+    return service
+
+
+@pytest.fixture
+def executor():
+    return DeferredExecutor()
+
+
+@pytest.fixture
+def manager(local, executor):
+    """DataManager sobre `local` que vuelve a sincronizar en cada lectura (TTL 0, sin servir datos caducados)"""
+    expired = CacheTTL(soft=0, hard=0)
+    return DataManager(
+        species_client=local, zone_client=local, conservation_client=local,
+        executor=executor, cache_ttls={'species': expired, 'zones': expired},
+        stale_while_revalidate=False,
+    )
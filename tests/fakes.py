@@ -0,0 +1,258 @@
+"""
+🧪 Fakes
+Servicio en memoria que imita los servicios SOAP de especies y zonas (incluida la sincronización incremental)
+"""
+
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+from core.text_normalization import fold_text
+
+SYNC_SCHEMA_VERSION = 1
+MAX_PAGE_SIZE = 1000  # CrudSpeciesService.MAX_PAGE_SIZE / CrudZonesService.MAX_PAGE_SIZE
+
+DEFAULT_CONSERVATION_STATES = (
+    (1, "Preocupación menor", "Especie sin amenaza aparente"),
+    (2, "Casi amenazada", "Podría estar amenazada en un futuro próximo"),
+    (3, "Vulnerable", "Alto riesgo de extinción en estado silvestre"),
+    (4, "En peligro", "Riesgo muy alto de extinción en estado silvestre"),
+    (5, "En peligro crítico", "Riesgo extremadamente alto de extinción"),
+)
+
+
+class LocalForestService:
+    """
+    Sustituto local de TreeSpeciesCrudService y ZoneCrudService.
+
+    Expone las mismas operaciones que los servicios Java a través de
+    `.service`, con registros de atributos camelCase (creadoEn /
+    actualizadoEn incluidos) como los que devuelve zeep, de modo que se puede
+    pasar directamente a DataManager:
+
+        local = LocalForestService()
+        manager = DataManager(species_client=local, zone_client=local, conservation_client=local)
+
+    Las bajas son lógicas y actualizan `actualizadoEn`, igual que en los DAO,
+    para que las consultas "modificado desde" las propaguen. `calls` cuenta
+    las operaciones invocadas.
+    """
+
+    def __init__(self, sync_version: int = SYNC_SCHEMA_VERSION):
+        """
+        Args:
+            sync_version: Versión del contrato devuelta por getSyncVersion (cambiarla simula un servidor incompatible)
+        """
+        self.sync_version = sync_version
+        self.calls: Counter = Counter()
+        self._species: Dict[int, SimpleNamespace] = {}
+        self._zones: Dict[int, SimpleNamespace] = {}
+        self._states = [SimpleNamespace(id=i, nombre=n, descripcion=d) for i, n, d in DEFAULT_CONSERVATION_STATES]
+        self._next_species_id = 1
+        self._next_zone_id = 1
+        self._last_stamp: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    @property
+    def service(self) -> "LocalForestService":
+        """Mismo acceso que un cliente zeep: `client.service.operacion(...)`"""
+        return self
+
+    def _now(self) -> datetime:
+        # Marcas estrictamente crecientes, aunque dos cambios caigan en el mismo instante del reloj
+        stamp = datetime.now()
+        if self._last_stamp is not None and stamp <= self._last_stamp:
+            stamp = self._last_stamp + timedelta(microseconds=1)
+        self._last_stamp = stamp
+        return stamp
+
+    @staticmethod
+    def _modified_since(records, since: Optional[datetime]) -> List[SimpleNamespace]:
+        if since is None:
+            return [r for r in records if r.activo]
+        changed = [r for r in records if (r.actualizadoEn or r.creadoEn) >= since]
+        changed.sort(key=lambda r: (r.actualizadoEn or r.creadoEn, r.id))
+        return changed
+
+    @staticmethod
+    def _page(records: Dict[int, SimpleNamespace], after_id: int, limit: int) -> List[SimpleNamespace]:
+        # Como findPage: activas con id > afterId, por id, con el límite acotado como en el servicio
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        return [r for _, r in sorted(records.items()) if r.activo and r.id > after_id][:limit]
+
+    @staticmethod
+    def _copy(record: Optional[SimpleNamespace]) -> Optional[SimpleNamespace]:
+        return SimpleNamespace(**vars(record)) if record is not None else None
+
+    # ===========================================
+    # ESPECIES
+    # ===========================================
+
+    def createTreeSpecies(self, nombreComun: str, nombreCientifico: str = "",
+                          estadoConservacionId: Optional[int] = None, zonaId: Optional[int] = None,
+                          activo: bool = True) -> bool:
+        with self._lock:
+            self.calls['createTreeSpecies'] += 1
+            if not nombreComun or not nombreComun.strip():
+                return False
+            species_id = self._next_species_id
+            self._next_species_id += 1
+            self._species[species_id] = SimpleNamespace(
+                id=species_id, nombreComun=nombreComun.strip(), nombreCientifico=nombreCientifico,
+                estadoConservacionId=estadoConservacionId, zonaId=zonaId, activo=activo,
+                creadoEn=self._now(), actualizadoEn=None,
+            )
+            return True
+
+    def getAllTreeSpecies(self) -> List[SimpleNamespace]:
+        with self._lock:
+            self.calls['getAllTreeSpecies'] += 1
+            return [self._copy(s) for s in self._species.values() if s.activo]
+
+    def getTreeSpeciesPage(self, afterId: int, limit: int) -> List[SimpleNamespace]:
+        with self._lock:
+            self.calls['getTreeSpeciesPage'] += 1
+            return [self._copy(s) for s in self._page(self._species, afterId, limit)]
+
+    def searchTreeSpecies(self, nameQuery: Optional[str] = None, zonaId: Optional[int] = None,
+                          estadoConservacionId: Optional[int] = None, activeOnly: Optional[bool] = None,
+                          createdAfter: Optional[datetime] = None, createdBefore: Optional[datetime] = None,
+                          afterId: int = 0, limit: int = MAX_PAGE_SIZE) -> List[SimpleNamespace]:
+        with self._lock:
+            self.calls['searchTreeSpecies'] += 1
+            # Como TreeSpeciesDAO.search: LIKE sin mayúsculas ni acentos; las fechas nulas no se descartan
+            query = fold_text(nameQuery.strip()) if nameQuery and nameQuery.strip() else None
+            limit = max(1, min(limit, MAX_PAGE_SIZE))
+            matches = []
+            for species_id, s in sorted(self._species.items()):
+                if len(matches) >= limit:
+                    break
+                if species_id <= afterId:
+                    continue
+                if query and query not in fold_text(s.nombreComun) and query not in fold_text(s.nombreCientifico):
+                    continue
+                if zonaId is not None and s.zonaId != zonaId:
+                    continue
+                if estadoConservacionId is not None and s.estadoConservacionId != estadoConservacionId:
+                    continue
+                # Como CrudSpeciesService: solo activeOnly=False incluye las inactivas
+                if activeOnly is not False and not s.activo:
+                    continue
+                if createdAfter is not None and s.creadoEn is not None and s.creadoEn < createdAfter:
+                    continue
+                if createdBefore is not None and s.creadoEn is not None and s.creadoEn > createdBefore:
+                    continue
+                matches.append(self._copy(s))
+            return matches
+
+    def getTreeSpeciesById(self, id: int) -> Optional[SimpleNamespace]:
+        with self._lock:
+            self.calls['getTreeSpeciesById'] += 1
+            return self._copy(self._species.get(id))
+
+    def getTreeSpeciesModifiedSince(self, since: Optional[datetime]) -> List[SimpleNamespace]:
+        with self._lock:
+            self.calls['getTreeSpeciesModifiedSince'] += 1
+            return [self._copy(s) for s in self._modified_since(self._species.values(), since)]
+
+    def updateTreeSpecies(self, id: int, nombreComun: str, nombreCientifico: str = "",
+                          estadoConservacionId: Optional[int] = None, zonaId: Optional[int] = None,
+                          activo: bool = True) -> bool:
+        with self._lock:
+            self.calls['updateTreeSpecies'] += 1
+            species = self._species.get(id)
+            if species is None or not nombreComun or not nombreComun.strip():
+                return False
+            species.nombreComun = nombreComun.strip()
+            species.nombreCientifico = nombreCientifico
+            species.estadoConservacionId = estadoConservacionId
+            species.zonaId = zonaId
+            species.activo = activo
+            species.actualizadoEn = self._now()
+            return True
+
+    def deleteTreeSpecies(self, id: int) -> bool:
+        with self._lock:
+            self.calls['deleteTreeSpecies'] += 1
+            species = self._species.get(id)
+            if species is None:
+                return False
+            species.activo = False
+            species.actualizadoEn = self._now()
+            return True
+
+    def getAllConservationStates(self) -> List[SimpleNamespace]:
+        with self._lock:
+            self.calls['getAllConservationStates'] += 1
+            return [self._copy(s) for s in self._states]
+
+    # ===========================================
+    # ZONAS
+    # ===========================================
+
+    def createZone(self, nombre: str, tipoBosque: str = "", areaHa: float = 0.0, activo: bool = True) -> bool:
+        with self._lock:
+            self.calls['createZone'] += 1
+            if not nombre or not nombre.strip():
+                return False
+            zone_id = self._next_zone_id
+            self._next_zone_id += 1
+            self._zones[zone_id] = SimpleNamespace(
+                id=zone_id, nombre=nombre.strip(), tipoBosque=tipoBosque, areaHa=areaHa,
+                activo=True, creadoEn=self._now(), actualizadoEn=None,
+            )
+            return True
+
+    def getAllZones(self) -> List[SimpleNamespace]:
+        with self._lock:
+            self.calls['getAllZones'] += 1
+            return [self._copy(z) for z in self._zones.values() if z.activo]
+
+    def getZonesPage(self, afterId: int, limit: int) -> List[SimpleNamespace]:
+        with self._lock:
+            self.calls['getZonesPage'] += 1
+            return [self._copy(z) for z in self._page(self._zones, afterId, limit)]
+
+    def getZoneById(self, id: int) -> Optional[SimpleNamespace]:
+        with self._lock:
+            self.calls['getZoneById'] += 1
+            return self._copy(self._zones.get(id))
+
+    def getZonesModifiedSince(self, since: Optional[datetime]) -> List[SimpleNamespace]:
+        with self._lock:
+            self.calls['getZonesModifiedSince'] += 1
+            return [self._copy(z) for z in self._modified_since(self._zones.values(), since)]
+
+    def updateZone(self, id: int, nombre: str, tipoBosque: str = "", areaHa: float = 0.0,
+                   activo: bool = True) -> bool:
+        with self._lock:
+            self.calls['updateZone'] += 1
+            zone = self._zones.get(id)
+            if zone is None or not nombre or not nombre.strip():
+                return False
+            # Como ZoneDAO.update: el estado 'activo' solo cambia con deleteZone
+            zone.nombre = nombre.strip()
+            zone.tipoBosque = tipoBosque
+            zone.areaHa = areaHa
+            zone.actualizadoEn = self._now()
+            return True
+
+    def deleteZone(self, id: int) -> bool:
+        with self._lock:
+            self.calls['deleteZone'] += 1
+            zone = self._zones.get(id)
+            if zone is None:
+                return False
+            zone.activo = False
+            zone.actualizadoEn = self._now()
+            return True
+
+    # ===========================================
+    # SINCRONIZACIÓN
+    # ===========================================
+
+    def getSyncVersion(self) -> int:
+        self.calls['getSyncVersion'] += 1
+        return self.sync_version
@@ -0,0 +1,96 @@
+"""
+🔌 Connection
+Lecturas mientras se conecta o sin conexión: no se guardan listas vacías como datos frescos
+"""
+
+import threading
+
+import pytest
+
+from core.data_manager import CACHE_EXPIRED, CACHE_STALE, DataManager
+
+
+class FakeConnect:
+    """_init_soap_clients de prueba: conecta a `local` cuando `online` lo permite"""
+
+    def __init__(self, manager, local, online=True):
+        self.manager = manager
+        self.local = local
+        self.online = online
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self):
+        self.release.wait(5)
+        if not self.online:
+            return False
+        self.manager._species_client = self.local
+        self.manager._zone_client = self.local
+        self.manager._conservation_client = self.local
+        return True
+
+
+@pytest.fixture
+def offline_manager(local, executor, monkeypatch):
+    """DataManager sin clientes inyectados, con la conexión SOAP sustituida por FakeConnect"""
+    manager = DataManager(executor=executor)
+    connect = FakeConnect(manager, local)
+    monkeypatch.setattr(manager, "_init_soap_clients", connect)
+    monkeypatch.setattr(manager, "_discard_soap_clients", lambda: None)
+    return manager, connect
+
+
+def entity_states(manager):
+    return {
+        'species': manager._cache_state('species', manager.species_cache),
+        'zones': manager._cache_state('zones', manager.zones_cache),
+        'conservation_states': manager._cache_state('conservation_states', manager.conservation_states_cache),
+    }
+
+
+def test_reads_while_connecting_are_not_cached(offline_manager):
+    manager, connect = offline_manager
+    connect.release.clear()
+    ready = manager.connect()
+
+    # En el hilo principal los clientes no esperan a la conexión
+    assert manager.get_zones() == []
+    assert manager.get_species() == []
+    assert manager.get_conservation_states() == []
+    assert set(entity_states(manager).values()) == {CACHE_EXPIRED}
+
+    connect.release.set()
+    assert ready.result(5) is True
+    assert len(manager.get_zones()) == 2
+    assert len(manager.get_species()) == 3
+    assert manager.get_conservation_states()
+
+
+def test_offline_load_then_reconnect_loads_everything(offline_manager):
+    manager, connect = offline_manager
+    connect.online = False
+    assert manager.connect().result(5) is False
+
+    offline = manager.load_all_concurrently()
+    assert offline == {'species': [], 'zones': [], 'conservation_states': []}
+    assert manager.cache_timestamp == {}
+
+    connect.online = True
+    assert manager.reconnect().result(5) is True
+    loaded = manager.load_all_concurrently()
+    assert len(loaded['species']) == 3
+    assert len(loaded['zones']) == 2
+    assert loaded['conservation_states']
+
+
+def test_reconnect_marks_loaded_caches_stale(offline_manager, local):
+    manager, connect = offline_manager
+    assert manager.connect().result(5) is True
+    manager.load_all_concurrently()
+
+    local.createZone("Amazonía", tipoBosque="HUMEDO_TROPICAL", areaHa=500.0)
+    assert manager.reconnect().result(5) is True
+
+    assert set(entity_states(manager).values()) == {CACHE_STALE}
+    assert len(manager.get_zones()) == 2  # Se sirven los datos anteriores...
+    assert manager.executor.pending  # ...y se revalidan en segundo plano
@@ -0,0 +1,184 @@
+"""
+📅 Date Index
+Límites incluidos / excluidos de los rangos de fecha y filtros del repositorio
+"""
+
+import random
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from core.date_index import SortedDateIndex, day_end, month_bounds, to_epoch
+from core.models import SearchFilter, TreeSpecies
+from core.remote_search import remote_filterable
+from core.species_store import SpeciesRepository
+
+MICROSECOND = timedelta(microseconds=1)
+START = datetime(2024, 3, 1, 12, 0)
+END = datetime(2024, 3, 31, 8, 30)
+
+
+@pytest.fixture
+def index():
+    index = SortedDateIndex()
+    index.add("before", START - MICROSECOND)
+    index.add("start", START)
+    index.add("middle", datetime(2024, 3, 15))
+    index.add("end", END)
+    index.add("after", END + MICROSECOND)
+    index.add("undated", None)
+    return index
+
+
+def test_both_bounds_are_inclusive(index):
+    found = index.between(START, END, include_undated=False)
+    assert found == {"start", "middle", "end"}
+    assert index.count(START, END, include_undated=False) == 3
+    assert index.contains("start", START, END) and index.contains("end", START, END)
+
+
+def test_one_microsecond_outside_is_excluded(index):
+    assert not index.contains("before", START, END)
+    assert not index.contains("after", START, END)
+    assert index.between(START + MICROSECOND, END - MICROSECOND, include_undated=False) == {"middle"}
+
+
+def test_open_ranges(index):
+    assert index.between(after=END, include_undated=False) == {"end", "after"}
+    assert index.between(before=START, include_undated=False) == {"before", "start"}
+    assert index.count(include_undated=False) == 5
+
+
+def test_single_instant_range(index):
+    assert index.between(START, START, include_undated=False) == {"start"}
+    assert index.between(END, START, include_undated=False) == set()
+    assert index.count(END, START, include_undated=False) == 0
+
+
+def test_undated_keys_pass_range_filters(index):
+    assert "undated" in index.between(START, END)
+    assert index.count(START, END) == 4
+    assert index.contains("undated", START, END)
+    assert not index.contains("missing", START, END)
+
+
+def test_incremental_updates_keep_order(index):
+    index.between()  # Construye las listas ordenadas
+    index.add("middle", END + timedelta(days=1))
+    index.add("late", END)
+    index.remove("start")
+    index.add("undated", START)
+
+    assert index.between(START, END, include_undated=False) == {"end", "late", "undated"}
+    assert len(index) == 6
+
+
+def test_same_instant_for_several_keys():
+    index = SortedDateIndex()
+    for key in ("a", "b", "c"):
+        index.add(key, START)
+    index.between()
+    index.remove("b")
+
+    assert index.between(START, START) == {"a", "c"}
+
+
+def test_aware_datetimes_compare_with_local_time():
+    aware = START.astimezone(timezone.utc)
+    assert to_epoch(aware) == to_epoch(START)
+
+
+def test_day_end_includes_the_whole_day():
+    assert day_end(date(2024, 3, 31)) == datetime(2024, 3, 31, 23, 59, 59, 999999)
+    assert day_end(date(2024, 3, 31)) + MICROSECOND == datetime(2024, 4, 1)
+
+
+@pytest.mark.parametrize("day, expected", [
+    (date(2024, 2, 10), (datetime(2024, 2, 1), datetime(2024, 2, 29, 23, 59, 59, 999999))),
+    (date(2024, 12, 31), (datetime(2024, 12, 1), datetime(2024, 12, 31, 23, 59, 59, 999999))),
+    (date(2025, 1, 1), (datetime(2025, 1, 1), datetime(2025, 1, 31, 23, 59, 59, 999999))),
+])
+def test_month_bounds(day, expected):
+    assert month_bounds(day) == expected
+
+
+def test_added_in_month_filter():
+    search_filter = SearchFilter.added_in_month(date(2024, 12, 5), zone_id=2)
+    assert (search_filter.created_after, search_filter.created_before) == month_bounds(date(2024, 12, 5))
+    assert search_filter.zone_id == 2 and search_filter.has_created_range
+    assert not search_filter.has_modified_range
+
+
+# ===========================================
+# REPOSITORIO
+# ===========================================
+
+def random_species(count, seed=7):
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1)
+    species = []
+    for i in range(1, count + 1):
+        created = base + timedelta(minutes=rng.randrange(0, 60 * 24 * 120)) if i % 10 else None
+        modified = created + timedelta(days=rng.randrange(0, 30)) if created and i % 3 else None
+        species.append(TreeSpecies(id=i, nombreComun=f"Especie {i}", zonaId=i % 4,
+                                   fechaCreacion=created, fechaModificacion=modified))
+    return species
+
+
+def in_range(value, after, before):
+    if value is None:
+        return True
+    return (after is None or value >= after) and (before is None or value <= before)
+
+
+@pytest.mark.parametrize("search_filter", [
+    SearchFilter.added_in_month(date(2024, 2, 1)),
+    SearchFilter(created_after=datetime(2024, 3, 1)),
+    SearchFilter(created_before=datetime(2024, 1, 15, 6, 0)),
+    SearchFilter(modified_after=datetime(2024, 2, 1), modified_before=day_end(date(2024, 2, 29))),
+    SearchFilter(created_after=datetime(2024, 1, 20), modified_before=datetime(2024, 3, 1), zone_id=1),
+])
+def test_repository_ranges_match_brute_force(search_filter):
+    species = random_species(500)
+    repository = SpeciesRepository(species)
+
+    expected = {
+        s.id for s in species
+        if in_range(s.fechaCreacion, search_filter.created_after, search_filter.created_before)
+        and in_range(s.fechaModificacion, search_filter.modified_after, search_filter.modified_before)
+        and (search_filter.zone_id is None or s.zonaId == search_filter.zone_id)
+    }
+    assert {s.id for s in repository.filter(search_filter)} == expected
+    assert all(repository.matches(i, search_filter) for i in expected)
+
+
+def test_repository_bounds_are_inclusive():
+    repository = SpeciesRepository([
+        TreeSpecies(id=1, fechaCreacion=START - MICROSECOND),
+        TreeSpecies(id=2, fechaCreacion=START, fechaModificacion=END),
+        TreeSpecies(id=3, fechaCreacion=END, fechaModificacion=END + MICROSECOND),
+        TreeSpecies(id=4),
+    ])
+
+    assert repository.ids_in_range(created_after=START, created_before=END) == {2, 3, 4}
+    assert repository.ids_in_range(modified_before=END) == {1, 2, 4}
+    assert repository.index_counts(SearchFilter(created_after=START, created_before=END)) == [3]
+
+
+def test_repository_reindexes_changed_dates():
+    repository = SpeciesRepository([TreeSpecies(id=1, fechaCreacion=START)])
+    march = SearchFilter.added_in_month(date(2024, 3, 1))
+    assert [s.id for s in repository.filter(march)] == [1]
+
+    repository.upsert(TreeSpecies(id=1, fechaCreacion=datetime(2024, 4, 1)))
+    assert repository.filter(march) == []
+
+    repository.upsert(TreeSpecies(id=2, fechaCreacion=END))
+    repository.remove(1)
+    assert [s.id for s in repository.filter(march)] == [2]
+
+
+def test_modified_range_is_not_remote_filterable():
+    assert remote_filterable(SearchFilter(created_after=START, created_before=END))
+    assert not remote_filterable(SearchFilter(modified_after=START))
+    assert not remote_filterable(SearchFilter(modified_before=END))
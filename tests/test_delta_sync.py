@@ -0,0 +1,84 @@
+"""
+🔄 Delta sync
+Sincronización incremental por marca de agua (getTreeSpeciesModifiedSince / getZonesModifiedSince)
+"""
+
+from core.data_manager import CacheTTL, DataManager
+from fakes import LocalForestService
+
+
+def names(items):
+    return sorted(item.nombreComun for item in items)
+
+
+def test_first_sync_is_full_and_sets_watermark(manager, local):
+    species = manager.get_species()
+
+    assert names(species) == ["Cedro", "Guayacán", "Roble andino"]
+    assert local.calls['getAllTreeSpecies'] == 1
+    assert local.calls['getTreeSpeciesModifiedSince'] == 0
+    assert manager.sync_watermarks['species'] == max(s.creadoEn for s in local._species.values())
+
+
+def test_next_sync_only_fetches_changes(manager, local):
+    manager.get_species()
+    local.updateTreeSpecies(2, "Cedro rojo", nombreCientifico="Cedrela odorata", estadoConservacionId=3, zonaId=2)
+
+    species = manager.get_species()
+
+    assert names(species) == ["Cedro rojo", "Guayacán", "Roble andino"]
+    assert local.calls['getAllTreeSpecies'] == 1
+    assert local.calls['getTreeSpeciesModifiedSince'] == 1
+    assert manager.sync_watermarks['species'] == local._species[2].actualizadoEn
+    assert manager.species_repository.get(2).nombreComun == "Cedro rojo"
+
+
+def test_soft_delete_is_removed_by_delta(manager, local):
+    manager.get_species()
+    local.deleteTreeSpecies(3)
+
+    assert names(manager.get_species()) == ["Cedro", "Guayacán"]
+    assert 3 not in manager.species_repository
+
+
+def test_watermark_boundary_is_inclusive(manager, local):
+    manager.get_species()
+    watermark = manager.sync_watermarks['species']
+    # Otra escritura confirmada en el mismo instante que la marca de agua
+    record = local._species[1]
+    record.nombreComun = "Guayacán amarillo"
+    record.actualizadoEn = watermark
+
+    species = manager.get_species()
+
+    # `>=`: la fila con la marca exacta llega; la que fijó la marca se repite sin duplicarse
+    assert names(species) == ["Cedro", "Guayacán amarillo", "Roble andino"]
+    assert len(manager.species_repository) == 3
+    assert manager.sync_watermarks['species'] == watermark
+
+
+def test_zone_delta_sync(manager, local):
+    manager.get_zones()
+    local.updateZone(2, "Andes orientales", tipoBosque="MONTANO", areaHa=95.0)
+    local.deleteZone(1)
+
+    zones = manager.get_zones()
+
+    assert [(z.id, z.nombre, z.area_ha) for z in zones] == [(2, "Andes orientales", 95.0)]
+    assert local.calls['getAllZones'] == 1
+    assert local.calls['getZonesModifiedSince'] == 1
+
+
+def test_incompatible_server_uses_full_loads(executor):
+    local = LocalForestService(sync_version=99)
+    local.createTreeSpecies("Cedro", zonaId=1, estadoConservacionId=1)
+    manager = DataManager(species_client=local, zone_client=local, conservation_client=local,
+                          executor=executor, cache_ttls={'species': CacheTTL(soft=0, hard=0)},
+                          stale_while_revalidate=False)
+
+    manager.get_species()
+    local.createTreeSpecies("Nogal", zonaId=1, estadoConservacionId=1)
+
+    assert names(manager.get_species()) == ["Cedro", "Nogal"]
+    assert local.calls['getAllTreeSpecies'] == 2
+    assert local.calls['getTreeSpeciesModifiedSince'] == 0
@@ -0,0 +1,166 @@
+"""
+📑 Paging
+Recorrido por keyset, orden de las páginas y precarga a través del TaskExecutor
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from core.paging import PageIterator, slice_page
+from core.task_executor import TaskExecutor
+
+ROWS = [SimpleNamespace(id=i) for i in (1, 2, 3, 5, 8)]
+
+
+class RecordingFetch:
+    """fetch_page sobre ROWS que anota cada llamada y el hilo que la hizo"""
+
+    def __init__(self, rows=ROWS):
+        self.rows = rows
+        self.calls = []
+
+    def __call__(self, after_id, limit):
+        self.calls.append((after_id, limit, threading.current_thread().name))
+        return slice_page(self.rows, after_id, limit)
+
+    @property
+    def after_ids(self):
+        return [after_id for after_id, _, _ in self.calls]
+
+
+@pytest.fixture
+def pool():
+    executor = TaskExecutor(max_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+def ids(pages):
+    return [[row.id for row in page] for page in pages]
+
+
+def test_pages_follow_keyset_order(pool):
+    fetch = RecordingFetch()
+    iterator = PageIterator(fetch, page_size=2, executor=pool)
+
+    assert ids(iterator) == [[1, 2], [3, 5], [8]]
+    assert fetch.after_ids == [0, 2, 5]
+    assert iterator.exhausted and iterator.pages_fetched == 3 and iterator.rows_fetched == 5
+
+
+def test_full_last_page_needs_one_empty_fetch(pool):
+    fetch = RecordingFetch(ROWS[:4])
+    assert ids(PageIterator(fetch, page_size=2, executor=pool)) == [[1, 2], [3, 5]]
+    assert fetch.after_ids == [0, 2, 5]
+
+
+def test_next_page_is_prefetched_on_the_executor(pool):
+    fetch = RecordingFetch()
+    iterator = PageIterator(fetch, page_size=2, executor=pool)
+
+    assert [row.id for row in iterator.first_page()] == [1, 2]
+    assert [row.id for row in iterator._pending.result(timeout=5)] == [3, 5]
+    assert fetch.calls[1][0] == 2 and fetch.calls[1][2].startswith("forest-worker")
+
+    assert [row.id for row in iterator.items()] == [3, 5, 8]
+    assert fetch.after_ids == [0, 2, 5]
+
+
+def test_queued_prefetch_is_fetched_inline(pool):
+    # El único hilo del pool está ocupado: la precarga queda en cola y no se espera por ella
+    release = threading.Event()
+    pool.submit(release.wait, 5)
+    fetch = RecordingFetch()
+    try:
+        assert ids(PageIterator(fetch, page_size=2, executor=pool)) == [[1, 2], [3, 5], [8]]
+    finally:
+        release.set()
+
+    caller = threading.current_thread().name
+    assert [thread for _, _, thread in fetch.calls] == [caller, caller, caller]
+    assert fetch.after_ids == [0, 2, 5]
+
+
+def test_close_cancels_pending_prefetch(pool):
+    release = threading.Event()
+    pool.submit(release.wait, 5)
+    fetch = RecordingFetch()
+    iterator = PageIterator(fetch, page_size=2, executor=pool)
+    try:
+        iterator.first_page()
+        pending = iterator._pending
+        iterator.close()
+    finally:
+        release.set()
+
+    assert pending.cancelled()
+    assert list(iterator.pages()) == []
+    assert fetch.after_ids == [0]
+
+
+def test_on_complete_receives_every_row(pool):
+    collected = []
+    iterator = PageIterator(RecordingFetch(), page_size=2, executor=pool, on_complete=collected.extend)
+
+    list(iterator.items())
+    assert [row.id for row in collected] == [1, 2, 3, 5, 8]
+
+
+def test_abandoned_walk_does_not_complete(pool):
+    collected = []
+    iterator = PageIterator(RecordingFetch(), page_size=2, executor=pool, on_complete=collected.extend)
+
+    for _ in iterator.pages():
+        break
+    assert collected == []
+
+
+def test_page_size_is_clamped():
+    assert PageIterator(RecordingFetch(), page_size=0).page_size == 1
+    assert PageIterator(RecordingFetch(), page_size=10_000).page_size == 1000
+
+
+def test_first_page_only_before_iterating(pool):
+    iterator = PageIterator(RecordingFetch(), page_size=2, executor=pool)
+    next(iter(iterator))
+    with pytest.raises(RuntimeError):
+        iterator.first_page()
+
+
+def test_from_items_is_a_single_page():
+    fetch_calls = []
+    iterator = PageIterator.from_items(ROWS)
+    iterator.executor = SimpleNamespace(submit=lambda *args, **kwargs: fetch_calls.append(args))
+
+    assert ids(iterator) == [[1, 2, 3, 5, 8]]
+    assert fetch_calls == []
+    assert ids(PageIterator.from_items([])) == []
+
+
+@pytest.mark.parametrize("after_id, limit, expected", [
+    (0, 2, [1, 2]),
+    (2, 2, [3, 5]),
+    (4, 10, [5, 8]),
+    (8, 2, []),
+    (100, 2, []),
+])
+def test_slice_page(after_id, limit, expected):
+    assert [row.id for row in slice_page(ROWS, after_id, limit)] == expected
+
+
+def test_data_manager_pages_species_and_stores_result(manager, local):
+    iterator = manager.iter_species_pages(page_size=2, store=True)
+
+    assert [species.id for species in iterator.items()] == [1, 2, 3]
+    assert local.calls['getTreeSpeciesPage'] == 2
+    assert local.calls['getAllTreeSpecies'] == 0
+    assert set(manager.species_repository.by_id) == {1, 2, 3}
+
+
+def test_data_manager_pages_zones(manager, local):
+    pages = list(manager.iter_zones_pages(page_size=1))
+
+    assert ids(pages) == [[1], [2]]
+    assert local.calls['getZonesPage'] == 3
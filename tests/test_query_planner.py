@@ -0,0 +1,166 @@
+"""
+🧭 Query Planner
+Estrategia elegida para cada búsqueda y salida de explain()
+"""
+
+from datetime import datetime
+
+import pytest
+
+from core.models import SearchFilter, TreeSpecies
+from core.query_planner import (
+    PLAN_CACHED, PLAN_LOAD_LOCAL, PLAN_LOCAL, PLAN_REFINE, PLAN_REMOTE, QueryPlanner,
+)
+from core.species_store import SpeciesRepository
+
+SMALL_DATASET = 100
+
+
+def make_species(count):
+    """Una especie de cada 50 en la zona 1 ("Cedro ..."); el resto en la zona 2 ("Nogal ...")"""
+    return [
+        TreeSpecies(id=i, nombreComun=f"Cedro {i}" if i % 50 == 0 else f"Nogal {i}",
+                    zonaId=1 if i % 50 == 0 else 2, estadoConservacionId=1)
+        for i in range(1, count + 1)
+    ]
+
+
+class Harness:
+    """Planificador sobre un repositorio en memoria con carga y búsqueda remota observables"""
+
+    def __init__(self, count, state="expired", remote=True, remote_result="match"):
+        self.rows = make_species(count)
+        self.repository = SpeciesRepository(self.rows)
+        self.state = state
+        self.loads = 0
+        self.remote_calls = []
+        self.remote_result = remote_result
+        self.planner = QueryPlanner(
+            self.repository,
+            cache_state=lambda: self.state,
+            load_all=self.load_all,
+            remote_search=self.remote_search if remote else None,
+            small_dataset=SMALL_DATASET,
+        )
+
+    def load_all(self):
+        self.loads += 1
+
+    def remote_search(self, search_filter):
+        self.remote_calls.append(search_filter)
+        if self.remote_result is None:
+            return None
+        return self.repository.filter(search_filter)
+
+
+ZONE_1 = SearchFilter(zone_id=1)
+
+
+@pytest.mark.parametrize("state", ["fresh", "stale"])
+def test_servable_cache_is_searched_locally(state):
+    harness = Harness(1000, state=state)
+
+    assert harness.planner.plan(ZONE_1).strategy == PLAN_LOCAL
+    assert [s.id for s in harness.planner.search(ZONE_1)] == list(range(50, 1001, 50))
+    assert harness.remote_calls == []
+
+
+def test_selective_filter_on_large_dataset_goes_remote():
+    harness = Harness(1000)
+    plan = harness.planner.plan(ZONE_1)
+
+    assert plan.strategy == PLAN_REMOTE
+    assert plan.estimated_rows == 20 and plan.selectivity == pytest.approx(0.02)
+    assert len(harness.planner.execute(plan)) == 20
+    assert harness.remote_calls == [ZONE_1] and harness.loads == 0
+
+
+def test_empty_cache_goes_remote():
+    assert Harness(0).planner.plan(ZONE_1).strategy == PLAN_REMOTE
+
+
+@pytest.mark.parametrize("count, search_filter, reason", [
+    (SMALL_DATASET, ZONE_1, "small dataset"),
+    (1000, SearchFilter(zone_id=2), "low selectivity"),
+    (1000, SearchFilter(), "no filters"),
+    (1000, SearchFilter(zone_id=1, modified_after=datetime(2024, 1, 1)), "only indexed locally"),
+])
+def test_load_local_choices(count, search_filter, reason):
+    harness = Harness(count)
+    plan = harness.planner.plan(search_filter)
+
+    assert plan.strategy == PLAN_LOAD_LOCAL
+    assert reason in plan.reason
+    harness.planner.execute(plan)
+    assert harness.loads == 1 and harness.remote_calls == []
+
+
+def test_without_remote_search_loads_locally():
+    plan = Harness(1000, remote=False).planner.plan(ZONE_1)
+    assert plan.strategy == PLAN_LOAD_LOCAL
+    assert "no remote search" in plan.reason
+
+
+def test_remote_failure_falls_back_to_local():
+    harness = Harness(1000, remote_result=None)
+
+    results = harness.planner.search(ZONE_1)
+
+    plan = harness.planner.last_plan
+    assert plan.strategy == PLAN_REMOTE and plan.fallback == PLAN_LOAD_LOCAL
+    assert len(results) == 20 and harness.loads == 1
+    assert "Plan: remote -> load+local" in harness.planner.explain()
+
+
+def test_repeated_filter_is_served_from_result_cache():
+    harness = Harness(1000, state="fresh")
+    first = harness.planner.search(ZONE_1)
+
+    assert harness.planner.plan(SearchFilter(zone_id=1, active_only=False)).strategy == PLAN_CACHED
+    assert harness.planner.search(ZONE_1) == first
+
+
+def test_narrower_name_query_refines_previous_result():
+    harness = Harness(1000, state="fresh")
+    harness.planner.search(SearchFilter(name_query="cedro"))
+
+    plan = harness.planner.plan(SearchFilter(name_query="Cedro 10"))
+    assert plan.strategy == PLAN_REFINE
+    assert [s.nombreComun for s in harness.planner.execute(plan)] == ["Cedro 100", "Cedro 1000"]
+
+
+def test_refine_needs_same_other_filters_and_repository_version():
+    harness = Harness(1000, state="fresh")
+    harness.planner.search(SearchFilter(name_query="cedro"))
+
+    assert harness.planner.plan(SearchFilter(name_query="cedro 10", zone_id=1)).strategy == PLAN_LOCAL
+    harness.repository.upsert(TreeSpecies(id=2000, nombreComun="Cedro 1001", zonaId=1))
+    assert harness.planner.plan(SearchFilter(name_query="cedro 10")).strategy == PLAN_LOCAL
+
+
+def test_explain_before_any_search():
+    assert Harness(10).planner.explain() == "🧭 No query executed yet"
+
+
+def test_explain_with_filter_plans_without_executing():
+    harness = Harness(1000)
+
+    text = harness.planner.explain(ZONE_1)
+
+    assert text.startswith("🧭 Plan: remote")
+    assert "selective filter" in text
+    assert "dataset: 1000  estimated rows: 20 (2.0%)" in text
+    assert "(not executed)" in text
+    assert harness.remote_calls == [] and harness.planner.last_plan is None
+
+
+def test_explain_after_search_reports_execution():
+    harness = Harness(1000, state="fresh")
+    harness.planner.search(ZONE_1)
+
+    text = harness.planner.explain()
+
+    assert text.startswith("🧭 Plan: local")
+    assert "cache: fresh" in text
+    assert "execution:" in text and "rows: 20" in text
+    assert "(not executed)" not in text
@@ -0,0 +1,51 @@
+"""
+🔎 Remote Search
+La misma búsqueda devuelve las mismas especies con el plan local y con searchTreeSpecies
+"""
+
+import pytest
+
+from core.data_manager import DataManager
+from core.models import SearchFilter
+from core.query_planner import PLAN_LOCAL, PLAN_REMOTE
+from core.remote_search import search_arguments
+
+
+def fresh_manager(local, executor):
+    """DataManager con los TTL por defecto: tras una carga la caché queda fresca"""
+    return DataManager(species_client=local, zone_client=local, conservation_client=local, executor=executor)
+
+
+@pytest.mark.parametrize("search_filter", [
+    SearchFilter(name_query="ced"),
+    SearchFilter(zone_id=2),
+    SearchFilter(zone_id=2, active_only=False),
+    SearchFilter(conservation_state_id=3, active_only=True),
+])
+def test_local_and_remote_plans_skip_soft_deleted_rows(local, executor, search_filter):
+    local.deleteTreeSpecies(2)  # Cedro: baja lógica (activo = False)
+
+    cold = fresh_manager(local, executor)
+    remote = cold.search_species(search_filter)
+    assert cold.query_planner.last_plan.strategy == PLAN_REMOTE
+
+    warm = fresh_manager(local, executor)
+    warm.get_species()
+    local_results = warm.search_species(search_filter)
+    assert warm.query_planner.last_plan.strategy == PLAN_LOCAL
+
+    assert [s.id for s in remote] == [s.id for s in local_results]
+    assert 2 not in {s.id for s in remote}
+
+
+def test_search_arguments_always_ask_for_active_rows():
+    for active_only in (None, False, True):
+        assert search_arguments(SearchFilter(active_only=active_only))['activeOnly'] is True
+
+
+def test_server_includes_inactive_rows_only_when_asked(local):
+    local.deleteTreeSpecies(2)
+
+    assert [s.id for s in local.searchTreeSpecies()] == [1, 3]
+    assert [s.id for s in local.searchTreeSpecies(activeOnly=True)] == [1, 3]
+    assert [s.id for s in local.searchTreeSpecies(activeOnly=False)] == [1, 2, 3]
@@ -0,0 +1,178 @@
+"""
+🗂️ Search Cache
+Invalidación de resultados por versión del repositorio e historial atrás/adelante
+"""
+
+import pytest
+
+from core import search_cache
+from core.models import SearchFilter, TreeSpecies
+from core.search_cache import SearchHistory, SearchResultCache
+from core.species_store import SpeciesRepository
+
+ZONE_1 = SearchFilter(zone_id=1)
+
+
+@pytest.fixture
+def repository():
+    return SpeciesRepository([
+        TreeSpecies(id=1, nombreComun="Guayacán", zonaId=1, estadoConservacionId=1),
+        TreeSpecies(id=2, nombreComun="Cedro", zonaId=2, estadoConservacionId=3),
+        TreeSpecies(id=3, nombreComun="Roble andino", zonaId=2, estadoConservacionId=2),
+    ])
+
+
+@pytest.fixture
+def cache(repository):
+    cache = SearchResultCache(repository)
+    cache.put(ZONE_1, repository.filter(ZONE_1))
+    return cache
+
+
+def test_equivalent_filters_share_an_entry(cache):
+    assert [s.id for s in cache.get(SearchFilter(zone_id=1, active_only=False))] == [1]
+    assert cache.hits == 1 and cache.misses == 0
+    assert cache.get(SearchFilter(zone_id=2)) is None
+    assert cache.misses == 1
+
+
+def test_unrelated_change_keeps_result_valid(cache, repository):
+    version = repository.version
+    repository.upsert(TreeSpecies(id=2, nombreComun="Cedro rojo", zonaId=2, estadoConservacionId=3))
+
+    assert repository.version == version + 1
+    assert [s.id for s in cache.get(ZONE_1)] == [1]
+    assert cache.invalidations == 0
+
+
+def test_change_to_a_cached_row_invalidates(cache, repository):
+    repository.upsert(TreeSpecies(id=1, nombreComun="Guayacán", zonaId=2, estadoConservacionId=1))
+
+    assert cache.get(ZONE_1) is None
+    assert cache.invalidations == 1 and ZONE_1 not in cache
+
+
+def test_row_that_now_matches_invalidates(cache, repository):
+    repository.upsert(TreeSpecies(id=4, nombreComun="Nogal", zonaId=1, estadoConservacionId=2))
+    assert cache.get(ZONE_1) is None
+
+
+def test_removal_of_a_cached_row_invalidates(cache, repository):
+    repository.remove(1)
+    assert cache.get(ZONE_1) is None
+
+
+def test_full_load_invalidates_everything(cache, repository):
+    repository.load(repository.all())
+    assert cache.get(ZONE_1) is None
+
+
+def test_too_many_changes_invalidate(cache, repository, monkeypatch):
+    monkeypatch.setattr(search_cache, "MAX_SELECTIVE_CHANGES", 1)
+    repository.apply_changes([
+        TreeSpecies(id=2, nombreComun="Cedro rojo", zonaId=2),
+        TreeSpecies(id=3, nombreComun="Roble", zonaId=2),
+    ])
+    assert cache.get(ZONE_1) is None
+
+
+def test_result_computed_on_an_older_version_is_checked(cache, repository):
+    # Resultado remoto pedido antes de un cambio que sí le afecta
+    version = repository.version
+    repository.upsert(TreeSpecies(id=4, nombreComun="Nogal", zonaId=1))
+    cache.put(ZONE_1, [repository.get(1)], version)
+
+    assert cache.get(ZONE_1) is None
+
+
+def test_lru_keeps_most_recently_used(repository):
+    cache = SearchResultCache(repository, max_entries=2)
+    filters = [SearchFilter(zone_id=zone) for zone in (1, 2, 3)]
+    cache.put(filters[0], [])
+    cache.put(filters[1], [])
+    cache.get(filters[0])
+    cache.put(filters[2], [])
+
+    assert len(cache) == 2
+    assert filters[0] in cache and filters[2] in cache
+    assert filters[1] not in cache
+
+
+def test_results_expire_after_max_age(repository, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(search_cache.time, "monotonic", lambda: now[0])
+    cache = SearchResultCache(repository, max_age=10)
+    cache.put(ZONE_1, [])
+
+    now[0] += 10
+    assert cache.get(ZONE_1) == []
+    now[0] += 0.5
+    assert cache.get(ZONE_1) is None
+
+
+def test_clear(cache):
+    cache.clear()
+    assert len(cache) == 0 and cache.get(ZONE_1) is None
+
+
+# ===========================================
+# HISTORIAL
+# ===========================================
+
+def names(*queries):
+    return [SearchFilter(name_query=query) for query in queries]
+
+
+def test_history_back_and_forward():
+    history = SearchHistory()
+    first, second, third = names("ce", "ced", "cedro")
+    for search_filter in (first, second, third):
+        history.push(search_filter)
+
+    assert history.current is third
+    assert not history.can_go_forward
+    assert history.back() is second
+    assert history.back() is first
+    assert history.back() is None and history.current is first
+    assert not history.can_go_back
+    assert history.forward() is second
+    assert history.forward() is third
+    assert history.forward() is None
+
+
+def test_new_search_discards_forward_entries():
+    history = SearchHistory()
+    first, second, third, other = names("ce", "ced", "cedro", "nogal")
+    for search_filter in (first, second, third):
+        history.push(search_filter)
+    history.back()
+    history.back()
+
+    history.push(other)
+
+    assert history.current is other and not history.can_go_forward
+    assert history.back() is first
+
+
+def test_repeating_current_search_adds_no_entry():
+    history = SearchHistory()
+    history.push(SearchFilter(name_query="Cedro"))
+    history.push(SearchFilter(name_query=" cedro "))
+
+    assert not history.can_go_back
+
+
+def test_history_is_bounded():
+    history = SearchHistory(max_entries=2)
+    first, second, third = names("a", "b", "c")
+    for search_filter in (first, second, third):
+        history.push(search_filter)
+
+    assert history.back() is second
+    assert history.back() is None
+
+
+def test_empty_history():
+    history = SearchHistory()
+    assert history.current is None
+    assert history.back() is None and history.forward() is None
@@ -0,0 +1,87 @@
+"""
+✍️ Write-through
+Cambios CRUD aplicados al instante en la caché y reconciliados después con el servidor
+"""
+
+from core.models import TreeSpecies, Zone, TipoBosque
+
+
+def record_repository_states(monkeypatch, repository):
+    """IDs del repositorio en cada cambio de versión (lo que un lector podría ver)"""
+    states = []
+    changed = repository._changed
+
+    def spy(species_ids):
+        changed(species_ids)
+        states.append(set(repository.by_id))
+
+    monkeypatch.setattr(repository, "_changed", spy)
+    return states
+
+
+def test_update_patches_cache_in_place(manager, local, executor):
+    manager.get_species()
+    species = manager.species_repository.get(2)
+
+    species.nombreComun = "Cedro rojo"
+    assert manager.update_species(species)
+
+    assert manager.species_repository.get(2).nombreComun == "Cedro rojo"
+    assert manager.species_repository.get(2).zonaNombre == species.zonaNombre
+    assert local._species[2].nombreComun == "Cedro rojo"
+    assert len(executor.pending) == 1  # Reconciliación programada, no ejecutada
+
+
+def test_create_uses_provisional_id_until_reconciled(manager, local, executor, monkeypatch):
+    manager.get_species()
+    assert manager.create_species(TreeSpecies(id=None, nombreComun="Nogal", zonaId=1, estadoConservacionId=2))
+
+    provisional = [s for s in manager.species_cache['species'] if s.nombreComun == "Nogal"]
+    assert len(provisional) == 1 and provisional[0].id < 0
+    assert manager.is_provisional('species', provisional[0].id)
+    # Las operaciones sobre un alta sin confirmar se rechazan
+    assert not manager.delete_species(provisional[0].id)
+
+    states = record_repository_states(monkeypatch, manager.species_repository)
+    executor.run_pending()
+
+    nogal = [s for s in manager.species_cache['species'] if s.nombreComun == "Nogal"]
+    assert [s.id for s in nogal] == [4]
+    assert not manager.is_provisional('species', provisional[0].id)
+    # El alta confirmada y la provisional nunca se ven a la vez
+    assert states and all(not (provisional[0].id in ids and 4 in ids) for ids in states)
+
+
+def test_zone_create_reconciles_without_duplicates(manager, local, executor, monkeypatch):
+    manager.get_zones()
+    published = []
+    store = manager._store_zones
+    monkeypatch.setattr(manager, "_store_zones", lambda zones: (published.append([z.id for z in zones]), store(zones)))
+
+    assert manager.create_zone(Zone(id=0, nombre="Amazonía", tipo_bosque=TipoBosque.OTRO, area_ha=300.0))
+    provisional_id = published[-1][-1]
+    assert provisional_id < 0
+
+    executor.run_pending()
+
+    assert [z.id for z in manager.zones_cache['zones']] == [1, 2, 3]
+    assert all(not (provisional_id in ids and 3 in ids) for ids in published)
+
+
+def test_failed_reconcile_keeps_provisional_row(manager, local, executor, monkeypatch):
+    manager.get_species()
+    manager.create_species(TreeSpecies(id=None, nombreComun="Nogal", zonaId=1, estadoConservacionId=2))
+
+    def offline(*args):
+        raise ConnectionError("server down")
+
+    monkeypatch.setattr(local, "getTreeSpeciesModifiedSince", offline)
+    errors = []
+    fn, args, kwargs, on_success, on_error = executor.pending.pop()
+    try:
+        fn(*args, **kwargs)
+    except ConnectionError as e:
+        errors.append(e)
+
+    assert errors
+    assert any(s.id < 0 for s in manager.species_cache['species'])